@@ -37,6 +37,7 @@ PYOGRIO_GTE_012 = version.parse(pyogrio.__version__) >= version.parse("0.12")
 
 PYTHON_313 = sys.version_info >= (3, 13) and sys.version_info < (3, 14)
 SHAPELY_GTE_20 = version.parse(shapely.__version__) >= version.parse("2")
+SHAPELY_GTE_21 = version.parse(shapely.__version__) >= version.parse("2.1")
 
 sqlite3_spatialite_version_info = _sqlite_util.spatialite_version_info()
 sqlite3_spatialite_version = sqlite3_spatialite_version_info["spatialite_version"]
@@ -3,8 +3,11 @@
 import contextlib
 import enum
 import filecmp
+import functools
+import json
 import locale
 import logging
+import math
 import os
 import pprint
 import shutil
@@ -13,7 +16,8 @@ import tempfile
 import time
 import warnings
 import zipfile
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
+from concurrent import futures
 from datetime import date, datetime
 from pathlib import Path
 from typing import Any, Literal, Union
@@ -28,15 +32,17 @@ from osgeo import gdal, ogr
 from pandas.api.types import is_integer_dtype
 from pygeoops import GeometryType, PrimitiveType  # noqa: F401
 
-from geofileops._compat import GDAL_GTE_311, PYOGRIO_GTE_012
+from geofileops._compat import GDAL_GTE_311, GEOPANDAS_GTE_10, PYOGRIO_GTE_012
 from geofileops.helpers import _general_helper
 from geofileops.helpers._options import ConfigOptions
 from geofileops.util import (
     _geofileinfo,
     _geoseries_util,
+    _gpkg_util,
     _io_util,
     _ogr_sql_util,
     _ogr_util,
+    _processing_util,
     _sqlite_util,
 )
 from geofileops.util._general_util import retry
@@ -415,10 +421,10 @@ def get_layerinfo(
             # CRS
             spatialref = datasource_layer.GetSpatialRef()
             if spatialref is not None:
-                crs = pyproj.CRS(spatialref.ExportToWkt())
+                crs, epsg = _crs_from_wkt(spatialref.ExportToWkt())
 
                 # If spatial ref has no epsg, try to find corresponding one
-                if crs.to_epsg() is None:
+                if epsg is None:
                     crs = _crs_custom_match(crs, path)
 
         elif raise_on_nogeom:
@@ -459,6 +465,108 @@ def get_layerinfo(
     )
 
 
+def get_layerinfo_many(
+    paths: Iterable[Union[str, "os.PathLike[Any]"]],
+    only_spatial_layers: bool = True,
+    raise_on_nogeom: bool = True,
+    raise_on_error: bool = True,
+    nb_parallel: int | None = None,
+) -> Iterator[tuple[Union[str, "os.PathLike[Any]"], dict[str, LayerInfo] | Exception]]:
+    """Get information about all layers in many geofiles.
+
+    Each file is opened only once to get the information of all its layers, and the
+    files are processed concurrently in threads. This is a lot faster than calling
+    :func:`listlayers` and :func:`get_layerinfo` for each file one by one, e.g. to
+    build an inventory of many files.
+
+    The results are yielded as soon as they are ready, so not in the order of `paths`.
+
+    .. versionadded:: 0.12.0
+
+    Args:
+        paths (Iterable[PathLike]): paths to the files to get info about. |GDAL_vsi|
+            paths are also supported.
+        only_spatial_layers (bool, optional): True to only return info about spatial
+            layers. False to return info about all tables. Defaults to True.
+        raise_on_nogeom (bool, optional): True to raise if a layer doesn't have a
+            geometry column. If False, the LayerInfo.geometrycolumn will be None for
+            such layers. Defaults to True.
+        raise_on_error (bool, optional): True to raise if an error occurs getting the
+            information of a file. If False, the exception is returned for that file
+            instead of the layer information. Defaults to True.
+        nb_parallel (int | None, optional): the number of threads to use. If None, the
+            preference set in the nb_parallel configuration option is used, which
+            defaults to the number of CPU cores available. For more information, see
+            :func:`options.set_nb_parallel`. Defaults to None.
+
+    Raises:
+        FileNotFoundError: if a file is not found and `raise_on_error` is True.
+        Exception: an error occured reading a file and `raise_on_error` is True.
+
+    Yields:
+        tuple[PathLike, dict[str, LayerInfo] | Exception]: the path and a dict with the
+            layer names as keys and their LayerInfo as values. If `raise_on_error` is
+            False and an error occured, the exception instead of the dict.
+
+    .. |GDAL_vsi| raw:: html
+
+        <a href="https://gdal.org/en/stable/user/virtual_file_systems.html" target="_blank">GDAL vsi</a>
+
+    """  # noqa: E501
+    paths_list = list(paths)
+    nb_parallel = ConfigOptions.get_nb_parallel(nb_parallel)
+    tasks = {
+        index: functools.partial(
+            _get_layerinfos,
+            path=path,
+            only_spatial_layers=only_spatial_layers,
+            raise_on_nogeom=raise_on_nogeom,
+        )
+        for index, path in enumerate(paths_list)
+    }
+
+    with futures.ThreadPoolExecutor(max_workers=nb_parallel) as pool:
+        # Limit the number of tasks submitted at the same time, so results are
+        # streamed and stopping early doesn't need to wait for all files.
+        for index, future in _processing_util.submit_with_backpressure(
+            pool, tasks, max_running=nb_parallel, min_mem_available=0
+        ):
+            result: dict[str, LayerInfo] | Exception
+            try:
+                result = future.result()
+            except Exception as ex:
+                if raise_on_error:
+                    raise
+                result = ex
+            yield paths_list[index], result  # type: ignore[index]
+
+
+def _get_layerinfos(
+    path: Union[str, "os.PathLike[Any]"],
+    only_spatial_layers: bool,
+    raise_on_nogeom: bool,
+) -> dict[str, LayerInfo]:
+    """Get the layer information of all layers in a file, opening it only once."""
+    datasource = None
+    try:
+        datasource = gdal.OpenEx(
+            str(path), nOpenFlags=gdal.OF_VECTOR | gdal.OF_READONLY
+        )
+        return {
+            layer: get_layerinfo(
+                path, layer, raise_on_nogeom=raise_on_nogeom, datasource=datasource
+            )
+            for layer in _listlayers(datasource, only_spatial_layers)
+        }
+
+    except Exception as ex:
+        if str(ex).endswith("No such file or directory"):
+            raise FileNotFoundError(f"File not found: {path}") from ex
+        raise
+    finally:
+        datasource = None
+
+
 def get_only_layer(path: Union[str, "os.PathLike[Any]"]) -> str:
     """Get the layername for a file that only contains one layer.
 
@@ -1161,13 +1269,16 @@ def add_columns(
     output_path: Union[str, "os.PathLike[Any]"] | None = None,
     output_layer: str | None = None,
     force_update: bool = False,
+    nb_parallel: int = 1,
 ) -> None:
     """Add columns to a layer of a geofile and optionally fill them out.
 
-    If columns are being filled out or updated, the file is copied to a temporary
-    location, the columns are added there, and then the file is moved back to the
-    original location (or to `output_path` if specified). If just adding columns without
-    filling them out, the columns are added in place.
+    For Geopackage and SQLite files, the columns are added and filled out in place in
+    a single transaction, so the file is left unchanged if an error occurs. For other
+    file types, if columns are being filled out or updated, the file is copied to a
+    temporary location, the columns are added there, and then the file is moved back
+    to the original location. If `output_path` is specified, the file is always copied
+    to a temporary location first and then moved to `output_path`.
 
     Note that you cannot reference columns being added in the expressions of other
     columns as they are being update at the same time. Most of the time the most
@@ -1208,6 +1319,13 @@ def add_columns(
         force_update (bool, optional): If a column already exists, execute
             the update expression even if it means overwriting existing data.
             Defaults to False.
+        nb_parallel (int, optional): the number of parallel workers to use to evaluate
+            the expressions. If != 1, the expressions are evaluated for ranges of rows
+            concurrently, after which all columns are updated in one go. This is only
+            applied for Geopackage files. If -1, all available CPUs are used.
+            Defaults to 1.
+
+            .. versionadded:: 0.12.0
 
     See Also:
         * :func:`add_column`: add a single column to the layer
@@ -1275,17 +1393,26 @@ def add_columns(
         if len(new_column) >= 3 and new_column[2] is not None:
             updates_needed = True
 
-    # Set some config options to improve performance for GPKG if updates are done
-    if updates_needed and Path(path).suffix.lower() == ".gpkg":
+    # For file types that support transactions, the updates can be done in place
+    # safely as they will be rolled back on errors.
+    in_place = (
+        output_path is None
+        and Path(path).exists()
+        and _geofileinfo.get_geofileinfo(path).is_spatialite_based
+    )
+
+    # Set some config options to improve performance for GPKG if updates are done on a
+    # temporary copy. Remark: without journal, the transaction cannot be rolled back.
+    if updates_needed and not in_place and Path(path).suffix.lower() == ".gpkg":
         gdal_handler = _ogr_util.set_config_options(
             {"OGR_SQLITE_SYNCHRONOUS": "OFF", "OGR_SQLITE_JOURNAL": "OFF"}
         )
     else:
         gdal_handler = contextlib.nullcontext()  # type: ignore[assignment]
 
-    # If columns are being updated or if there is an output_path, create a tmp_dir to
-    # first make a local copy. If just adding columns, do it in place.
-    if updates_needed or output_path is not None:
+    # If columns are being updated and this cannot be done in place or if there is an
+    # output_path, create a tmp_dir to first make a local copy.
+    if (updates_needed and not in_place) or output_path is not None:
         tmp_dir_handler = _general_helper.create_gfo_tmp_dir("add_columns")
     else:
         tmp_dir_handler = contextlib.nullcontext()  # type: ignore[assignment]
@@ -1319,7 +1446,7 @@ def add_columns(
             _ogr_util.StartTransaction(datasource)
             update_set_expressions = []
             columns_upper = [column.upper() for column in layerinfo.columns]
-            column_added = False
+            columns_added = []
             for new_column in new_columns:
                 name = new_column[0]
                 type_str = _validate_datatype(new_column[1])
@@ -1332,14 +1459,14 @@ def add_columns(
                     logger.warning(f"Column {name} existed already in {path}#{layer}")
                     continue
 
-                column_added = True
+                columns_added.append(name)
 
                 # Open datasource if not opened yet
                 sql_stmt = f'ALTER TABLE "{layer}" ADD COLUMN "{name}" {type_str}'
                 datasource.ExecuteSQL(sql_stmt)
 
             # check if the columns were really added
-            if column_added:
+            if len(columns_added) > 0:
                 datasource_layer = datasource.GetLayer(layer)
                 layer_defn = datasource_layer.GetLayerDefn()
                 for new_column in new_columns:
@@ -1352,13 +1479,20 @@ def add_columns(
                         )
 
             # If an expression was provided and update can be done, go for it...
-            if len(update_set_expressions) > 0 and (column_added or force_update):
-                set_expr = "\n,".join(update_set_expressions)
-                sql_stmt = f"""
-                    UPDATE "{layer}"
-                       SET {set_expr}
-                """
-                datasource.ExecuteSQL(sql_stmt, dialect="SQLITE")
+            update_parallel = False
+            if len(update_set_expressions) > 0 and (
+                len(columns_added) > 0 or force_update
+            ):
+                update_parallel = nb_parallel != 1 and _update_columns_parallel_ok(
+                    output_tmp_path, layerinfo, nb_parallel
+                )
+                if not update_parallel:
+                    set_expr = "\n,".join(update_set_expressions)
+                    sql_stmt = f"""
+                        UPDATE "{layer}"
+                           SET {set_expr}
+                    """
+                    datasource.ExecuteSQL(sql_stmt, dialect="SQLITE")
 
             _ogr_util.CommitTransaction(datasource)
             driver = datasource.GetDriver()
@@ -1367,6 +1501,28 @@ def add_columns(
             )
             datasource = None
 
+            if update_parallel:
+                # The columns must be committed and the datasource closed first.
+                try:
+                    _update_columns_parallel(
+                        path=output_tmp_path,
+                        layerinfo=layerinfo,
+                        set_expressions={
+                            new_column[0]: new_column[2]
+                            for new_column in new_columns
+                            if len(new_column) >= 3 and new_column[2] is not None
+                        },
+                        where=None,
+                        nb_parallel=nb_parallel,
+                    )
+                except Exception:
+                    # If working in place, drop the columns added again. On a
+                    # temporary copy, the copy is just not moved into place.
+                    if tmp_dir is None:
+                        for name in columns_added:
+                            drop_column(output_tmp_path, name, layer=layer)
+                    raise
+
             # For multilayer file types, if an output_path is specified, but no
             # output_layer, determine if the output output layer needs to be changed
             # and change output_layer accordingly.
@@ -1416,6 +1572,87 @@ def add_columns(
                 logger.info(f"Ready, add_columns of {name} took {took:.2f}")
 
 
+def _update_columns_parallel_ok(
+    path: Union[str, "os.PathLike[Any]"], layerinfo: LayerInfo, nb_parallel: int
+) -> bool:
+    """Check if the columns of the layer can be updated in parallel."""
+    if Path(path).suffix.lower() != ".gpkg" or not Path(path).exists():
+        return False
+
+    nb_parallel = ConfigOptions.get_nb_parallel(nb_parallel)
+    return min(nb_parallel, math.ceil(layerinfo.featurecount / 10_000)) > 1
+
+
+def _update_columns_parallel(
+    path: Union[str, "os.PathLike[Any]"],
+    layerinfo: LayerInfo,
+    set_expressions: dict[str, str],
+    where: str | None,
+    nb_parallel: int,
+) -> None:
+    """Update columns by evaluating the expressions for ranges of rows in parallel.
+
+    The expressions are evaluated per range of rowids in worker processes into keyed
+    tables in separate files. All columns are then updated in a single transaction
+    with an ``UPDATE ... FROM`` on the rowid.
+    """
+    nb_parallel = ConfigOptions.get_nb_parallel(nb_parallel)
+    nb_batches = min(nb_parallel, math.ceil(layerinfo.featurecount / 10_000))
+    batch_info_df = _determine_rowid_batches(
+        path=path,
+        layer=layerinfo.name,
+        nb_rows=layerinfo.featurecount,
+        nb_batches=nb_batches,
+    )
+    end_ids = batch_info_df["start_id"].shift(-1) - 1
+    batch_wheres = []
+    for start_id, end_id in zip(batch_info_df["start_id"], end_ids, strict=True):
+        batch_where = f"rowid >= {int(start_id)}"
+        if not np.isnan(end_id):
+            batch_where += f" AND rowid <= {int(end_id)}"
+        if where is not None:
+            batch_where = f"({batch_where}) AND ({where})"
+        batch_wheres.append(batch_where)
+
+    worker_type = _general_helper.worker_type_to_use(layerinfo.featurecount)
+    logger.info(f"Start update of columns in {nb_batches} {worker_type} batches")
+    with (
+        _general_helper.create_gfo_tmp_dir("update_columns") as tmp_dir,
+        _processing_util.PooledExecutorFactory(
+            worker_type=worker_type,
+            max_workers=nb_batches,
+            initializer=_processing_util.initialize_worker,
+            initargs=(worker_type,),
+        ) as pool,
+    ):
+        values_paths = [
+            tmp_dir / f"values_{batch_id}.sqlite"
+            for batch_id in range(len(batch_wheres))
+        ]
+        batch_futures = [
+            pool.submit(
+                _sqlite_util.evaluate_expressions,
+                input_path=Path(path),
+                input_table=layerinfo.name,
+                expressions=list(set_expressions.values()),
+                output_path=values_path,
+                output_table="gfo_values",
+                where=batch_where,
+            )
+            for values_path, batch_where in zip(values_paths, batch_wheres, strict=True)
+        ]
+        for future in batch_futures:
+            future.result()
+
+        _sqlite_util.update_table_from_values(
+            path=Path(path),
+            table=layerinfo.name,
+            columns=list(set_expressions),
+            values_paths=values_paths,
+            values_table="gfo_values",
+        )
+
+
 def _validate_datatype(datatype: str | DataType) -> str:
     """Validate the datatype specified for a column.
 
@@ -1494,6 +1731,7 @@ def update_column(
     expression: str,
     layer: str | None = None,
     where: str | None = None,
+    nb_parallel: int = 1,
 ) -> None:
     """Update a column from a layer of the geofile.
 
@@ -1509,6 +1747,13 @@ def update_column(
             has only one layer, that layer is used. Defaults to None.
         where (str, optional): SQL where clause to restrict the rows that will
             be updated. Defaults to None.
+        nb_parallel (int, optional): the number of parallel workers to use to evaluate
+            the expression. If != 1, the expression is evaluated for ranges of rows
+            concurrently, after which the column is updated in one go. This is only
+            applied for Geopackage files and if the column updated isn't the geometry
+            column. If -1, all available CPUs are used. Defaults to 1.
+
+            .. versionadded:: 0.12.0
 
     See Also:
         * :func:`add_column`: add a column to the layer
@@ -1566,14 +1811,35 @@ def update_column(
         # If column doesn't exist yet, error!
         raise ValueError(f"Column {name} doesn't exist in {path}#{layerinfo.name}")
 
+    # Evaluate the expression in parallel if asked and possible.
+    is_geometrycolumn = (
+        layerinfo.geometrycolumn is not None
+        and name.upper() == layerinfo.geometrycolumn.upper()
+    )
+    update_parallel = (
+        nb_parallel != 1
+        and not is_geometrycolumn
+        and _update_columns_parallel_ok(path, layerinfo, nb_parallel)
+    )
+
     # Go!
+    datasource = None
     try:
-        datasource = gdal.OpenEx(str(path), nOpenFlags=gdal.OF_UPDATE)
-        sqlite_stmt = f'UPDATE "{layerinfo.name}" SET "{name}" = {expression}'
-        if where is not None:
-            sqlite_stmt += f"\n WHERE {where}"
-        result = datasource.ExecuteSQL(sqlite_stmt, dialect="SQLITE")
-        datasource.ReleaseResultSet(result)
+        if update_parallel:
+            _update_columns_parallel(
+                path=path,
+                layerinfo=layerinfo,
+                set_expressions={name: expression},
+                where=where,
+                nb_parallel=nb_parallel,
+            )
+        else:
+            datasource = gdal.OpenEx(str(path), nOpenFlags=gdal.OF_UPDATE)
+            sqlite_stmt = f'UPDATE "{layerinfo.name}" SET "{name}" = {expression}'
+            if where is not None:
+                sqlite_stmt += f"\n WHERE {where}"
+            result = datasource.ExecuteSQL(sqlite_stmt, dialect="SQLITE")
+            datasource.ReleaseResultSet(result)
 
     except Exception as ex:
         ex.args = (f"update_column error for {path}#{layerinfo.name}:\n  {ex}",)
@@ -1598,6 +1864,7 @@ def read_file(
     sql_dialect: Literal["SQLITE", "OGRSQL"] | None = None,
     ignore_geometry: bool = False,
     fid_as_index: bool = False,
+    nb_parallel: int = 1,
     **kwargs: object,
 ) -> gpd.GeoDataFrame:
     """Reads a file to a geopandas GeoDataframe.
@@ -1672,6 +1939,11 @@ def read_file(
         fid_as_index (bool, optional): If True, will use the FIDs of the features that
             were read as the index of the GeoDataFrame. May start at 0 or 1 depending on
             the driver. Defaults to False.
+        nb_parallel (int, optional): the number of threads to use to read the file. The
+            layer is split in ranges of rows that are read concurrently. If -1, all
+            available CPUs are used. This is not applied if ``sql_stmt`` or ``rows``
+            is specified, or for file types that don't support efficient random access
+            when ``where`` or ``bbox`` is used. Defaults to 1.
         **kwargs: All additional parameters will be passed on to the io-engine used
             ("pyogrio" or "fiona").
 
@@ -1694,6 +1966,22 @@ def read_file(
         <a href="https://gdal.org/en/stable/user/virtual_file_systems.html" target="_blank">GDAL vsi</a>
 
     """  # noqa: E501
+    if nb_parallel != 1 and sql_stmt is None and rows is None:
+        # Read ranges of rows concurrently if possible. If not, None is returned.
+        result_gdf = _read_file_parallel(
+            path=path,
+            layer=layer,
+            columns=columns,
+            bbox=bbox,
+            where=where,
+            ignore_geometry=ignore_geometry,
+            fid_as_index=fid_as_index,
+            nb_parallel=nb_parallel,
+            **kwargs,
+        )
+        if result_gdf is not None:
+            return result_gdf
+
     result_gdf = _read_file_base(
         path=path,
         layer=layer,
@@ -1712,6 +2000,331 @@ def read_file(
     return result_gdf
 
 
+def _read_file_parallel(
+    path: Union[str, "os.PathLike[Any]"],
+    layer: str | None,
+    columns: Iterable[str] | None,
+    bbox: tuple[float, float, float, float] | None,
+    where: str | None,
+    ignore_geometry: bool,
+    fid_as_index: bool,
+    nb_parallel: int,
+    **kwargs: object,
+) -> pd.DataFrame | gpd.GeoDataFrame | None:
+    """Read a file by reading ranges of rows concurrently in threads.
+
+    For Geopackage and Spatialite files, the ranges are determined on the rowid, so
+    they can be combined with ``where`` and ``bbox`` filters. For other file types the
+    ranges are read via ``rows``, which is only possible without filters.
+
+    Returns:
+        pd.DataFrame | gpd.GeoDataFrame | None: the data read or None if the file
+            cannot be read in parallel.
+    """
+    # Only local files
+    if not Path(path).exists():
+        return None
+    if isinstance(columns, str):
+        columns = [columns]
+    elif columns is not None:
+        columns = list(columns)
+
+    layerinfo = get_layerinfo(path, layer, raise_on_nogeom=False)
+    nb_parallel = ConfigOptions.get_nb_parallel(nb_parallel)
+    nb_batches = min(nb_parallel, math.ceil(layerinfo.featurecount / 10_000))
+    if nb_batches <= 1:
+        return None
+
+    # Determine the filters to read the batches
+    path_info = _geofileinfo.get_geofileinfo(path)
+    batch_kwargs: list[dict[str, Any]] = []
+    if path_info.is_spatialite_based:
+        batch_info_df = _determine_rowid_batches(
+            path=path,
+            layer=layerinfo.name,
+            nb_rows=layerinfo.featurecount,
+            nb_batches=nb_batches,
+        )
+        end_ids = batch_info_df["start_id"].shift(-1) - 1
+        for start_id, end_id in zip(batch_info_df["start_id"], end_ids, strict=True):
+            batch_where = f"rowid >= {int(start_id)}"
+            if not np.isnan(end_id):
+                batch_where += f" AND rowid <= {int(end_id)}"
+            if where is not None:
+                batch_where = f"({batch_where}) AND ({where})"
+            batch_kwargs.append({"where": batch_where, "bbox": bbox})
+    elif where is None and bbox is None:
+        nb_rows_per_batch = math.ceil(layerinfo.featurecount / nb_batches)
+        for start in range(0, layerinfo.featurecount, nb_rows_per_batch):
+            batch_kwargs.append({"rows": slice(start, start + nb_rows_per_batch)})
+    else:
+        return None
+
+    # Read the batches concurrently, the order of the results is preserved by map
+    def read_batch(batch: dict[str, Any]) -> pd.DataFrame | gpd.GeoDataFrame:
+        return _read_file_base(
+            path=path,
+            layer=layerinfo.name,
+            columns=columns,
+            bbox=batch.get("bbox"),
+            rows=batch.get("rows"),
+            where=batch.get("where"),
+            sql_stmt=None,
+            sql_dialect=None,
+            ignore_geometry=ignore_geometry,
+            fid_as_index=fid_as_index,
+            **kwargs,
+        )
+
+    with futures.ThreadPoolExecutor(max_workers=nb_batches) as pool:
+        batch_gdfs = list(pool.map(read_batch, batch_kwargs))
+
+    # Avoid that empty batches influence the dtypes of the result
+    batch_gdfs = [gdf for gdf in batch_gdfs if len(gdf) > 0] or batch_gdfs[:1]
+    return pd.concat(batch_gdfs, ignore_index=not fid_as_index)
+
+
+def _determine_rowid_batches(
+    path: Union[str, "os.PathLike[Any]"], layer: str, nb_rows: int, nb_batches: int
+) -> pd.DataFrame:
+    """Determine the start rowid of batches with about the same number of rows.
+
+    Only supported for sqlite based files.
+
+    Args:
+        path (PathLike): the file to determine the batches for.
+        layer (str): the layer to determine the batches for.
+        nb_rows (int): the number of rows in the layer.
+        nb_batches (int): the number of batches wanted.
+
+    Returns:
+        pd.DataFrame: DataFrame with the columns "batch_id" and "start_id", ordered by
+            "start_id". The end of a batch is the start_id of the next batch - 1.
+    """
+    # Determine the min_rowid and max_rowid
+    # Remark: SELECT MIN(rowid), MAX(rowid) ... is a lot slower than UNION ALL!
+    sql_stmt = f"""
+        SELECT MIN(rowid) minmax_rowid FROM "{layer}"
+        UNION ALL
+        SELECT MAX(rowid) minmax_rowid FROM "{layer}"
+    """
+    batch_info_df = read_file(path=path, sql_stmt=sql_stmt, sql_dialect="SQLITE")
+    min_rowid = pd.to_numeric(batch_info_df["minmax_rowid"][0]).item()
+    max_rowid = pd.to_numeric(batch_info_df["minmax_rowid"][1]).item()
+
+    # Determine the exact batches to use
+    if ((max_rowid - min_rowid) / nb_rows) < 1.1:
+        # If the rowid's are quite consecutive, use an imperfect, but
+        # fast distribution in batches
+        batch_info_list = []
+        start_id = min_rowid
+        offset_per_batch = round((max_rowid - min_rowid) / nb_batches)
+        for batch_id in range(nb_batches):
+            batch_info_list.append((batch_id, start_id))
+            start_id += offset_per_batch
+
+        batch_info_df = pd.DataFrame(batch_info_list, columns=["batch_id", "start_id"])
+    else:
+        # The rowids are not consecutive, so determine the optimal rowid
+        # ranges for each batch so each batch has same number of elements
+        # Remark: - this might take some seconds for larger datasets!
+        #         - (batch_id - 1) AS id to make the id zero-based
+        sql_stmt = f"""
+            SELECT (batch_id - 1) AS batch_id
+                ,MIN(rowid) AS start_id
+            FROM
+                ( SELECT rowid
+                        ,NTILE({nb_batches}) OVER (ORDER BY rowid) batch_id
+                    FROM "{layer}"
+                )
+            GROUP BY batch_id;
+        """
+        batch_info_df = read_file(path=path, sql_stmt=sql_stmt)
+
+    return batch_info_df
+
+
+def read_file_iter(
+    path: Union[str, "os.PathLike[Any]"],
+    layer: str | None = None,
+    columns: Iterable[str] | None = None,
+    bbox: tuple[float, float, float, float] | None = None,
+    where: str | None = None,
+    sql_stmt: str | None = None,
+    sql_dialect: Literal["SQLITE", "OGRSQL"] | None = None,
+    ignore_geometry: bool = False,
+    fid_as_index: bool = False,
+    batch_size: int = 65_536,
+    as_arrow: bool = False,
+    **kwargs: object,
+) -> Iterator[Union[gpd.GeoDataFrame, pd.DataFrame, "pyarrow.Table"]]:
+    """Reads a file in chunks of a limited number of rows.
+
+    Contrary to :func:`read_file`, the data is not read in memory at once but is
+    streamed from one open dataset, so also files that are too large to fit in memory
+    can be processed. This is also a lot faster than reading chunks using the ``rows``
+    parameter of :func:`read_file`.
+
+    The parameters are the same as for :func:`read_file`, including the placeholders
+    that can be used in ``sql_stmt`` and the handling of the casing of ``columns``.
+
+    The data is always read using "pyogrio" with arrow, regardless of the
+    "GFO_IO_ENGINE" setting, so pyarrow needs to be installed.
+
+    .. versionadded:: 0.12.0
+
+    Args:
+        path (file path): path to the file to read from. |GDAL_vsi| paths are also
+            supported.
+        layer (str, optional): The layer to read. If None and there is only one layer in
+            the file it is read, otherwise an error is thrown. Defaults to None.
+        columns (Iterable[str], optional): The (non-geometry) columns to read will
+            be returned in the order specified. If None, all standard columns are read.
+            In addition to standard columns, it is also possible to specify "fid", a
+            unique index available in all input files. Defaults to None.
+        bbox (Tuple, optional): return only geometries intersecting this bbox.
+            Defaults to None, then all rows are read.
+        where (str, optional): where clause to filter features in layer by attribute
+            values. For more information, see :func:`read_file`. Defaults to None.
+        sql_stmt (str): SQL statement to use. Defaults to None.
+        sql_dialect (str, optional): SQL dialect used. Options are None, "SQLITE" or
+            "OGRSQL". For more information, see :func:`read_file`. Defaults to None.
+        ignore_geometry (bool, optional): True not to read/return the geometry.
+            Defaults to False.
+        fid_as_index (bool, optional): If True, will use the FIDs of the features that
+            were read as the index of the GeoDataFrames. Defaults to False.
+        batch_size (int, optional): the maximum number of rows in each chunk.
+            Defaults to 65536.
+        as_arrow (bool, optional): True to return the chunks as pyarrow Tables rather
+            than as GeoDataFrames. The geometry column then contains WKB and the fid
+            column, if asked, is named "fid". Defaults to False.
+        **kwargs: All additional parameters will be passed on to
+            ``pyogrio.open_arrow``.
+
+    Raises:
+        ValueError: an invalid parameter value was passed.
+        ImportError: pyarrow is not installed.
+
+    Yields:
+        gpd.GeoDataFrame or pd.DataFrame or pyarrow.Table: the data read, in chunks of
+            at most ``batch_size`` rows. If ``fid_as_index`` is False, the index of the
+            chunks continues where the previous chunk stopped.
+
+    Examples:
+        Process a large file chunk by chunk:
+
+        .. code-block:: python
+
+            for chunk_gdf in gfo.read_file_iter(path, batch_size=100_000):
+                ...
+
+    .. |GDAL_vsi| raw:: html
+
+        <a href="https://gdal.org/en/stable/user/virtual_file_systems.html" target="_blank">GDAL vsi</a>
+
+    """  # noqa: E501
+    if pyarrow is None:
+        raise ImportError(
+            "pyarrow is not installed, but needed for read_file_iter. "
+            "Please install pyarrow."
+        )
+    if batch_size <= 0:
+        raise ValueError(f"batch_size should be > 0, not {batch_size}")
+
+    # Check if the fid column needs to be read as column via the columns parameter
+    if isinstance(columns, str):
+        # If a string is passed, convert to list
+        columns = [columns]
+    if columns is not None:
+        columns = list(columns)
+    fid_as_column = columns is not None and "fid" in [col.lower() for col in columns]
+
+    layerinfo: str | LayerInfo | None = layer
+    columns_prepared = None
+    if sql_stmt is None:
+        if columns is not None:
+            layerinfo = get_layerinfo(path, layer, raise_on_nogeom=False)
+            columns_prepared = _prepare_columns_lookup(layerinfo, columns)
+        elif layerinfo is None:
+            # If no sql + no layer specified, there should be only one layer.
+            layerinfo = get_only_layer(path)
+        layername = layerinfo.name if isinstance(layerinfo, LayerInfo) else layerinfo
+    else:
+        # Fill out placeholders, keep columns_prepared None because column filtering
+        # should happen in sql_stmt.
+        sql_stmt = _fill_out_sql_placeholders(
+            path=path, layer=layer, sql_stmt=sql_stmt, columns=columns
+        )
+        # Specifying a layer as well as an SQL statement in pyogrio is not supported.
+        layername = None
+
+    return_fids = fid_as_index or fid_as_column
+    columns_list = None if columns_prepared is None else list(columns_prepared)
+    nb_rows_read = 0
+    with pyogrio.open_arrow(
+        path,
+        layer=layername,
+        columns=columns_list,
+        bbox=bbox,
+        where=where,
+        sql=sql_stmt,
+        sql_dialect=sql_dialect,
+        read_geometry=not ignore_geometry,
+        return_fids=return_fids,
+        batch_size=batch_size,
+        use_pyarrow=True,
+        **kwargs,
+    ) as (meta, reader):
+        geometry_name = meta["geometry_name"] or "wkb_geometry"
+        for batch in reader:
+            table = pyarrow.Table.from_batches([batch])
+            if as_arrow:
+                renames = {meta["fid_column"]: "fid"} if return_fids else {}
+                if columns_prepared is not None:
+                    renames.update(columns_prepared)
+                yield table.rename_columns(
+                    [renames.get(name, name) for name in table.column_names]
+                )
+                continue
+
+            chunk_df = table.to_pandas(date_as_object=False)
+            del table
+            if return_fids:
+                chunk_df = chunk_df.set_index(meta["fid_column"])
+                chunk_df.index.name = "fid"
+            else:
+                chunk_df.index = pd.RangeIndex(
+                    nb_rows_read, nb_rows_read + len(chunk_df)
+                )
+            if geometry_name in chunk_df.columns:
+                wkb_values = chunk_df.pop(geometry_name)
+                chunk_df["geometry"] = gpd.GeoSeries.from_wkb(
+                    wkb_values, crs=meta["crs"]
+                )
+                chunk_df = gpd.GeoDataFrame(
+                    chunk_df, geometry="geometry", crs=meta["crs"]
+                )
+
+            chunk_df = _postprocess_read_result(
+                chunk_df,
+                path=path,
+                layer=layerinfo,
+                columns_prepared=columns_prepared,
+                ignore_geometry=ignore_geometry,
+            )
+
+            # Copy the index to a column if needed...
+            if fid_as_column:
+                chunk_df["fid"] = chunk_df.index
+                if not fid_as_index:
+                    chunk_df.index = pd.RangeIndex(
+                        nb_rows_read, nb_rows_read + len(chunk_df)
+                    )
+
+            nb_rows_read += len(chunk_df)
+            yield chunk_df
+
+
 def read_file_nogeom(
     path: Union[str, "os.PathLike[Any]"],
     layer: str | None = None,
@@ -1767,7 +2380,26 @@ def _read_file_base(
 
     # Read with the engine specified
     engine = ConfigOptions.get_io_engine
-    if engine.startswith("pyogrio"):
+    gdf = None
+    if (
+        engine.startswith("pyogrio")
+        and ConfigOptions.get_read_file_sqlite_direct
+        and sql_stmt is None
+        and set(kwargs).issubset({"use_arrow"})
+    ):
+        # Try to read directly via sqlite. If not supported, None is returned.
+        gdf = _gpkg_util.read_gpkg(
+            path=path,
+            layer=layer,
+            columns=None if columns is None else list(columns),
+            bbox=bbox,
+            rows=rows,
+            where=where,
+            ignore_geometry=ignore_geometry,
+            fid_as_index=fid_as_index or fid_as_column,
+        )
+
+    if gdf is None and engine.startswith("pyogrio"):
         if "use_arrow" in kwargs:
             use_arrow = bool(kwargs["use_arrow"]) if pyarrow else False
             del kwargs["use_arrow"]
@@ -1787,7 +2419,7 @@ def _read_file_base(
             use_arrow=use_arrow,
             **kwargs,
         )
-    elif engine == "fiona":
+    elif gdf is None and engine == "fiona":
         gdf = _read_file_base_fiona(
             path=path,
             layer=layer,
@@ -1801,7 +2433,7 @@ def _read_file_base(
             fid_as_index=fid_as_index or fid_as_column,
             **kwargs,
         )
-    else:
+    elif gdf is None:
         raise ValueError(f"Unsupported engine: {engine}")
 
     # Copy the index to a column if needed...
@@ -1998,12 +2630,7 @@ def _read_file_base_pyogrio(
         if columns is not None:
             if not isinstance(layer, LayerInfo):
                 layer = get_layerinfo(path, layer, raise_on_nogeom=False)
-            columns_upper_lookup = {column.upper(): column for column in columns}
-            columns_prepared = {
-                column: columns_upper_lookup[column.upper()]
-                for column in layer.columns
-                if column.upper() in columns_upper_lookup
-            }
+            columns_prepared = _prepare_columns_lookup(layer, columns)
 
         # If no sql + no layer specified, there should be only one layer in the file.
         if layer is None:
@@ -2077,6 +2704,48 @@ def _read_file_base_pyogrio(
         **kwargs,
     )
 
+    result_gdf = _postprocess_read_result(
+        result_gdf,
+        path=path,
+        layer=layer,
+        columns_prepared=columns_prepared,
+        ignore_geometry=ignore_geometry,
+    )
+
+    assert isinstance(result_gdf, gpd.GeoDataFrame | pd.DataFrame)
+    return result_gdf
+
+
+def _prepare_columns_lookup(layer: LayerInfo, columns: Iterable[str]) -> dict[str, str]:
+    """Map the column names in the layer to the casing used in `columns`.
+
+    Checking if column names should be read is case sensitive in pyogrio, so the
+    columns to read should be specified with the casing used in the layer.
+
+    Args:
+        layer (LayerInfo): the layer info of the layer to read.
+        columns (Iterable[str]): the columns asked.
+
+    Returns:
+        dict[str, str]: dict with the column names as in the layer as keys and the
+            column names as asked as values.
+    """
+    columns_upper_lookup = {column.upper(): column for column in columns}
+    return {
+        column: columns_upper_lookup[column.upper()]
+        for column in layer.columns
+        if column.upper() in columns_upper_lookup
+    }
+
+
+def _postprocess_read_result(
+    result_gdf: pd.DataFrame | gpd.GeoDataFrame,
+    path: Union[str, "os.PathLike[Any]"],
+    layer: str | LayerInfo | None,
+    columns_prepared: dict[str, str] | None,
+    ignore_geometry: bool,
+) -> pd.DataFrame | gpd.GeoDataFrame:
+    """Apply the column ordering, casing and datetime fixes to data read by pyogrio."""
     # Reorder columns + change casing so they are the same as columns parameter
     if columns_prepared is not None and len(columns_prepared) > 0:
         columns_to_keep = list(columns_prepared)
@@ -2094,7 +2763,6 @@ def _read_file_base_pyogrio(
             if isinstance(result_gdf[column].iloc[0], date | datetime):
                 result_gdf[column] = pd.to_datetime(result_gdf[column])
 
-    assert isinstance(result_gdf, gpd.GeoDataFrame | pd.DataFrame)
     return result_gdf
 
 
@@ -2284,6 +2952,24 @@ def to_file(
 
     engine = ConfigOptions.get_io_engine
 
+    # Try to write directly via sqlite. If not supported, False is returned.
+    if (
+        engine.startswith("pyogrio")
+        and ConfigOptions.get_to_file_sqlite_direct
+        and set(kwargs).issubset({"use_arrow"})
+        and _gpkg_util.write_gpkg(
+            gdf=gdf,
+            path=path,
+            layer=layer,
+            force_output_geometrytype=force_output_geometrytype,
+            force_multitype=force_multitype,
+            append=append,
+            index=index,
+            create_spatial_index=create_spatial_index,
+        )
+    ):
+        return None
+
     # Write file with the correct engine
     if engine.startswith("pyogrio"):
         if "use_arrow" in kwargs:
@@ -2577,6 +3263,304 @@ def _to_file_pyogrio(
         gdf.to_file(str(path), **kwargs)
 
 
+def open_writer(
+    path: Union[str, "os.PathLike[Any]"],
+    layer: str | None = None,
+    schema: pd.DataFrame | gpd.GeoDataFrame | None = None,
+    force_output_geometrytype: GeometryType | str | None = None,
+    create_spatial_index: bool | None = None,
+    transaction_size: int = 100_000,
+    index: bool | None = None,
+) -> "LayerWriter":
+    """Open a writer to append data to a layer while keeping the file open.
+
+    Appending many small GeoDataFrames with :func:`to_file` is relatively slow, because
+    the file is opened, the layer is looked up and the data is committed for every call.
+    A :class:`LayerWriter` keeps the file open, and commits the data written in
+    transactions of ``transaction_size`` rows.
+
+    If the layer doesn't exist yet, it is created based on ``schema`` or, if no schema
+    is specified, on the first data written. To avoid the spatial index being updated
+    for every row written, the spatial index of a new layer is only created when the
+    writer is closed.
+
+    The writer should preferably be used as a context manager, so it is closed properly
+    when done or if an error occurs. If an error occurs, the data written since the
+    last commit is rolled back.
+
+    Writing is done using GDAL with Arrow, so pyarrow needs to be installed. To write
+    GeoDataFrames, geopandas >= 1.0 is needed.
+
+    .. versionadded:: 0.12.0
+
+    Args:
+        path (PathLike): The file path to write to.
+        layer (str, optional): The layer to write to. If None, the default layer name
+            for the path is used. Defaults to None.
+        schema (pd.DataFrame | gpd.GeoDataFrame, optional): a (typically empty)
+            (Geo)DataFrame with the columns, data types and crs to create the layer
+            with if it doesn't exist yet. If None, the first data written is used.
+            Defaults to None.
+        force_output_geometrytype (Union[GeometryType, str], optional): geometry type
+            to use when creating the layer. Defaults to None.
+        create_spatial_index (bool, optional): True to create a spatial index on a
+            layer created by the writer, False to avoid creation. None leads to the
+            default behaviour of gdal. Defaults to None.
+        transaction_size (int, optional): the number of rows after which the data
+            written is committed. Defaults to 100000.
+        index (bool, optional): If True, write the index into one or more columns. For
+            more information, see :func:`to_file`. Defaults to None.
+
+    Raises:
+        ImportError: pyarrow or geopandas >= 1.0 is not installed.
+        ValueError: an invalid parameter value was passed.
+
+    Returns:
+        LayerWriter: the writer.
+
+    Examples:
+        Write the chunks read from a file to a new file:
+
+        .. code-block:: python
+
+            with gfo.open_writer(dst) as writer:
+                for chunk_gdf in gfo.read_file_iter(src):
+                    writer.write(chunk_gdf)
+
+    """
+    if pyarrow is None:
+        raise ImportError(
+            "pyarrow is not installed, but needed for open_writer. "
+            "Please install pyarrow."
+        )
+    if transaction_size <= 0:
+        raise ValueError(f"transaction_size should be > 0, not {transaction_size}")
+    if layer is None:
+        if _vsi_exists(path):
+            layer = get_only_layer(path)
+        else:
+            layer = get_default_layer(path)
+
+    return LayerWriter(
+        path=path,
+        layer=layer,
+        schema=schema,
+        force_output_geometrytype=force_output_geometrytype,
+        create_spatial_index=create_spatial_index,
+        transaction_size=transaction_size,
+        index=index,
+    )
+
+
+class LayerWriter:
+    """Writer to append data to a layer while keeping the file open.
+
+    Use :func:`open_writer` to create a LayerWriter.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, "os.PathLike[Any]"],
+        layer: str,
+        schema: pd.DataFrame | gpd.GeoDataFrame | None,
+        force_output_geometrytype: GeometryType | str | None,
+        create_spatial_index: bool | None,
+        transaction_size: int,
+        index: bool | None,
+    ) -> None:
+        """Constructor of LayerWriter.
+
+        For the description of the parameters, see :func:`open_writer`.
+        """
+        self.path = path
+        self.layer = layer
+        self._force_output_geometrytype = force_output_geometrytype
+        self._create_spatial_index = create_spatial_index
+        self._transaction_size = transaction_size
+        self._index = index
+        self._datasource: gdal.Dataset | None = None
+        self._datasource_layer: ogr.Layer | None = None
+        self._layer_created = False
+        self._use_transactions = False
+        self._nb_rows_uncommitted = 0
+        self._closed = False
+        self.nb_rows_written = 0
+
+        if schema is not None:
+            self._open(schema)
+
+    def __enter__(self) -> "LayerWriter":
+        """Enter the context manager."""
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, *args: object) -> None:
+        """Exit the context manager: close the writer."""
+        self.close(rollback=exc_type is not None)
+
+    def write(
+        self, data: Union[pd.DataFrame, gpd.GeoDataFrame, "pyarrow.Table"]
+    ) -> None:
+        """Write data to the layer.
+
+        Args:
+            data (pd.DataFrame | gpd.GeoDataFrame | pyarrow.Table): the data to write.
+                The columns should be the same as the ones in the layer. A geometry
+                column in an Arrow table should be WKB encoded and have the
+                "geoarrow.wkb" or "ogc.wkb" extension type.
+
+        Raises:
+            ValueError: the writer is already closed.
+        """
+        if self._closed:
+            raise ValueError(f"LayerWriter for {self.path}#{self.layer} is closed")
+
+        if isinstance(data, pyarrow.Table):
+            table = data
+            if self._datasource is None:
+                self._open(_arrow_schema_to_geodataframe(table.schema))
+        else:
+            if self._datasource is None:
+                self._open(data.iloc[0:0])
+            table = self._to_arrow(data)
+
+        if len(table) == 0:
+            return
+
+        # Make sure the geometry column has the name used in the layer.
+        assert self._datasource_layer is not None
+        geometrycolumn = self._datasource_layer.GetGeometryColumn()
+        wkb_columns = _get_arrow_wkb_columns(table.schema)
+        if geometrycolumn and len(wkb_columns) == 1:
+            table = table.rename_columns(
+                [
+                    geometrycolumn if name == wkb_columns[0] else name
+                    for name in table.column_names
+                ]
+            )
+
+        # Write the data, in a transaction if supported
+        assert self._datasource is not None
+        if self._use_transactions and self._nb_rows_uncommitted == 0:
+            self._datasource.StartTransaction()
+        self._datasource_layer.WritePyArrow(table)
+        self._nb_rows_uncommitted += len(table)
+        self.nb_rows_written += len(table)
+        if self._nb_rows_uncommitted >= self._transaction_size:
+            self._commit()
+
+    def close(self, rollback: bool = False) -> None:
+        """Close the writer.
+
+        The data written is committed and, if the layer was created by the writer, the
+        spatial index is created if applicable.
+
+        Args:
+            rollback (bool, optional): True to rollback the data written since the last
+                commit instead of committing it. Defaults to False.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if self._datasource is None:
+            return
+
+        try:
+            if self._nb_rows_uncommitted > 0:
+                if rollback and self._use_transactions:
+                    self._datasource.RollbackTransaction()
+                    self._nb_rows_uncommitted = 0
+                else:
+                    self._commit()
+        finally:
+            self._datasource_layer = None
+            self._datasource.Close()
+            self._datasource = None
+
+        # The spatial index of a new layer is only created now, in bulk.
+        if self._layer_created and not rollback:
+            create_index = self._create_spatial_index
+            if create_index is None:
+                create_index = _geofileinfo.get_driver(self.path) == "GPKG"
+            if create_index:
+                create_spatial_index(
+                    self.path, self.layer, exist_ok=True, no_geom_ok=True
+                )
+
+    def _open(self, schema: pd.DataFrame | gpd.GeoDataFrame) -> None:
+        """Open the file, and create the layer based on schema if needed."""
+        if not _vsi_exists(self.path) or self.layer not in listlayers(
+            self.path, only_spatial_layers=False
+        ):
+            # Remark: for multi-layer file types, the layer is added to the file.
+            to_file(
+                schema.iloc[0:0],
+                self.path,
+                layer=self.layer,
+                force_output_geometrytype=self._force_output_geometrytype,
+                index=self._index,
+                create_spatial_index=False,
+            )
+            self._layer_created = True
+
+        self._datasource = gdal.OpenEx(
+            str(self.path), nOpenFlags=gdal.OF_VECTOR | gdal.OF_UPDATE
+        )
+        self._datasource_layer = _get_layer(self._datasource, self.layer)
+        self._use_transactions = bool(
+            self._datasource.TestCapability(ogr.ODsCTransactions)
+        )
+
+    def _commit(self) -> None:
+        assert self._datasource is not None
+        if self._use_transactions:
+            self._datasource.CommitTransaction()
+        else:
+            self._datasource.FlushCache()
+        self._nb_rows_uncommitted = 0
+
+    def _to_arrow(self, data: pd.DataFrame | gpd.GeoDataFrame) -> "pyarrow.Table":
+        """Convert a (Geo)DataFrame to an Arrow table with WKB geometries."""
+        if isinstance(data, gpd.GeoDataFrame):
+            if not GEOPANDAS_GTE_10:
+                raise ImportError("geopandas >= 1.0 is needed to write GeoDataFrames")
+            return pyarrow.table(
+                data.to_arrow(index=self._index, geometry_encoding="WKB")
+            )
+
+        return pyarrow.Table.from_pandas(data, preserve_index=self._index)
+
+
+def _get_arrow_wkb_columns(schema: "pyarrow.Schema") -> list[str]:
+    """Get the names of the WKB geometry columns in an Arrow schema."""
+    return [
+        field.name
+        for field in schema
+        if field.metadata is not None
+        and field.metadata.get(b"ARROW:extension:name") in (b"geoarrow.wkb", b"ogc.wkb")
+    ]
+
+
+def _arrow_schema_to_geodataframe(
+    schema: "pyarrow.Schema",
+) -> pd.DataFrame | gpd.GeoDataFrame:
+    """Create an empty (Geo)DataFrame with the columns of an Arrow schema."""
+    df = schema.empty_table().to_pandas()
+    wkb_columns = _get_arrow_wkb_columns(schema)
+    if len(wkb_columns) == 0:
+        return df
+
+    # Use the first geometry column as geometry + take the crs from the metadata.
+    geometrycolumn = wkb_columns[0]
+    crs = None
+    metadata = schema.field(geometrycolumn).metadata
+    extension_metadata = metadata.get(b"ARROW:extension:metadata")
+    if extension_metadata:
+        crs = json.loads(extension_metadata).get("crs")
+    geometry = gpd.GeoSeries.from_wkb(df.pop(geometrycolumn), crs=crs)
+
+    return gpd.GeoDataFrame(df, geometry=geometry.rename(geometrycolumn), crs=crs)
+
+
 def get_crs(
     path: Union[str, "os.PathLike[Any]"],
     layer: str | None = None,
@@ -2611,10 +3595,10 @@ def get_crs(
         # Get the crs
         spatialref = datasource_layer.GetSpatialRef()
         if spatialref is not None:
-            crs = pyproj.CRS(spatialref.ExportToWkt())
+            crs, epsg = _crs_from_wkt(spatialref.ExportToWkt(), min_confidence)
 
             # If spatial ref has no epsg, try to find corresponding one
-            if crs.to_epsg(min_confidence=min_confidence) is None:
+            if epsg is None:
                 crs = _crs_custom_match(crs, path)
 
     except ValueError:
@@ -2628,6 +3612,27 @@ def get_crs(
     return crs
 
 
+@functools.lru_cache(maxsize=256)
+def _crs_from_wkt(wkt: str, min_confidence: int = 70) -> tuple[pyproj.CRS, int | None]:
+    """Create a crs from a WKT string and determine its epsg code.
+
+    Both can be slow, especially if no epsg code can be found for the crs, so the
+    result is cached per WKT string.
+
+    Args:
+        wkt (str): the WKT string of the crs.
+        min_confidence (int, optional): a value between 0-100 where 100 is the most
+            confident. It is used to match the crs to a crs defined by EPSG.
+            Defaults to 70.
+
+    Returns:
+        tuple[pyproj.CRS, int | None]: the crs and its epsg code, or None if no epsg
+            code was found.
+    """
+    crs = pyproj.CRS(wkt)
+    return crs, crs.to_epsg(min_confidence=min_confidence)
+
+
 def _crs_custom_match(
     crs: pyproj.CRS, path_to_fix: Union[str, "os.PathLike[Any]", None]
 ) -> pyproj.CRS:
@@ -3033,6 +4038,7 @@ def copy_layer(
     options: dict | None = None,
     append: bool = False,
     force: bool = False,
+    nb_parallel: int = 1,
 ) -> None:
     """Copy a layer from a source to a destination dataset.
 
@@ -3164,6 +4170,14 @@ def copy_layer(
         force (bool, optional): True to overwrite the output file/layer (depending on
             `write_mode`) if it already exists. False to just return if the output
             file/layer exists. Defaults to False.
+        nb_parallel (int, optional): the number of parallel workers to use to copy
+            the layer. If != 1, ranges of rows are copied concurrently to partial files
+            that are appended to the destination afterwards, in order. This is only
+            applied for local Geopackage, Spatialite and shapefile sources without
+            `sql_stmt`, otherwise the layer is copied in one go. If -1, all available
+            CPUs are used. Defaults to 1.
+
+            .. versionadded:: 0.12.0
 
     .. |spatialite_reference_link| raw:: html
 
@@ -3266,6 +4280,32 @@ def copy_layer(
                 f"Failed to copy data directly in sqlite, retry with gdal: {ex}"
             )
 
+    # If asked, copy ranges of rows concurrently to partial files and merge them.
+    if (
+        nb_parallel != 1
+        and sql_stmt is None
+        and _copy_layer_parallel(
+            src=src,
+            dst=dst,
+            src_layer=src_layername,
+            dst_layer=dst_layer,
+            write_mode=write_mode,
+            src_crs=src_crs,
+            dst_crs=dst_crs,
+            columns=columns,
+            where=where,
+            reproject=reproject,
+            explodecollections=explodecollections,
+            force_output_geometrytype=force_output_geometrytype,
+            create_spatial_index=create_spatial_index,
+            preserve_fid=preserve_fid,
+            dst_dimensions=dst_dimensions,
+            options=options,
+            nb_parallel=nb_parallel,
+        )
+    ):
+        return
+
     options = _ogr_util._prepare_gdal_options(options)
     if (
         create_spatial_index is not None
@@ -3340,6 +4380,140 @@ def copy_layer(
     _ogr_util.vector_translate_by_info(info=translate_info)
 
 
+def _copy_layer_parallel(
+    src: Union[str, "os.PathLike[Any]"],
+    dst: Union[str, "os.PathLike[Any]"],
+    src_layer: str | None,
+    dst_layer: str,
+    write_mode: Literal["create", "add_layer", "append", "append_add_fields"],
+    src_crs: str | int | None,
+    dst_crs: str | int | None,
+    columns: Iterable[str] | None,
+    where: str | None,
+    reproject: bool,
+    explodecollections: bool,
+    force_output_geometrytype: GeometryType | str | None,
+    create_spatial_index: bool | None,
+    preserve_fid: bool | None,
+    dst_dimensions: str | None,
+    options: dict,
+    nb_parallel: int,
+) -> bool:
+    """Copy a layer by copying ranges of rows concurrently.
+
+    The ranges are copied, including all transformations asked, to partial Geopackage
+    files in worker processes. The partial files are appended to the destination in
+    the order of the ranges, so the row order and, if asked, the fids are preserved.
+
+    For Geopackage and Spatialite files the ranges are determined on the rowid, for
+    shapefiles on the fid. Other file types are not supported.
+
+    Returns:
+        bool: True if the layer was copied, False if it cannot be copied in parallel.
+    """
+    # Only local files
+    if not Path(src).exists() or str(dst).startswith("/vsi"):
+        return False
+
+    src_info = _geofileinfo.get_geofileinfo(src)
+    if not src_info.is_spatialite_based and src_info.driver != "ESRI Shapefile":
+        return False
+
+    layerinfo = get_layerinfo(src, src_layer, raise_on_nogeom=False)
+    nb_parallel = ConfigOptions.get_nb_parallel(nb_parallel)
+    nb_batches = min(nb_parallel, math.ceil(layerinfo.featurecount / 10_000))
+    if nb_batches <= 1:
+        return False
+
+    # Determine the filters for the batches
+    batch_wheres: list[str] = []
+    if src_info.is_spatialite_based:
+        batch_info_df = _determine_rowid_batches(
+            path=src,
+            layer=layerinfo.name,
+            nb_rows=layerinfo.featurecount,
+            nb_batches=nb_batches,
+        )
+        start_ids = batch_info_df["start_id"].tolist()
+        id_column = "rowid"
+    else:
+        # The fids of a shapefile are a contiguous range starting from 0
+        nb_rows_per_batch = math.ceil(layerinfo.featurecount / nb_batches)
+        start_ids = list(range(0, layerinfo.featurecount, nb_rows_per_batch))
+        id_column = "FID"
+    for start_id, next_start_id in zip(start_ids, [*start_ids[1:], None], strict=True):
+        batch_where = f"{id_column} >= {int(start_id)}"
+        if next_start_id is not None:
+            batch_where += f" AND {id_column} < {int(next_start_id)}"
+        if where is not None:
+            batch_where = f"({batch_where}) AND ({where})"
+        batch_wheres.append(batch_where)
+
+    # The input options are used to read the source, the other ones to write the
+    # destination.
+    input_options = {}
+    output_options = {}
+    for name, value in options.items():
+        if name.upper().startswith(("INPUT_OPEN.", "CONFIG.")):
+            input_options[name] = value
+        if not name.upper().startswith("INPUT_OPEN."):
+            output_options[name] = value
+
+    worker_type = _general_helper.worker_type_to_use(layerinfo.featurecount)
+    logger.info(f"Start copy_layer in {nb_batches} {worker_type} batches: {src}")
+    with (
+        _general_helper.create_gfo_tmp_dir("copy_layer") as tmp_dir,
+        _processing_util.PooledExecutorFactory(
+            worker_type=worker_type,
+            max_workers=nb_batches,
+            initializer=_processing_util.initialize_worker,
+            initargs=(worker_type,),
+        ) as pool,
+    ):
+        # Copy the batches to partial files
+        batch_futures = []
+        for batch_id, batch_where in enumerate(batch_wheres):
+            future = pool.submit(
+                copy_layer,
+                src=src,
+                dst=tmp_dir / f"partial_{batch_id}.gpkg",
+                src_layer=layerinfo.name,
+                dst_layer=dst_layer,
+                src_crs=src_crs,
+                dst_crs=dst_crs,
+                columns=columns,
+                where=batch_where,
+                reproject=reproject,
+                explodecollections=explodecollections,
+                force_output_geometrytype=force_output_geometrytype,
+                create_spatial_index=False,
+                preserve_fid=preserve_fid,
+                dst_dimensions=dst_dimensions,
+                options=input_options,
+            )
+            batch_futures.append(future)
+
+        # Append the partial files to the destination in order, as soon as they are
+        # ready.
+        for batch_id, future in enumerate(batch_futures):
+            future.result()
+            partial_path = tmp_dir / f"partial_{batch_id}.gpkg"
+            copy_layer(
+                src=partial_path,
+                dst=dst,
+                src_layer=dst_layer,
+                dst_layer=dst_layer,
+                write_mode=write_mode if batch_id == 0 else "append",
+                create_spatial_index=create_spatial_index,
+                preserve_fid=preserve_fid,
+                options=output_options,
+                force=True,
+            )
+            remove(partial_path)
+
+    return True
+
+
 def zip_geofile(
     input_path: Union[str, "os.PathLike[Any]"],
     output_path: Union[str, "os.PathLike[Any]"],
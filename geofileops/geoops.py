@@ -1,25 +1,53 @@
-"""Module exposing all supported operations on geometries in geofiles."""
+"""Module exposing all supported operations on geometries in geofiles.
 
+The input layers of the operations can also be passed as (Geo)DataFrame or pyarrow
+Table. If the ``output_path`` of an operation is None, the result is returned as
+GeoDataFrame instead of being written to a file.
+"""
+
+import functools
+import inspect
 import logging
 import logging.config
+import queue
+import threading
 import warnings
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from concurrent import futures
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Literal, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Literal,
+    ParamSpec,
+    Protocol,
+    TypeVar,
+    Union,
+    cast,
+    overload,
+)
 
+import geopandas as gpd
+import pandas as pd
+import psutil
+import shapely
 from pygeoops import GeometryType
 
 from geofileops import fileops
 from geofileops.geoops_sql import _union_full
 from geofileops.helpers import _general_helper
+from geofileops.helpers._options import ConfigOptions
 from geofileops.util import (
+    _cache_util,
     _geofileinfo,
     _geoops_gpd,
     _geoops_ogr,
     _geoops_sql,
     _io_util,
+    _processing_util,
     _sqlite_util,
+    _workqueue_util,
 )
 from geofileops.util._geometry_util import (
     BufferEndCapStyle,
@@ -27,15 +55,156 @@ from geofileops.util._geometry_util import (
     SimplifyAlgorithm,
 )
 from geofileops.util._geopath_util import GeoPath
+from geofileops.util._pipeline import Pipeline
 
 if TYPE_CHECKING:  # pragma: no cover
     import os
 
+    import pyarrow
+
 logger = logging.getLogger(__name__)
 
+_IN_MEMORY_INPUT_PARAMS = (
+    "input_path",
+    "input1_path",
+    "input2_path",
+    "input_to_select_from_path",
+    "input_to_compare_with_path",
+    "clip_path",
+    "erase_path",
+)
+_SHM_DIR = Path("/dev/shm")
+
+
+_P = ParamSpec("_P")
+_R_co = TypeVar("_R_co", covariant=True)
+
+
+class _InMemoryOperation(Protocol[_P, _R_co]):
+    """An operation decorated with :func:`_in_memory_io`.
+
+    Called with files, the operation has the signature it is declared with. Called
+    with in-memory data, e.g. with ``output_path`` None, the result can also be a
+    GeoDataFrame.
+    """
+
+    @overload
+    def __call__(self, *args: _P.args, **kwargs: _P.kwargs) -> _R_co: ...
+
+    @overload
+    def __call__(self, *args: object, **kwargs: object) -> _R_co | gpd.GeoDataFrame: ...
 
+
+def _estimate_file_size(data: pd.DataFrame) -> int:
+    """Estimate the size of the data when written to a file, in bytes.
+
+    ``memory_usage`` only counts a pointer per geometry, so the size of the geometry
+    columns is estimated from their number of coordinates.
+    """
+    size = 0
+    for column in data.columns:
+        if data[column].dtype == "geometry":
+            geoms = data[column].to_numpy()
+            dims = 3 if shapely.has_z(geoms).any() else 2
+            nb_coords = int(shapely.get_num_coordinates(geoms).sum())
+            # Add some bytes per row for the headers of the geometry and the index
+            size += nb_coords * dims * 8 + 100 * len(geoms)
+        else:
+            size += int(data[column].memory_usage(deep=True, index=False))
+
+    return size
+
+
+def _in_memory_io(func: Callable[_P, _R_co]) -> _InMemoryOperation[_P, _R_co]:
+    """Let an operation accept GeoDataFrames as input and return its result in memory.
+
+    Inputs passed as GeoDataFrame or pyarrow Table are written to temporary Geopackage
+    files, which are placed on the RAM-backed /dev/shm if there is enough space. If the
+    required ``output_path`` is None, the result is written to a temporary file as
+    well and returned as GeoDataFrame. Hence, the decorated function itself is always
+    called with files, which is how it is annotated.
+
+    Operations on files are run via the cache of results. The cache is only used if a
+    cache directory is set, see :func:`options.set_cache_dir`. If a checkpoint
+    directory is set, see :func:`options.set_checkpoint_dir`, they are also made
+    resumable.
+    """
+    signature = inspect.signature(func)
+    output_param = signature.parameters.get("output_path")
+    output_in_memory_supported = (
+        output_param is not None and output_param.default is inspect.Parameter.empty
+    )
+
+    @functools.wraps(func)
+    def wrapper(*args: object, **kwargs: object) -> object:
+        bound = signature.bind(*args, **kwargs)
+        in_memory_inputs = {
+            name: bound.arguments[name]
+            for name in _IN_MEMORY_INPUT_PARAMS
+            if name in bound.arguments
+            and (
+                isinstance(bound.arguments[name], pd.DataFrame)
+                or type(bound.arguments[name]).__module__.startswith("pyarrow")
+            )
+        }
+        output_in_memory = (
+            output_in_memory_supported and bound.arguments.get("output_path") is None
+        )
+        if len(in_memory_inputs) == 0 and not output_in_memory:
+            # Make the operation resumable if a checkpoint directory is set
+            checkpoint_key = None
+            if (
+                ConfigOptions.get_checkpoint_dir is not None
+                and bound.arguments.get("output_path") is not None
+            ):
+                checkpoint_key = _cache_util.checkpoint_key(
+                    func.__name__, bound.arguments
+                )
+            with _general_helper.checkpoint_scope(checkpoint_key):
+                return _cache_util.run_cached(func, bound)
+
+        # Convert arrow tables and determine the size of the data
+        for name, data in in_memory_inputs.items():
+            if not isinstance(data, pd.DataFrame):
+                in_memory_inputs[name] = gpd.GeoDataFrame.from_arrow(data)
+        size = sum(_estimate_file_size(data) for data in in_memory_inputs.values())
+
+        # Use the RAM-backed /dev/shm if available and large enough. If a work queue
+        # is used, the files should be accessible for the workers on other hosts.
+        parent_dir = None
+        if ConfigOptions.get_work_queue_dir is not None:
+            parent_dir = ConfigOptions.get_tmp_dir
+        elif _SHM_DIR.is_dir():
+            try:
+                if psutil.disk_usage(str(_SHM_DIR)).free > 4 * size:
+                    parent_dir = _SHM_DIR / "geofileops"
+                    parent_dir.mkdir(exist_ok=True)
+            except OSError:  # pragma: no cover
+                parent_dir = None
+
+        with _general_helper.create_gfo_tmp_dir(
+            f"in_memory_{func.__name__}", parent_dir=parent_dir
+        ) as tmp_dir:
+            for name, data in in_memory_inputs.items():
+                input_path = tmp_dir / f"{name}.gpkg"
+                fileops.to_file(data, input_path)
+                bound.arguments[name] = input_path
+
+            if not output_in_memory:
+                return func(*bound.args, **bound.kwargs)
+
+            output_path = tmp_dir / "output.gpkg"
+            bound.arguments["output_path"] = output_path
+            func(*bound.args, **bound.kwargs)
+
+            return fileops.read_file(output_path)
+
+    return cast("_InMemoryOperation[_P, _R_co]", wrapper)
+
+
+@_in_memory_io
 def dissolve_within_distance(
-    input_path: Union[str, "os.PathLike[Any]"],
+    input_path: Union[str, "os.PathLike[Any]", gpd.GeoDataFrame, "pyarrow.Table"],
     output_path: Union[str, "os.PathLike[Any]"],
     distance: float,
     gridsize: float,
@@ -74,8 +243,9 @@ def dissolve_within_distance(
       - Keywords: merge, dissolve, aggregate, snap, close gaps, union
 
     Args:
-        input_path (PathLike): the input file.
-        output_path (PathLike): the file to write the result to.
+        input_path (PathLike | GeoDataFrame | pyarrow.Table): the input file.
+        output_path (PathLike | None): the file to write the result to. If None, the
+            result is returned as GeoDataFrame.
         distance (float): the maximum distance between geometries to be dissolved.
         gridsize (float, optional): the size of the grid the coordinates of the ouput
             will be rounded to. Eg. 0.001 to keep 3 decimals. Value 0.0 doesn't change
@@ -101,6 +271,9 @@ def dissolve_within_distance(
         force (bool, optional): overwrite existing output file(s).
             Defaults to False.
 
+    Returns:
+        gpd.GeoDataFrame | None: the result if ``output_path`` is None, otherwise None.
+
     See Also:
         * :func:`dissolve`: dissolve the input layer
 
@@ -108,7 +281,7 @@ def dissolve_within_distance(
     input_path = Path(input_path)
     output_path = Path(output_path)
     if _io_util.output_exists(path=output_path, remove_if_exists=force):
-        return
+        return None
 
     start_time = datetime.now()
     operation_name = "dissolve_within_distance"
@@ -396,8 +569,9 @@ def dissolve_within_distance(
     logger.info(f"Ready, took {datetime.now() - start_time}")
 
 
+@_in_memory_io
 def apply(
-    input_path: Union[str, "os.PathLike[Any]"],
+    input_path: Union[str, "os.PathLike[Any]", gpd.GeoDataFrame, "pyarrow.Table"],
     output_path: Union[str, "os.PathLike[Any]"],
     func: Callable[[Any], Any],
     only_geom_input: bool = True,
@@ -424,8 +598,9 @@ def apply(
     the fid will be preserved. In other cases this will typically not be the case.
 
     Args:
-        input_path (PathLike): the input file
-        output_path (PathLike): the file to write the result to
+        input_path (PathLike | GeoDataFrame | pyarrow.Table): the input file
+        output_path (PathLike | None): the file to write the result to. If None, the
+            result is returned as GeoDataFrame.
         func (Callable): lambda function to apply to the geometry column.
         only_geom_input (bool, optional): If True, only the geometry
             column is available. If False, the entire row is input.
@@ -462,6 +637,9 @@ def apply(
         force (bool, optional): overwrite existing output file(s).
             Defaults to False.
 
+    Returns:
+        gpd.GeoDataFrame | None: the result if ``output_path`` is None, otherwise None.
+
     See Also:
         * :func:`apply_vectorized`: apply a vectorized python function on the geometry
           column
@@ -502,7 +680,7 @@ def apply(
     logger = logging.getLogger("geofileops.apply")
     logger.info(f"Start on {input_path}")
 
-    return _geoops_gpd.apply(
+    _geoops_gpd.apply(
         input_path=Path(input_path),
         output_path=Path(output_path),
         func=func,
@@ -521,8 +699,9 @@ def apply(
     )
 
 
+@_in_memory_io
 def apply_vectorized(
-    input_path: Union[str, "os.PathLike[Any]"],
+    input_path: Union[str, "os.PathLike[Any]", gpd.GeoDataFrame, "pyarrow.Table"],
     output_path: Union[str, "os.PathLike[Any]"],
     func: Callable[[Any], Any],
     input_layer: str | None = None,
@@ -550,8 +729,9 @@ def apply_vectorized(
     .. versionadded:: 0.10.0
 
     Args:
-        input_path (PathLike): the input file
-        output_path (PathLike): the file to write the result to
+        input_path (PathLike | GeoDataFrame | pyarrow.Table): the input file
+        output_path (PathLike | None): the file to write the result to. If None, the
+            result is returned as GeoDataFrame.
         func (Callable): vectorized lambda function to apply to the geometry column.
             Vectorized means here that the function should accept a shapely geometry
             array as input and will return a shapely geometry for each item in the input
@@ -588,6 +768,9 @@ def apply_vectorized(
         force (bool, optional): overwrite existing output file(s).
             Defaults to False.
 
+    Returns:
+        gpd.GeoDataFrame | None: the result if ``output_path`` is None, otherwise None.
+
     See Also:
         * :func:`apply`: apply a python function on the geometry column
 
@@ -613,7 +796,7 @@ def apply_vectorized(
     logger = logging.getLogger("geofileops.apply_vectorized")
     logger.info(f"Start on {input_path}")
 
-    return _geoops_gpd.apply_vectorized(
+    _geoops_gpd.apply_vectorized(
         input_path=Path(input_path),
         output_path=Path(output_path),
         operation_name=None,
@@ -634,8 +817,123 @@ def apply_vectorized(
     )
 
 
+@_in_memory_io
+def apply_operations(
+    input_path: Union[str, "os.PathLike[Any]", gpd.GeoDataFrame, "pyarrow.Table"],
+    operations: list[tuple[str, Union[str, "os.PathLike[Any]"], dict[str, Any]]],
+    input_layer: str | None = None,
+    columns: list[str] | None = None,
+    explodecollections: bool = False,
+    gridsize: float = 0.0,
+    keep_empty_geoms: bool = False,
+    where_post: str | None = None,
+    nb_parallel: int | None = None,
+    batchsize: int = -1,
+    force: bool = False,
+) -> None:
+    """Applies multiple single layer operations on the input file in one pass.
+
+    Each batch of the input file is read only once and all operations are applied on
+    it, each writing to its own output file. This is faster than calling the
+    operations one by one, as reading the input and starting the workers is shared.
+
+    The operations are specified as a list of tuples of the form
+    ``(operation, output_path, params)``. The supported operations and their
+    ``params`` are:
+
+        - "buffer": ``distance``, ``quadrantsegments``, ``endcap_style``,
+          ``join_style``, ``mitre_limit``, ``single_sided``
+        - "convexhull": no parameters
+        - "simplify": ``tolerance``, ``algorithm``, ``lookahead``
+        - "makevalid": ``force_output_geometrytype``
+        - "apply": ``func``, ``only_geom_input``, ``force_output_geometrytype``
+        - "apply_vectorized": ``func``, ``force_output_geometrytype``
+
+    The parameters have the same meaning and defaults as in the corresponding
+    functions, e.g. :func:`buffer`. For each operation, ``output_layer`` can be
+    specified in the ``params`` as well.
+
+    Output files that already exist are skipped, unless ``force`` is True.
+
+    Remark: all operations are calculated using geopandas, so e.g. for "buffer" the
+    results can differ slightly from :func:`buffer` with the default options, which
+    uses spatialite.
+
+    Args:
+        input_path (PathLike | GeoDataFrame | pyarrow.Table): the input file
+        operations (List[Tuple[str, PathLike, dict]]): the operations to apply, with
+            the output file to write each result to.
+        input_layer (str, optional): input layer name. If None, ``input_path`` should
+            contain only one layer. Defaults to None.
+        columns (List[str], optional): list of columns to retain. If None, all standard
+            columns are retained. In addition to standard columns, it is also possible
+            to specify "fid", a unique index available in all input files. Note that the
+            "fid" will be aliased eg. to "fid_1". Defaults to None.
+        explodecollections (bool, optional): True to output only simple geometries.
+            Defaults to False.
+        gridsize (float, optional): the size of the grid the coordinates of the ouput
+            will be rounded to. Eg. 0.001 to keep 3 decimals. Value 0.0 doesn't change
+            the precision. Defaults to 0.0.
+        keep_empty_geoms (bool, optional): True to keep rows with empty/null geometries
+            in the output. Defaults to False.
+        where_post (str, optional): SQL filter to apply on all outputs after all other
+            processing, including e.g. ``explodecollections``. It should be in sqlite
+            syntax and |spatialite_reference_link| functions can be used.
+            Defaults to None.
+        nb_parallel (int | None, optional): the number of parallel workers to use.
+            If None, the preference set in the nb_parallel configuration option is used,
+            which defaults to the number of CPU cores available. For more information,
+            see :func:`options.set_nb_parallel`. Defaults to None.
+        batchsize (int, optional): indicative number of rows to process per
+            batch. A smaller batch size, possibly in combination with a
+            smaller ``nb_parallel``, will reduce the memory usage.
+            Defaults to -1: (try to) determine optimal size automatically.
+        force (bool, optional): overwrite existing output file(s).
+            Defaults to False.
+
+    Examples:
+        Buffer a file with several distances and calculate its convex hull:
+
+        .. code-block:: python
+
+            gfo.apply_operations(
+                input_path="parcels.gpkg",
+                operations=[
+                    ("buffer", "parcels_buf5.gpkg", {"distance": 5}),
+                    ("buffer", "parcels_buf10.gpkg", {"distance": 10}),
+                    ("convexhull", "parcels_hull.gpkg", {}),
+                ],
+            )
+
+    .. |spatialite_reference_link| raw:: html
+
+        <a href="https://www.gaia-gis.it/gaia-sins/spatialite-sql-latest.html" target="_blank">spatialite reference</a>
+
+    """  # noqa: E501
+    logger = logging.getLogger("geofileops.apply_operations")
+    logger.info(f"Start, on {input_path} ({len(operations)} operations)")
+
+    return _geoops_gpd.apply_operations(
+        input_path=Path(input_path),
+        operations=[
+            (operation, Path(output_path), params)
+            for operation, output_path, params in operations
+        ],
+        input_layer=input_layer,
+        columns=columns,
+        explodecollections=explodecollections,
+        gridsize=gridsize,
+        keep_empty_geoms=keep_empty_geoms,
+        where_post=where_post,
+        nb_parallel=nb_parallel,
+        batchsize=batchsize,
+        force=force,
+    )
+
+
+@_in_memory_io
 def buffer(
-    input_path: Union[str, "os.PathLike[Any]"],
+    input_path: Union[str, "os.PathLike[Any]", gpd.GeoDataFrame, "pyarrow.Table"],
     output_path: Union[str, "os.PathLike[Any]"],
     distance: float,
     quadrantsegments: int = 5,
@@ -662,8 +960,9 @@ def buffer(
     the fid will be preserved. In other cases this will typically not be the case.
 
     Args:
-        input_path (PathLike): the input file
-        output_path (PathLike): the file to write the result to
+        input_path (PathLike | GeoDataFrame | pyarrow.Table): the input file
+        output_path (PathLike | None): the file to write the result to. If None, the
+            result is returned as GeoDataFrame.
         distance (float): the buffer size to apply. In projected coordinate
             systems this is typically in meter, in geodetic systems this is
             typically in degrees.
@@ -719,6 +1018,9 @@ def buffer(
         force (bool, optional): overwrite existing output file(s).
             Defaults to False.
 
+    Returns:
+        gpd.GeoDataFrame | None: the result if ``output_path`` is None, otherwise None.
+
     Notes:
         Using the different buffer style option parameters you can control how the
         buffer is created:
@@ -814,7 +1116,7 @@ def buffer(
         and single_sided is False
     ):
         # If default buffer options for spatialite, use the faster SQL version
-        return _geoops_sql.buffer(
+        _geoops_sql.buffer(
             input_path=Path(input_path),
             output_path=Path(output_path),
             distance=distance,
@@ -832,7 +1134,7 @@ def buffer(
         )
     else:
         # If special buffer options, use geopandas version
-        return _geoops_gpd.buffer(
+        _geoops_gpd.buffer(
             input_path=Path(input_path),
             output_path=Path(output_path),
             distance=distance,
@@ -854,8 +1156,9 @@ def buffer(
         )
 
 
+@_in_memory_io
 def clip_by_geometry(
-    input_path: Union[str, "os.PathLike[Any]"],
+    input_path: Union[str, "os.PathLike[Any]", gpd.GeoDataFrame, "pyarrow.Table"],
     output_path: Union[str, "os.PathLike[Any]"],
     clip_geometry: tuple[float, float, float, float] | str,
     input_layer: str | None = None,
@@ -870,8 +1173,9 @@ def clip_by_geometry(
     the fid will be preserved. In other cases this will typically not be the case.
 
     Args:
-        input_path (PathLike): the input file
-        output_path (PathLike): the file to write the result to
+        input_path (PathLike | GeoDataFrame | pyarrow.Table): the input file
+        output_path (PathLike | None): the file to write the result to. If None, the
+            result is returned as GeoDataFrame.
         clip_geometry (Union[Tuple[float, float, float, float], str]): the bounds
             or WKT geometry to clip with.
         input_layer (str, optional): input layer name. If None, ``input_path`` should
@@ -887,13 +1191,16 @@ def clip_by_geometry(
         force (bool, optional): overwrite existing output file(s).
             Defaults to False.
 
+    Returns:
+        gpd.GeoDataFrame | None: the result if ``output_path`` is None, otherwise None.
+
     See Also:
         * :func:`clip`: clip geometries by the features in another layer
 
     """
     logger = logging.getLogger("geofileops.clip_by_geometry")
     logger.info(f"Start, on {input_path}")
-    return _geoops_ogr.clip_by_geometry(
+    _geoops_ogr.clip_by_geometry(
         input_path=Path(input_path),
         output_path=Path(output_path),
         clip_geometry=clip_geometry,
@@ -905,8 +1212,9 @@ def clip_by_geometry(
     )
 
 
+@_in_memory_io
 def convexhull(
-    input_path: Union[str, "os.PathLike[Any]"],
+    input_path: Union[str, "os.PathLike[Any]", gpd.GeoDataFrame, "pyarrow.Table"],
     output_path: Union[str, "os.PathLike[Any]"],
     input_layer: str | None = None,
     output_layer: str | None = None,
@@ -927,8 +1235,9 @@ def convexhull(
     the fid will be preserved. In other cases this will typically not be the case.
 
     Args:
-        input_path (PathLike): the input file
-        output_path (PathLike): the file to write the result to
+        input_path (PathLike | GeoDataFrame | pyarrow.Table): the input file
+        output_path (PathLike | None): the file to write the result to. If None, the
+            result is returned as GeoDataFrame.
         input_layer (str, optional): input layer name. If None, ``input_path`` should
             contain only one layer. Defaults to None.
         output_layer (str, optional): output layer name. If None, the ``output_path``
@@ -958,6 +1267,9 @@ def convexhull(
         force (bool, optional): overwrite existing output file(s).
             Defaults to False.
 
+    Returns:
+        gpd.GeoDataFrame | None: the result if ``output_path`` is None, otherwise None.
+
     .. |spatialite_reference_link| raw:: html
 
         <a href="https://www.gaia-gis.it/gaia-sins/spatialite-sql-latest.html" target="_blank">spatialite reference</a>
@@ -966,7 +1278,7 @@ def convexhull(
     logger = logging.getLogger("geofileops.convexhull")
     logger.info(f"Start, on {input_path}")
 
-    return _geoops_sql.convexhull(
+    _geoops_sql.convexhull(
         input_path=Path(input_path),
         output_path=Path(output_path),
         input_layer=input_layer,
@@ -982,8 +1294,9 @@ def convexhull(
     )
 
 
+@_in_memory_io
 def delete_duplicate_geometries(
-    input_path: Union[str, "os.PathLike[Any]"],
+    input_path: Union[str, "os.PathLike[Any]", gpd.GeoDataFrame, "pyarrow.Table"],
     output_path: Union[str, "os.PathLike[Any]"],
     input_layer: str | None = None,
     output_layer: str | None = None,
@@ -1013,8 +1326,9 @@ def delete_duplicate_geometries(
     the fid will be preserved. In other cases this will typically not be the case.
 
     Args:
-        input_path (PathLike): the input file
-        output_path (PathLike): the file to write the result to
+        input_path (PathLike | GeoDataFrame | pyarrow.Table): the input file
+        output_path (PathLike | None): the file to write the result to. If None, the
+            result is returned as GeoDataFrame.
         input_layer (str, optional): input layer name. If None, ``input_path`` should
             contain only one layer. Defaults to None.
         output_layer (str, optional): output layer name. If None, the ``output_path``
@@ -1045,6 +1359,9 @@ def delete_duplicate_geometries(
         force (bool, optional): overwrite existing output file(s).
             Defaults to False.
 
+    Returns:
+        gpd.GeoDataFrame | None: the result if ``output_path`` is None, otherwise None.
+
     .. |spatialite_reference_link| raw:: html
 
         <a href="https://www.gaia-gis.it/gaia-sins/spatialite-sql-latest.html" target="_blank">spatialite reference</a>
@@ -1053,7 +1370,7 @@ def delete_duplicate_geometries(
     logger = logging.getLogger("geofileops.delete_duplicate_geometries")
     logger.info(f"Start, on {input_path}")
 
-    return _geoops_sql.delete_duplicate_geometries(
+    _geoops_sql.delete_duplicate_geometries(
         input_path=Path(input_path),
         output_path=Path(output_path),
         input_layer=input_layer,
@@ -1071,8 +1388,9 @@ def delete_duplicate_geometries(
     )
 
 
+@_in_memory_io
 def dissolve(
-    input_path: Union[str, "os.PathLike[Any]"],
+    input_path: Union[str, "os.PathLike[Any]", gpd.GeoDataFrame, "pyarrow.Table"],
     output_path: Union[str, "os.PathLike[Any]"],
     explodecollections: bool,
     groupby_columns: list[str] | str | None = None,
@@ -1153,8 +1471,9 @@ def dissolve(
     never crossed.
 
     Args:
-        input_path (PathLike): the input file
-        output_path (PathLike): the file to write the result to
+        input_path (PathLike | GeoDataFrame | pyarrow.Table): the input file
+        output_path (PathLike | None): the file to write the result to. If None, the
+            result is returned as GeoDataFrame.
         explodecollections (bool): True to output only simple geometries. If
             False, this can result in huge geometries for large files,
             especially if no ``groupby_columns`` are specified.
@@ -1225,6 +1544,9 @@ def dissolve(
         force (bool, optional): overwrite existing output file(s).
             Defaults to False.
 
+    Returns:
+        gpd.GeoDataFrame | None: the result if ``output_path`` is None, otherwise None.
+
     See Also:
         * :func:`dissolve_within_distance`: dissolve all feature within the distance
           specified of each other
@@ -1241,7 +1563,7 @@ def dissolve(
 
     logger = logging.getLogger("geofileops.dissolve")
     logger.info(f"Start, on {input_path} to {output_path}")
-    return _geoops_gpd.dissolve(
+    _geoops_gpd.dissolve(
         input_path=Path(input_path),
         output_path=Path(output_path),
         explodecollections=explodecollections,
@@ -1259,8 +1581,9 @@ def dissolve(
     )
 
 
+@_in_memory_io
 def export_by_bounds(
-    input_path: Union[str, "os.PathLike[Any]"],
+    input_path: Union[str, "os.PathLike[Any]", gpd.GeoDataFrame, "pyarrow.Table"],
     output_path: Union[str, "os.PathLike[Any]"],
     bounds: tuple[float, float, float, float],
     input_layer: str | None = None,
@@ -1275,8 +1598,9 @@ def export_by_bounds(
     the fid will be preserved. In other cases this will typically not be the case.
 
     Args:
-        input_path (PathLike): the input file
-        output_path (PathLike): the file to write the result to
+        input_path (PathLike | GeoDataFrame | pyarrow.Table): the input file
+        output_path (PathLike | None): the file to write the result to. If None, the
+            result is returned as GeoDataFrame.
         bounds (Tuple[float, float, float, float]): the bounds to filter on.
         input_layer (str, optional): input layer name. If None, ``input_path`` should
             contain only one layer. Defaults to None.
@@ -1291,6 +1615,9 @@ def export_by_bounds(
         force (bool, optional): overwrite existing output file(s).
             Defaults to False.
 
+    Returns:
+        gpd.GeoDataFrame | None: the result if ``output_path`` is None, otherwise None.
+
     See Also:
         * :func:`export_by_distance`: export features that are within a certain distance
           of features of another layer
@@ -1300,7 +1627,7 @@ def export_by_bounds(
     """
     logger = logging.getLogger("geofileops.export_by_bounds")
     logger.info(f"Start, on {input_path}")
-    return _geoops_ogr.export_by_bounds(
+    _geoops_ogr.export_by_bounds(
         input_path=Path(input_path),
         output_path=Path(output_path),
         bounds=bounds,
@@ -1312,8 +1639,9 @@ def export_by_bounds(
     )
 
 
+@_in_memory_io
 def isvalid(
-    input_path: Union[str, "os.PathLike[Any]"],
+    input_path: Union[str, "os.PathLike[Any]", gpd.GeoDataFrame, "pyarrow.Table"],
     output_path: Union[str, "os.PathLike[Any]", None] = None,
     only_invalid: bool = True,  # noqa: ARG001
     input_layer: str | None = None,
@@ -1333,7 +1661,7 @@ def isvalid(
     the fid will be preserved. In other cases this will typically not be the case.
 
     Args:
-        input_path (PathLike): The input file.
+        input_path (PathLike | GeoDataFrame | pyarrow.Table): The input file.
         output_path (PathLike, optional): The output file path. If not
             specified the result will be written in a new file alongside the
             input file. Defaults to None.
@@ -1394,8 +1722,9 @@ def isvalid(
     )
 
 
+@_in_memory_io
 def makevalid(
-    input_path: Union[str, "os.PathLike[Any]"],
+    input_path: Union[str, "os.PathLike[Any]", gpd.GeoDataFrame, "pyarrow.Table"],
     output_path: Union[str, "os.PathLike[Any]"],
     input_layer: str | None = None,
     output_layer: str | None = None,
@@ -1424,8 +1753,9 @@ def makevalid(
     the fid will be preserved. In other cases this will typically not be the case.
 
     Args:
-        input_path (PathLike): The input file.
-        output_path (PathLike): The file to write the result to.
+        input_path (PathLike | GeoDataFrame | pyarrow.Table): The input file.
+        output_path (PathLike | None): The file to write the result to. If None, the
+            result is returned as GeoDataFrame.
         input_layer (str, optional): input layer name. If None, ``input_path`` should
             contain only one layer. Defaults to None.
         output_layer (str, optional): output layer name. If None, the ``output_path``
@@ -1462,6 +1792,9 @@ def makevalid(
         force (bool, optional): overwrite existing output file(s).
             Defaults to False.
 
+    Returns:
+        gpd.GeoDataFrame | None: the result if ``output_path`` is None, otherwise None.
+
     See Also:
         * :func:`isvalid`: check if the geometries in the input layer are valid
 
@@ -1533,8 +1866,9 @@ def makevalid(
             _sqlite_util.test_data_integrity(path=input_path)
 
 
+@_in_memory_io
 def warp(
-    input_path: Union[str, "os.PathLike[Any]"],
+    input_path: Union[str, "os.PathLike[Any]", gpd.GeoDataFrame, "pyarrow.Table"],
     output_path: Union[str, "os.PathLike[Any]"],
     gcps: list[tuple[float, float, float, float, float | None]],
     algorithm: str = "polynomial",
@@ -1552,8 +1886,9 @@ def warp(
         - rubbersheet, rubbersheeting
 
     Args:
-        input_path (PathLike): The input file.
-        output_path (PathLike): The file to write the result to.
+        input_path (PathLike | GeoDataFrame | pyarrow.Table): The input file.
+        output_path (PathLike | None): The file to write the result to. If None, the
+            result is returned as GeoDataFrame.
         gcps (List[Tuple[float, float, float, float]]): ground control points to
             use to warp the input geometries. This is a list of tuples like this:
             [(x_orig, y_orig, x_dest, y_dest, elevation), ...].
@@ -1575,6 +1910,10 @@ def warp(
             Defaults to False.
         force (bool, optional): overwrite existing output file(s).
             Defaults to False.
+
+    Returns:
+        gpd.GeoDataFrame | None: the result if ``output_path`` is None, otherwise None.
+
     """
     logger = logging.getLogger("geofileops.warp")
     logger.info(f"Start, on {input_path}")
@@ -1592,8 +1931,58 @@ def warp(
     )
 
 
-def select(
+def pipeline(
     input_path: Union[str, "os.PathLike[Any]"],
+    input_layer: str | None = None,
+    columns: list[str] | None = None,
+) -> Pipeline:
+    """Start a lazy pipeline of operations on the input file.
+
+    Operations can be added to the returned :class:`Pipeline` by chaining them. They
+    are only executed when :meth:`Pipeline.run` is called.
+
+    Consecutive operations that only need the geometry of one row at a time, e.g.
+    ``makevalid``, ``buffer``, ``simplify``, ``convexhull``, ``apply`` and
+    ``apply_vectorized``, are fused: each batch of rows is read once, all these
+    operations are applied on it and the result is written once. Intermediate files
+    are only written before operations that need a view on all rows: ``clip``,
+    ``difference`` and ``dissolve``. This avoids writing, indexing and finalizing an
+    intermediate file after every step.
+
+    Args:
+        input_path (PathLike): the input file
+        input_layer (str, optional): input layer name. If None, ``input_path`` should
+            contain only one layer. Defaults to None.
+        columns (List[str], optional): list of columns to retain. If None, all standard
+            columns are retained. In addition to standard columns, it is also possible
+            to specify "fid", a unique index available in all input files. Note that the
+            "fid" will be aliased eg. to "fid_1". Defaults to None.
+
+    Returns:
+        Pipeline: the pipeline, without operations yet.
+
+    Examples:
+        Make the input valid, buffer it, clip it with a mask and dissolve the result.
+        Only one intermediate file is written: before the clip.
+
+        .. code-block:: python
+
+            (
+                gfo.pipeline("parcels.gpkg")
+                .makevalid()
+                .buffer(5)
+                .clip("mask.gpkg")
+                .dissolve(explodecollections=True)
+                .run("parcels_dissolved.gpkg")
+            )
+
+    """
+    return Pipeline(input_path=input_path, input_layer=input_layer, columns=columns)
+
+
+@_in_memory_io
+def select(
+    input_path: Union[str, "os.PathLike[Any]", gpd.GeoDataFrame, "pyarrow.Table"],
     output_path: Union[str, "os.PathLike[Any]"],
     sql_stmt: str,
     sql_dialect: Literal["SQLITE", "OGRSQL"] | None = "SQLITE",
@@ -1616,8 +2005,9 @@ def select(
     The result is written to the output file specified.
 
     Args:
-        input_path (PathLike): the input file
-        output_path (PathLike): the file to write the result to
+        input_path (PathLike | GeoDataFrame | pyarrow.Table): the input file
+        output_path (PathLike | None): the file to write the result to. If None, the
+            result is returned as GeoDataFrame.
         sql_stmt (str): the SELECT SQL statement to execute
         sql_dialect (str, optional): the SQL dialect to use. If None, the default SQL
             dialect of the underlying source is used. Defaults to "SQLITE".
@@ -1654,6 +2044,9 @@ def select(
             Defaults to -1: (try to) determine optimal size automatically.
         force (bool, optional): overwrite existing output file(s). Defaults to False.
 
+    Returns:
+        gpd.GeoDataFrame | None: the result if ``output_path`` is None, otherwise None.
+
     See Also:
         * :func:`select_two_layers`: select features using two input layers based on a
           SQL query
@@ -1741,7 +2134,7 @@ def select(
     if force_output_geometrytype is not None:
         force_output_geometrytype = GeometryType(force_output_geometrytype)
 
-    return _geoops_sql.select(
+    _geoops_sql.select(
         input_path=Path(input_path),
         output_path=Path(output_path),
         sql_stmt=sql_stmt,
@@ -1759,8 +2152,9 @@ def select(
     )
 
 
+@_in_memory_io
 def simplify(
-    input_path: Union[str, "os.PathLike[Any]"],
+    input_path: Union[str, "os.PathLike[Any]", gpd.GeoDataFrame, "pyarrow.Table"],
     output_path: Union[str, "os.PathLike[Any]"],
     tolerance: float,
     algorithm: str | SimplifyAlgorithm = "rdp",
@@ -1786,8 +2180,9 @@ def simplify(
     the fid will be preserved. In other cases this will typically not be the case.
 
     Args:
-        input_path (PathLike): the input file
-        output_path (PathLike): the file to write the result to
+        input_path (PathLike | GeoDataFrame | pyarrow.Table): the input file
+        output_path (PathLike | None): the file to write the result to. If None, the
+            result is returned as GeoDataFrame.
         tolerance (float): tolerance to use for the simplification. Depends on the
             ``algorithm`` specified.
             In projected coordinate systems this tolerance will typically be
@@ -1829,6 +2224,9 @@ def simplify(
         force (bool, optional): overwrite existing output file(s).
             Defaults to False.
 
+    Returns:
+        gpd.GeoDataFrame | None: the result if ``output_path`` is None, otherwise None.
+
     .. |spatialite_reference_link| raw:: html
 
         <a href="https://www.gaia-gis.it/gaia-sins/spatialite-sql-latest.html" target="_blank">spatialite reference</a>
@@ -1840,7 +2238,7 @@ def simplify(
         algorithm = SimplifyAlgorithm(algorithm)
 
     if algorithm == SimplifyAlgorithm.RAMER_DOUGLAS_PEUCKER:
-        return _geoops_sql.simplify(
+        _geoops_sql.simplify(
             input_path=Path(input_path),
             output_path=Path(output_path),
             tolerance=tolerance,
@@ -1856,7 +2254,7 @@ def simplify(
             force=force,
         )
     else:
-        return _geoops_gpd.simplify(
+        _geoops_gpd.simplify(
             input_path=Path(input_path),
             output_path=Path(output_path),
             tolerance=tolerance,
@@ -1880,9 +2278,10 @@ def simplify(
 # -----------------------------
 
 
+@_in_memory_io
 def clip(
-    input_path: Union[str, "os.PathLike[Any]"],
-    clip_path: Union[str, "os.PathLike[Any]"],
+    input_path: Union[str, "os.PathLike[Any]", gpd.GeoDataFrame, "pyarrow.Table"],
+    clip_path: Union[str, "os.PathLike[Any]", gpd.GeoDataFrame, "pyarrow.Table"],
     output_path: Union[str, "os.PathLike[Any]"],
     input_layer: str | None = None,
     input_columns: list[str] | None = None,
@@ -1931,9 +2330,11 @@ def clip(
          - |clip_result|
 
     Args:
-        input_path (PathLike): The file to clip.
-        clip_path (PathLike): The file with the geometries to clip with.
-        output_path (PathLike): the file to write the result to
+        input_path (PathLike | GeoDataFrame | pyarrow.Table): The file to clip.
+        clip_path (PathLike | GeoDataFrame | pyarrow.Table): The file with the
+            geometries to clip with.
+        output_path (PathLike | None): the file to write the result to. If None, the
+            result is returned as GeoDataFrame.
         input_layer (str, optional): input layer name. If None, ``input_path`` should
             contain only one layer. Defaults to None.
         input_columns (List[str], optional): list of columns to retain. If None, all
@@ -1968,6 +2369,9 @@ def clip(
         force (bool, optional): True to overwrite existing output file(s).
             Defaults to False.
 
+    Returns:
+        gpd.GeoDataFrame | None: the result if ``output_path`` is None, otherwise None.
+
     See Also:
         * :func:`clip_by_geometry`: clip the input layer by a geometry specified
 
@@ -1983,7 +2387,7 @@ def clip(
     """  # noqa: E501
     logger = logging.getLogger("geofileops.clip")
     logger.info(f"Start on {input_path} with {clip_path} to {output_path}")
-    return _geoops_sql.clip(
+    _geoops_sql.clip(
         input_path=Path(input_path),
         clip_path=Path(clip_path),
         output_path=Path(output_path),
@@ -2001,6 +2405,184 @@ def clip(
     )
 
 
+class _IterationStopped(BaseException):
+    """Raised in an operation when the consumer of its batch results stopped.
+
+    It derives from BaseException, so it isn't caught and wrapped by the error
+    handling of the operations.
+    """
+
+
+def iter_batch_results(
+    operation: Callable[..., Any], **kwargs: object
+) -> Iterator[gpd.GeoDataFrame]:
+    """Run an operation and yield the results of its batches as soon as they are ready.
+
+    The operation is run in a background thread. Each time a batch of the operation
+    is finished, its result is yielded as GeoDataFrame, so processing the results can
+    overlap with the operation. The results are yielded in the order the batches are
+    finished, so not in the order of the input rows.
+
+    If ``output_path`` is specified, the complete result is also written to this file.
+    Operations that don't process the input in independent batches (e.g.
+    :func:`dissolve`) or that combine the results of several steps (e.g.
+    :func:`union`) yield their complete result once it is ready.
+
+    The batch results are buffered as files in a temporary directory, so the operation
+    doesn't need to wait till they are consumed. If the iteration is stopped early, the
+    operation is stopped when its next batch is finished and the batches that didn't
+    start yet are cancelled.
+
+    .. versionadded:: 0.12.0
+
+    Args:
+        operation (Callable): the geoops operation to run, e.g. :func:`intersection`.
+        **kwargs: the parameters to pass to the operation. They must be passed as
+            keyword arguments.
+
+    Yields:
+        gpd.GeoDataFrame: the result of each batch.
+
+    Examples:
+        Process the results of an intersection while it is still running:
+
+        .. code-block:: python
+
+            for batch_gdf in gfo.iter_batch_results(
+                gfo.intersection, input1_path="a.gpkg", input2_path="b.gpkg"
+            ):
+                print(len(batch_gdf))
+
+    """
+    results: queue.Queue = queue.Queue()
+    stop = threading.Event()
+    done = object()
+
+    with _general_helper.create_gfo_tmp_dir(f"iter_{operation.__name__}") as tmp_dir:
+        if kwargs.get("output_path") is None:
+            kwargs["output_path"] = tmp_dir / "output.gpkg"
+        output_path = Path(str(kwargs["output_path"]))
+        output_layer = kwargs.get("output_layer")
+        nb_reported = 0
+
+        def handle_batch_result(
+            batch_output_path: Path,
+            partial_path: Path,
+            layer: str | None,
+            where: str | None,
+        ) -> None:
+            # Only the batches of the operation itself, not of intermediate steps
+            nonlocal nb_reported
+            if stop.is_set():
+                raise _IterationStopped()
+            if Path(batch_output_path) != output_path:
+                return
+
+            # Keep a copy of the partial file, as it is merged in the output next
+            nb_reported += 1
+            result_path = tmp_dir / f"batch_{nb_reported}{Path(partial_path).suffix}"
+            fileops.copy(partial_path, result_path)
+            results.put((result_path, layer, where))
+
+        def run_operation() -> None:
+            try:
+                with _general_helper.batch_result_handler(handle_batch_result):
+                    operation(**kwargs)
+            finally:
+                results.put(done)
+
+        with futures.ThreadPoolExecutor(max_workers=1) as pool:
+            future = pool.submit(run_operation)
+            try:
+                while (result := results.get()) is not done:
+                    result_path, layer, where = result
+                    if where is not None and "{geometrycolumn}" in where:
+                        info = fileops.get_layerinfo(
+                            result_path, layer, raise_on_nogeom=False
+                        )
+                        where = where.format(geometrycolumn=info.geometrycolumn)
+                    result_gdf = fileops.read_file(
+                        result_path, layer=layer, where=where
+                    )
+                    fileops.remove(result_path)
+                    if len(result_gdf) > 0:
+                        yield result_gdf
+            finally:
+                stop.set()
+
+            # Raise errors of the operation if the iteration wasn't stopped early
+            future.result()
+
+        # If no batch results were reported, yield the complete result.
+        if nb_reported == 0 and output_path.exists():
+            layer = str(output_layer) if output_layer is not None else None
+            yield fileops.read_file(output_path, layer=layer)
+
+
+def run_worker(
+    queue_dir: Union[str, "os.PathLike[Any]"],
+    poll_interval: float = 1.0,
+    idle_timeout: float | None = None,
+) -> int:
+    """Run a worker that processes the batches of operations from a work queue.
+
+    If a work queue directory is configured with :func:`options.set_work_queue_dir`,
+    the batches of the single layer operations using GeoPandas and of the two layer
+    operations are written as tasks to this directory instead of being processed by a
+    local pool of workers. Workers claim these tasks one at a time, process them and
+    write back the result. The process that started the operation merges the results
+    as they become available.
+
+    Workers can be started on multiple machines, as long as they can access the work
+    queue directory, the input files and the temporary directory via the same
+    absolute paths as the process that started the operation, e.g. on a shared file
+    system. Run one worker per CPU to use, e.g. by starting this function in multiple
+    processes.
+
+    If a worker dies while processing a task, the task is released again for another
+    worker after a timeout.
+
+    The tasks are exchanged as pickled python objects and unpickling them can execute
+    arbitrary code. Hence, the work queue directory should only be writable by
+    trusted users.
+
+    .. versionadded:: 0.12.0
+
+    Args:
+        queue_dir (PathLike): the work queue directory.
+        poll_interval (float, optional): the number of seconds to wait before checking
+            for new tasks again if there are none. Defaults to 1.0.
+        idle_timeout (float, optional): stop if no task was found for this number of
+            seconds. If None, the worker keeps on running. Defaults to None.
+
+    Returns:
+        int: the number of tasks processed.
+
+    Examples:
+        On each machine, start workers, e.g. from a script run in multiple processes:
+
+        .. code-block:: python
+
+            gfo.run_worker("/shared/geofileops_queue")
+
+        Then run the operation with the work queue configured:
+
+        .. code-block:: python
+
+            with gfo.options.set_work_queue_dir("/shared/geofileops_queue"):
+                gfo.intersection(
+                    input1_path="/shared/parcels.gpkg",
+                    input2_path="/shared/zones.gpkg",
+                    output_path="/shared/parcels_zones.gpkg",
+                    nb_parallel=64,
+                )
+
+    """
+    return _workqueue_util.run_worker(
+        queue_dir, poll_interval=poll_interval, idle_timeout=idle_timeout
+    )
+
+
 def concat(
     input_paths: list[Union[str, "os.PathLike[Any]"]],
     output_path: Union[str, "os.PathLike[Any]"],
@@ -2009,6 +2591,7 @@ def concat(
     columns: list[str] | None = None,
     explodecollections: bool = False,
     create_spatial_index: bool | None = None,
+    nb_parallel: int | None = None,
     force: bool = False,
 ) -> None:
     """Concatenate multiple geofiles into one output geofile.
@@ -2021,6 +2604,12 @@ def concat(
     rows. If you want to retain only a subset of the columns, specify these in the
     ``columns`` parameter.
 
+    The schemas of all input files are read up front, so the output layer is created
+    only once with the unified schema of all inputs. If the output file is a GeoPackage
+    and all input files have the same crs, GeoPackage input files are inserted directly
+    in the output file using sqlite. Input files in other formats are first converted
+    to temporary GeoPackage files in parallel.
+
     .. versionadded:: 0.11.0
 
     Args:
@@ -2040,6 +2629,10 @@ def concat(
         create_spatial_index (bool, optional): True to create a spatial index on the
             output file/layer. If None, the default behaviour by gdal for that file
             type is respected. Defaults to None.
+        nb_parallel (int | None, optional): the number of parallel workers to use.
+            If None, the preference set in the nb_parallel configuration option is used,
+            which defaults to the number of CPU cores available. For more information,
+            see :func:`options.set_nb_parallel`. Defaults to None.
         force (bool, optional): True to overwrite the output file if it already exists.
     """
     # Validate + cleanup input parameters
@@ -2061,45 +2654,83 @@ def concat(
     logger.info(f"Start concat to {output_path}")
 
     start_time = datetime.now()
-    with _general_helper.create_gfo_tmp_dir("concat") as tmp_dir:
-        # Loop over all files and copy_layer them one by one together.
-        tmp_dst = tmp_dir / output_path.name
-        is_first = True
-        for src_path, src_layer in zip(input_paths, input_layers, strict=True):
-            # This first file will be created, the others appended
-            write_mode: Literal["create", "append_add_fields"]
-            if is_first:
-                force_local = force
-                write_mode = "create"
-            else:
-                force_local = False
-                write_mode = "append_add_fields"
+    nb_parallel = ConfigOptions.get_nb_parallel(nb_parallel)
+
+    # Read the schemas of all input files up front, concurrently.
+    with futures.ThreadPoolExecutor(max_workers=nb_parallel) as pool:
+        src_infos = list(
+            pool.map(
+                lambda path, layer: fileops.get_layerinfo(
+                    path, layer=layer, raise_on_nogeom=False
+                ),
+                input_paths,
+                input_layers,
+            )
+        )
 
-            # The columns specified should only be columns present in the file,
-            # otherwise the output is invalid.
-            if columns is None or len(columns) == 0:
-                columns_local = columns
-            else:
-                src_info = fileops.get_layerinfo(src_path, layer=src_layer)
-                src_columns_lower = {col.lower() for col in src_info.columns}
-                columns_local = [
-                    col for col in columns if col.lower() in src_columns_lower
-                ]
+    # The columns specified should only be columns present in the file, otherwise the
+    # output is invalid.
+    columns_per_src: list[list[str] | None] = []
+    for src_info in src_infos:
+        if columns is None or len(columns) == 0:
+            columns_per_src.append(columns)
+        else:
+            src_columns_lower = {col.lower() for col in src_info.columns}
+            columns_per_src.append(
+                [col for col in columns if col.lower() in src_columns_lower]
+            )
 
-            fileops.copy_layer(
-                src=src_path,
-                dst=tmp_dst,
-                write_mode=write_mode,
-                src_layer=src_layer,
-                dst_layer=output_layer,
-                columns=columns_local,
+    with _general_helper.create_gfo_tmp_dir("concat") as tmp_dir:
+        tmp_dst = tmp_dir / output_path.name
+        if (
+            output_path.suffix.lower() == ".gpkg"
+            and len(input_paths) > 1
+            and ConfigOptions.get_copy_layer_sqlite_direct
+            and all(info.geometrycolumn is not None for info in src_infos)
+            and all(info.crs == src_infos[0].crs for info in src_infos)
+        ):
+            _concat_gpkg(
+                input_paths=input_paths,
+                src_infos=src_infos,
+                columns_per_src=[
+                    list(info.columns) if cols is None else cols
+                    for info, cols in zip(src_infos, columns_per_src, strict=True)
+                ],
+                tmp_dst=tmp_dst,
+                output_layer=output_layer,
                 explodecollections=explodecollections,
-                create_spatial_index=False,
-                force=force_local,
+                nb_parallel=nb_parallel,
+                force=force,
             )
+        else:
+            # Loop over all files and copy_layer them one by one together.
+            is_first = True
+            for src_path, src_info, columns_local in zip(
+                input_paths, src_infos, columns_per_src, strict=True
+            ):
+                # This first file will be created, the others appended
+                write_mode: Literal["create", "append_add_fields"]
+                if is_first:
+                    force_local = force
+                    write_mode = "create"
+                else:
+                    force_local = False
+                    write_mode = "append_add_fields"
+
+                fileops.copy_layer(
+                    src=src_path,
+                    dst=tmp_dst,
+                    write_mode=write_mode,
+                    src_layer=src_info.name,
+                    dst_layer=output_layer,
+                    columns=columns_local,
+                    explodecollections=explodecollections,
+                    create_spatial_index=False,
+                    force=force_local,
+                )
 
-            if is_first:
-                is_first = False
+                if is_first:
+                    is_first = False
 
         # Add a spatial index if needed
         if create_spatial_index:
@@ -2110,9 +2741,122 @@ def concat(
     logger.info(f"Ready, took {datetime.now() - start_time}")
 
 
+def _concat_gpkg(
+    input_paths: list[Union[str, "os.PathLike[Any]"]],
+    src_infos: list[fileops.LayerInfo],
+    columns_per_src: list[list[str]],
+    tmp_dst: Path,
+    output_layer: str | None,
+    explodecollections: bool,
+    nb_parallel: int,
+    force: bool,
+) -> None:
+    """Concatenate the input files into a GeoPackage, inserting the rows with sqlite.
+
+    The output layer is created once with the unified schema of all input files.
+    GeoPackage input files are inserted directly, input files in other formats are
+    first converted to staged GeoPackage files in parallel. The rows are always
+    inserted in the order of the input files.
+    """
+    if output_layer is None:
+        output_layer = fileops.get_default_layer(tmp_dst)
+
+    # Create the output layer based on the first input file, then add the columns only
+    # present in the other input files without copying any rows.
+    fileops.copy_layer(
+        src=input_paths[0],
+        dst=tmp_dst,
+        src_layer=src_infos[0].name,
+        dst_layer=output_layer,
+        write_mode="create",
+        columns=columns_per_src[0],
+        explodecollections=explodecollections,
+        create_spatial_index=False,
+        force=force,
+    )
+    output_columns_lower = {col.lower() for col in columns_per_src[0]}
+    for src_path, src_info, src_columns in zip(
+        input_paths[1:], src_infos[1:], columns_per_src[1:], strict=True
+    ):
+        if all(col.lower() in output_columns_lower for col in src_columns):
+            continue
+        fileops.copy_layer(
+            src=src_path,
+            dst=tmp_dst,
+            src_layer=src_info.name,
+            dst_layer=output_layer,
+            write_mode="append_add_fields",
+            columns=src_columns,
+            where="0 = 1",
+            create_spatial_index=False,
+        )
+        output_columns_lower.update(col.lower() for col in src_columns)
+    output_geometrycolumn = fileops.get_layerinfo(tmp_dst, output_layer).geometrycolumn
+    assert output_geometrycolumn is not None
+
+    # Determine which input files can be inserted directly and which need staging.
+    to_stage = [
+        idx
+        for idx, (src_path, src_info) in enumerate(
+            zip(input_paths, src_infos, strict=True)
+        )
+        if idx > 0
+        and (
+            explodecollections
+            or Path(src_path).suffix.lower() != ".gpkg"
+            or not Path(src_path).exists()
+            or src_info.geometrycolumn != output_geometrycolumn
+        )
+    ]
+    featurecount = sum(src_infos[idx].featurecount for idx in to_stage)
+    worker_type = _general_helper.worker_type_to_use(featurecount)
+    with _processing_util.PooledExecutorFactory(
+        worker_type=worker_type,
+        max_workers=max(1, min(nb_parallel, len(to_stage))),
+        initializer=_processing_util.initialize_worker,
+        initargs=(worker_type,),
+    ) as pool:
+        staged_futures = {}
+        for idx in to_stage:
+            staged_futures[idx] = pool.submit(
+                fileops.copy_layer,
+                src=input_paths[idx],
+                dst=tmp_dst.parent / f"staged_{idx}.gpkg",
+                src_layer=src_infos[idx].name,
+                dst_layer=output_layer,
+                columns=columns_per_src[idx],
+                explodecollections=explodecollections,
+                create_spatial_index=False,
+                options={"LAYER_CREATION.GEOMETRY_NAME": output_geometrycolumn},
+            )
+
+        # Insert the rows of all input files in order.
+        for idx in range(1, len(input_paths)):
+            if idx in staged_futures:
+                staged_futures[idx].result()
+                insert_path = tmp_dst.parent / f"staged_{idx}.gpkg"
+                insert_layer = output_layer
+            else:
+                insert_path = Path(input_paths[idx])
+                insert_layer = src_infos[idx].name
+
+            _sqlite_util.copy_table(
+                input_path=insert_path,
+                output_path=tmp_dst,
+                input_table=insert_layer,
+                output_table=output_layer,
+                columns=[output_geometrycolumn, *columns_per_src[idx]],
+            )
+            if idx in staged_futures:
+                fileops.remove(insert_path)
+
+
+@_in_memory_io
 def difference(
-    input1_path: Union[str, "os.PathLike[Any]"],
-    input2_path: Union[str, "os.PathLike[Any]", None],
+    input1_path: Union[str, "os.PathLike[Any]", gpd.GeoDataFrame, "pyarrow.Table"],
+    input2_path: Union[
+        str, "os.PathLike[Any]", gpd.GeoDataFrame, "pyarrow.Table", None
+    ],
     output_path: Union[str, "os.PathLike[Any]"],
     input1_layer: str | None = None,
     input1_columns: list[str] | None = None,
@@ -2156,13 +2900,15 @@ def difference(
         - ArcMap: erase
 
     Args:
-        input1_path (PathLike): The file to remove/difference from.
-        input2_path (PathLike, optional): The file with the geometries to remove from
-            input1. If None, the 1st input layer is used for both inputs but interactions
-            between the same rows in this layer will be ignored. The output will be the
-            (pieces of) features in this layer that don't have any intersections with
-            other features in this layer.
-        output_path (PathLike): the file to write the result to.
+        input1_path (PathLike | GeoDataFrame | pyarrow.Table): The file to
+            remove/difference from.
+        input2_path (PathLike | GeoDataFrame | pyarrow.Table, optional): The file with
+            the geometries to remove from input1. If None, the 1st input layer is used
+            for both inputs but interactions between the same rows in this layer will be
+            ignored. The output will be the (pieces of) features in this layer that
+            don't have any intersections with other features in this layer.
+        output_path (PathLike | None): the file to write the result to. If None, the
+            result is returned as GeoDataFrame.
         input1_layer (str, optional): input layer name. If None, ``input1_path`` should
             contain only one layer. Defaults to None.
         input1_columns (List[str], optional): list of columns to retain. If None, all
@@ -2197,6 +2943,9 @@ def difference(
         force (bool, optional): overwrite existing output file(s).
             Defaults to False.
 
+    Returns:
+        gpd.GeoDataFrame | None: the result if ``output_path`` is None, otherwise None.
+
     See Also:
         * :func:`identity`: calculate the identity of two layers
         * :func:`intersection`: calculate the intersection of two layers
@@ -2220,7 +2969,7 @@ def difference(
         input2_layer = input1_layer
         overlay_self = True
 
-    return _geoops_sql.difference(
+    _geoops_sql.difference(
         input1_path=Path(input1_path),
         input2_path=Path(input2_path),
         output_path=Path(output_path),
@@ -2239,9 +2988,10 @@ def difference(
     )
 
 
+@_in_memory_io
 def erase(
-    input_path: Union[str, "os.PathLike[Any]"],
-    erase_path: Union[str, "os.PathLike[Any]", None],
+    input_path: Union[str, "os.PathLike[Any]", gpd.GeoDataFrame, "pyarrow.Table"],
+    erase_path: Union[str, "os.PathLike[Any]", gpd.GeoDataFrame, "pyarrow.Table", None],
     output_path: Union[str, "os.PathLike[Any]"],
     input_layer: str | None = None,
     input_columns: list[str] | None = None,
@@ -2280,9 +3030,14 @@ def erase(
     )
 
 
+@_in_memory_io
 def export_by_location(
-    input_to_select_from_path: Union[str, "os.PathLike[Any]"],
-    input_to_compare_with_path: Union[str, "os.PathLike[Any]"],
+    input_to_select_from_path: Union[
+        str, "os.PathLike[Any]", gpd.GeoDataFrame, "pyarrow.Table"
+    ],
+    input_to_compare_with_path: Union[
+        str, "os.PathLike[Any]", gpd.GeoDataFrame, "pyarrow.Table"
+    ],
     output_path: Union[str, "os.PathLike[Any]"],
     spatial_relations_query: str = "intersects is True",
     min_area_intersect: float | None = None,
@@ -2322,9 +3077,12 @@ def export_by_location(
         - QGIS: extract by location
 
     Args:
-        input_to_select_from_path (PathLike): the 1st input file
-        input_to_compare_with_path (PathLike): the 2nd input file
-        output_path (PathLike): the file to write the result to
+        input_to_select_from_path (PathLike | GeoDataFrame | pyarrow.Table): the 1st
+            input file
+        input_to_compare_with_path (PathLike | GeoDataFrame | pyarrow.Table): the 2nd
+            input file
+        output_path (PathLike | None): the file to write the result to. If None, the
+            result is returned as GeoDataFrame.
         spatial_relations_query (str, optional): a query that specifies the spatial
             relations to match between the 2 layers. Defaults to "intersects is True".
         min_area_intersect (float, optional): minimum area of the intersection.
@@ -2365,6 +3123,9 @@ def export_by_location(
         force (bool, optional): overwrite existing output file(s).
             Defaults to False.
 
+    Returns:
+        gpd.GeoDataFrame | None: the result if ``output_path`` is None, otherwise None.
+
     See Also:
         * :func:`export_by_bounds`: export features that intersect with the bounds
           specified
@@ -2389,7 +3150,7 @@ def export_by_location(
         f"export_by_location: select from {input_to_select_from_path} "
         f"interacting with {input_to_compare_with_path} to {output_path}"
     )
-    return _geoops_sql.export_by_location(
+    _geoops_sql.export_by_location(
         input_path=Path(input_to_select_from_path),
         input_to_compare_with_path=Path(input_to_compare_with_path),
         output_path=Path(output_path),
@@ -2409,9 +3170,14 @@ def export_by_location(
     )
 
 
+@_in_memory_io
 def export_by_distance(
-    input_to_select_from_path: Union[str, "os.PathLike[Any]"],
-    input_to_compare_with_path: Union[str, "os.PathLike[Any]"],
+    input_to_select_from_path: Union[
+        str, "os.PathLike[Any]", gpd.GeoDataFrame, "pyarrow.Table"
+    ],
+    input_to_compare_with_path: Union[
+        str, "os.PathLike[Any]", gpd.GeoDataFrame, "pyarrow.Table"
+    ],
     output_path: Union[str, "os.PathLike[Any]"],
     max_distance: float,
     input1_layer: str | None = None,
@@ -2430,9 +3196,12 @@ def export_by_distance(
     any features in ``input_to_compare_with_path``.
 
     Args:
-        input_to_select_from_path (PathLike): the 1st input file
-        input_to_compare_with_path (PathLike): the 2nd input file
-        output_path (PathLike): the file to write the result to
+        input_to_select_from_path (PathLike | GeoDataFrame | pyarrow.Table): the 1st
+            input file
+        input_to_compare_with_path (PathLike | GeoDataFrame | pyarrow.Table): the 2nd
+            input file
+        output_path (PathLike | None): the file to write the result to. If None, the
+            result is returned as GeoDataFrame.
         max_distance (float): maximum distance
         input1_layer (str, optional): 1st input layer name. If None,
             ``input_to_select_from_path`` should contain only one layer.
@@ -2463,6 +3232,9 @@ def export_by_distance(
         force (bool, optional): overwrite existing output file(s).
             Defaults to False.
 
+    Returns:
+        gpd.GeoDataFrame | None: the result if ``output_path`` is None, otherwise None.
+
     See Also:
         * :func:`export_by_bounds`: export features that intersect with the bounds
           specified
@@ -2480,7 +3252,7 @@ def export_by_distance(
         f"max_distance of {max_distance} from {input_to_compare_with_path} "
         f"to {output_path}"
     )
-    return _geoops_sql.export_by_distance(
+    _geoops_sql.export_by_distance(
         input_to_select_from_path=Path(input_to_select_from_path),
         input_to_compare_with_path=Path(input_to_compare_with_path),
         output_path=Path(output_path),
@@ -2497,9 +3269,12 @@ def export_by_distance(
     )
 
 
+@_in_memory_io
 def identity(
-    input1_path: Union[str, "os.PathLike[Any]"],
-    input2_path: Union[str, "os.PathLike[Any]", None],
+    input1_path: Union[str, "os.PathLike[Any]", gpd.GeoDataFrame, "pyarrow.Table"],
+    input2_path: Union[
+        str, "os.PathLike[Any]", gpd.GeoDataFrame, "pyarrow.Table", None
+    ],
     output_path: Union[str, "os.PathLike[Any]"],
     input1_layer: str | None = None,
     input1_columns: list[str] | None = None,
@@ -2555,11 +3330,12 @@ def identity(
           here: :func:`options.set_sliver_tolerance <options.set_sliver_tolerance>`.
 
     Args:
-        input1_path (PathLike): the 1st input file.
-        input2_path (PathLike, optional): the 2nd input file. If None, the 1st input
-            layer is used for both inputs but interactions between the same rows in this
-            layer will be ignored.
-        output_path (PathLike): the file to write the result to
+        input1_path (PathLike | GeoDataFrame | pyarrow.Table): the 1st input file.
+        input2_path (PathLike | GeoDataFrame | pyarrow.Table, optional): the 2nd input
+            file. If None, the 1st input layer is used for both inputs but interactions
+            between the same rows in this layer will be ignored.
+        output_path (PathLike | None): the file to write the result to. If None, the
+            result is returned as GeoDataFrame.
         input1_layer (str, optional): 1st input layer name. If None, ``input1_path``
             should contain only one layer. Defaults to None.
         input1_columns (List[str], optional): list of columns to retain. If None, all
@@ -2609,6 +3385,9 @@ def identity(
         force (bool, optional): overwrite existing output file(s).
             Defaults to False.
 
+    Returns:
+        gpd.GeoDataFrame | None: the result if ``output_path`` is None, otherwise None.
+
     See Also:
         * :func:`difference`: calculate the difference between two layers
         * :func:`intersection`: calculate the intersection of two layers
@@ -2632,7 +3411,7 @@ def identity(
         input2_layer = input1_layer
         overlay_self = True
 
-    return _geoops_sql.identity(
+    _geoops_sql.identity(
         input1_path=Path(input1_path),
         input2_path=Path(input2_path),
         output_path=Path(output_path),
@@ -2655,9 +3434,10 @@ def identity(
     )
 
 
+@_in_memory_io
 def split(
-    input1_path: Union[str, "os.PathLike[Any]"],
-    input2_path: Union[str, "os.PathLike[Any]"],
+    input1_path: Union[str, "os.PathLike[Any]", gpd.GeoDataFrame, "pyarrow.Table"],
+    input2_path: Union[str, "os.PathLike[Any]", gpd.GeoDataFrame, "pyarrow.Table"],
     output_path: Union[str, "os.PathLike[Any]"],
     input1_layer: str | None = None,
     input1_columns: list[str] | None = None,
@@ -2683,7 +3463,7 @@ def split(
     )
     logger = logging.getLogger("geofileops.identity")
     logger.info(f"Start,  between {input1_path} and {input2_path} to {output_path}")
-    return _geoops_sql.identity(
+    _geoops_sql.identity(
         input1_path=Path(input1_path),
         input2_path=Path(input2_path),
         output_path=Path(output_path),
@@ -2706,9 +3486,10 @@ def split(
     )
 
 
+@_in_memory_io
 def intersect(
-    input1_path: Union[str, "os.PathLike[Any]"],
-    input2_path: Union[str, "os.PathLike[Any]"],
+    input1_path: Union[str, "os.PathLike[Any]", gpd.GeoDataFrame, "pyarrow.Table"],
+    input2_path: Union[str, "os.PathLike[Any]", gpd.GeoDataFrame, "pyarrow.Table"],
     output_path: Union[str, "os.PathLike[Any]"],
     input1_layer: str | None = None,
     input1_columns: list[str] | None = None,
@@ -2749,9 +3530,12 @@ def intersect(
     )
 
 
+@_in_memory_io
 def intersection(
-    input1_path: Union[str, "os.PathLike[Any]"],
-    input2_path: Union[str, "os.PathLike[Any]", None],
+    input1_path: Union[str, "os.PathLike[Any]", gpd.GeoDataFrame, "pyarrow.Table"],
+    input2_path: Union[
+        str, "os.PathLike[Any]", gpd.GeoDataFrame, "pyarrow.Table", None
+    ],
     output_path: Union[str, "os.PathLike[Any]"],
     input1_layer: str | None = None,
     input1_columns: list[str] | None = None,
@@ -2811,11 +3595,12 @@ def intersection(
         - GeoPandas: overlay(how="intersection")
 
     Args:
-        input1_path (PathLike): the 1st input file
-        input2_path (PathLike): the 2nd input file. If None, the 1st input layer is used
-            for both inputs but intersections between the same rows in this layer will
-            be omitted from the result.
-        output_path (PathLike): the file to write the result to
+        input1_path (PathLike | GeoDataFrame | pyarrow.Table): the 1st input file
+        input2_path (PathLike | GeoDataFrame | pyarrow.Table): the 2nd input file. If
+            None, the 1st input layer is used for both inputs but intersections between
+            the same rows in this layer will be omitted from the result.
+        output_path (PathLike | None): the file to write the result to. If None, the
+            result is returned as GeoDataFrame.
         input1_layer (str, optional): 1st input layer name. If None, ``input1_path``
             should contain only one layer. Defaults to None.
         input1_columns (List[str], optional): list of columns to retain. If None, all
@@ -2866,6 +3651,9 @@ def intersection(
         force (bool, optional): overwrite existing output file(s).
             Defaults to False.
 
+    Returns:
+        gpd.GeoDataFrame | None: the result if ``output_path`` is None, otherwise None.
+
     See Also:
         * :func:`difference`: calculate the difference between two layers
         * :func:`identity`: calculate the identity of two layers
@@ -2889,7 +3677,7 @@ def intersection(
         input2_layer = input1_layer
         overlay_self = True
 
-    return _geoops_sql.intersection(
+    _geoops_sql.intersection(
         input1_path=Path(input1_path),
         input2_path=Path(input2_path),
         output_path=Path(output_path),
@@ -2912,9 +3700,10 @@ def intersection(
     )
 
 
+@_in_memory_io
 def join(
-    input1_path: Path,
-    input2_path: Path,
+    input1_path: Union[Path, gpd.GeoDataFrame, "pyarrow.Table"],
+    input2_path: Union[Path, gpd.GeoDataFrame, "pyarrow.Table"],
     output_path: Path,
     input1_on: list[str] | str,
     input2_on: list[str] | str,
@@ -2945,9 +3734,10 @@ def join(
     .. versionadded:: 0.11.0
 
     Args:
-        input1_path (PathLike): the 1st input file
-        input2_path (PathLike): the 2nd input file
-        output_path (PathLike): the file to write the result to
+        input1_path (PathLike | GeoDataFrame | pyarrow.Table): the 1st input file
+        input2_path (PathLike | GeoDataFrame | pyarrow.Table): the 2nd input file
+        output_path (PathLike | None): the file to write the result to. If None, the
+            result is returned as GeoDataFrame.
         input1_on (List[str] or str): column(s) in the 1st input layer to join on.
         input2_on (List[str] or str): column(s) in the 2nd input layer to join on.
         join_type (str, optional): type of join: "INNER" or "LEFT". Defaults to "INNER".
@@ -2988,6 +3778,9 @@ def join(
         force (bool, optional): overwrite existing output file(s).
             Defaults to False.
 
+    Returns:
+        gpd.GeoDataFrame | None: the result if ``output_path`` is None, otherwise None.
+
     See Also:
         * :func:`join_by_location`: join two layers based on their spatial relationship
 
@@ -3000,7 +3793,7 @@ def join(
     logger.info(
         f"join: select from {input1_path} joining with {input2_path} to {output_path}"
     )
-    return _geoops_sql.join(
+    _geoops_sql.join(
         input1_path=Path(input1_path),
         input2_path=Path(input2_path),
         output_path=Path(output_path),
@@ -3023,9 +3816,10 @@ def join(
     )
 
 
+@_in_memory_io
 def join_by_location(
-    input1_path: Union[str, "os.PathLike[Any]"],
-    input2_path: Union[str, "os.PathLike[Any]"],
+    input1_path: Union[str, "os.PathLike[Any]", gpd.GeoDataFrame, "pyarrow.Table"],
+    input2_path: Union[str, "os.PathLike[Any]", gpd.GeoDataFrame, "pyarrow.Table"],
     output_path: Union[str, "os.PathLike[Any]"],
     spatial_relations_query: str = "intersects is True",
     discard_nonmatching: bool = True,
@@ -3073,9 +3867,10 @@ def join_by_location(
         - QGIS: join attributes by location
 
     Args:
-        input1_path (PathLike): the 1st input file
-        input2_path (PathLike): the 2nd input file
-        output_path (PathLike): the file to write the result to
+        input1_path (PathLike | GeoDataFrame | pyarrow.Table): the 1st input file
+        input2_path (PathLike | GeoDataFrame | pyarrow.Table): the 2nd input file
+        output_path (PathLike | None): the file to write the result to. If None, the
+            result is returned as GeoDataFrame.
         spatial_relations_query (str, optional): a query that specifies the
             spatial relations to match between the 2 layers.
             Defaults to "intersects is True".
@@ -3121,6 +3916,9 @@ def join_by_location(
         force (bool, optional): overwrite existing output file(s).
             Defaults to False.
 
+    Returns:
+        gpd.GeoDataFrame | None: the result if ``output_path`` is None, otherwise None.
+
     See Also:
         * :func:`export_by_location`: export features that e.g. intersect with features
           of another layer
@@ -3138,7 +3936,7 @@ def join_by_location(
     """  # noqa: E501
     logger = logging.getLogger("geofileops.join_by_location")
     logger.info(f"select from {input1_path} joined with {input2_path} to {output_path}")
-    return _geoops_sql.join_by_location(
+    _geoops_sql.join_by_location(
         input1_path=Path(input1_path),
         input2_path=Path(input2_path),
         output_path=Path(output_path),
@@ -3162,9 +3960,10 @@ def join_by_location(
     )
 
 
+@_in_memory_io
 def join_nearest(
-    input1_path: Union[str, "os.PathLike[Any]"],
-    input2_path: Union[str, "os.PathLike[Any]"],
+    input1_path: Union[str, "os.PathLike[Any]", gpd.GeoDataFrame, "pyarrow.Table"],
+    input2_path: Union[str, "os.PathLike[Any]", gpd.GeoDataFrame, "pyarrow.Table"],
     output_path: Union[str, "os.PathLike[Any]"],
     nb_nearest: int,
     distance: float | None = None,
@@ -3201,9 +4000,12 @@ def join_nearest(
     are mandatory.
 
     Args:
-        input1_path (PathLike): the input file to join to nb_nearest features.
-        input2_path (PathLike): the file where nb_nearest features are looked for.
-        output_path (PathLike): the file to write the result to
+        input1_path (PathLike | GeoDataFrame | pyarrow.Table): the input file to join to
+            nb_nearest features.
+        input2_path (PathLike | GeoDataFrame | pyarrow.Table): the file where nb_nearest
+            features are looked for.
+        output_path (PathLike | None): the file to write the result to. If None, the
+            result is returned as GeoDataFrame.
         nb_nearest (int): the number of nearest features from input 2 to join
             to input1.
         distance (float): maximum distance to search for the nearest items. If
@@ -3244,6 +4046,9 @@ def join_nearest(
         force (bool, optional): overwrite existing output file(s).
             Defaults to False.
 
+    Returns:
+        gpd.GeoDataFrame | None: the result if ``output_path`` is None, otherwise None.
+
     See Also:
         * :func:`export_by_distance`: export features that are within a certain distance
           of features of another layer
@@ -3253,7 +4058,7 @@ def join_nearest(
     """
     logger = logging.getLogger("geofileops.join_nearest")
     logger.info(f"select from {input1_path} joined with {input2_path} to {output_path}")
-    return _geoops_sql.join_nearest(
+    _geoops_sql.join_nearest(
         input1_path=Path(input1_path),
         input2_path=Path(input2_path),
         output_path=Path(output_path),
@@ -3274,9 +4079,10 @@ def join_nearest(
     )
 
 
+@_in_memory_io
 def select_two_layers(
-    input1_path: Union[str, "os.PathLike[Any]"],
-    input2_path: Union[str, "os.PathLike[Any]"],
+    input1_path: Union[str, "os.PathLike[Any]", gpd.GeoDataFrame, "pyarrow.Table"],
+    input2_path: Union[str, "os.PathLike[Any]", gpd.GeoDataFrame, "pyarrow.Table"],
     output_path: Union[str, "os.PathLike[Any]"],
     sql_stmt: str,
     input1_layer: str | None = None,
@@ -3303,9 +4109,10 @@ def select_two_layers(
     The result is written to the output file specified.
 
     Args:
-        input1_path (PathLike): the 1st input file.
-        input2_path (PathLike): the 2nd input file.
-        output_path (PathLike): the file to write the result to.
+        input1_path (PathLike | GeoDataFrame | pyarrow.Table): the 1st input file.
+        input2_path (PathLike | GeoDataFrame | pyarrow.Table): the 2nd input file.
+        output_path (PathLike | None): the file to write the result to. If None, the
+            result is returned as GeoDataFrame.
         sql_stmt (str): the SELECT SQL statement to be executed. Must be in SQLite
             dialect.
         input1_layer (str, optional): 1st input layer name. If None, ``input1_path``
@@ -3360,6 +4167,9 @@ def select_two_layers(
         force (bool, optional): overwrite existing output file(s).
             Defaults to False.
 
+    Returns:
+        gpd.GeoDataFrame | None: the result if ``output_path`` is None, otherwise None.
+
     Notes:
         By convention, the ``sql_stmt`` can contain following placeholders that
         will be automatically replaced for you:
@@ -3493,7 +4303,7 @@ def select_two_layers(
     '''  # noqa: E501
     logger = logging.getLogger("geofileops.select_two_layers")
     logger.info(f"select from {input1_path} and {input2_path} to {output_path}")
-    return _geoops_sql.select_two_layers(
+    _geoops_sql.select_two_layers(
         input1_path=Path(input1_path),
         input2_path=Path(input2_path),
         output_path=Path(output_path),
@@ -3516,9 +4326,12 @@ def select_two_layers(
     )
 
 
+@_in_memory_io
 def symmetric_difference(
-    input1_path: Union[str, "os.PathLike[Any]"],
-    input2_path: Union[str, "os.PathLike[Any]", None],
+    input1_path: Union[str, "os.PathLike[Any]", gpd.GeoDataFrame, "pyarrow.Table"],
+    input2_path: Union[
+        str, "os.PathLike[Any]", gpd.GeoDataFrame, "pyarrow.Table", None
+    ],
     output_path: Union[str, "os.PathLike[Any]"],
     input1_layer: str | None = None,
     input1_columns: list[str] | None = None,
@@ -3572,11 +4385,13 @@ def symmetric_difference(
         - QGIS, ArcMap: symmetrical difference
 
     Args:
-        input1_path (PathLike): the 1st input file.
-        input2_path (PathLike): the 2nd input file. If None, the 1st input layer is used
+        input1_path (PathLike | GeoDataFrame | pyarrow.Table): the 1st input file.
+        input2_path (PathLike | GeoDataFrame | pyarrow.Table): the 2nd input file. If
+            None, the 1st input layer is used
           for both inputs but interactions between the same rows in this layer will be
           ignored.
-        output_path (PathLike): the file to write the result to
+        output_path (PathLike | None): the file to write the result to. If None, the
+            result is returned as GeoDataFrame.
         input1_layer (str, optional): 1st input layer name. If None, ``input1_path``
             should contain only one layer. Defaults to None.
         input1_columns (List[str], optional): list of columns to retain. If None, all
@@ -3619,6 +4434,9 @@ def symmetric_difference(
         force (bool, optional): overwrite existing output file(s).
             Defaults to False.
 
+    Returns:
+        gpd.GeoDataFrame | None: the result if ``output_path`` is None, otherwise None.
+
     See Also:
         * :func:`difference`: calculate the difference between two layers
         * :func:`identity`: calculate the identity of two layers
@@ -3645,7 +4463,7 @@ def symmetric_difference(
         input2_layer = input1_layer
         overlay_self = True
 
-    return _geoops_sql.symmetric_difference(
+    _geoops_sql.symmetric_difference(
         input1_path=Path(input1_path),
         input2_path=Path(input2_path),
         output_path=Path(output_path),
@@ -3667,9 +4485,12 @@ def symmetric_difference(
     )
 
 
+@_in_memory_io
 def union(
-    input1_path: Union[str, "os.PathLike[Any]"],
-    input2_path: Union[str, "os.PathLike[Any]", None],
+    input1_path: Union[str, "os.PathLike[Any]", gpd.GeoDataFrame, "pyarrow.Table"],
+    input2_path: Union[
+        str, "os.PathLike[Any]", gpd.GeoDataFrame, "pyarrow.Table", None
+    ],
     output_path: Union[str, "os.PathLike[Any]"],
     input1_layer: str | None = None,
     input1_columns: list[str] | None = None,
@@ -3738,11 +4559,12 @@ def union(
         - GeoPandas: overlay(how="union")
 
     Args:
-        input1_path (PathLike): the 1st input file.
-        input2_path (PathLike, optional): the 2nd input file. If None, the 1st input
-            layer is used for both inputs but interactions between the same rows in this
-            layer will be ignored.
-        output_path (PathLike): the file to write the result to
+        input1_path (PathLike | GeoDataFrame | pyarrow.Table): the 1st input file.
+        input2_path (PathLike | GeoDataFrame | pyarrow.Table, optional): the 2nd input
+            file. If None, the 1st input layer is used for both inputs but interactions
+            between the same rows in this layer will be ignored.
+        output_path (PathLike | None): the file to write the result to. If None, the
+            result is returned as GeoDataFrame.
         input1_layer (str, optional): 1st input layer name. If None, ``input1_path``
             should contain only one layer. Defaults to None.
         input1_columns (List[str], optional): list of columns to retain. If None, all
@@ -3793,6 +4615,9 @@ def union(
         force (bool, optional): overwrite existing output file(s).
             Defaults to False.
 
+    Returns:
+        gpd.GeoDataFrame | None: the result if ``output_path`` is None, otherwise None.
+
     See Also:
         * :func:`union_full_self`: calculate the "Full" union of a layer
         * :func:`difference`: calculate the difference between two layers
@@ -3820,7 +4645,7 @@ def union(
         input2_layer = input1_layer
         overlay_self = True
 
-    return _geoops_sql.union(
+    _geoops_sql.union(
         input1_path=Path(input1_path),
         input2_path=Path(input2_path),
         output_path=Path(output_path),
@@ -3843,8 +4668,9 @@ def union(
     )
 
 
+@_in_memory_io
 def union_full_self(
-    input_path: Path,
+    input_path: Union[Path, gpd.GeoDataFrame, "pyarrow.Table"],
     output_path: Path,
     *,
     intersections_as: Literal["COLUMNS", "LISTS", "ROWS"],
@@ -3896,8 +4722,9 @@ def union_full_self(
     .. versionadded:: 0.11.0
 
     Args:
-        input_path (PathLike): the input file.
-        output_path (PathLike): the file to write the result to
+        input_path (PathLike | GeoDataFrame | pyarrow.Table): the input file.
+        output_path (PathLike | None): the file to write the result to. If None, the
+            result is returned as GeoDataFrame.
         intersections_as (Literal["COLUMNS", "LISTS", "ROWS"]): determines the way
             intersecting features in the input layer are treated in the output. Possible
             options are:
@@ -3959,6 +4786,9 @@ def union_full_self(
         force (bool, optional): overwrite existing output file(s).
             Defaults to False.
 
+    Returns:
+        gpd.GeoDataFrame | None: the result if ``output_path`` is None, otherwise None.
+
     See Also:
         * :func:`union`: calculate the pairwise union of two layers
 
@@ -3985,3 +4815,117 @@ def union_full_self(
         subdivide_coords=subdivide_coords,
         force=force,
     )
+
+
+def update_overlay(
+    operation: Literal["intersection", "join_by_location"],
+    input1_path: Union[str, "os.PathLike[Any]"],
+    input2_path: Union[str, "os.PathLike[Any]"],
+    output_path: Union[str, "os.PathLike[Any]"],
+    id_column: str,
+    operation_params: dict[str, Any] | None = None,
+    input1_previous_path: Union[str, "os.PathLike[Any]", None] = None,
+    changed_ids: list[Any] | None = None,
+    input1_layer: str | None = None,
+    input2_layer: str | None = None,
+    output_layer: str | None = None,
+    nb_parallel: int | None = None,
+    batchsize: int = -1,
+) -> None:
+    r"""Update the output of an overlay after features in the 1st input layer changed.
+
+    If only a limited number of features in ``input1`` was added, changed or deleted
+    since the output was calculated, it is a lot faster to update the existing output
+    than to calculate it again. Only the output rows of the changed features are
+    removed and recalculated. The output file is updated in place in one transaction,
+    so it is never left partially updated.
+
+    The output rows are linked to the features in ``input1`` via ``id_column``. This
+    should be a column with unique values in ``input1`` that was retained in the output,
+    so with ``input1_columns_prefix`` in front of it. The special column "fid" can be
+    used as well.
+
+    The features that changed can be specified via ``changed_ids`` or they can be
+    determined by comparing ``input1_path`` with ``input1_previous_path``: the version
+    of the file the output was calculated with. Features are compared on their geometry
+    and on the columns in ``input1_columns``.
+
+    Remarks:
+        - ``input2`` must be unchanged since the output was calculated.
+        - ``input1_path``, ``input1_previous_path`` and ``output_path`` must be GPKG
+          files.
+        - For ``intersection``, self-overlays are not supported.
+
+    .. versionadded:: 0.12.0
+
+    Args:
+        operation (str): the operation the output was calculated with. Supported
+            operations: "intersection" and "join_by_location".
+        input1_path (PathLike): the current version of the 1st input file
+        input2_path (PathLike): the 2nd input file
+        output_path (PathLike): the output file to update
+        id_column (str): the column in ``input1`` that identifies the features.
+        operation_params (dict, optional): the other parameters the output was
+            calculated with, e.g. ``input1_columns``, ``gridsize``,... Parameters that
+            are set by ``update_overlay`` itself, like the files, the layers or
+            ``nb_parallel``, are not allowed. Defaults to None.
+        input1_previous_path (PathLike, optional): the version of the 1st input file the
+            output was calculated with. Defaults to None.
+        changed_ids (list, optional): the values in ``id_column`` of the features that
+            were added, changed or deleted. Defaults to None.
+        input1_layer (str, optional): 1st input layer name. If None, ``input1_path``
+            should contain only one layer. Defaults to None.
+        input2_layer (str, optional): 2nd input layer name. If None, ``input2_path``
+            should contain only one layer. Defaults to None.
+        output_layer (str, optional): output layer name. If None, ``output_path``
+            should contain only one layer. Defaults to None.
+        nb_parallel (int | None, optional): the number of parallel workers to use.
+            If None, the preference set in the nb_parallel configuration option is used,
+            which defaults to the number of CPU cores available. For more information,
+            see :func:`options.set_nb_parallel`. Defaults to None.
+        batchsize (int, optional): indicative number of rows to process per
+            batch. A smaller batch size, possibly in combination with a
+            smaller ``nb_parallel``, will reduce the memory usage.
+            Defaults to -1: (try to) determine optimal size automatically.
+
+    Examples:
+        Update the intersection of parcels with soil types after some parcels were
+        edited:
+
+        .. code-block:: python
+
+            gfo.update_overlay(
+                "intersection",
+                input1_path="parcels.gpkg",
+                input2_path="soiltypes.gpkg",
+                output_path="parcels_soiltypes.gpkg",
+                id_column="fid",
+                operation_params={"input1_columns": ["fid", "crop"]},
+                input1_previous_path="parcels_previous.gpkg",
+            )
+
+    See Also:
+        * :func:`intersection`: calculate the pairwise intersection of two layers
+        * :func:`join_by_location`: join two layers based on spatial relations
+
+    """
+    logger = logging.getLogger("geofileops.update_overlay")
+    logger.info(f"Start, update {output_path} for changes in {input1_path}")
+
+    _geoops_sql.update_overlay(
+        operation=operation,
+        input1_path=Path(input1_path),
+        input2_path=Path(input2_path),
+        output_path=Path(output_path),
+        id_column=id_column,
+        operation_params=operation_params,
+        input1_previous_path=(
+            None if input1_previous_path is None else Path(input1_previous_path)
+        ),
+        changed_ids=changed_ids,
+        input1_layer=input1_layer,
+        input2_layer=input2_layer,
+        output_layer=output_layer,
+        nb_parallel=nb_parallel,
+        batchsize=batchsize,
+    )
@@ -1,16 +1,27 @@
 """General helper functions, specific for geofileops."""
 
+import json
 import shutil
 import warnings
-from collections.abc import Iterator
+from collections.abc import Callable, Iterator
 from contextlib import contextmanager
+from contextvars import ContextVar
 from pathlib import Path
+from typing import Any
 
 import psutil
+from osgeo import gdal
 
 from geofileops.helpers._options import ConfigOptions
 from geofileops.util import _general_util, _io_util
 
+_batch_result_handler: ContextVar[
+    Callable[[Path, Path, str | None, str | None], None] | None
+] = ContextVar("batch_result_handler", default=None)
+_checkpoint_state: ContextVar[dict[str, Any] | None] = ContextVar(
+    "checkpoint_state", default=None
+)
+
 
 @contextmanager
 def create_gfo_tmp_dir(
@@ -21,6 +32,10 @@ def create_gfo_tmp_dir(
     The directory and its contents are removed when the context is exited, unless
     `ConfigOptions.remove_temp_files` is set to False.
 
+    If the operation is resumable, see :func:`checkpoint_scope`, the directory gets a
+    stable name in the checkpoint directory and it is kept if the context is exited
+    because of an exception.
+
     Args:
         base_dirname (str): The base name of the temporary directory to create. The
             following characters are replaced to "_": "/", " ".
@@ -32,18 +47,183 @@ def create_gfo_tmp_dir(
     Returns:
         Path: The path to the created temporary directory.
     """
-    if parent_dir is None:
-        parent_dir = ConfigOptions.get_tmp_dir
     base_dirname = base_dirname.replace("/", "_").replace(" ", "_")
 
-    tmp_dir = _io_util.create_tempdir(base_dirname, parent_dir)
+    state = _checkpoint_state.get()
+    if state is None:
+        if parent_dir is None:
+            parent_dir = ConfigOptions.get_tmp_dir
+        tmp_dir = _io_util.create_tempdir(base_dirname, parent_dir)
+    else:
+        # The operation is resumable: reuse a directory left behind by a failed run.
+        # Directories of steps that succeeded were removed, so the remaining ones
+        # belong to the steps that still need to be (re)done, in the same order.
+        if parent_dir is None:
+            parent_dir = state["root"]
+        parent_dir.mkdir(parents=True, exist_ok=True)
+        existing = {}
+        for path in parent_dir.iterdir():
+            prefix, _, counter_str = path.name.rpartition("_")
+            if prefix == base_dirname and counter_str.isdigit() and path.is_dir():
+                existing[int(counter_str)] = path
+        reusable = [
+            existing[counter]
+            for counter in sorted(existing)
+            if existing[counter] not in state["in_use"]
+        ]
+        if len(reusable) > 0:
+            tmp_dir = reusable[0]
+            # Only directories with a checkpoint contain work that can be reused
+            if not (tmp_dir / "checkpoint.json").exists():
+                shutil.rmtree(tmp_dir)
+                tmp_dir.mkdir()
+        else:
+            counter = max(existing, default=0) + 1
+            tmp_dir = parent_dir / f"{base_dirname}_{counter:06d}"
+            tmp_dir.mkdir()
+        state["in_use"].add(tmp_dir)
+
+    succeeded = False
     try:
         yield tmp_dir
+        succeeded = True
     finally:
-        if ConfigOptions.get_remove_temp_files:
+        # If the operation is resumable, keep the directory if it failed
+        if ConfigOptions.get_remove_temp_files and (succeeded or state is None):
             shutil.rmtree(tmp_dir, ignore_errors=True)
 
 
+@contextmanager
+def checkpoint_scope(key: str | None) -> Iterator[None]:
+    """Context manager to make an operation resumable after a failure.
+
+    If a checkpoint directory is set, see :func:`options.set_checkpoint_dir`, the
+    temporary directories created with :func:`create_gfo_tmp_dir` while the context is
+    active get a stable name in a subdirectory ``key`` of the checkpoint directory. If
+    the operation fails, they are kept, so when the operation is called again with the
+    same key the work recorded as completed with :class:`Checkpoint` can be skipped.
+    If the operation succeeds, they are removed.
+
+    If the context is already active, e.g. for operations called by other operations,
+    the outer context is used.
+
+    Args:
+        key (str | None): a key identifying the operation call, e.g. a hash of the
+            operation name, the parameters and the input files. If None, the operation
+            is not made resumable.
+    """
+    checkpoint_dir = ConfigOptions.get_checkpoint_dir
+    if key is None or checkpoint_dir is None or _checkpoint_state.get() is not None:
+        yield
+        return
+
+    root = checkpoint_dir / key
+    root.mkdir(parents=True, exist_ok=True)
+    token = _checkpoint_state.set({"root": root, "in_use": set()})
+    try:
+        yield
+    finally:
+        _checkpoint_state.reset(token)
+
+    # Only reached if the operation succeeded
+    if ConfigOptions.get_remove_temp_files:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+class Checkpoint:
+    """Keeps track of the completed batches and steps of an operation.
+
+    The state is saved in the temporary directory of the operation, so when a failed
+    operation is resumed (see :func:`checkpoint_scope`) the completed work can be
+    skipped. If the operation isn't resumable, nothing is saved and no work is ever
+    considered completed.
+    """
+
+    def __init__(self, tmp_dir: Path, identity: str) -> None:
+        """Constructor of Checkpoint.
+
+        Args:
+            tmp_dir (Path): the temporary directory of the operation.
+            identity (str): identifies the operation, e.g. its name and output path.
+                If the state saved in ``tmp_dir`` belongs to another operation, the
+                directory is emptied.
+        """
+        self.enabled = _checkpoint_state.get() is not None
+        self.path = tmp_dir / "checkpoint.json"
+        self._state: dict[str, Any] = {"identity": identity, "done": {}}
+        if not self.enabled:
+            return
+
+        if self.path.exists():
+            state = json.loads(self.path.read_text())
+            if state.get("identity") == identity:
+                self._state = state
+                return
+
+        # No state of this operation found, so start from an empty directory
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget all completed work and empty the temporary directory."""
+        self._state = {"identity": self._state["identity"], "done": {}}
+        if not self.enabled:
+            return
+
+        for path in self.path.parent.iterdir():
+            if path.is_dir():
+                shutil.rmtree(path)
+            else:
+                path.unlink()
+        self._save()
+
+    def is_done(self, name: str) -> bool:
+        """Returns True if the batch or step with this name was completed."""
+        return name in self._state["done"]
+
+    def get(self, name: str, default: object = None) -> object:
+        """Returns the value saved when the batch or step was marked as completed."""
+        return self._state["done"].get(name, default)
+
+    def mark_done(self, name: str, value: object = True) -> None:
+        """Mark the batch or step with this name as completed.
+
+        Args:
+            name (str): the name of the batch or step.
+            value (object, optional): a json serializable value to save with it.
+                Defaults to True.
+        """
+        if not self.enabled:
+            return
+        self._state["done"][name] = value
+        self._save()
+
+    def batches(self, batches: list[Any]) -> list[Any]:
+        """Returns the batches to process.
+
+        When resuming, the batches saved the first time are returned, so the completed
+        batches stay valid even if e.g. the number of parallel workers changed.
+
+        Args:
+            batches (list[Any]): the json serializable batches determined for this run.
+
+        Returns:
+            list[Any]: the batches to process.
+        """
+        if not self.enabled:
+            return batches
+        if "batches" not in self._state:
+            self._state["batches"] = batches
+            self._save()
+
+        return self._state["batches"]
+
+    def _save(self) -> None:
+        # Write to a temporary file first, so the state is never partially written
+        tmp_path = self.path.parent / f"{self.path.name}.tmp"
+        tmp_path.write_text(json.dumps(self._state))
+        tmp_path.replace(self.path)
+
+
 def worker_type_to_use(input_layer_featurecount: int) -> str:
     worker_type = ConfigOptions.get_worker_type
     if worker_type in ("threads", "processes"):
@@ -56,6 +236,45 @@ def worker_type_to_use(input_layer_featurecount: int) -> str:
     return "processes"
 
 
+_TMP_FILE_FORMATS = {
+    "gpkg": ("GPKG", ".gpkg"),
+    "fgb": ("FlatGeobuf", ".fgb"),
+    "arrow": ("Arrow", ".arrow"),
+    "parquet": ("Parquet", ".parquet"),
+}
+
+
+def tmp_partial_suffix(gpkg_needed: bool = False) -> str:
+    """Determine the suffix to use for temporary partial files.
+
+    The file format set in the tmp_file_format configuration option is used, see
+    :func:`options.set_tmp_file_format`.
+
+    Args:
+        gpkg_needed (bool, optional): True if the partial files need Geopackage
+            features, e.g. to preserve the fid or to apply spatialite sql on them. If
+            True, ".gpkg" is always returned. Defaults to False.
+
+    Raises:
+        ValueError: if the file format is invalid or if the GDAL driver needed for it
+            is not available.
+
+    Returns:
+        str: the suffix to use for temporary partial files.
+    """
+    tmp_file_format = ConfigOptions.get_tmp_file_format
+    if gpkg_needed:
+        return ".gpkg"
+
+    driver, suffix = _TMP_FILE_FORMATS[tmp_file_format]
+    if gdal.GetDriverByName(driver) is None:
+        raise ValueError(
+            f"tmp_file_format '{tmp_file_format}' needs the GDAL {driver} driver, "
+            "which is not available"
+        )
+    return suffix
+
+
 def warn_if_low_mem(called_from: str | None = None) -> None:
     """Warning if the low memory thresshold is reached.
 
@@ -71,3 +290,43 @@ def warn_if_low_mem(called_from: str | None = None) -> None:
         if called_from:
             warning_msg += f" ({called_from=})"
         warnings.warn(warning_msg, stacklevel=2)
+
+
+@contextmanager
+def batch_result_handler(
+    handler: Callable[[Path, Path, str | None, str | None], None],
+) -> Iterator[None]:
+    """Context manager to set a handler for the results of finished batches.
+
+    While the context is active, operations processed in batches call the handler
+    with the partial result file of every batch as soon as the batch is finished.
+
+    Args:
+        handler (Callable): function called with the output path of the operation, the
+            path to the partial result file, the layer and the where filter that still
+            needs to be applied on the partial result.
+    """
+    token = _batch_result_handler.set(handler)
+    try:
+        yield
+    finally:
+        _batch_result_handler.reset(token)
+
+
+def report_batch_result(
+    output_path: Path, partial_path: Path, layer: str | None, where: str | None
+) -> None:
+    """Pass the partial result file of a finished batch to the batch result handler.
+
+    If no handler was set with :func:`batch_result_handler`, nothing is done.
+
+    Args:
+        output_path (Path): the output path of the operation the batch belongs to.
+        partial_path (Path): the partial result file of the batch.
+        layer (str, optional): the layer in the partial result file.
+        where (str, optional): a filter that still needs to be applied on the partial
+            result. It can contain a "{geometrycolumn}" placeholder.
+    """
+    handler = _batch_result_handler.get()
+    if handler is not None:
+        handler(output_path, partial_path, layer, where)
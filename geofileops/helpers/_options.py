@@ -47,6 +47,306 @@ class ConfigOptions:
 
     """
 
+    @staticmethod
+    def set_batch_balance_by_cost(enable: bool | None) -> _RestoreOriginalHandler:
+        """Enable option to balance the batches of two-layer operations by cost.
+
+        If not set, this option is disabled by default and the batches are balanced
+        on the number of rows of the first input layer.
+
+        The processing time of e.g. an intersection is mainly determined by the number
+        of vertices of the geometries involved and the number of candidate geometries
+        in the second layer they need to be compared with, not by the number of rows.
+        Hence, if the input layer contains some very complex geometries (e.g. a
+        coastline), the batches they end up in can take a lot longer than the others.
+
+        If this option is enabled, the batch boundaries are determined so each batch
+        has approximately the same estimated cost. The cost of a row is estimated
+        based on the number of vertices of its geometry and the number of geometries
+        in the second layer its bounding box intersects with, as found in the
+        spatial index.
+
+        Remarks:
+
+            - Estimating the cost requires reading all geometries of the first input
+              layer, so for layers with simple geometries this can be slower than the
+              default row-based balancing.
+            - Only applied if both input files are Geopackages.
+            - You can also set the option temporarily by using this function as a
+              context manager.
+            - You can also set the option by directly setting the environment variable
+              `GFO_BATCH_BALANCE_BY_COST` to "TRUE" or "FALSE".
+
+        .. versionadded:: 0.12.0
+
+        Args:
+            enable (bool | None): If True, this option is enabled. If None, the option
+                is unset (so the default behavior is used).
+
+        Examples:
+            If you want to change the default value of the option in general, you can
+            just call it as a function:
+
+            .. code-block:: python
+
+                gfo.options.set_batch_balance_by_cost(True)
+
+
+            If you want to temporarily change the option, you can use it as a context
+            manager:
+
+            .. code-block:: python
+
+                with gfo.options.set_batch_balance_by_cost(True):
+                    gfo.intersection(...)
+
+        """
+        key = "GFO_BATCH_BALANCE_BY_COST"
+        original_value = os.environ.get(key)
+        if enable is not None:
+            os.environ[key] = "TRUE" if enable else "FALSE"
+        elif key in os.environ:
+            del os.environ[key]
+
+        return _RestoreOriginalHandler(key, original_value)
+
+    @classproperty
+    def get_batch_balance_by_cost(cls) -> bool:
+        """Should the batches of two-layer operations be balanced by estimated cost.
+
+        Returns:
+            bool: True to balance batches by estimated cost. Defaults to False.
+        """
+        return _get_bool("GFO_BATCH_BALANCE_BY_COST", default=False)
+
+    @staticmethod
+    def set_cache_dir(
+        path: Union[str, "os.PathLike[Any]"] | None,
+    ) -> _RestoreOriginalHandler:
+        """Set the directory to cache the results of operations in.
+
+        If set, the results of the operations in ``geoops`` are cached in this
+        directory. When an operation is called again with the same parameters and the
+        input files didn't change since, the cached result is copied to the output
+        file instead of running the operation again. The runtime options that can
+        influence the result, e.g. :func:`options.set_sliver_tolerance`, are taken into
+        account as well.
+
+        The input files are identified by their path, size and modification time, so
+        an input file that is overwritten with other data is detected as changed. The
+        cache size is limited via :func:`options.set_cache_max_size`: when it is
+        exceeded, the least recently used results are removed.
+
+        If not set, no results are cached.
+
+        Remarks:
+
+            - You can also set the option temporarily by using this function as a
+              context manager.
+            - You can also set the option by directly setting the environment variable
+              `GFO_CACHE_DIR` to the desired cache directory path.
+
+        .. versionadded:: 0.12.0
+
+        Args:
+            path (PathLike | str | None): The cache directory path. If None, the
+                option is unset (so no results are cached).
+
+        Examples:
+            If you want to change the default value of the option in general, you can
+            just call it as a function:
+
+            .. code-block:: python
+
+                gfo.options.set_cache_dir("/path/to/cache")
+
+
+            If you want to temporarily change the option, you can use it as a context
+            manager:
+
+            .. code-block:: python
+
+                with gfo.options.set_cache_dir("/path/to/cache"):
+                    gfo.intersection(...)
+
+        """
+        key = "GFO_CACHE_DIR"
+        original_value = os.environ.get(key)
+        if path is not None:
+            if not isinstance(path, str):
+                path = str(path)
+            os.environ[key] = path
+        elif key in os.environ:
+            del os.environ[key]
+
+        return _RestoreOriginalHandler(key, original_value)
+
+    @classproperty
+    def get_cache_dir(cls) -> Path | None:
+        """The directory to cache the results of operations in.
+
+        Returns:
+            Path | None: The cache directory or None if results should not be cached.
+                Defaults to None.
+        """
+        cache_dir_str = os.environ.get("GFO_CACHE_DIR")
+        if cache_dir_str is None or cache_dir_str.strip() == "":
+            return None
+
+        cache_dir = Path(cache_dir_str.strip())
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        return cache_dir
+
+    @staticmethod
+    def set_cache_max_size(max_bytes: int | None) -> _RestoreOriginalHandler:
+        """Set the maximum size of the cache with the results of operations.
+
+        If not set, the cache can grow to 10 GB. When the cache is larger after
+        adding a result, the least recently used results are removed.
+
+        Remarks:
+
+            - You can also set the option temporarily by using this function as a
+              context manager.
+            - You can also set the option by directly setting the environment variable
+              `GFO_CACHE_MAX_SIZE` to a string representing the number of bytes.
+            - The cache is only used if a cache directory is set with
+              :func:`options.set_cache_dir`.
+
+        .. versionadded:: 0.12.0
+
+        Args:
+            max_bytes (int | None): The maximum size of the cache, in bytes. If None,
+                the option is unset (so the default behavior is used).
+
+        Examples:
+            If you want to change the default value of the option in general, you can
+            just call it as a function:
+
+            .. code-block:: python
+
+                gfo.options.set_cache_max_size(50 * 1024**3)
+
+
+            If you want to temporarily change the option, you can use it as a context
+            manager:
+
+            .. code-block:: python
+
+                with gfo.options.set_cache_max_size(50 * 1024**3):
+                    gfo.intersection(...)
+
+        """
+        key = "GFO_CACHE_MAX_SIZE"
+        original_value = os.environ.get(key)
+        if max_bytes is not None:
+            os.environ[key] = str(max_bytes)
+        elif key in os.environ:
+            del os.environ[key]
+
+        return _RestoreOriginalHandler(key, original_value)
+
+    @classproperty
+    def get_cache_max_size(cls) -> int:
+        """Get the maximum size of the cache with the results of operations.
+
+        Returns:
+            int: The maximum size of the cache, in bytes. Defaults to 10 GB.
+        """
+        max_size_str = os.environ.get("GFO_CACHE_MAX_SIZE")
+        if max_size_str is None:
+            return 10 * 1024 * 1024 * 1024  # 10 GB
+
+        try:
+            max_size = int(max_size_str)
+        except ValueError as ex:
+            raise ValueError(
+                f"invalid value for configoption <GFO_CACHE_MAX_SIZE>: '{max_size_str}'"
+            ) from ex
+
+        return max_size
+
+    @staticmethod
+    def set_checkpoint_dir(
+        path: Union[str, "os.PathLike[Any]"] | None,
+    ) -> _RestoreOriginalHandler:
+        """Set the directory to keep the work of operations in, so they can be resumed.
+
+        If set, the operations in ``geoops`` keep their temporary files in a stable
+        directory in this directory, together with the batch plan and which batches
+        and steps were completed. If an operation fails, e.g. because the process ran
+        out of memory, these files are kept. When the operation is called again with
+        the same parameters and the input files didn't change since, the completed
+        batches and steps are skipped and the operation continues where it stopped.
+
+        If the operation succeeds, its files are removed from the checkpoint directory.
+
+        If not set, operations always start from scratch.
+
+        Remarks:
+
+            - You can also set the option temporarily by using this function as a
+              context manager.
+            - You can also set the option by directly setting the environment variable
+              `GFO_CHECKPOINT_DIR` to the desired checkpoint directory path.
+            - Completed batches are skipped for the single layer operations using
+              GeoPandas, for the two layer operations and for the tiles of
+              :func:`dissolve`. :func:`union` and :func:`dissolve` also skip the
+              steps they completed before, e.g. the merge of the polygons on the
+              tile borders.
+            - Only a call writing to the same output path and layer is resumed.
+
+        .. versionadded:: 0.12.0
+
+        Args:
+            path (PathLike | str | None): The checkpoint directory path. If None, the
+                option is unset (so operations can't be resumed).
+
+        Examples:
+            If you want to change the default value of the option in general, you can
+            just call it as a function:
+
+            .. code-block:: python
+
+                gfo.options.set_checkpoint_dir("/path/to/checkpoints")
+
+
+            If you want to temporarily change the option, you can use it as a context
+            manager:
+
+            .. code-block:: python
+
+                with gfo.options.set_checkpoint_dir("/path/to/checkpoints"):
+                    gfo.union(...)
+
+        """
+        key = "GFO_CHECKPOINT_DIR"
+        original_value = os.environ.get(key)
+        if path is not None:
+            if not isinstance(path, str):
+                path = str(path)
+            os.environ[key] = path
+        elif key in os.environ:
+            del os.environ[key]
+
+        return _RestoreOriginalHandler(key, original_value)
+
+    @classproperty
+    def get_checkpoint_dir(cls) -> Path | None:
+        """The directory to keep the work of operations in, so they can be resumed.
+
+        Returns:
+            Path | None: The checkpoint directory or None if operations should not be
+                resumable. Defaults to None.
+        """
+        checkpoint_dir_str = os.environ.get("GFO_CHECKPOINT_DIR")
+        if checkpoint_dir_str is None or checkpoint_dir_str.strip() == "":
+            return None
+
+        checkpoint_dir = Path(checkpoint_dir_str.strip())
+        checkpoint_dir.mkdir(parents=True, exist_ok=True)
+        return checkpoint_dir
+
     @staticmethod
     def set_copy_layer_sqlite_direct(enable: bool | None) -> _RestoreOriginalHandler:
         """Enable option to copy data directly in SQLite in `copy_layer` when possible.
@@ -192,6 +492,88 @@ class ConfigOptions:
 
         return io_engine
 
+    @staticmethod
+    def set_low_mem_available_pause_threshold(
+        min_bytes_available: int | None,
+    ) -> _RestoreOriginalHandler:
+        """Set the threshold to pause starting new batches when memory is low.
+
+        If not set, new batches are held back once less than 500 MB of memory, in
+        addition to the memory a batch is expected to need, is available.
+
+        Before a new batch is started in a parallelized operation, the available memory
+        is checked. If the memory available is less than this threshold plus the memory
+        a batch is expected to use, no new batches are started till enough memory
+        becomes available again as other batches finish. The memory a batch is expected
+        to use is estimated via the largest memory usage observed for the worker
+        processes. If no batches are running, a new batch is always started so the
+        operation keeps making progress.
+
+        Remarks:
+
+            - You can also set the option temporarily by using this function as a
+              context manager.
+            - You can also set the option by directly setting the environment variable
+              `GFO_LOW_MEM_AVAILABLE_PAUSE_THRESHOLD` to a string representing the
+              number of bytes.
+            - Set the threshold to 0 to disable pausing batches.
+
+        .. versionadded:: 0.12.0
+
+        Args:
+            min_bytes_available (int | None): The minimum amount of memory (in bytes)
+                that should be available to start new batches. If None, the option
+                is unset (so the default behavior is used).
+
+        Examples:
+            If you want to change the default value of the option in general, you can
+            just call it as a function:
+
+            .. code-block:: python
+
+                gfo.options.set_low_mem_available_pause_threshold(2 * 1024**3)
+
+
+            If you want to temporarily change the option, you can use it as a context
+            manager:
+
+            .. code-block:: python
+
+                with gfo.options.set_low_mem_available_pause_threshold(2 * 1024**3):
+                    gfo.dissolve(...)
+
+        """
+        key = "GFO_LOW_MEM_AVAILABLE_PAUSE_THRESHOLD"
+        original_value = os.environ.get(key)
+        if min_bytes_available is not None:
+            os.environ[key] = str(min_bytes_available)
+        elif key in os.environ:
+            del os.environ[key]
+
+        return _RestoreOriginalHandler(key, original_value)
+
+    @classproperty
+    def get_low_mem_available_pause_threshold(cls) -> int:
+        """Get the threshold to pause starting new batches when memory is low.
+
+        Returns:
+            int: The minimum amount of memory (in bytes) that should be available to
+                start new batches. Defaults to 500 MB.
+        """
+        threshold_str = os.environ.get("GFO_LOW_MEM_AVAILABLE_PAUSE_THRESHOLD")
+        if threshold_str is None:
+            return 500 * 1024 * 1024  # 500 MB
+
+        try:
+            threshold = int(threshold_str)
+        except ValueError as ex:
+            raise ValueError(
+                "invalid value for configoption "
+                f"<GFO_LOW_MEM_AVAILABLE_PAUSE_THRESHOLD>: '{threshold_str}'"
+            ) from ex
+
+        return threshold
+
     @staticmethod
     def set_low_mem_available_warn_threshold(
         min_bytes_available: int | None,
@@ -433,6 +815,75 @@ class ConfigOptions:
 
         return value_cleaned
 
+    @staticmethod
+    def set_read_file_sqlite_direct(enable: bool | None) -> _RestoreOriginalHandler:
+        """Enable option to read data directly via SQLite in `read_file` when possible.
+
+        If not set, this option is disabled by default.
+
+        The query is then executed directly in SQLite and the geometries are converted
+        from the Geopackage format in bulk, without the per-row overhead of GDAL. This
+        can be significantly faster to read large datasets.
+
+        It is only applied if several conditions are met:
+
+            - only used for Geopackage files
+            - only if no `sql_stmt` is used
+            - only if the `where` filter doesn't use GDAL or spatialite functions
+            - only if a `bbox` filter is used, if the layer has a spatial index
+            - only if the columns read are of type integer, real or text
+            - only for linear geometry types without M values
+            - ...
+
+        Remarks:
+
+            - You can also set the option temporarily by using this function as a
+              context manager.
+            - You can also set the option by directly setting the environment variable
+              `GFO_READ_FILE_SQLITE_DIRECT` to "TRUE" or "FALSE".
+
+        .. versionadded:: 0.12.0
+
+        Args:
+            enable (bool | None): If True, this option is enabled. If None, the option
+                is unset (so the default behavior is used).
+
+        Examples:
+            If you want to change the default value of the option in general, you can
+            just call it as a function:
+
+            .. code-block:: python
+
+                gfo.options.set_read_file_sqlite_direct(True)
+
+
+            If you want to temporarily change the option, you can use it as a context
+            manager:
+
+            .. code-block:: python
+
+                with gfo.options.set_read_file_sqlite_direct(True):
+                    gfo.read_file(...)
+
+        """
+        key = "GFO_READ_FILE_SQLITE_DIRECT"
+        original_value = os.environ.get(key)
+        if enable is not None:
+            os.environ[key] = "TRUE" if enable else "FALSE"
+        elif key in os.environ:
+            del os.environ[key]
+
+        return _RestoreOriginalHandler(key, original_value)
+
+    @classproperty
+    def get_read_file_sqlite_direct(cls) -> bool:
+        """Should read_file use sqlite directly when possible.
+
+        Returns:
+            bool: True to use sqlite directly to read layers. Defaults to False.
+        """
+        return _get_bool("GFO_READ_FILE_SQLITE_DIRECT", default=False)
+
     @staticmethod
     def set_remove_temp_files(enable: bool | None) -> _RestoreOriginalHandler:
         """Enable or disable removal of temporary files created during operations.
@@ -836,6 +1287,324 @@ class ConfigOptions:
         tmpdir.mkdir(parents=True, exist_ok=True)
         return tmpdir
 
+    @staticmethod
+    def set_tmp_file_format(
+        file_format: Literal["gpkg", "fgb", "arrow", "parquet"] | None,
+    ) -> _RestoreOriginalHandler:
+        """Set the file format to use for temporary partial files during processing.
+
+        Operations processed in batches write the result of each batch to a temporary
+        partial file that is appended to the output file afterwards. Using a file
+        format that is lighter to create than a Geopackage for these short-lived files
+        can reduce the fixed cost per batch. The final output is always written in the
+        file format asked.
+
+        Possible options are:
+
+            - **"gpkg"** (default if not set): Geopackage.
+            - **"fgb"**: FlatGeobuf.
+            - **"arrow"**: Arrow IPC, needs GDAL with the "Arrow" driver.
+            - **"parquet"**: GeoParquet, needs GDAL with the "Parquet" driver.
+
+        It is only applied if several conditions are met:
+
+            - the partial files don't need to preserve the fid of the input rows.
+            - no sql filter needs to be applied on the partial files (`where_post`).
+            - for two-layer operations, only when the calculation is done via GDAL
+              (`use_ogr=True`), as otherwise sqlite writes the partial files directly.
+
+        Remarks:
+
+            - You can also set the option temporarily by using this function as a
+              context manager.
+            - You can also set the option by directly setting the environment variable
+              `GFO_TMP_FILE_FORMAT` to one of "GPKG", "FGB", "ARROW" or "PARQUET".
+
+        .. versionadded:: 0.12.0
+
+        Args:
+            file_format (Literal["gpkg", "fgb", "arrow", "parquet"] | None): The file
+                format to use. If None, the option is unset (so the default behavior is
+                used).
+
+        Examples:
+            If you want to change the default value of the option in general, you can
+            just call it as a function:
+
+            .. code-block:: python
+
+                gfo.options.set_tmp_file_format("fgb")
+
+
+            If you want to temporarily change the option, you can use it as a context
+            manager:
+
+            .. code-block:: python
+
+                with gfo.options.set_tmp_file_format("fgb"):
+                    gfo.buffer(...)
+
+        """
+        key = "GFO_TMP_FILE_FORMAT"
+        original_value = os.environ.get(key)
+        if file_format is not None:
+            os.environ[key] = file_format.upper()
+        elif key in os.environ:
+            del os.environ[key]
+
+        return _RestoreOriginalHandler(key, original_value)
+
+    @classproperty
+    def get_tmp_file_format(cls) -> str:
+        """The file format to use for temporary partial files during processing.
+
+        Returns:
+            str: the file format to use. Possible values (lowercase):
+
+                - "gpkg" (default if not set): Geopackage.
+                - "fgb": FlatGeobuf.
+                - "arrow": Arrow IPC.
+                - "parquet": GeoParquet.
+        """
+        value = os.environ.get("GFO_TMP_FILE_FORMAT", default="gpkg").strip().lower()
+        supported_values = ["gpkg", "fgb", "arrow", "parquet"]
+        if value not in supported_values:
+            raise ValueError(
+                f"invalid value for configoption <GFO_TMP_FILE_FORMAT>: '{value}', "
+                f"should be one of {supported_values}"
+            )
+
+        return value
+
+    @staticmethod
+    def set_to_file_sqlite_direct(enable: bool | None) -> _RestoreOriginalHandler:
+        """Enable option to write data directly via SQLite in `to_file` when possible.
+
+        If not set, this option is disabled by default.
+
+        The geometries are then converted to the Geopackage format in bulk and all rows
+        are inserted in a single transaction, without the per-row overhead of GDAL. The
+        spatial index is created afterwards in bulk. This can be significantly faster to
+        write large datasets.
+
+        It is only applied if several conditions are met:
+
+            - only used for Geopackage files
+            - only if the columns are of type integer, float, bool or string
+            - only if all geometries have the same geometry type
+            - only if the crs has an EPSG code
+            - when appending, only if the columns of the layer are the same
+            - ...
+
+        Remarks:
+
+            - You can also set the option temporarily by using this function as a
+              context manager.
+            - You can also set the option by directly setting the environment variable
+              `GFO_TO_FILE_SQLITE_DIRECT` to "TRUE" or "FALSE".
+
+        .. versionadded:: 0.12.0
+
+        Args:
+            enable (bool | None): If True, this option is enabled. If None, the option
+                is unset (so the default behavior is used).
+
+        Examples:
+            If you want to change the default value of the option in general, you can
+            just call it as a function:
+
+            .. code-block:: python
+
+                gfo.options.set_to_file_sqlite_direct(True)
+
+
+            If you want to temporarily change the option, you can use it as a context
+            manager:
+
+            .. code-block:: python
+
+                with gfo.options.set_to_file_sqlite_direct(True):
+                    gfo.to_file(...)
+
+        """
+        key = "GFO_TO_FILE_SQLITE_DIRECT"
+        original_value = os.environ.get(key)
+        if enable is not None:
+            os.environ[key] = "TRUE" if enable else "FALSE"
+        elif key in os.environ:
+            del os.environ[key]
+
+        return _RestoreOriginalHandler(key, original_value)
+
+    @classproperty
+    def get_to_file_sqlite_direct(cls) -> bool:
+        """Should to_file use sqlite directly when possible.
+
+        Returns:
+            bool: True to use sqlite directly to write layers. Defaults to False.
+        """
+        return _get_bool("GFO_TO_FILE_SQLITE_DIRECT", default=False)
+
+    @staticmethod
+    def set_work_queue_dir(
+        path: Union[str, "os.PathLike[Any]"] | None,
+    ) -> _RestoreOriginalHandler:
+        """Set a shared directory to distribute the batches of operations over workers.
+
+        If set, the batches of the single layer operations using GeoPandas and of the
+        two layer operations are not processed by a local pool of workers, but written
+        as tasks to this directory. Workers, possibly on other machines, claim these
+        tasks and write back their results. The workers are started by calling
+        :func:`run_worker` with the same directory, e.g. in a separate process on each
+        machine. The calling process merges the results as they become available.
+
+        If not set, batches are processed by a local pool of workers.
+
+        Remarks:
+
+            - You can also set the option temporarily by using this function as a
+              context manager.
+            - You can also set the option by directly setting the environment variable
+              `GFO_WORK_QUEUE_DIR` to the desired work queue directory path.
+            - All workers should be able to access the work queue directory, the
+              input files and the temporary directory (see :func:`set_tmp_dir`) via
+              the same absolute paths as the calling process, e.g. on a shared file
+              system.
+            - The number of batches submitted at the same time is determined by the
+              ``nb_parallel`` parameter of the operations, so typically it should be
+              set to the total number of workers.
+            - The tasks and results are exchanged as pickled python objects, and
+              unpickling them can execute arbitrary code. Hence, only use a directory
+              that can only be written to by trusted users.
+            - If no worker claims the tasks, the operation waits indefinitely and
+              logs a warning regularly. Use :func:`set_work_queue_timeout` to stop
+              waiting after some time.
+
+        .. versionadded:: 0.12.0
+
+        Args:
+            path (PathLike | str | None): The work queue directory path. If None, the
+                option is unset (so batches are processed locally).
+
+        Examples:
+            If you want to change the default value of the option in general, you can
+            just call it as a function:
+
+            .. code-block:: python
+
+                gfo.options.set_work_queue_dir("/shared/geofileops_queue")
+
+
+            If you want to temporarily change the option, you can use it as a context
+            manager:
+
+            .. code-block:: python
+
+                with gfo.options.set_work_queue_dir("/shared/geofileops_queue"):
+                    gfo.intersection(..., nb_parallel=32)
+
+        """
+        key = "GFO_WORK_QUEUE_DIR"
+        original_value = os.environ.get(key)
+        if path is not None:
+            if not isinstance(path, str):
+                path = str(path)
+            os.environ[key] = path
+        elif key in os.environ:
+            del os.environ[key]
+
+        return _RestoreOriginalHandler(key, original_value)
+
+    @classproperty
+    def get_work_queue_dir(cls) -> Path | None:
+        """The shared directory to distribute the batches of operations over workers.
+
+        Returns:
+            Path | None: The work queue directory or None if batches should be
+                processed locally. Defaults to None.
+        """
+        work_queue_dir_str = os.environ.get("GFO_WORK_QUEUE_DIR")
+        if work_queue_dir_str is None or work_queue_dir_str.strip() == "":
+            return None
+
+        work_queue_dir = Path(work_queue_dir_str.strip())
+        work_queue_dir.mkdir(parents=True, exist_ok=True)
+        return work_queue_dir
+
+    @staticmethod
+    def set_work_queue_timeout(timeout: float | None) -> _RestoreOriginalHandler:
+        """Set the number of seconds to wait till a worker claims a task.
+
+        If a work queue directory is set with :func:`set_work_queue_dir` and no task
+        of an operation was claimed by a worker for this number of seconds, e.g.
+        because no workers were started, the tasks not claimed yet fail with a
+        ``TimeoutError``.
+
+        If not set, the operation waits indefinitely for workers to claim the tasks,
+        but a warning is logged regularly.
+
+        Remarks:
+
+            - You can also set the option temporarily by using this function as a
+              context manager.
+            - You can also set the option by directly setting the environment variable
+              `GFO_WORK_QUEUE_TIMEOUT` to the number of seconds.
+
+        .. versionadded:: 0.12.0
+
+        Args:
+            timeout (float | None): The number of seconds to wait. If None, the option
+                is unset (so the default behavior is used).
+
+        Examples:
+            If you want to change the default value of the option in general, you can
+            just call it as a function:
+
+            .. code-block:: python
+
+                gfo.options.set_work_queue_timeout(600)
+
+
+            If you want to temporarily change the option, you can use it as a context
+            manager:
+
+            .. code-block:: python
+
+                with gfo.options.set_work_queue_timeout(600):
+                    gfo.intersection(...)
+
+        """
+        key = "GFO_WORK_QUEUE_TIMEOUT"
+        original_value = os.environ.get(key)
+        if timeout is not None:
+            os.environ[key] = str(timeout)
+        elif key in os.environ:
+            del os.environ[key]
+
+        return _RestoreOriginalHandler(key, original_value)
+
+    @classproperty
+    def get_work_queue_timeout(cls) -> float | None:
+        """The number of seconds to wait till a worker claims a task.
+
+        Returns:
+            float | None: The number of seconds to wait or None to wait indefinitely.
+                Defaults to None.
+        """
+        timeout_str = os.environ.get("GFO_WORK_QUEUE_TIMEOUT")
+        if timeout_str is None or timeout_str.strip() == "":
+            return None
+
+        try:
+            timeout = float(timeout_str)
+        except ValueError as ex:
+            raise ValueError(
+                "invalid value for configoption "
+                f"<GFO_WORK_QUEUE_TIMEOUT>: '{timeout_str}'"
+            ) from ex
+
+        return timeout
+
     @staticmethod
     def set_worker_type(
         worker_type: Literal["processes", "threads", "auto"] | None,
@@ -0,0 +1,256 @@
+"""Module with a cache for the results of operations."""
+
+import enum
+import hashlib
+import inspect
+import json
+import logging
+import os
+import shutil
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import cloudpickle
+
+import geofileops as gfo
+from geofileops import fileops
+from geofileops.helpers._options import ConfigOptions
+from geofileops.util import _geofileinfo
+
+logger = logging.getLogger(__name__)
+
+# Parameters that don't influence the result of an operation. The output layer name
+# is applied when a cached result is copied.
+_PARAMS_NOT_IN_KEY = (
+    "output_path",
+    "output_layer",
+    "force",
+    "nb_parallel",
+    "batchsize",
+)
+# Runtime options that can influence the result of an operation
+_OPTIONS_IN_KEY = (
+    "GFO_IO_ENGINE",
+    "GFO_ON_DATA_ERROR",
+    "GFO_SLIVER_TOLERANCE",
+    "GFO_TMP_FILE_FORMAT",
+)
+
+
+def run_cached(func: Callable, bound: inspect.BoundArguments) -> object:
+    """Run an operation, using the cache of results if a cache directory is set.
+
+    If the result of the operation with the same parameters and the same input files
+    is in the cache, it is copied to the output path instead of running the
+    operation. Otherwise the operation is run and its result is added to the cache.
+
+    Only operations with a required ``output_path`` they write their result to are
+    cached.
+
+    Args:
+        func (Callable): the operation to run.
+        bound (inspect.BoundArguments): the arguments to call the operation with.
+
+    Returns:
+        object: the return value of the operation.
+    """
+    cache_dir = ConfigOptions.get_cache_dir
+    output_path = bound.arguments.get("output_path")
+    output_param = inspect.signature(func).parameters.get("output_path")
+    if (
+        cache_dir is None
+        or output_path is None
+        or output_param is None
+        or output_param.default is not inspect.Parameter.empty
+    ):
+        return func(*bound.args, **bound.kwargs)
+
+    # If the output exists and force is False, the operation will do nothing anyway
+    output_path = Path(output_path)
+    force = bound.arguments.get("force", False)
+    if output_path.exists() and not force:
+        return func(*bound.args, **bound.kwargs)
+
+    key = cache_key(func.__name__, bound.arguments)
+    if key is None:
+        return func(*bound.args, **bound.kwargs)
+
+    # Cache hit: copy the cached result to the output path
+    entry_dir = cache_dir / key
+    cached_path = entry_dir / f"output{output_path.suffix}"
+    if cached_path.exists():
+        logger.info(f"{func.__name__}: result found in cache, copy to {output_path}")
+        if output_path.exists():
+            fileops.remove(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        fileops.copy(cached_path, output_path)
+        _set_output_layer(output_path, bound.arguments.get("output_layer"))
+        # Touch the entry so it is considered recently used
+        os.utime(entry_dir)
+        return None
+
+    # Cache miss: run the operation and add the result to the cache
+    result = func(*bound.args, **bound.kwargs)
+    if output_path.exists():
+        try:
+            _add_to_cache(output_path, entry_dir, cached_path)
+            evict(cache_dir, max_size=ConfigOptions.get_cache_max_size)
+        except Exception as ex:
+            logger.warning(f"error adding result to cache {cache_dir}: {ex}")
+
+    return result
+
+
+def cache_key(operation_name: str, arguments: dict[str, Any]) -> str | None:
+    """Determine the key in the cache for an operation call.
+
+    The key is a hash of the operation name, the normalized parameters, the runtime
+    options that can influence the result and the fingerprints of the input files.
+    Input files are identified by their path, size and modification time, including
+    the extra files some file types consist of. The name of the output layer is not
+    part of the key: it is set when a cached result is copied to the output path.
+
+    Args:
+        operation_name (str): the name of the operation.
+        arguments (dict[str, Any]): the arguments of the operation call.
+
+    Returns:
+        str | None: the key, or None if the call cannot be cached.
+    """
+    normalized: dict[str, Any] = {
+        "operation": operation_name,
+        "version": gfo.__version__,
+    }
+    for name, value in arguments.items():
+        if name in _PARAMS_NOT_IN_KEY:
+            continue
+        if name.endswith("_path") and isinstance(value, str | os.PathLike):
+            normalized[name] = _fingerprint(Path(value))
+        else:
+            try:
+                normalized[name] = _normalize(value)
+            except Exception:
+                # E.g. functions that cannot be pickled
+                return None
+
+    # The file format of the output influences the result
+    normalized["output_suffix"] = Path(arguments["output_path"]).suffix.lower()
+    normalized["options"] = {key: os.environ.get(key) for key in _OPTIONS_IN_KEY}
+
+    key_str = json.dumps(normalized, sort_keys=True)
+    return hashlib.sha256(key_str.encode()).hexdigest()
+
+
+def checkpoint_key(operation_name: str, arguments: dict[str, Any]) -> str | None:
+    """Determine the key of the checkpoint directory for an operation call.
+
+    Contrary to the key in the cache, the output path and layer are part of the key:
+    the work left behind by a failed call is only resumed to write the same output.
+
+    Args:
+        operation_name (str): the name of the operation.
+        arguments (dict[str, Any]): the arguments of the operation call.
+
+    Returns:
+        str | None: the key, or None if the call cannot be resumed.
+    """
+    key = cache_key(operation_name, arguments)
+    if key is None:
+        return None
+
+    normalized = {
+        "cache_key": key,
+        "output_path": str(Path(arguments["output_path"]).absolute()),
+        "output_layer": arguments.get("output_layer"),
+    }
+    key_str = json.dumps(normalized, sort_keys=True)
+    return hashlib.sha256(key_str.encode()).hexdigest()
+
+
+def evict(cache_dir: Path, max_size: int) -> None:
+    """Remove the least recently used results till the cache isn't too large anymore.
+
+    Args:
+        cache_dir (Path): the cache directory.
+        max_size (int): the maximum size of the cache, in bytes.
+    """
+    entries = []
+    for entry_dir in cache_dir.iterdir():
+        if not entry_dir.is_dir() or entry_dir.name.startswith("tmp_"):
+            continue
+        size = sum(path.stat().st_size for path in entry_dir.iterdir())
+        entries.append((entry_dir.stat().st_mtime, size, entry_dir))
+
+    total_size = sum(size for _, size, _ in entries)
+    for _, size, entry_dir in sorted(entries):
+        if total_size <= max_size:
+            break
+        logger.debug(f"remove least recently used result from cache: {entry_dir}")
+        shutil.rmtree(entry_dir, ignore_errors=True)
+        total_size -= size
+
+
+def _add_to_cache(output_path: Path, entry_dir: Path, cached_path: Path) -> None:
+    # Copy to a temporary directory first, so other processes never see a partially
+    # written entry.
+    tmp_entry_dir = entry_dir.parent / f"tmp_{entry_dir.name}_{os.getpid()}"
+    tmp_entry_dir.mkdir(parents=True, exist_ok=True)
+    fileops.copy(output_path, tmp_entry_dir / cached_path.name)
+    try:
+        tmp_entry_dir.rename(entry_dir)
+    except OSError:
+        # Another process added the same result in the meantime
+        shutil.rmtree(tmp_entry_dir, ignore_errors=True)
+
+
+def _set_output_layer(output_path: Path, output_layer: str | None) -> None:
+    """Rename the layer of a result copied from the cache to the layer name asked."""
+    if _geofileinfo.get_geofileinfo(output_path).is_singlelayer:
+        # The layer name is determined by the file name
+        return
+    if output_layer is None:
+        output_layer = gfo.get_default_layer(output_path)
+    layers = fileops.listlayers(output_path)
+    if layers != [output_layer]:
+        fileops.rename_layer(output_path, new_layer=output_layer, layer=layers[0])
+
+
+def _fingerprint(path: Path) -> str | list[list[object]]:
+    """Fingerprint a file based on its path, size and modification time."""
+    if not path.exists():
+        return str(path)
+
+    paths = [path]
+    if path.is_file():
+        suffixes = _geofileinfo.get_geofileinfo(path).suffixes_extrafiles
+        paths.extend(path.parent / f"{path.stem}{suffix}" for suffix in suffixes)
+        # Changes in a GPKG/SQLite file can still be in the write-ahead log
+        paths.append(path.parent / f"{path.name}-wal")
+
+    fingerprint: list[list[object]] = []
+    for curr_path in dict.fromkeys(paths):
+        if not curr_path.exists():
+            continue
+        stat = curr_path.stat()
+        fingerprint.append([str(curr_path.resolve()), stat.st_size, stat.st_mtime_ns])
+
+    return fingerprint
+
+
+def _normalize(value: object) -> object:
+    """Convert a parameter value to a value that can be serialized to json."""
+    if value is None or isinstance(value, bool | int | float | str):
+        return value
+    if isinstance(value, enum.Enum):
+        return f"{type(value).__name__}.{value.name}"
+    if isinstance(value, os.PathLike):
+        return _fingerprint(Path(value))
+    if isinstance(value, list | tuple):
+        return [_normalize(item) for item in value]
+    if isinstance(value, dict):
+        return {str(key): _normalize(item) for key, item in sorted(value.items())}
+    if callable(value):
+        return hashlib.sha256(cloudpickle.dumps(value)).hexdigest()
+
+    return repr(value)
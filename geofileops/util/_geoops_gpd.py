@@ -2,6 +2,8 @@
 
 import copy
 import enum
+import functools
+import itertools
 import json
 import logging
 import logging.config
@@ -24,6 +26,7 @@ import psutil
 import pygeoops
 import shapely
 import shapely.geometry as sh_geom
+from numpy.typing import NDArray
 from pygeoops import GeometryType, PrimitiveType
 from pyproj import Transformer
 from shapely.geometry.base import BaseGeometry
@@ -247,11 +250,13 @@ class ProcessingParams:
         nb_parallel: int,
         batches: list[str],
         batchsize: int,
+        row_cost_estimate: dict[str, float] | None = None,
     ) -> None:
         self.nb_rows_to_process = nb_rows_to_process
         self.nb_parallel = nb_parallel
         self.batches = batches
         self.batchsize = batchsize
+        self.row_cost_estimate = row_cost_estimate
 
     def to_json(self, path: Path) -> None:
         prepared = _general_util.prepare_for_serialize(vars(self))
@@ -259,6 +264,131 @@ class ProcessingParams:
             file.write(json.dumps(prepared, indent=4, sort_keys=True))
 
 
+class GeoOperation(enum.Enum):
+    SIMPLIFY = "simplify"
+    BUFFER = "buffer"
+    CONVEXHULL = "convexhull"
+    APPLY = "apply"
+    APPLY_VECTORIZED = "apply_vectorized"
+    CHAIN = "chain"
+
+
+# Factor to apply on the memory needed to store the input geometries to estimate the
+# peak memory usage while applying the operation.
+_OPERATION_MEMORY_FACTOR = {
+    GeoOperation.BUFFER: 4.0,
+    GeoOperation.CONVEXHULL: 2.0,
+    GeoOperation.SIMPLIFY: 2.0,
+    GeoOperation.APPLY: 3.0,
+    GeoOperation.APPLY_VECTORIZED: 3.0,
+    GeoOperation.CHAIN: 4.0,
+}
+# Relative cost to process one point of a geometry for the operation.
+_OPERATION_COST_FACTOR = {
+    GeoOperation.BUFFER: 4.0,
+    GeoOperation.CONVEXHULL: 1.0,
+    GeoOperation.SIMPLIFY: 1.0,
+    GeoOperation.APPLY: 2.0,
+    GeoOperation.APPLY_VECTORIZED: 1.0,
+    GeoOperation.CHAIN: 6.0,
+}
+# The maximum cost (~ number of points x cost factor) to aim for in one batch.
+_MAX_COST_PER_BATCH = 10_000_000
+# Only estimate the row costs for layers with more rows, smaller layers are processed
+# in one batch anyway.
+_ROW_COST_ESTIMATE_MIN_ROWS = 1000
+
+
+def _estimate_row_costs(
+    input_path: Path,
+    input_layer: LayerInfo,
+    columns: list[str] | None,
+    operation: GeoOperation | None,
+    sample_size: int = 300,
+) -> dict[str, float] | None:
+    """Estimate the memory and the processing cost per row for an operation.
+
+    A sample of rows, spread evenly over the fid range of the layer, is queried for
+    the number of points and the size of the geometries and for the size of the
+    attribute columns to be read.
+
+    Args:
+        input_path (Path): the file to estimate the row costs for.
+        input_layer (LayerInfo): the layer to estimate the row costs for.
+        columns (list[str] | None): the columns that will be read. If None, all
+            columns are read.
+        operation (GeoOperation | None): the operation that will be applied.
+        sample_size (int, optional): the number of rows to sample. Defaults to 300.
+
+    Returns:
+        dict[str, float] | None: the estimate, or None if no rows could be sampled.
+            Keys: "nb_rows_sampled", "avg_npoints", "avg_geom_bytes",
+            "avg_attr_bytes", "bytes_per_row" and "cost_per_row".
+    """
+    if input_layer.featurecount == 0:
+        return None
+
+    # Determine the fids to sample
+    if GeofileInfo(input_path).is_spatialite_based:
+        sql_stmt = f"""
+            SELECT MIN(rowid) minmax_fid FROM "{input_layer.name}"
+            UNION ALL
+            SELECT MAX(rowid) minmax_fid FROM "{input_layer.name}"
+        """
+        minmax_df = gfo.read_file(input_path, sql_stmt=sql_stmt, sql_dialect="SQLITE")
+        min_fid = pd.to_numeric(minmax_df["minmax_fid"][0]).item()
+        max_fid = pd.to_numeric(minmax_df["minmax_fid"][1]).item()
+    else:
+        min_fid = 0 if GeofileInfo(input_path).is_fid_zerobased else 1
+        max_fid = min_fid + input_layer.featurecount - 1
+    sample_fids = np.unique(
+        np.linspace(min_fid, max_fid, num=sample_size).round().astype(np.int64)
+    )
+    sample_fids_str = ", ".join(str(fid) for fid in sample_fids)
+
+    # Query the sizes of the sampled rows
+    if columns is None:
+        columns = list(input_layer.columns)
+    columns = [column for column in columns if column.lower() != "fid"]
+    attr_bytes_str = " + ".join(f'IFNULL(LENGTH("{column}"), 0)' for column in columns)
+    if attr_bytes_str == "":
+        attr_bytes_str = "0"
+    geometrycolumn = input_layer.geometrycolumn
+    sql_stmt = f"""
+        SELECT IFNULL(ST_NPoints("{geometrycolumn}"), 0) AS npoints
+              ,IFNULL(LENGTH("{geometrycolumn}"), 0) AS geom_bytes
+              ,{attr_bytes_str} AS attr_bytes
+          FROM "{input_layer.name}"
+         WHERE rowid IN ({sample_fids_str})
+    """
+    sample_df = gfo.read_file(input_path, sql_stmt=sql_stmt, sql_dialect="SQLITE")
+    if len(sample_df) == 0:
+        return None
+
+    avg_npoints = float(sample_df["npoints"].mean())
+    avg_geom_bytes = float(sample_df["geom_bytes"].mean())
+    avg_attr_bytes = float(sample_df["attr_bytes"].mean())
+
+    # A shapely geometry needs ~24 bytes per point + some fixed overhead. Python
+    # objects for the attributes have an overhead of ~60 bytes per value.
+    memory_factor = 3.0
+    cost_factor = 2.0
+    if operation is not None:
+        memory_factor = _OPERATION_MEMORY_FACTOR[operation]
+        cost_factor = _OPERATION_COST_FACTOR[operation]
+    geom_bytes = (avg_geom_bytes + 24 * avg_npoints + 200) * memory_factor
+    attr_bytes = avg_attr_bytes + 60 * len(columns)
+
+    return {
+        "nb_rows_sampled": len(sample_df),
+        "avg_npoints": avg_npoints,
+        "avg_geom_bytes": avg_geom_bytes,
+        "avg_attr_bytes": avg_attr_bytes,
+        "bytes_per_row": math.ceil(geom_bytes + attr_bytes),
+        "cost_per_row": max(avg_npoints, 1.0) * cost_factor,
+    }
+
+
 def _prepare_processing_params(
     input_path: Path,
     input_layer: LayerInfo,
@@ -266,8 +396,39 @@ def _prepare_processing_params(
     batchsize: int,
     parallelization_config: ParallelizationConfig | None = None,
     tmp_dir: Path | None = None,
+    operation: GeoOperation | None = None,
+    columns: list[str] | None = None,
 ) -> ProcessingParams:
     fid_column = input_layer.fid_column if input_layer.fid_column != "" else "fid"
+
+    # If no explicit parallelization config or batchsize is specified, base the
+    # parallelization config on the costs estimated on a sample of the input rows.
+    row_cost_estimate = None
+    if (
+        parallelization_config is None
+        and batchsize <= 0
+        and input_layer.featurecount > _ROW_COST_ESTIMATE_MIN_ROWS
+    ):
+        row_cost_estimate = _estimate_row_costs(
+            input_path, input_layer, columns=columns, operation=operation
+        )
+        if row_cost_estimate is not None:
+            max_rows_per_batch = int(
+                _MAX_COST_PER_BATCH / row_cost_estimate["cost_per_row"]
+            )
+            max_rows_per_batch = max(min(max_rows_per_batch, 100000), 100)
+            parallelization_config = ParallelizationConfig(
+                bytes_per_row=int(row_cost_estimate["bytes_per_row"]),
+                min_rows_per_batch=min(1000, max_rows_per_batch),
+                max_rows_per_batch=max_rows_per_batch,
+            )
+            logger.info(
+                "Row costs estimated: "
+                f"bytes_per_row: {row_cost_estimate['bytes_per_row']}, "
+                f"avg_npoints: {row_cost_estimate['avg_npoints']:.1f}, "
+                f"max_rows_per_batch: {max_rows_per_batch}"
+            )
+
     nb_parallel, nb_batches = _determine_nb_batches(
         nb_rows_total=input_layer.featurecount,
         nb_parallel=nb_parallel,
@@ -354,6 +515,7 @@ def _prepare_processing_params(
         nb_parallel=nb_parallel,
         batches=batches,
         batchsize=int(input_layer.featurecount / len(batches)),
+        row_cost_estimate=row_cost_estimate,
     )
 
     if tmp_dir is not None:
@@ -361,14 +523,6 @@ def _prepare_processing_params(
     return returnvalue
 
 
-class GeoOperation(enum.Enum):
-    SIMPLIFY = "simplify"
-    BUFFER = "buffer"
-    CONVEXHULL = "convexhull"
-    APPLY = "apply"
-    APPLY_VECTORIZED = "apply_vectorized"
-
-
 def apply(
     input_path: Path,
     output_path: Path,
@@ -678,6 +832,283 @@ def simplify(
     )
 
 
+def apply_operations(
+    input_path: Path,
+    operations: list[tuple[str, Path, dict[str, Any]]],
+    input_layer: str | LayerInfo | None = None,
+    columns: list[str] | None = None,
+    explodecollections: bool = False,
+    gridsize: float = 0.0,
+    keep_empty_geoms: bool = False,
+    where_post: str | None = None,
+    nb_parallel: int | None = None,
+    batchsize: int = -1,
+    force: bool = False,
+) -> None:
+    # Init
+    if not isinstance(input_layer, LayerInfo):
+        input_layer = gfo.get_layerinfo(input_path, input_layer)
+
+    # Validate all operations before existing outputs are removed
+    outputs = []
+    output_paths: set[Path] = set()
+    for operation_name, output_path, params in operations:
+        output_path = Path(output_path)
+        if output_path in output_paths:
+            raise ValueError(
+                f"apply_operations: output_path specified multiple times: {output_path}"
+            )
+        output_paths.add(output_path)
+
+        params = dict(params)
+        output_layer = params.pop("output_layer", None)
+        output = _prepare_operation(
+            operation_name, params, input_layer.geometrytypename, explodecollections
+        )
+        outputs.append(
+            {**output, "output_path": output_path, "output_layer": output_layer}
+        )
+
+    outputs = [
+        output
+        for output in outputs
+        if not _io_util.output_exists(
+            path=output["output_path"], remove_if_exists=force
+        )
+    ]
+
+    if len(outputs) == 0:
+        return
+
+    # Go!
+    # The first output is the main one, the others are calculated on the same batches
+    return _apply_geooperation_to_layer(
+        input_path=input_path,
+        output_path=outputs[0]["output_path"],
+        operation=outputs[0]["operation"],
+        operation_params=outputs[0]["operation_params"],
+        input_layer=input_layer,
+        output_layer=outputs[0]["output_layer"],
+        columns=columns,
+        explodecollections=explodecollections,
+        force_output_geometrytype=outputs[0]["force_output_geometrytype"],
+        gridsize=gridsize,
+        keep_empty_geoms=keep_empty_geoms,
+        where_post=where_post,
+        nb_parallel=nb_parallel,
+        batchsize=batchsize,
+        force=force,
+        tmp_basedir=None,
+        extra_outputs=outputs[1:],
+    )
+
+
+def chain(
+    input_path: Path,
+    output_path: Path,
+    steps: list[tuple[str, dict[str, Any]]],
+    input_layer: str | LayerInfo | None = None,
+    output_layer: str | None = None,
+    columns: list[str] | None = None,
+    explodecollections: bool = False,
+    gridsize: float = 0.0,
+    keep_empty_geoms: bool = False,
+    where_post: str | None = None,
+    nb_parallel: int | None = None,
+    batchsize: int = -1,
+    force: bool = False,
+) -> None:
+    """Applies a chain of single layer operations on each batch of the input layer.
+
+    Each batch is read once, all operations are applied one after the other on it and
+    the result is written once.
+
+    Args:
+        input_path (Path): the input file.
+        output_path (Path): the file to write the result to.
+        steps (list[tuple[str, dict[str, Any]]]): the operations to apply, as tuples of
+            the operation name and its parameters. The supported operations are the
+            same as for :func:`apply_operations`.
+        input_layer (str | LayerInfo, optional): input layer name. If None,
+            ``input_path`` should contain only one layer. Defaults to None.
+        output_layer (str, optional): output layer name. If None, the ``output_path``
+            stem is used. Defaults to None.
+        columns (list[str], optional): the columns to keep. If None, all columns are
+            kept. Defaults to None.
+        explodecollections (bool, optional): True to output only simple geometries.
+            Defaults to False.
+        gridsize (float, optional): the size of the grid the coordinates of the output
+            will be rounded to. Defaults to 0.0.
+        keep_empty_geoms (bool, optional): True to keep rows with empty/null
+            geometries in the output. Defaults to False.
+        where_post (str, optional): sql filter to apply after all other processing.
+            Defaults to None.
+        nb_parallel (int | None, optional): the number of parallel workers to use.
+            Defaults to None.
+        batchsize (int, optional): indicative number of rows to process per batch.
+            Defaults to -1: (try to) determine optimal size automatically.
+        force (bool, optional): overwrite existing output file(s). Defaults to False.
+
+    """
+    if not isinstance(input_layer, LayerInfo):
+        input_layer = gfo.get_layerinfo(input_path, input_layer)
+    if len(steps) == 0:
+        raise ValueError("chain: at least one step must be specified")
+
+    # Prepare the steps. The output geometry type is the one of the last step that
+    # determines it, unless a later step can change the geometry type.
+    chain_steps = []
+    force_output_geometrytype = None
+    geometrytypename = input_layer.geometrytypename
+    for operation_name, params in steps:
+        step = _prepare_operation(
+            operation_name, params, geometrytypename, explodecollections
+        )
+        chain_steps.append((step["operation"], step["operation_params"]))
+        if step["force_output_geometrytype"] is not None:
+            force_output_geometrytype = step["force_output_geometrytype"]
+            geometrytypename = force_output_geometrytype
+        elif step["operation"] is not GeoOperation.SIMPLIFY:
+            force_output_geometrytype = None
+            geometrytypename = GeometryType.GEOMETRY.name
+
+    if len(chain_steps) == 1:
+        operation, operation_params = chain_steps[0]
+    else:
+        operation = GeoOperation.CHAIN
+        operation_params = {
+            "operation_name": "chain",
+            "steps": chain_steps,
+        }
+
+    # Go!
+    return _apply_geooperation_to_layer(
+        input_path=input_path,
+        output_path=output_path,
+        operation=operation,
+        operation_params=operation_params,
+        input_layer=input_layer,
+        output_layer=output_layer,
+        columns=columns,
+        explodecollections=explodecollections,
+        force_output_geometrytype=force_output_geometrytype,
+        gridsize=gridsize,
+        keep_empty_geoms=keep_empty_geoms,
+        where_post=where_post,
+        nb_parallel=nb_parallel,
+        batchsize=batchsize,
+        force=force,
+        tmp_basedir=None,
+    )
+
+
+def _prepare_operation(
+    operation_name: str,
+    params: dict[str, Any],
+    input_geometrytypename: str,
+    explodecollections: bool,
+) -> dict[str, Any]:
+    """Determine the operation and operation_params for an operation by name.
+
+    The parameters supported per operation are the same as the ones of the
+    corresponding function in geoops.py.
+
+    Returns:
+        dict[str, Any]: with keys "operation", "operation_params" and
+            "force_output_geometrytype".
+    """
+    force_output_geometrytype = None
+    if operation_name == "buffer":
+        operation = GeoOperation.BUFFER
+        defaults: dict[str, Any] = {
+            "distance": None,
+            "quadrantsegments": 5,
+            "endcap_style": BufferEndCapStyle.ROUND,
+            "join_style": BufferJoinStyle.ROUND,
+            "mitre_limit": 5.0,
+            "single_sided": False,
+        }
+        # Buffer operation always results in polygons...
+        if explodecollections:
+            force_output_geometrytype = GeometryType.POLYGON.name
+        else:
+            force_output_geometrytype = GeometryType.MULTIPOLYGON.name
+    elif operation_name == "convexhull":
+        operation = GeoOperation.CONVEXHULL
+        defaults = {}
+    elif operation_name == "simplify":
+        operation = GeoOperation.SIMPLIFY
+        defaults = {
+            "tolerance": None,
+            "algorithm": SimplifyAlgorithm.RAMER_DOUGLAS_PEUCKER,
+            "lookahead": 8,
+        }
+    elif operation_name == "apply":
+        operation = GeoOperation.APPLY
+        defaults = {
+            "func": None,
+            "only_geom_input": True,
+            "force_output_geometrytype": None,
+        }
+    elif operation_name in ("makevalid", "apply_vectorized"):
+        operation = GeoOperation.APPLY_VECTORIZED
+        defaults = {"force_output_geometrytype": None}
+        if operation_name == "apply_vectorized":
+            defaults["func"] = None
+    else:
+        raise ValueError(f"unsupported operation: {operation_name}")
+
+    unknown_params = set(params) - set(defaults)
+    if len(unknown_params) > 0:
+        raise ValueError(
+            f"invalid parameters for {operation_name}: {sorted(unknown_params)}"
+        )
+    operation_params = {**defaults, **params}
+    missing_params = [
+        key
+        for key, value in operation_params.items()
+        if value is None and key != "force_output_geometrytype"
+    ]
+    if len(missing_params) > 0:
+        raise ValueError(f"missing parameters for {operation_name}: {missing_params}")
+
+    if operation_name == "buffer":
+        operation_params["operation_name"] = operation_name
+    elif operation_name == "simplify":
+        operation_params["step"] = operation_params.pop("lookahead")
+    elif operation_name in ("apply", "makevalid", "apply_vectorized"):
+        force_output_geometrytype = operation_params.pop("force_output_geometrytype")
+        if isinstance(force_output_geometrytype, GeometryType):
+            force_output_geometrytype = force_output_geometrytype.name
+
+        if operation_name == "makevalid":
+            # Determine if collapsed parts need to be kept after makevalid or not
+            keep_collapsed = force_output_geometrytype is not None and not (
+                force_output_geometrytype.startswith(input_geometrytypename)
+                or input_geometrytypename.startswith(force_output_geometrytype)
+            )
+
+            def func(geom: NDArray[Any]) -> NDArray[Any]:
+                return pygeoops.make_valid(
+                    geom, keep_collapsed=keep_collapsed, only_if_invalid=True
+                )
+
+        else:
+            func = operation_params.pop("func")
+
+        operation_params = {
+            **operation_params,
+            "operation_name": operation_name,
+            "pickled_func": cloudpickle.dumps(func),
+        }
+
+    return {
+        "operation": operation,
+        "operation_params": operation_params,
+        "force_output_geometrytype": force_output_geometrytype,
+    }
+
+
 def _apply_geooperation_to_layer(
     input_path: Path,
     output_path: Path,
@@ -696,6 +1127,7 @@ def _apply_geooperation_to_layer(
     force: bool,  # = False
     tmp_basedir: Path | None,
     parallelization_config: ParallelizationConfig | None = None,
+    extra_outputs: list[dict[str, Any]] | None = None,
 ) -> None:
     """Applies a geo operation on a layer.
 
@@ -767,6 +1199,11 @@ def _apply_geooperation_to_layer(
             geofileops temporary directory. Useful to keep all temporary files for an
             operation that uses multiple steps in one temporary directory.
         parallelization_config (ParallelizationConfig, optional): Defaults to None.
+        extra_outputs (list[dict], optional): extra operations to apply on the same
+            batches of input rows, each written to its own output file. Each dict
+            has the keys "output_path", "operation", "operation_params" and optionally
+            "output_layer" and "force_output_geometrytype". The input is read only once
+            per batch for all outputs. Defaults to None.
 
     Technical remarks:
         - Retaining None geometry values in the output files is hard, because when
@@ -798,18 +1235,37 @@ def _apply_geooperation_to_layer(
 
     if not isinstance(input_layer, LayerInfo):
         input_layer = gfo.get_layerinfo(input_path, input_layer)
-    if output_layer is None:
-        output_layer = gfo.get_default_layer(output_path)
-    if isinstance(force_output_geometrytype, GeometryType):
-        force_output_geometrytype = force_output_geometrytype.name
     if isinstance(columns, str):
         # If a string is passed, convert to list
         columns = [columns]
 
-    # Check if we want to preserve the fid in the output
-    preserve_fid = False
-    if not explodecollections and gfo.get_driver(output_path) == "GPKG":
-        preserve_fid = True
+    # Determine the outputs to write: the main output + the extra outputs
+    outputs: list[dict[str, Any]] = [
+        {
+            "output_path": output_path,
+            "operation": operation,
+            "operation_params": operation_params,
+            "output_layer": output_layer,
+            "force_output_geometrytype": force_output_geometrytype,
+        }
+    ]
+    for extra_output in extra_outputs or []:
+        if extra_output["output_path"] == input_path:
+            raise ValueError(f"{operation_name}: output_path must not equal input_path")
+        outputs.append(dict(extra_output))
+
+    for output in outputs:
+        if output.get("output_layer") is None:
+            output["output_layer"] = gfo.get_default_layer(output["output_path"])
+        if isinstance(output.get("force_output_geometrytype"), GeometryType):
+            output["force_output_geometrytype"] = output[
+                "force_output_geometrytype"
+            ].name
+
+        # Check if we want to preserve the fid in the output
+        output["preserve_fid"] = (
+            not explodecollections and gfo.get_driver(output["output_path"]) == "GPKG"
+        )
 
     # Prepare where_to_apply and filter_null_geoms
     if where_post is not None:
@@ -821,6 +1277,16 @@ def _apply_geooperation_to_layer(
             where_post = where_post.format(geometrycolumn="geom")
 
     with _general_helper.create_gfo_tmp_dir(operation.value, tmp_basedir) as tmp_dir:
+        # If the operation is resumed, the batches completed before can be skipped.
+        # If it was interrupted while merging a batch, the merged result can't be
+        # trusted anymore, so start from scratch.
+        checkpoint = _general_helper.Checkpoint(
+            tmp_dir, identity=f"{operation_name}:{output_path}"
+        )
+        if checkpoint.get("batch_merging") is not None:
+            logger.info("Previous run was interrupted while merging, start again")
+            checkpoint.reset()
+
         # Calculate the best number of parallel processes and batches for
         # the available resources
         process_params = _prepare_processing_params(
@@ -830,11 +1296,26 @@ def _apply_geooperation_to_layer(
             batchsize=batchsize,
             parallelization_config=parallelization_config,
             tmp_dir=tmp_dir,
+            operation=operation,
+            columns=columns,
+        )
+        process_params.batches = checkpoint.batches(process_params.batches)
+        process_params.nb_parallel = min(
+            process_params.nb_parallel, len(process_params.batches)
         )
 
-        # Prepare temp output filename
+        # Prepare temp output filenames
         # If output is a zip file, drop the .zip suffix
-        tmp_output_path = tmp_dir / GeoPath(output_path).name_nozip
+        # Remark: the files of extra outputs are put in a subdirectory per output.
+        for output_id, output in enumerate(outputs):
+            output_tmp_dir = tmp_dir if output_id == 0 else tmp_dir / f"{output_id}"
+            output_tmp_dir.mkdir(exist_ok=True)
+            output["tmp_output_path"] = (
+                output_tmp_dir / GeoPath(output["output_path"]).name_nozip
+            )
+            output["partial_suffix"] = _general_helper.tmp_partial_suffix(
+                gpkg_needed=output["preserve_fid"] or where_post is not None,
+            )
 
         # Start processing
         worker_type = _general_helper.worker_type_to_use(
@@ -852,53 +1333,79 @@ def _apply_geooperation_to_layer(
             max_workers=process_params.nb_parallel,
             initializer=_processing_util.initialize_worker,
             initargs=(worker_type,),
+            distributable=True,
         ) as calculate_pool:
             batches: dict[int, dict] = {}
-            future_to_batch_id = {}
+            tasks = {}
 
             for batch_id, batch_filter in enumerate(process_params.batches):
-                batches[batch_id] = {}
-                batches[batch_id]["layer"] = output_layer
-
                 # Output each batch to a seperate temporary file, otherwise there
                 # are timeout issues when processing large files
-                output_tmp_partial_path = (
-                    tmp_dir / f"{output_path.stem}_{batch_id}.gpkg"
-                )
-                batches[batch_id]["tmp_partial_output_path"] = output_tmp_partial_path
-                batches[batch_id]["filter"] = batch_filter
+                batch_outputs = []
+                for output in outputs:
+                    tmp_partial_output_path = (
+                        output["tmp_output_path"].parent
+                        / f"{output['output_path'].stem}_{batch_id}"
+                        f"{output['partial_suffix']}"
+                    )
+                    batch_outputs.append(
+                        {
+                            "output_path": tmp_partial_output_path,
+                            "operation": output["operation"],
+                            "operation_params": output["operation_params"],
+                            "output_layer": output["output_layer"],
+                            "force_output_geometrytype": output[
+                                "force_output_geometrytype"
+                            ],
+                            "preserve_fid": output["preserve_fid"],
+                        }
+                    )
+                if checkpoint.is_done(f"batch_{batch_id}"):
+                    continue
+                # Remove partial results of an interrupted earlier run
+                for batch_output in batch_outputs:
+                    gfo.remove(batch_output["output_path"], missing_ok=True)
+
+                batches[batch_id] = {
+                    "filter": batch_filter,
+                    "tmp_partial_output_paths": [
+                        batch_output["output_path"] for batch_output in batch_outputs
+                    ],
+                }
 
                 # Remark: this temp file doesn't need spatial index
                 # Remark: because force_output_geometrytype for GeoDataFrame
                 # operations is (a lot) more limited than gdal-based, the gdal version
                 # is used later on when the results are merged to the result file.
-                future = calculate_pool.submit(
+                tasks[batch_id] = functools.partial(
                     _apply_geooperation,
                     input_path=input_path,
-                    output_path=output_tmp_partial_path,
+                    output_path=batch_outputs[0]["output_path"],
                     operation=operation,
                     operation_params=operation_params,
                     input_layer=input_layer,
                     columns=columns,
-                    output_layer=output_layer,
+                    output_layer=outputs[0]["output_layer"],
                     where=batch_filter,
                     explodecollections=explodecollections,
-                    force_output_geometrytype=force_output_geometrytype,
+                    force_output_geometrytype=outputs[0]["force_output_geometrytype"],
                     gridsize=gridsize,
                     keep_empty_geoms=keep_empty_geoms,
-                    preserve_fid=preserve_fid,
+                    preserve_fid=outputs[0]["preserve_fid"],
                     create_spatial_index=False,
                     force=force,
+                    extra_outputs=batch_outputs[1:],
                 )
-                future_to_batch_id[future] = batch_id
 
             # Loop till all parallel processes are ready, but process each one
             # that is ready already
             # Remark: calculating can be done in parallel, but only one process
             # can write to the same output file at the time...
             start_time = datetime.now()
-            nb_done = 0
             nb_batches = len(process_params.batches)
+            nb_done = nb_batches - len(tasks)
+            if nb_done > 0:
+                logger.info(f"Resume: {nb_done} batches were completed before")
             _general_util.report_progress(
                 start_time,
                 nb_done,
@@ -910,22 +1417,38 @@ def _apply_geooperation_to_layer(
             # Warn about low memory availability if needed
             _general_helper.warn_if_low_mem(called_from=f"{operation_name}_loop")
 
-            for future in futures.as_completed(future_to_batch_id):
+            for batch_id, future in _processing_util.submit_with_backpressure(
+                calculate_pool,
+                tasks,
+                max_running=process_params.nb_parallel,
+                min_mem_available=ConfigOptions.get_low_mem_available_pause_threshold,
+            ):
                 try:
                     message = future.result()
                     logger.debug(message)
 
                     # If the calculate gave results, copy to output
-                    batch_id = future_to_batch_id[future]
-                    tmp_partial_output_path = batches[batch_id][
-                        "tmp_partial_output_path"
-                    ]
-                    if (
-                        tmp_partial_output_path.exists()
-                        and tmp_partial_output_path.stat().st_size > 0
+                    checkpoint.mark_done("batch_merging", batch_id)
+                    for output, tmp_partial_output_path in zip(
+                        outputs,
+                        batches[batch_id]["tmp_partial_output_paths"],
+                        strict=True,
                     ):
-                        # Remark: force_output_geometrytype and explodecollections have
-                        # already been applied in the calculation step.
+                        if (
+                            not tmp_partial_output_path.exists()
+                            or tmp_partial_output_path.stat().st_size == 0
+                        ):
+                            continue
+
+                        # Remark: force_output_geometrytype and explodecollections
+                        # have already been applied in the calculation step.
+                        _general_helper.report_batch_result(
+                            output["output_path"],
+                            tmp_partial_output_path,
+                            output["output_layer"],
+                            where_post,
+                        )
+                        tmp_output_path = output["tmp_output_path"]
                         if (
                             where_post is None
                             and tmp_partial_output_path.suffix == tmp_output_path.suffix
@@ -936,17 +1459,19 @@ def _apply_geooperation_to_layer(
                             fileops.copy_layer(
                                 src=tmp_partial_output_path,
                                 dst=tmp_output_path,
-                                src_layer=output_layer,
-                                dst_layer=output_layer,
+                                src_layer=output["output_layer"],
+                                dst_layer=output["output_layer"],
                                 write_mode="append",
                                 create_spatial_index=False,
                                 where=where_post,
-                                preserve_fid=preserve_fid,
+                                preserve_fid=output["preserve_fid"],
                             )
                             gfo.remove(tmp_partial_output_path)
 
+                    checkpoint.mark_done(f"batch_{batch_id}")
+                    checkpoint.mark_done("batch_merging", None)
+
                 except Exception as ex:  # pragma: no cover
-                    batch_id = future_to_batch_id[future]
                     message = f"Error {ex} executing {batches[batch_id]}"
                     logger.exception(message)
                     raise RuntimeError(message) from ex
@@ -963,14 +1488,21 @@ def _apply_geooperation_to_layer(
 
         # Round up and clean up
         # Now create spatial index and move to output location
-        if tmp_output_path.exists():
+        for output in outputs:
+            tmp_output_path = output["tmp_output_path"]
+            if not tmp_output_path.exists():
+                logger.debug(f"Result was empty for {output['output_path']}")
+                continue
+
             # Create spatial index if needed
             if GeofileInfo(tmp_output_path).default_spatial_index:
-                gfo.create_spatial_index(path=tmp_output_path, layer=output_layer)
+                gfo.create_spatial_index(
+                    path=tmp_output_path, layer=output["output_layer"]
+                )
 
             # Zip if needed
             if (
-                output_path.suffix.lower() == ".zip"
+                output["output_path"].suffix.lower() == ".zip"
                 and tmp_output_path.suffix.lower() != ".zip"
             ):
                 zipped_path = Path(f"{tmp_output_path.as_posix()}.zip")
@@ -978,9 +1510,10 @@ def _apply_geooperation_to_layer(
                 tmp_output_path = zipped_path
 
             # Move to final location
-            gfo.move(tmp_output_path, output_path)
-        else:
-            logger.debug("Result was empty")
+            gfo.move(tmp_output_path, output["output_path"])
+
+        # The merged results were moved, so they can't be reused anymore
+        checkpoint.reset()
 
     logger.info(f"Ready, took {datetime.now() - start_time_global}")
 
@@ -1001,6 +1534,7 @@ def _apply_geooperation(
     preserve_fid: bool = False,
     create_spatial_index: bool = False,
     force: bool = False,
+    extra_outputs: list[dict[str, Any]] | None = None,
 ) -> str:
     # Init
     if not output_path.parent.exists():
@@ -1012,47 +1546,75 @@ def _apply_geooperation(
         else:
             gfo.remove(output_path)
 
+    outputs: list[dict[str, Any]] = [
+        {
+            "output_path": output_path,
+            "operation": operation,
+            "operation_params": operation_params,
+            "output_layer": output_layer,
+            "force_output_geometrytype": force_output_geometrytype,
+            "preserve_fid": preserve_fid,
+        },
+        *(extra_outputs or []),
+    ]
+
     # Now go!
+    # Remark: the input is read only once for all outputs.
     start_time = datetime.now()
-    data_gdf = gfo.read_file(
+    input_gdf = gfo.read_file(
         path=input_path,
         layer=input_layer.name,
         columns=columns,
         where=where,
-        fid_as_index=preserve_fid,
+        fid_as_index=any(output.get("preserve_fid", False) for output in outputs),
     )
 
+    nb_rows = []
+    for output in outputs:
+        data_gdf = input_gdf.copy() if len(outputs) > 1 else input_gdf
+        nb_rows.append(
+            _apply_geooperation_to_gdf(
+                data_gdf=data_gdf,
+                output_path=output["output_path"],
+                operation=output["operation"],
+                operation_params=output["operation_params"],
+                input_layer=input_layer,
+                output_layer=output.get("output_layer"),
+                explodecollections=explodecollections,
+                force_output_geometrytype=output.get("force_output_geometrytype"),
+                gridsize=gridsize,
+                keep_empty_geoms=keep_empty_geoms,
+                preserve_fid=output.get("preserve_fid", False),
+                create_spatial_index=create_spatial_index,
+            )
+        )
+
+    message = f"Took {datetime.now() - start_time} for {nb_rows[0]} rows ({where})"
+    return message
+
+
+def _apply_geooperation_to_gdf(
+    data_gdf: gpd.GeoDataFrame,
+    output_path: Path,
+    operation: GeoOperation,
+    operation_params: dict,
+    input_layer: LayerInfo,
+    output_layer: str | None,
+    explodecollections: bool,
+    force_output_geometrytype: GeometryType | str | None,
+    gridsize: float,
+    keep_empty_geoms: bool,
+    preserve_fid: bool,
+    create_spatial_index: bool,
+) -> int:
+    """Apply the operation on the data and write the result to the output file.
+
+    Returns:
+        int: the number of rows written.
+    """
     # Run operation if data read
     if len(data_gdf) > 0:
-        if operation is GeoOperation.BUFFER:
-            data_gdf.geometry = data_gdf.geometry.buffer(
-                distance=operation_params["distance"],
-                resolution=operation_params["quadrantsegments"],
-                cap_style=operation_params["endcap_style"].value,
-                join_style=operation_params["join_style"].value,
-                mitre_limit=operation_params["mitre_limit"],
-                single_sided=operation_params["single_sided"],
-            )
-        elif operation is GeoOperation.CONVEXHULL:
-            data_gdf.geometry = data_gdf.geometry.convex_hull
-        elif operation is GeoOperation.SIMPLIFY:
-            data_gdf.geometry = pygeoops.simplify(
-                data_gdf.geometry,
-                algorithm=operation_params["algorithm"].value,
-                tolerance=operation_params["tolerance"],
-                lookahead=operation_params["step"],
-            )
-        elif operation is GeoOperation.APPLY:
-            func = pickle.loads(operation_params["pickled_func"])
-            if operation_params["only_geom_input"] is True:
-                data_gdf.geometry = data_gdf.geometry.apply(func)
-            else:
-                data_gdf.geometry = data_gdf.apply(func, axis=1)
-        elif operation is GeoOperation.APPLY_VECTORIZED:
-            func = pickle.loads(operation_params["pickled_func"])
-            data_gdf.geometry = func(data_gdf.geometry)
-        else:
-            raise ValueError(f"operation not supported: {operation}")
+        _apply_operation_to_geometries(data_gdf, operation, operation_params)
 
     # If there is an fid column in the dataset, rename it, because the fid column is a
     # "special case" in gdal that should not be written.
@@ -1103,8 +1665,45 @@ def _apply_geooperation(
         create_spatial_index=create_spatial_index,
     )
 
-    message = f"Took {datetime.now() - start_time} for {len(data_gdf)} rows ({where})"
-    return message
+    return len(data_gdf)
+
+
+def _apply_operation_to_geometries(
+    data_gdf: gpd.GeoDataFrame, operation: GeoOperation, operation_params: dict
+) -> None:
+    """Apply the operation on the geometries of the data, in place."""
+    if operation is GeoOperation.CHAIN:
+        for step_operation, step_params in operation_params["steps"]:
+            _apply_operation_to_geometries(data_gdf, step_operation, step_params)
+    elif operation is GeoOperation.BUFFER:
+        data_gdf.geometry = data_gdf.geometry.buffer(
+            distance=operation_params["distance"],
+            resolution=operation_params["quadrantsegments"],
+            cap_style=operation_params["endcap_style"].value,
+            join_style=operation_params["join_style"].value,
+            mitre_limit=operation_params["mitre_limit"],
+            single_sided=operation_params["single_sided"],
+        )
+    elif operation is GeoOperation.CONVEXHULL:
+        data_gdf.geometry = data_gdf.geometry.convex_hull
+    elif operation is GeoOperation.SIMPLIFY:
+        data_gdf.geometry = pygeoops.simplify(
+            data_gdf.geometry,
+            algorithm=operation_params["algorithm"].value,
+            tolerance=operation_params["tolerance"],
+            lookahead=operation_params["step"],
+        )
+    elif operation is GeoOperation.APPLY:
+        func = pickle.loads(operation_params["pickled_func"])
+        if operation_params["only_geom_input"] is True:
+            data_gdf.geometry = data_gdf.geometry.apply(func)
+        else:
+            data_gdf.geometry = data_gdf.apply(func, axis=1)
+    elif operation is GeoOperation.APPLY_VECTORIZED:
+        func = pickle.loads(operation_params["pickled_func"])
+        data_gdf.geometry = func(data_gdf.geometry)
+    else:
+        raise ValueError(f"operation not supported: {operation}")
 
 
 def dissolve(  # noqa: D417
@@ -1134,13 +1733,13 @@ def dissolve(  # noqa: D417
     don't have a location. It could be implemented, but as long as nobody needs it...
 
     The attribute data aggregation logic is a bit more complex to be able to process
-    per tile and in multiple passed for large datasets:
+    per tile and to merge the tile results afterwards for large datasets:
       - Note that a geometry that lies on the edge of 2 (or more) tiles will be split up
         on the tile boundary(ies) and each part will be further treated in the
         respective tile.
       - To be able to correctly perform attribute aggregations, they can only be
-        determined after all tiles and passes have been finished, as the information
-        from multiple tiles over multiple passes might have to be combined.
+        determined after all tiles have been processed and merged, as the information
+        from multiple tiles might have to be combined.
       - Hence, all needed data (columns and values) is stored in intermediate/temporary
         results so it can be all combined at the end.
       - In practice, during the first calculation pass, all relevant columns and values
@@ -1149,17 +1748,17 @@ def dissolve(  # noqa: D417
         this pass, their json strings are concatenated to a list. This way, all data is
         retained. An example of a JSON string list for 2 dissolved geometries:
             [{"fid_orig": 1, "area": 10.0}, {"fid_orig": 2, "area": 5.0}]
-      - When geometries are merged in a following dissolve pass, the lists of JSON
+      - When the geometries on the tile borders are merged afterwards, the lists of JSON
         strings will be concatenated so all data is always retained. If a geometry was
         on the border of 2 tiles, this can result in multiple identical JSON strings. In
-        the following example, fid_orig 1 was on the border of 2 tiles and was dissolved
-        again in a following pass, leading to the following JSON string list:
+        the following example, fid_orig 1 was on the border of 2 tiles and was merged
+        again afterwards, leading to the following JSON string list:
             [
                 {"fid_orig": 1, "area": 10.0},
                 {"fid_orig": 1, "area": 10.0},
                 {"fid_orig": 2, "area": 5.0},
             ]
-      - When all passes are done, meaning everything is glued together and all attribute
+      - When the merge is done, meaning everything is glued together and all attribute
         JSON strings are combined in one big list for each final geometry, the attribute
         aggregations can be performed.
       - When an original geometry was on the boundary of 2 (or more) tiles in the first
@@ -1347,141 +1946,177 @@ def dissolve(  # noqa: D417
         if len(result_tiles_gdf) > 1:
             result_tiles_gdf["tile_id"] = result_tiles_gdf.reset_index().index
 
-        # The dissolve for polygons is done in several passes, and after the first
-        # pass, only the 'onborder' features are further dissolved, as the
-        # 'notonborder' features are already OK.
+        # The dissolve for polygons is done in two stages. First the input is dissolved
+        # per tile, and the 'notonborder' features of this pass are final immediately.
+        # The 'onborder' features are merged afterwards in one targeted step: the
+        # pieces that are connected with each other are determined and only those are
+        # unioned together.
         with _general_helper.create_gfo_tmp_dir(operation_name, tmp_basedir) as tmp_dir:
+            # If the operation is resumed, the tiles and the batches of the dissolve
+            # pass completed before can be skipped, as well as the merge of the
+            # onborder polygons. If it was interrupted while merging a result, the
+            # merged result can't be trusted anymore, so start from scratch.
+            checkpoint = _general_helper.Checkpoint(
+                tmp_dir, identity=f"{operation_name}:{output_path}"
+            )
+            if checkpoint.get("batch_merging") is not None:
+                logger.info("Previous run was interrupted while merging, start again")
+                checkpoint.reset()
+
             if output_layer is None:
                 output_layer = gfo.get_default_layer(output_path)
             output_tmp_path = tmp_dir / "output_tmp.gpkg"
-            prev_nb_batches = None
             last_pass = False
-            pass_id = 1
             geoindex_column = "__tmp_geoindex_column__"
 
             logger.info(f"Start, with input {input_path}")
-            input_pass_path = input_path
-            input_pass_layer = input_layer
-            while True:
-                # Get info of the current file that needs to be dissolved
-                nb_rows_total = input_pass_layer.featurecount
-
-                # Calculate the best number of parallel processes and batches for
-                # the available resources for the current pass
-                # Limit the nb of rows per batch, as dissolve slows down with more rows.
-                nb_parallel, nb_batches = _determine_nb_batches(
-                    nb_rows_total=nb_rows_total,
-                    nb_parallel=nb_parallel,
-                    batchsize=batchsize,
-                    parallelization_config=ParallelizationConfig(
-                        max_rows_per_batch=10000
+            nb_rows_total = input_layer.featurecount
+
+            # Calculate the best number of parallel processes and batches for
+            # the available resources.
+            # Limit the nb of rows per batch, as dissolve slows down with more rows.
+            nb_parallel, nb_batches = _determine_nb_batches(
+                nb_rows_total=nb_rows_total,
+                nb_parallel=nb_parallel,
+                batchsize=batchsize,
+                parallelization_config=ParallelizationConfig(max_rows_per_batch=10000),
+            )
+
+            pass_tiles_path = tmp_dir / "output_1_tiles.gpkg"
+            if checkpoint.is_done("tiles"):
+                # Resumed: continue with the tiles of the first run
+                tiles_gdf = gfo.read_file(pass_tiles_path)
+                last_pass = bool(checkpoint.get("tiles"))
+                nb_parallel = min(len(tiles_gdf), nb_parallel)
+
+            # If the ideal number of batches is close to the nb. result tiles asked,
+            # dissolve towards the asked result!
+            # If not, a temporary result is created using smaller tiles
+            elif nb_batches <= len(result_tiles_gdf) * 1.1:
+                tiles_gdf = result_tiles_gdf
+                last_pass = True
+                nb_parallel = min(len(result_tiles_gdf), nb_parallel)
+            elif len(result_tiles_gdf) == 1:
+                # Create a grid based on the ideal number of batches
+                grid_total_bounds = (
+                    input_layer.total_bounds[0] - 0.000001,
+                    input_layer.total_bounds[1] - 0.000001,
+                    input_layer.total_bounds[2] + 0.000001,
+                    input_layer.total_bounds[3] + 0.000001,
+                )
+                tiles_gdf = gpd.GeoDataFrame(
+                    geometry=pygeoops.create_grid2(
+                        total_bounds=grid_total_bounds, nb_squarish_tiles=nb_batches
                     ),
+                    crs=input_layer.crs,
                 )
-
-                # If the ideal number of batches is close to the nb. result tiles asked,
-                # dissolve towards the asked result!
-                # If not, a temporary result is created using smaller tiles
-                if nb_batches <= len(result_tiles_gdf) * 1.1:
-                    tiles_gdf = result_tiles_gdf
-                    last_pass = True
-                    nb_parallel = min(len(result_tiles_gdf), nb_parallel)
-                elif len(result_tiles_gdf) == 1:
-                    # Create a grid based on the ideal number of batches, but make
-                    # sure the number is smaller than the maximum...
-                    nb_squarish_tiles_max = None
-                    if prev_nb_batches is not None:
-                        nb_squarish_tiles_max = max(prev_nb_batches - 1, 1)
-                        nb_batches = min(nb_batches, nb_squarish_tiles_max)
-                    grid_total_bounds = (
-                        input_pass_layer.total_bounds[0] - 0.000001,
-                        input_pass_layer.total_bounds[1] - 0.000001,
-                        input_pass_layer.total_bounds[2] + 0.000001,
-                        input_pass_layer.total_bounds[3] + 0.000001,
-                    )
-                    tiles_gdf = gpd.GeoDataFrame(
-                        geometry=pygeoops.create_grid2(
-                            total_bounds=grid_total_bounds,
-                            nb_squarish_tiles=nb_batches,
-                            nb_squarish_tiles_max=nb_squarish_tiles_max,
-                        ),
-                        crs=input_pass_layer.crs,
-                    )
-                else:
-                    # If a grid is specified already, add extra columns/rows instead of
-                    # creating new one...
-                    tiles_gdf = pygeoops.split_tiles(result_tiles_gdf, nb_batches)
-
-                # Apply gridsize tolerance on tiles, otherwise the border polygons can't
-                # be unioned properly because gaps appear after rounding coordinates.
+            else:
+                # If a grid is specified already, add extra columns/rows instead of
+                # creating new one...
+                tiles_gdf = pygeoops.split_tiles(result_tiles_gdf, nb_batches)
+
+            if not checkpoint.is_done("tiles"):
+                # Apply gridsize tolerance on tiles, otherwise the border polygons
+                # can't be unioned properly because gaps appear after rounding
+                # coordinates.
                 if gridsize != 0.0:
                     tiles_gdf.geometry = shapely.set_precision(
                         tiles_gdf.geometry, grid_size=gridsize
                     )
-                gfo.to_file(tiles_gdf, tmp_dir / f"output_{pass_id}_tiles.gpkg")
+                gfo.to_file(tiles_gdf, pass_tiles_path)
 
                 # If the number of tiles ends up as 1, it is the last pass anyway...
                 if len(tiles_gdf) == 1:
                     last_pass = True
+                checkpoint.mark_done("tiles", last_pass)
 
-                # If we are not in the last pass, onborder parcels will need extra
-                # processing still in further passes, so are saved in a seperate
-                # gfo. The notonborder rows are final immediately
-                if last_pass is not True:
-                    output_tmp_onborder_path = (
-                        tmp_dir / f"output_{pass_id}_onborder.gpkg"
-                    )
-                else:
-                    output_tmp_onborder_path = output_tmp_path
+            # If we are not in the last pass, onborder parcels still need to be merged
+            # afterwards, so are saved in a seperate file. The notonborder rows are
+            # final immediately.
+            if last_pass is not True:
+                output_tmp_onborder_path = tmp_dir / "output_1_onborder.gpkg"
+            else:
+                output_tmp_onborder_path = output_tmp_path
 
-                # Now go!
-                logger.info(
-                    f"Start pass {pass_id} to {len(tiles_gdf)} tiles "
-                    f"(batch size: {int(nb_rows_total / len(tiles_gdf))})"
-                )
-                pass_start = datetime.now()
-                _dissolve_polygons_pass(
-                    input_path=input_pass_path,
-                    output_notonborder_path=output_tmp_path,
-                    output_onborder_path=output_tmp_onborder_path,
+            # Now go!
+            logger.info(
+                f"Start pass 1 to {len(tiles_gdf)} tiles "
+                f"(batch size: {int(nb_rows_total / len(tiles_gdf))})"
+            )
+            pass_start = datetime.now()
+            _dissolve_polygons_pass(
+                input_path=input_path,
+                output_notonborder_path=output_tmp_path,
+                output_onborder_path=output_tmp_onborder_path,
+                explodecollections=explodecollections,
+                groupby_columns=groupby_columns,
+                agg_columns=agg_columns,
+                tiles_gdf=tiles_gdf,
+                input_layer=input_layer,
+                output_layer=output_layer,
+                gridsize=gridsize,
+                keep_empty_geoms=False,
+                nb_parallel=nb_parallel,
+                geoindex_column=geoindex_column,
+                checkpoint=checkpoint,
+                on_data_error=on_data_error,
+            )
+            logger.info(f"Pass 1 ready, took {datetime.now() - pass_start}")
+
+            # If there are onborder polygons, merge the ones that are connected. They
+            # are merged to a separate file first, so an interrupted merge doesn't
+            # invalidate the result of the pass.
+            if (
+                not last_pass
+                and output_tmp_onborder_path.exists()
+                and not checkpoint.is_done("merge")
+            ):
+                merge_start = datetime.now()
+                logger.info("Start merging the onborder polygons")
+                output_tmp_merged_path = tmp_dir / "output_tmp_merged.gpkg"
+                gfo.remove(output_tmp_merged_path, missing_ok=True)
+                _dissolve_polygons_merge_onborder(
+                    input_path=output_tmp_onborder_path,
+                    output_path=output_tmp_merged_path,
                     explodecollections=explodecollections,
                     groupby_columns=groupby_columns,
                     agg_columns=agg_columns,
-                    tiles_gdf=tiles_gdf,
-                    input_layer=input_pass_layer,
+                    result_tiles_gdf=(
+                        result_tiles_gdf if len(result_tiles_gdf) > 1 else None
+                    ),
+                    input_geometrytype=input_layer.geometrytype,
                     output_layer=output_layer,
                     gridsize=gridsize,
-                    keep_empty_geoms=False,
                     nb_parallel=nb_parallel,
+                    batchsize=batchsize,
                     geoindex_column=geoindex_column,
                     on_data_error=on_data_error,
                 )
-                logger.info(f"Pass {pass_id} ready, took {datetime.now() - pass_start}")
-
-                # If this was the last pass, if the last pass didn't have any onborder
-                # polygons as result, we are ready dissolving.
-                if last_pass or not output_tmp_onborder_path.exists():
-                    break
 
-                # Prepare the next pass
-                prev_nb_batches = len(tiles_gdf)
-                input_pass_path = output_tmp_onborder_path
-                input_pass_layer = gfo.get_layerinfo(input_pass_path)
-                pass_id += 1
+                checkpoint.mark_done("batch_merging", "merge")
+                if output_tmp_merged_path.exists():
+                    if not output_tmp_path.exists():
+                        fileops.move(src=output_tmp_merged_path, dst=output_tmp_path)
+                    else:
+                        fileops.copy_layer(
+                            src=output_tmp_merged_path,
+                            dst=output_tmp_path,
+                            src_layer=output_layer,
+                            dst_layer=output_layer,
+                            write_mode="append",
+                            create_spatial_index=False,
+                            preserve_fid=False,
+                        )
+                        gfo.remove(output_tmp_merged_path)
+                checkpoint.mark_done("merge")
+                checkpoint.mark_done("batch_merging", None)
+                logger.info(
+                    f"Merging onborder polygons ready, took "
+                    f"{datetime.now() - merge_start}"
+                )
 
             # Calculation ready! Now finalise output!
             logger.info("Finalize result")
-            # If there is a result on border, append it to the rest
-            if (
-                str(output_tmp_onborder_path) != str(output_tmp_path)
-                and output_tmp_onborder_path.exists()
-            ):
-                gfo.copy_layer(
-                    output_tmp_onborder_path,
-                    output_tmp_path,
-                    dst_layer=output_layer,
-                    write_mode="append",
-                    preserve_fid=False,
-                )
 
             # If there is a result...
             if output_tmp_path.exists():
@@ -1725,6 +2360,7 @@ def _dissolve_polygons_pass(
     keep_empty_geoms: bool,
     nb_parallel: int,
     geoindex_column: str,
+    checkpoint: _general_helper.Checkpoint,
     on_data_error: str = "raise",
 ) -> None:
     start_time = datetime.now()
@@ -1756,16 +2392,19 @@ def _dissolve_polygons_pass(
         batches: dict[int, dict] = {}
         nb_batches = len(tiles_gdf)
         nb_batches_done = 0
-        future_to_batch_id = {}
+        tasks = {}
         nb_rows_done = 0
         for batch_id, tile_row in enumerate(tiles_gdf.itertuples()):
+            if checkpoint.is_done(f"batch_{batch_id}"):
+                nb_batches_done += 1
+                continue
             batches[batch_id] = {}
             batches[batch_id]["layer"] = output_layer
             batches[batch_id]["bounds"] = tile_row.geometry.bounds
 
             # Output each batch to a seperate temporary file, otherwise there
             # are timeout issues when processing large files
-            suffix = output_notonborder_path.suffix
+            suffix = _general_helper.tmp_partial_suffix()
             name = f"{output_notonborder_path.stem}_{batch_id}{suffix}"
             output_notonborder_tmp_partial_path = tmp_dir / name
             batches[batch_id]["output_notonborder_tmp_partial_path"] = (
@@ -1776,11 +2415,14 @@ def _dissolve_polygons_pass(
             batches[batch_id]["output_onborder_tmp_partial_path"] = (
                 output_onborder_tmp_partial_path
             )
+            # Remove partial results of an interrupted earlier run
+            gfo.remove(output_notonborder_tmp_partial_path, missing_ok=True)
+            gfo.remove(output_onborder_tmp_partial_path, missing_ok=True)
 
             # Get tile_id if present
             tile_id = tile_row.tile_id if "tile_id" in tile_row._fields else None
 
-            future = calculate_pool.submit(
+            tasks[batch_id] = functools.partial(
                 _dissolve_polygons,
                 input_path=input_path,
                 output_notonborder_path=output_notonborder_tmp_partial_path,
@@ -1798,7 +2440,6 @@ def _dissolve_polygons_pass(
                 geoindex_column=geoindex_column,
                 on_data_error=on_data_error,
             )
-            future_to_batch_id[future] = batch_id
 
         # Loop till all parallel processes are ready, but process each one
         # that is ready already
@@ -1808,11 +2449,15 @@ def _dissolve_polygons_pass(
         # Warn about low memory availability if needed
         _general_helper.warn_if_low_mem(called_from="dissolve, loop")
 
-        for future in futures.as_completed(future_to_batch_id):
+        for batch_id, future in _processing_util.submit_with_backpressure(
+            calculate_pool,
+            tasks,
+            max_running=nb_parallel,
+            min_mem_available=ConfigOptions.get_low_mem_available_pause_threshold,
+        ):
             try:
                 # If the calculate gave results
                 nb_batches_done += 1
-                batch_id = future_to_batch_id[future]
                 result = future.result()
 
                 if result is not None:
@@ -1829,9 +2474,8 @@ def _dissolve_polygons_pass(
                             logger.debug(f"Perfstring: {result['perfstring']}")
 
                     # Start copy of the result to a common file
-                    batch_id = future_to_batch_id[future]
-
                     # If calculate gave notonborder results, append to output
+                    checkpoint.mark_done("batch_merging", batch_id)
                     output_notonborder_tmp_partial_path = batches[batch_id][
                         "output_notonborder_tmp_partial_path"
                     ]
@@ -1839,7 +2483,11 @@ def _dissolve_polygons_pass(
                         output_notonborder_tmp_partial_path.exists()
                         and output_notonborder_tmp_partial_path.stat().st_size > 0
                     ):
-                        if not output_notonborder_path.exists():
+                        if (
+                            not output_notonborder_path.exists()
+                            and output_notonborder_tmp_partial_path.suffix
+                            == output_notonborder_path.suffix
+                        ):
                             fileops.move(
                                 src=output_notonborder_tmp_partial_path,
                                 dst=output_notonborder_path,
@@ -1864,7 +2512,11 @@ def _dissolve_polygons_pass(
                         output_onborder_tmp_partial_path.exists()
                         and output_onborder_tmp_partial_path.stat().st_size > 0
                     ):
-                        if not output_onborder_path.exists():
+                        if (
+                            not output_onborder_path.exists()
+                            and output_onborder_tmp_partial_path.suffix
+                            == output_onborder_path.suffix
+                        ):
                             fileops.move(
                                 src=output_onborder_tmp_partial_path,
                                 dst=output_onborder_path,
@@ -1881,8 +2533,10 @@ def _dissolve_polygons_pass(
                             )
                             gfo.remove(output_onborder_tmp_partial_path)
 
+                checkpoint.mark_done(f"batch_{batch_id}")
+                checkpoint.mark_done("batch_merging", None)
+
             except Exception as ex:  # pragma: no cover
-                batch_id = future_to_batch_id[future]
                 message = f"Error executing {batches[batch_id]}: {ex}"
                 logger.exception(message)
                 calculate_pool.shutdown()
@@ -2131,20 +2785,7 @@ def _dissolve_polygons(
 
         # Add geoindex_column to the notonborder_gdf if asked
         if geoindex_column is not None:
-            crs = notonborder_gdf.crs
-            if crs is not None and crs.area_of_use is not None:
-                transformer = Transformer.from_crs(
-                    crs.geodetic_crs, crs, always_xy=True
-                )
-                crs_bounds = transformer.transform_bounds(*crs.area_of_use.bounds)
-                notonborder_gdf[geoindex_column] = notonborder_gdf.hilbert_distance(
-                    crs_bounds
-                )
-            else:
-                # Use representative point x coordinate as fallback.
-                notonborder_gdf[geoindex_column] = shapely.get_x(
-                    notonborder_gdf.geometry.representative_point()
-                )
+            _add_geoindex_column(notonborder_gdf, geoindex_column)
 
         gfo.to_file(
             notonborder_gdf,
@@ -2182,6 +2823,326 @@ def _dissolve_polygons(
     return return_info
 
 
+def _add_geoindex_column(gdf: gpd.GeoDataFrame, geoindex_column: str) -> None:
+    """Add a column to the GeoDataFrame that can be used to sort it spatially.
+
+    Args:
+        gdf (gpd.GeoDataFrame): the GeoDataFrame to add the column to.
+        geoindex_column (str): the name of the column to add.
+    """
+    crs = gdf.crs
+    if crs is not None and crs.area_of_use is not None:
+        transformer = Transformer.from_crs(crs.geodetic_crs, crs, always_xy=True)
+        crs_bounds = transformer.transform_bounds(*crs.area_of_use.bounds)
+        gdf[geoindex_column] = gdf.hilbert_distance(crs_bounds)
+    else:
+        # Use representative point x coordinate as fallback.
+        gdf[geoindex_column] = shapely.get_x(gdf.geometry.representative_point())
+
+
+def _dissolve_polygons_merge_onborder(
+    input_path: Path,
+    output_path: Path,
+    explodecollections: bool,
+    groupby_columns: Iterable[str] | None,
+    agg_columns: dict | None,
+    result_tiles_gdf: gpd.GeoDataFrame | None,
+    input_geometrytype: GeometryType,
+    output_layer: str,
+    gridsize: float,
+    nb_parallel: int | None,
+    batchsize: int,
+    geoindex_column: str,
+    on_data_error: str = "raise",
+) -> None:
+    """Merge the onborder polygons resulting from a tiled dissolve pass.
+
+    The onborder polygons are grouped in connected components: polygons with the same
+    groupby values that intersect each other, directly or via other polygons. The
+    candidate pairs found via the bounding boxes in an STRtree are refined with an
+    `intersects` on the polygons themselves.
+
+    The polygons are written to a temporary file, sorted on component, so every batch
+    can read its components via a range of rowids. Each component is unioned exactly
+    once, in parallel over the components. A component is never split over batches,
+    so a very large component is unioned in a single batch, with the tree based union
+    of GEOS.
+
+    Args:
+        input_path (Path): the file with the onborder polygons.
+        output_path (Path): the file to append the merged polygons to.
+        explodecollections (bool): True to explode the result.
+        groupby_columns (Iterable[str] | None): the groupby columns.
+        agg_columns (dict | None): the aggregation columns. If not None, the
+            "__DISSOLVE_TOJSON" column of the input is merged.
+        result_tiles_gdf (gpd.GeoDataFrame | None): if not None, the tiles the result
+            should be split on. A "tile_id" column is added to the output.
+        input_geometrytype (GeometryType): the geometry type of the original input.
+        output_layer (str): the layer name for the input and output files.
+        gridsize (float): the gridsize to apply.
+        nb_parallel (int | None): the number of parallel workers to use.
+        batchsize (int): indicative number of rows to process per batch.
+        geoindex_column (str): name of the column to add with a spatial sort key.
+        on_data_error (str, optional): what to do if a data error occurs.
+            Defaults to "raise".
+    """
+    start_time = datetime.now()
+    groupby_columns = list(groupby_columns) if groupby_columns is not None else []
+    columns = list(groupby_columns)
+    if agg_columns is not None:
+        columns.append("__DISSOLVE_TOJSON")
+
+    onborder_gdf = gfo.read_file(input_path, layer=output_layer, columns=columns)
+    onborder_gdf = onborder_gdf[~onborder_gdf.geometry.isna()]
+    nb_rows_total = len(onborder_gdf)
+    if nb_rows_total == 0:
+        return
+
+    # Determine the connected components of the onborder polygons. Only polygons
+    # with the same groupby values can be connected.
+    groups = None
+    if len(groupby_columns) > 0:
+        groups = (
+            onborder_gdf.groupby(groupby_columns, dropna=False, sort=False)
+            .ngroup()
+            .to_numpy()
+        )
+    components = _geoseries_util.connected_components(onborder_gdf.geometry, groups)
+
+    # Renumber the components from large to small, so the largest components are
+    # started first, and sort the polygons on component.
+    component_sizes = np.bincount(components)
+    size_order = np.argsort(-component_sizes, kind="stable")
+    component_rank = np.empty_like(size_order)
+    component_rank[size_order] = np.arange(len(size_order))
+    components = component_rank[components]
+    component_sizes = component_sizes[size_order]
+    sort_idx = np.argsort(components, kind="stable")
+    components = components[sort_idx]
+    onborder_gdf = onborder_gdf.iloc[sort_idx].reset_index(drop=True)
+    component_column = "__tmp_component_id__"
+    onborder_gdf[component_column] = components
+
+    # Write the sorted polygons to a new file, so the rowids are 1 till nb_rows_total
+    # in component order.
+    tmp_dir = output_path.parent
+    components_path = tmp_dir / f"{output_path.stem}_onborder_components.gpkg"
+    gfo.to_file(
+        onborder_gdf,
+        components_path,
+        layer=output_layer,
+        index=False,
+        create_spatial_index=False,
+    )
+    del onborder_gdf
+
+    # Limit the nb of rows per batch, as dissolve slows down with more rows. The
+    # batches are divided at component boundaries.
+    nb_parallel, nb_batches = _determine_nb_batches(
+        nb_rows_total=nb_rows_total,
+        nb_parallel=nb_parallel,
+        batchsize=batchsize,
+        parallelization_config=ParallelizationConfig(max_rows_per_batch=10000),
+    )
+    row_bounds = np.linspace(0, nb_rows_total, nb_batches + 1).astype(np.int64)
+    batch_starts = np.searchsorted(
+        components, components[row_bounds[1:-1]], side="left"
+    )
+    batch_bounds = np.unique(np.concatenate([[0], batch_starts, [nb_rows_total]]))
+    logger.info(
+        f"{nb_rows_total} onborder polygons form {len(component_sizes)} components, "
+        f"the largest has {component_sizes[0]} rows"
+    )
+
+    partial_suffix = _general_helper.tmp_partial_suffix()
+    batches: dict[int, dict] = {}
+    worker_type = _general_helper.worker_type_to_use(nb_rows_total)
+    with _processing_util.PooledExecutorFactory(
+        worker_type=worker_type,
+        max_workers=nb_parallel,
+        initializer=_processing_util.initialize_worker,
+        initargs=(worker_type,),
+    ) as calculate_pool:
+        future_to_batch_id = {}
+        for start, end in itertools.pairwise(batch_bounds):
+            batch_id = len(batches)
+            name = f"{output_path.stem}_merged_{batch_id}{partial_suffix}"
+            batches[batch_id] = {
+                "nb_rows": int(end - start),
+                "tmp_partial_output_path": tmp_dir / name,
+            }
+            future = calculate_pool.submit(
+                _dissolve_polygons_components,
+                input_path=components_path,
+                rowid_start=int(start) + 1,
+                rowid_end=int(end),
+                component_column=component_column,
+                columns=[*columns, component_column],
+                output_path=batches[batch_id]["tmp_partial_output_path"],
+                explodecollections=explodecollections,
+                groupby_columns=groupby_columns,
+                merge_json=agg_columns is not None,
+                tiles_gdf=result_tiles_gdf,
+                input_geometrytype=input_geometrytype,
+                output_layer=output_layer,
+                gridsize=gridsize,
+                geoindex_column=geoindex_column,
+                on_data_error=on_data_error,
+            )
+            future_to_batch_id[future] = batch_id
+
+        nb_batches = len(batches)
+        nb_batches_done = 0
+        _general_util.report_progress(
+            start_time, nb_batches_done, nb_batches, "dissolve merge"
+        )
+        for future in futures.as_completed(future_to_batch_id):
+            batch_id = future_to_batch_id[future]
+            batch = batches[batch_id]
+            try:
+                _ = future.result()
+
+                tmp_partial_output_path = batch["tmp_partial_output_path"]
+                if (
+                    tmp_partial_output_path.exists()
+                    and tmp_partial_output_path.stat().st_size > 0
+                ):
+                    if (
+                        not output_path.exists()
+                        and tmp_partial_output_path.suffix == output_path.suffix
+                    ):
+                        fileops.move(src=tmp_partial_output_path, dst=output_path)
+                    else:
+                        fileops.copy_layer(
+                            src=tmp_partial_output_path,
+                            dst=output_path,
+                            src_layer=output_layer,
+                            dst_layer=output_layer,
+                            write_mode="append",
+                            create_spatial_index=False,
+                            preserve_fid=False,
+                        )
+                        gfo.remove(tmp_partial_output_path)
+
+            except Exception as ex:  # pragma: no cover
+                message = (
+                    f"Error executing merge batch {batch_id} with {batch['nb_rows']} "
+                    f"rows: {ex}"
+                )
+                logger.exception(message)
+                calculate_pool.shutdown()
+                raise RuntimeError(message) from ex
+
+            nb_batches_done += 1
+            _general_util.report_progress(
+                start_time, nb_batches_done, nb_batches, "dissolve merge"
+            )
+
+    gfo.remove(components_path, missing_ok=True)
+
+
+def _dissolve_polygons_components(
+    input_path: Path,
+    rowid_start: int,
+    rowid_end: int,
+    component_column: str,
+    columns: list[str],
+    output_path: Path,
+    explodecollections: bool,
+    groupby_columns: list[str],
+    merge_json: bool,
+    tiles_gdf: gpd.GeoDataFrame | None,
+    input_geometrytype: GeometryType,
+    output_layer: str,
+    gridsize: float,
+    geoindex_column: str,
+    on_data_error: str = "raise",
+) -> dict:
+    """Union the polygons in a range of rowids per connected component.
+
+    The polygons are grouped on the `groupby_columns` and the component id in the
+    `component_column`. The range should not split a component.
+    """
+    start_time = datetime.now()
+    return_info: dict[str, Any] = {
+        "nb_rows_done": rowid_end - rowid_start + 1,
+        "total_time": 0,
+    }
+
+    input_gdf = gfo.read_file(
+        input_path,
+        layer=output_layer,
+        columns=columns,
+        where=f"fid BETWEEN {rowid_start} AND {rowid_end}",
+    )
+    groupby_columns = [*groupby_columns, component_column]
+
+    try:
+        diss_gdf = _dissolve(
+            df=input_gdf,
+            by=groupby_columns,
+            aggfunc="merge_json_lists" if merge_json else "first",
+            as_index=False,
+            dropna=False,
+            grid_size=gridsize,
+        )
+    except Exception as ex:  # pragma: no cover
+        # If a GEOS exception occurs, check on_data_error on how to proceed.
+        if on_data_error == "warn":
+            message = f"Error merging onborder polygons, POLYGONS LOST!!!: {ex}"
+            warnings.warn(message, UserWarning, stacklevel=3)
+            return_info["message"] = message
+            return return_info
+        else:
+            raise ex
+
+    diss_gdf = diss_gdf.drop(columns=[groupby_columns[-1]])
+    if "index" in diss_gdf.columns and "index" not in groupby_columns:
+        diss_gdf = diss_gdf.drop(columns="index")
+
+    # Polygons are always exploded. If needed they will be 'collected' afterwards to
+    # multipolygons again.
+    diss_gdf = diss_gdf.explode(ignore_index=True)
+
+    # If a tiled result is asked, split the merged polygons on the result tiles
+    if tiles_gdf is not None:
+        diss_gdf = gpd.sjoin(
+            diss_gdf, tiles_gdf[["tile_id", "geometry"]], predicate="intersects"
+        )
+        tile_geoms = tiles_gdf.geometry.loc[diss_gdf["index_right"]].to_numpy()
+        diss_gdf = diss_gdf.drop(columns="index_right")
+        diss_gdf.geometry = gpd.GeoSeries(
+            shapely.intersection(
+                diss_gdf.geometry.to_numpy(), tile_geoms, grid_size=gridsize
+            ),
+            index=diss_gdf.index,
+            crs=diss_gdf.crs,
+        )
+        diss_gdf.geometry = pygeoops.collection_extract(
+            diss_gdf.geometry, primitivetype=input_geometrytype.to_primitivetype
+        )
+        diss_gdf = diss_gdf.explode(ignore_index=True)
+
+    # Remove empty geometries
+    diss_gdf = diss_gdf[~(diss_gdf.geometry.isna() | diss_gdf.geometry.is_empty)].copy()
+    if len(diss_gdf) > 0:
+        _add_geoindex_column(diss_gdf, geoindex_column)
+
+        # If explodecollections is False, force multitype to avoid warnings when some
+        # batches contain singletype and some contain multitype geometries.
+        gfo.to_file(
+            diss_gdf,
+            output_path,
+            layer=output_layer,
+            force_multitype=not explodecollections,
+            index=False,
+            create_spatial_index=False,
+        )
+
+    return_info["total_time"] = (datetime.now() - start_time).total_seconds()
+    return return_info
+
+
 def _dissolve(
     df: gpd.GeoDataFrame,
     by: str | Iterable[str] | None = None,
@@ -1,11 +1,13 @@
 """Module containing the implementation of Geofile operations using a sql statement."""
 
+import functools
 import json
 import logging
 import logging.config
 import math
 import os
 import re
+import shutil
 import string
 import time
 import warnings
@@ -13,7 +15,7 @@ from collections.abc import Iterable
 from concurrent import futures
 from datetime import datetime
 from pathlib import Path
-from typing import Literal
+from typing import Any, Literal
 
 import numpy as np
 import pandas as pd
@@ -634,6 +636,7 @@ def _single_layer_vector_operation(
                 input1_layer=input_layer,
                 tmp_dir=tmp_dir,
                 unzip_gpkg=True,
+                nb_parallel=ConfigOptions.get_nb_parallel(nb_parallel),
             )
 
         processing_params = _prepare_processing_params(
@@ -775,6 +778,9 @@ def _single_layer_vector_operation(
             tmp_output_path = tmp_dir / output_path.stem
         else:
             tmp_output_path = tmp_dir / output_path.name
+        partial_suffix = _general_helper.tmp_partial_suffix(
+            gpkg_needed=preserve_fid or where_post is not None
+        )
 
         # Processing in threads is 2x faster for small datasets (on Windows)
         worker_type = _general_helper.worker_type_to_use(input_layer.featurecount)
@@ -799,7 +805,7 @@ def _single_layer_vector_operation(
                 batches[batch_id]["layer"] = output_layer
 
                 tmp_partial_output_path = (
-                    tmp_dir / f"{GeoPath(output_path).stem}_{batch_id}.gpkg"
+                    tmp_dir / f"{GeoPath(output_path).stem}_{batch_id}{partial_suffix}"
                 )
                 batches[batch_id]["tmp_partial_output_path"] = tmp_partial_output_path
 
@@ -815,6 +821,7 @@ def _single_layer_vector_operation(
                 create_spatial_index = (
                     GeofileInfo(tmp_partial_output_path).default_spatial_index
                     if nb_batches == 1
+                    and tmp_partial_output_path.suffix == tmp_output_path.suffix
                     else False
                 )
                 # input_layers is already in the sql_stmt, so doesn't need to be passed.
@@ -872,6 +879,9 @@ def _single_layer_vector_operation(
                     logger.warning(f"Result file {tmp_partial_output_path} not found")
                     continue
 
+                _general_helper.report_batch_result(
+                    output_path, tmp_partial_output_path, output_layer, where_post
+                )
                 if (
                     tmp_partial_output_path.suffix == tmp_output_path.suffix
                     and where_post is None
@@ -1049,6 +1059,7 @@ def clip(
             force=force,
             tmp_basedir=tmp_dir,
             column_types={},
+            skip_batches_without_overlap=True,
         )
 
 
@@ -1727,6 +1738,9 @@ def export_by_location(
             force=force,
             column_types=column_types,
             tmp_basedir=tmp_dir,
+            skip_batches_without_overlap=(
+                relation_should_be_found and not true_for_disjoint
+            ),
         )
 
     # Print time taken
@@ -1824,6 +1838,7 @@ def intersection(  # noqa: D417
     tmp_basedir: Path | None = None,
     input1_subdivided_path: Path | None = None,
     input2_subdivided_path: Path | None = None,
+    input1_rowids: list[int] | None = None,
 ) -> None:
     """Calculate the intersection between two layers.
 
@@ -1850,6 +1865,8 @@ def intersection(  # noqa: D417
             the subdivided version of input1 can be found here. If a Path to root
             (Path("/")), input2 was tested, but it does not need subdividing. If None,
             input2 still needs to be subdivided. Defaults to None.
+        input1_rowids (list[int], optional): if specified, only the rows of input1
+            with these rowids are processed. Defaults to None.
     """
     # Because there might be extra preparation of the input layers before going ahead
     # with the real calculation, do some additional init + checks here...
@@ -2093,6 +2110,8 @@ def intersection(  # noqa: D417
             input1_subdivided_path=input1_subdivided_path,
             input2_subdivided_path=input2_subdivided_path,
             output_with_spatial_index=output_with_spatial_index,
+            skip_batches_without_overlap=True,
+            input1_rowids=input1_rowids,
         )
 
     # Print time taken
@@ -2203,6 +2222,7 @@ def join_by_location(
     output_with_spatial_index: bool | None = None,
     operation_prefix: str = "",
     tmp_basedir: Path | None = None,
+    input1_rowids: list[int] | None = None,
 ) -> None:
     # Prepare sql template for this operation
     operation_name = f"{operation_prefix}join_by_location"
@@ -2336,7 +2356,280 @@ def join_by_location(
         tmp_basedir=tmp_basedir,
         column_types=column_types,
         output_with_spatial_index=output_with_spatial_index,
+        skip_batches_without_overlap=discard_nonmatching,
+        input1_rowids=input1_rowids,
+    )
+
+
+def update_overlay(
+    operation: str,
+    input1_path: Path,
+    input2_path: Path,
+    output_path: Path,
+    id_column: str,
+    operation_params: dict[str, Any] | None = None,
+    input1_previous_path: Path | None = None,
+    changed_ids: list[Any] | None = None,
+    input1_layer: str | LayerInfo | None = None,
+    input2_layer: str | LayerInfo | None = None,
+    output_layer: str | None = None,
+    nb_parallel: int | None = None,
+    batchsize: int = -1,
+) -> None:
+    """Update the output of an overlay for the features of input1 that changed.
+
+    For the arguments, check out the corresponding function in geoops.py.
+    """
+    start_time = datetime.now()
+    operation_name = f"update_overlay/{operation}"
+    logger = logging.getLogger(f"geofileops.{operation_name}")
+
+    # Check input parameters
+    if operation not in ("intersection", "join_by_location"):
+        raise ValueError(f"update_overlay: unsupported operation: {operation}")
+    if (input1_previous_path is None) == (changed_ids is None):
+        raise ValueError(
+            "update_overlay: specify either input1_previous_path or changed_ids"
+        )
+    if not output_path.exists():
+        raise FileNotFoundError(f"update_overlay: output_path not found: {output_path}")
+    for name, path in (
+        ("input1_path", input1_path),
+        ("input1_previous_path", input1_previous_path),
+        ("output_path", output_path),
+    ):
+        if path is not None and _geofileinfo.get_geofileinfo(path).driver != "GPKG":
+            raise ValueError(f"update_overlay: {name} must be a GPKG file: {path}")
+    operation_params = dict(operation_params or {})
+    # The parameters update_overlay passes to the operation itself can't be overruled
+    invalid_params = {
+        "input1_path",
+        "input2_path",
+        "output_path",
+        "input1_layer",
+        "input2_layer",
+        "output_layer",
+        "nb_parallel",
+        "batchsize",
+        "operation_prefix",
+        "tmp_basedir",
+        "input1_rowids",
+        "force",
+        "overlay_self",
+        "include_duplicates",
+        "input1_subdivided_path",
+        "input2_subdivided_path",
+    }
+    invalid_params &= set(operation_params)
+    if len(invalid_params) > 0:
+        raise ValueError(
+            f"update_overlay: invalid operation_params: {sorted(invalid_params)}"
+        )
+
+    # If no input1_layer is specified, the previous input1 should have only one layer
+    previous_layer = None
+    if input1_layer is not None:
+        previous_layer = (
+            input1_layer.name if isinstance(input1_layer, LayerInfo) else input1_layer
+        )
+    if not isinstance(input1_layer, LayerInfo):
+        input1_layer = gfo.get_layerinfo(input1_path, input1_layer)
+    output_layerinfo = gfo.get_layerinfo(output_path, output_layer)
+
+    # The rows in the output are linked to the features in input1 via the id column
+    input1_columns = operation_params.get("input1_columns")
+    if input1_columns is not None and id_column.lower() not in [
+        column.lower() for column in input1_columns
+    ]:
+        raise ValueError(
+            f"update_overlay: id_column {id_column} must be in input1_columns"
+        )
+    prefix = operation_params.get("input1_columns_prefix", "l1_")
+    output_id_column = next(
+        (
+            column
+            for column in output_layerinfo.columns
+            if column.lower() == f"{prefix}{id_column}".lower()
+        ),
+        None,
     )
+    if output_id_column is None:
+        raise ValueError(
+            f"update_overlay: column {prefix}{id_column} not found in {output_path}"
+        )
+
+    # Determine the features that were added, changed or deleted
+    if changed_ids is None:
+        assert input1_previous_path is not None
+        changed_ids = _determine_changed_ids(
+            previous_path=input1_previous_path,
+            previous_layer=previous_layer,
+            current_path=input1_path,
+            current_layer=input1_layer.name,
+            id_column=id_column,
+            columns=input1_columns,
+        )
+    if len(changed_ids) == 0:
+        logger.info("No changed features found, so nothing to update")
+        return
+
+    logger.info(f"Start, update {output_path} for {len(changed_ids)} features")
+    with _general_helper.create_gfo_tmp_dir(operation_name) as tmp_dir:
+        # Recalculate the output rows of the changed features that still exist. As
+        # each output row only depends on one feature of input1, the batch filter can
+        # be restricted to the rowids of these features.
+        id_column_sql = id_column
+        if id_column.lower() == "fid" and input1_layer.fid_column != "":
+            id_column_sql = input1_layer.fid_column
+        rowids = []
+        for ids_sql in _sql_value_lists(changed_ids):
+            rowids_df = gfo.read_file(
+                input1_path,
+                sql_stmt=f"""
+                    SELECT rowid AS input1_rowid
+                      FROM "{input1_layer.name}"
+                     WHERE "{id_column_sql}" IN ({ids_sql})
+                """,
+                sql_dialect="SQLITE",
+            )
+            rowids.extend(rowids_df["input1_rowid"].astype("int64").tolist())
+
+        update_path = tmp_dir / "update.gpkg"
+        if len(rowids) > 0:
+            # Remark: the input layers aren't subdivided, because for the limited
+            # number of rows to recalculate this costs more than it gains.
+            kwargs: dict[str, Any] = {
+                "input1_path": input1_path,
+                "input2_path": input2_path,
+                "output_path": update_path,
+                "input1_layer": input1_layer,
+                "input2_layer": input2_layer,
+                "output_layer": output_layerinfo.name,
+                "nb_parallel": nb_parallel,
+                "batchsize": batchsize,
+                "operation_prefix": "update_overlay/",
+                "tmp_basedir": tmp_dir,
+                "input1_rowids": rowids,
+            }
+            if operation == "intersection":
+                intersection(
+                    overlay_self=False,
+                    include_duplicates=True,
+                    input1_subdivided_path=Path("/"),
+                    input2_subdivided_path=Path("/"),
+                    **kwargs,
+                    **operation_params,
+                )
+            else:
+                join_by_location(**kwargs, **operation_params)
+
+        # Patch the output in place: remove the rows of the changed features and add
+        # the rows recalculated for them. This is done in one transaction, so if an
+        # error occurs the output is left unchanged.
+        delete_where = [
+            f'"{output_id_column}" IN ({ids_sql})'
+            for ids_sql in _sql_value_lists(changed_ids)
+        ]
+        if update_path.exists():
+            _sqlite_util.copy_table(
+                input_path=update_path,
+                output_path=output_path,
+                input_table=output_layerinfo.name,
+                output_table=output_layerinfo.name,
+                delete_where=delete_where,
+            )
+        else:
+            _sqlite_util.execute_sql(
+                output_path,
+                sql_stmt=[
+                    f'DELETE FROM "{output_layerinfo.name}" WHERE {delete_clause}'
+                    for delete_clause in delete_where
+                ],
+            )
+
+    logger.info(f"Ready, full update took {datetime.now() - start_time}")
+
+
+def _determine_changed_ids(
+    previous_path: Path,
+    previous_layer: str | None,
+    current_path: Path,
+    current_layer: str,
+    id_column: str,
+    columns: list[str] | None,
+) -> list[Any]:
+    """Determine the ids of the features that were added, changed or deleted.
+
+    Features are compared on their geometry and on the columns specified. The
+    comparison is done in SQLite, with the previous file attached to the current one,
+    so the files don't need to be loaded in memory.
+    """
+    previous_info = gfo.get_layerinfo(previous_path, previous_layer)
+    current_info = gfo.get_layerinfo(current_path, current_layer)
+
+    # Determine the columns to compare: the geometry and the columns in both layers
+    if columns is None:
+        columns = list(current_info.columns)
+    previous_columns = {column.lower() for column in previous_info.columns}
+    compare_columns = [
+        column
+        for column in columns
+        if column.lower() not in ("fid", id_column.lower())
+        and column.lower() in previous_columns
+    ]
+    # Compare the geometries on their binary representation
+    compare_exprs = [
+        f'cur."{current_info.geometrycolumn}" '
+        f'IS NOT prev."{previous_info.geometrycolumn}"',
+        *[f'cur."{column}" IS NOT prev."{column}"' for column in compare_columns],
+    ]
+    changed_sql = "\n OR ".join(compare_exprs)
+
+    cur_id = prev_id = f'"{id_column}"'
+    if id_column.lower() == "fid":
+        cur_id = prev_id = "rowid"
+
+    conn = _sqlite_util.connect(current_path, use_spatialite=False)
+    sql = None
+    try:
+        sql = "ATTACH DATABASE ? AS previous_db"
+        conn.execute(sql, (str(previous_path),))
+        sql = f"""
+            SELECT cur.{cur_id}
+              FROM main."{current_info.name}" cur
+              LEFT JOIN previous_db."{previous_info.name}" prev
+                ON prev.{prev_id} = cur.{cur_id}
+             WHERE prev.rowid IS NULL
+                OR {changed_sql}
+            UNION ALL
+            SELECT prev.{prev_id}
+              FROM previous_db."{previous_info.name}" prev
+             WHERE NOT EXISTS (
+                   SELECT 1
+                     FROM main."{current_info.name}" cur
+                    WHERE cur.{cur_id} = prev.{prev_id}
+                   )
+        """
+        changed_ids = [row[0] for row in conn.execute(sql).fetchall()]
+    except Exception as ex:
+        raise RuntimeError(f"Error {ex} executing {sql}") from ex
+    finally:
+        conn.close()
+        conn = None  # type: ignore[assignment]
+
+    return changed_ids
+
+
+def _sql_value_lists(values: list[Any], chunksize: int = 10000) -> Iterable[str]:
+    """Format the values as comma separated SQL literals, in chunks."""
+    for start in range(0, len(values), chunksize):
+        literals = []
+        for value in values[start : start + chunksize]:
+            if isinstance(value, str):
+                literals.append("'{}'".format(value.replace("'", "''")))
+            else:
+                literals.append(str(value))
+        yield ",".join(literals)
 
 
 def _prepare_filter_by_location_params(
@@ -3131,68 +3424,92 @@ def union(
 
     start_time = datetime.now()
     with _general_helper.create_gfo_tmp_dir("union") as tmp_dir:
-        # Prepare the input files
-        logger.info("Step 1 of 5: prepare input files")
-        input1_subdivided_path = _subdivide_layer(
-            path=input1_path,
-            layer=input1_layer,
-            output_path=tmp_dir / "subdivided/input1_layer.gpkg",
-            subdivide_coords=subdivide_coords,
-            nb_parallel=nb_parallel,
-            batchsize=batchsize,
-            operation_prefix="union/",
-            tmp_basedir=tmp_dir,
+        # If the union is resumed, the steps completed before can be skipped. If it
+        # was interrupted while appending to the intermediate result, this result
+        # can't be trusted anymore, so start from scratch.
+        checkpoint = _general_helper.Checkpoint(
+            tmp_dir, identity=f"union:{output_path}"
         )
-        if input1_subdivided_path is None:
-            # Hardcoded optimization: root means that no subdivide was needed
-            input1_subdivided_path = Path("/")
+        if checkpoint.get("appending") is not None:
+            logger.info("Previous run was interrupted while appending, start again")
+            checkpoint.reset()
 
-        if overlay_self:
-            # With overlay_self, input2 is the same as input1
-            input2_subdivided_path: Path | None = input1_subdivided_path
+        # Prepare the input files
+        logger.info("Step 1 of 5: prepare input files")
+        subdivided_paths = checkpoint.get("prepare")
+        if subdivided_paths is not None:
+            logger.info("Step 1 was completed before, skip it")
+            assert isinstance(subdivided_paths, list)
+            input1_subdivided_path: Path | None = Path(subdivided_paths[0])
+            input2_subdivided_path: Path | None = Path(subdivided_paths[1])
         else:
-            input2_subdivided_path = _subdivide_layer(
-                path=input2_path,
-                layer=input2_layer,
-                output_path=tmp_dir / "subdivided/input2_layer.gpkg",
+            input1_subdivided_path = _subdivide_layer(
+                path=input1_path,
+                layer=input1_layer,
+                output_path=tmp_dir / "subdivided/input1_layer.gpkg",
                 subdivide_coords=subdivide_coords,
                 nb_parallel=nb_parallel,
                 batchsize=batchsize,
                 operation_prefix="union/",
                 tmp_basedir=tmp_dir,
             )
-            if input2_subdivided_path is None:
+            if input1_subdivided_path is None:
                 # Hardcoded optimization: root means that no subdivide was needed
-                input2_subdivided_path = Path("/")
+                input1_subdivided_path = Path("/")
+
+            if overlay_self:
+                # With overlay_self, input2 is the same as input1
+                input2_subdivided_path = input1_subdivided_path
+            else:
+                input2_subdivided_path = _subdivide_layer(
+                    path=input2_path,
+                    layer=input2_layer,
+                    output_path=tmp_dir / "subdivided/input2_layer.gpkg",
+                    subdivide_coords=subdivide_coords,
+                    nb_parallel=nb_parallel,
+                    batchsize=batchsize,
+                    operation_prefix="union/",
+                    tmp_basedir=tmp_dir,
+                )
+                if input2_subdivided_path is None:
+                    # Hardcoded optimization: root means that no subdivide was needed
+                    input2_subdivided_path = Path("/")
+            checkpoint.mark_done(
+                "prepare", [str(input1_subdivided_path), str(input2_subdivided_path)]
+            )
 
         # First apply intersection of input1 with input2 to a temporary output file...
         logger.info("Step 2 of 5: intersection")
         intersection_output_path = tmp_dir / "intersection_output.gpkg"
-        intersection(
-            input1_path=input1_path,
-            input2_path=input2_path,
-            output_path=intersection_output_path,
-            overlay_self=overlay_self,
-            include_duplicates=include_duplicates,
-            input1_layer=input1_layer,
-            input1_columns=input1_columns,
-            input1_columns_prefix=input1_columns_prefix,
-            input2_layer=input2_layer,
-            input2_columns=input2_columns,
-            input2_columns_prefix=input2_columns_prefix,
-            output_layer=output_layer,
-            explodecollections=explodecollections,
-            gridsize=gridsize,
-            where_post=where_post,
-            nb_parallel=nb_parallel,
-            batchsize=batchsize,
-            force=force,
-            output_with_spatial_index=False,
-            operation_prefix="union/",
-            tmp_basedir=tmp_dir,
-            input1_subdivided_path=input1_subdivided_path,
-            input2_subdivided_path=input2_subdivided_path,
-        )
+        if checkpoint.is_done("intersection"):
+            logger.info("Step 2 was completed before, skip it")
+        else:
+            intersection(
+                input1_path=input1_path,
+                input2_path=input2_path,
+                output_path=intersection_output_path,
+                overlay_self=overlay_self,
+                include_duplicates=include_duplicates,
+                input1_layer=input1_layer,
+                input1_columns=input1_columns,
+                input1_columns_prefix=input1_columns_prefix,
+                input2_layer=input2_layer,
+                input2_columns=input2_columns,
+                input2_columns_prefix=input2_columns_prefix,
+                output_layer=output_layer,
+                explodecollections=explodecollections,
+                gridsize=gridsize,
+                where_post=where_post,
+                nb_parallel=nb_parallel,
+                batchsize=batchsize,
+                force=force,
+                output_with_spatial_index=False,
+                operation_prefix="union/",
+                tmp_basedir=tmp_dir,
+                input1_subdivided_path=input1_subdivided_path,
+                input2_subdivided_path=input2_subdivided_path,
+            )
+            checkpoint.mark_done("intersection")
 
         # Difference input1 from input2 to another temporary output gfo.
         logger.info("Step 3 of 5: difference of input 1 from input 2")
@@ -3200,6 +3517,8 @@ def union(
             logger.info(
                 "For a self-union with include_duplicates=False, step 3 is skipped"
             )
+        elif checkpoint.is_done("difference1"):
+            logger.info("Step 3 was completed before, skip it")
         else:
             diff1_output_path = tmp_dir / "diff_input1_from_input2_output.gpkg"
             difference(
@@ -3226,6 +3545,7 @@ def union(
                 input2_subdivided_path=input1_subdivided_path,
             )
             # Note: append will never create an index on an already existing layer.
+            checkpoint.mark_done("appending", "difference1")
             fileops.copy_layer(
                 src=diff1_output_path,
                 dst=intersection_output_path,
@@ -3233,44 +3553,51 @@ def union(
                 dst_layer=output_layer,
                 write_mode="append",
             )
+            checkpoint.mark_done("difference1")
+            checkpoint.mark_done("appending", None)
             gfo.remove(diff1_output_path)
 
         # Difference input1 from input2 to and add to temporary output file.
         logger.info("Step 4 of 5: difference input 2 from input 1")
-        diff2_output_path = tmp_dir / "diff_input2_from_input1_output.gpkg"
-
-        difference(
-            input1_path=input1_path,
-            input2_path=input2_path,
-            output_path=diff2_output_path,
-            overlay_self=overlay_self,
-            input1_layer=input1_layer,
-            input1_columns=input1_columns,
-            input_columns_prefix=input1_columns_prefix,
-            input2_layer=input2_layer,
-            output_layer=output_layer,
-            explodecollections=explodecollections,
-            gridsize=gridsize,
-            where_post=where_post,
-            nb_parallel=nb_parallel,
-            batchsize=batchsize,
-            subdivide_coords=subdivide_coords,
-            force=force,
-            output_with_spatial_index=False,
-            operation_prefix="union/",
-            tmp_basedir=tmp_dir,
-            input1_subdivided_path=input1_subdivided_path,
-            input2_subdivided_path=input2_subdivided_path,
-        )
-        # Note: append will never create an index on an already existing layer.
-        fileops.copy_layer(
-            src=diff2_output_path,
-            dst=intersection_output_path,
-            src_layer=output_layer,
-            dst_layer=output_layer,
-            write_mode="append",
-        )
-        gfo.remove(diff2_output_path)
+        if checkpoint.is_done("difference2"):
+            logger.info("Step 4 was completed before, skip it")
+        else:
+            diff2_output_path = tmp_dir / "diff_input2_from_input1_output.gpkg"
+            difference(
+                input1_path=input1_path,
+                input2_path=input2_path,
+                output_path=diff2_output_path,
+                overlay_self=overlay_self,
+                input1_layer=input1_layer,
+                input1_columns=input1_columns,
+                input_columns_prefix=input1_columns_prefix,
+                input2_layer=input2_layer,
+                output_layer=output_layer,
+                explodecollections=explodecollections,
+                gridsize=gridsize,
+                where_post=where_post,
+                nb_parallel=nb_parallel,
+                batchsize=batchsize,
+                subdivide_coords=subdivide_coords,
+                force=force,
+                output_with_spatial_index=False,
+                operation_prefix="union/",
+                tmp_basedir=tmp_dir,
+                input1_subdivided_path=input1_subdivided_path,
+                input2_subdivided_path=input2_subdivided_path,
+            )
+            # Note: append will never create an index on an already existing layer.
+            checkpoint.mark_done("appending", "difference2")
+            fileops.copy_layer(
+                src=diff2_output_path,
+                dst=intersection_output_path,
+                src_layer=output_layer,
+                dst_layer=output_layer,
+                write_mode="append",
+            )
+            checkpoint.mark_done("difference2")
+            checkpoint.mark_done("appending", None)
+            gfo.remove(diff2_output_path)
 
         # Convert or add spatial index
         logger.info("Step 5 of 5: finalize")
@@ -3286,6 +3613,9 @@ def union(
         # Now we are ready to move the result to the final spot...
         gfo.move(tmp_output_path, output_path)
 
+        # The intermediate result was moved, so it can't be reused anymore
+        checkpoint.reset()
+
     logger.info(f"Ready, full union took {datetime.now() - start_time}")
 
 
@@ -3317,6 +3647,8 @@ def _two_layer_vector_operation(
     input2_subdivided_path: Path | None = None,
     use_ogr: bool = False,
     output_with_spatial_index: bool | None = None,
+    skip_batches_without_overlap: bool = False,
+    input1_rowids: list[int] | None = None,
 ) -> None:
     """Executes an operation that needs 2 input files.
 
@@ -3376,6 +3708,12 @@ def _two_layer_vector_operation(
             Defaults to False.
         output_with_spatial_index (bool, optional): True to create output file with
             spatial index. None to use the GDAL default. Defaults to None.
+        skip_batches_without_overlap (bool, optional): True if the result is empty for
+            rows of input1 that don't overlap with input2. If True, batches are shrunk
+            to the rows that overlap with input2 based on the spatial indexes, and
+            batches without such rows are skipped. Defaults to False.
+        input1_rowids (list[int], optional): if specified, only the rows of input1
+            with these rowids are processed. Defaults to None.
         tmp_basedir (Optional[Path]): The directory to create the temporary directory in
             for this operation execution. If None, it is created in the default
             geofileops temporary directory. Useful to keep all temporary files for an
@@ -3449,29 +3787,72 @@ def _two_layer_vector_operation(
     # Init layer info
     start_time = datetime.now()
     with _general_helper.create_gfo_tmp_dir(operation_name, tmp_basedir) as tmp_dir:
+        # If the operation is resumed, the batches completed before can be skipped.
+        # If it was interrupted while merging a batch, the merged result can't be
+        # trusted anymore, so start from scratch.
+        checkpoint = _general_helper.Checkpoint(
+            tmp_dir, identity=f"{operation_name}:{output_path}"
+        )
+        if checkpoint.get("batch_merging") is not None:
+            logger.info("Previous run was interrupted while merging, start again")
+            checkpoint.reset()
+
         # Check if crs are the same in the input layers + use it (if there is one)
         output_crs = _check_crs(input1_layer, input2_layer)
 
         # Prepare tmp output filename
         tmp_output_path = tmp_dir / GeoPath(output_path).name_nozip
         tmp_output_path.parent.mkdir(exist_ok=True, parents=True)
-        gfo.remove(tmp_output_path, missing_ok=True)
+        if not checkpoint.enabled:
+            gfo.remove(tmp_output_path, missing_ok=True)
+        partial_suffix = _general_helper.tmp_partial_suffix(
+            gpkg_needed=not use_ogr or where_post is not None
+        )
 
         # Prepare tmp files/batches
         # -------------------------
         logger.debug(f"Prepare input (params), {tmp_dir=}")
-        input1_path, input1_layer, input2_path, input2_layer = (
-            _convert_to_spatialite_based(  # type: ignore[assignment]
-                input1_path=input1_path,
-                input1_layer=input1_layer,
-                tmp_dir=tmp_dir,
-                unzip_gpkg=True,
-                input2_path=input2_path,
-                input2_layer=input2_layer,
+        # If the operation is resumed, the input files prepared before are reused.
+        prepared_input = checkpoint.get("input")
+        if isinstance(prepared_input, list):
+            input1_path, input1_layer_name, input2_path, input2_layer_name = (
+                prepared_input
+            )
+            input1_path = Path(input1_path)
+            input1_layer = gfo.get_layerinfo(
+                input1_path, input1_layer_name, raise_on_nogeom=False
+            )
+            input2_path = Path(input2_path)
+            input2_layer = gfo.get_layerinfo(
+                input2_path, input2_layer_name, raise_on_nogeom=False
+            )
+        else:
+            input_tmp_dir = tmp_dir / "input"
+            if input_tmp_dir.exists():
+                shutil.rmtree(input_tmp_dir)
+            input_tmp_dir.mkdir()
+            input1_path, input1_layer, input2_path, input2_layer = (
+                _convert_to_spatialite_based(  # type: ignore[assignment]
+                    input1_path=input1_path,
+                    input1_layer=input1_layer,
+                    tmp_dir=input_tmp_dir,
+                    unzip_gpkg=True,
+                    input2_path=input2_path,
+                    input2_layer=input2_layer,
+                    nb_parallel=ConfigOptions.get_nb_parallel(nb_parallel),
+                )
+            )
+            assert input2_path is not None
+            assert input2_layer is not None
+            checkpoint.mark_done(
+                "input",
+                [
+                    str(input1_path),
+                    input1_layer.name,
+                    str(input2_path),
+                    input2_layer.name,
+                ],
             )
-        )
-        assert input2_path is not None
-        assert input2_layer is not None
 
         # Prepare parameters needed to prepare the batches for optimized processing.
         input1_for_prepare_path = input1_path
@@ -3507,10 +3888,28 @@ def _two_layer_vector_operation(
             tmp_dir=tmp_dir,
             nb_parallel=nb_parallel,
             batchsize=batchsize,
+            skip_batches_without_overlap=skip_batches_without_overlap,
+            input1_rowids=input1_rowids,
         )
         if processing_params is None or processing_params.batches is None:
             return
 
+        # If the operation is resumed, continue with the batches of the first run
+        batch_template = next(iter(processing_params.batches.values()))
+        batch_filters = checkpoint.batches(
+            [
+                [int(batch_id), batch["batch_filter"]]
+                for batch_id, batch in processing_params.batches.items()
+            ]
+        )
+        processing_params.batches = {
+            batch_id: {**batch_template, "batch_filter": batch_filter}
+            for batch_id, batch_filter in batch_filters
+        }
+        processing_params.nb_parallel = min(
+            processing_params.nb_parallel, len(processing_params.batches)
+        )
+
         # Do some checks on the placeholders
         sql_template_placeholders = [
             name for _, name, _, _ in string.Formatter().parse(sql_template) if name
@@ -3734,18 +4133,24 @@ def _two_layer_vector_operation(
             max_workers=processing_params.nb_parallel,
             initializer=_processing_util.initialize_worker,
             initargs=(worker_type,),
+            distributable=True,
         ) as calculate_pool:
             # Start looping
             batches: dict[int, dict] = {}
-            future_to_batch_id = {}
+            tasks = {}
             for batch_id in processing_params.batches:
+                if checkpoint.is_done(f"batch_{batch_id}"):
+                    continue
+
                 batches[batch_id] = {}
                 batches[batch_id]["layer"] = output_layer
 
                 tmp_partial_output_path = (
-                    tmp_dir / f"{GeoPath(output_path).stem}_{batch_id}.gpkg"
+                    tmp_dir / f"{GeoPath(output_path).stem}_{batch_id}{partial_suffix}"
                 )
                 batches[batch_id]["tmp_partial_output_path"] = tmp_partial_output_path
+                # Remove the partial result of an interrupted earlier run
+                gfo.remove(tmp_partial_output_path, missing_ok=True)
 
                 # Fill out final things in sql_template
                 sql_stmt = sql_template.format(
@@ -3758,7 +4163,7 @@ def _two_layer_vector_operation(
                 batches[batch_id]["sqlite_stmt"] = sql_stmt
 
                 # Remark: this temp file doesn't need spatial index
-                future = calculate_pool.submit(
+                tasks[batch_id] = functools.partial(
                     _calculate_two_layers,
                     input_databases=input_databases,
                     output_path=tmp_partial_output_path,
@@ -3771,11 +4176,12 @@ def _two_layer_vector_operation(
                     create_spatial_index=False,
                     column_datatypes=column_types,
                 )
-                future_to_batch_id[future] = batch_id
 
             # Loop till all parallel processes are ready, but process each one
             # that is ready already
-            nb_done = 0
+            nb_done = nb_batches - len(tasks)
+            if nb_done > 0:
+                logger.info(f"Resume: {nb_done} batches were completed before")
             _general_util.report_progress(
                 start_time,
                 nb_done,
@@ -3787,31 +4193,42 @@ def _two_layer_vector_operation(
             # Warn about low memory availability if needed
             _general_helper.warn_if_low_mem(called_from=operation_name)
 
-            for future in futures.as_completed(future_to_batch_id):
+            for batch_id, future in _processing_util.submit_with_backpressure(
+                calculate_pool,
+                tasks,
+                max_running=processing_params.nb_parallel,
+                min_mem_available=ConfigOptions.get_low_mem_available_pause_threshold,
+            ):
                 try:
                     # Get the result
                     result = future.result()
                     if result is not None:
                         logger.debug(f"{result}")
                 except Exception as ex:
-                    batch_id = future_to_batch_id[future]
                     error = str(ex).partition("\n")[0]
                     message = f"Error <{error}> executing {batches[batch_id]}"
                     logger.exception(message)
                     raise Exception(message) from ex
 
                 # If the calculate gave results, copy/append to output
-                batch_id = future_to_batch_id[future]
                 tmp_partial_output_path = batches[batch_id]["tmp_partial_output_path"]
                 nb_done += 1
 
                 # Normally all partial files should exist, but to be sure...
                 if not tmp_partial_output_path.exists():
                     logger.warning(f"Result file {tmp_partial_output_path} not found")
+                    checkpoint.mark_done(f"batch_{batch_id}")
                     continue
 
+                # The partial result is only final if nothing is applied on append
+                if not explode_append and output_geometrytype_append is None:
+                    _general_helper.report_batch_result(
+                        output_path, tmp_partial_output_path, output_layer, where_post
+                    )
+
                 # If this is the first partial file (no tmp output file yet), just
                 # rename/move it as that is faster.
+                checkpoint.mark_done("batch_merging", batch_id)
                 if (
                     not explodecollections
                     and output_geometrytype_append is None
@@ -3850,6 +4267,8 @@ def _two_layer_vector_operation(
                         preserve_fid=False,
                     )
                     gfo.remove(tmp_partial_output_path)
+                checkpoint.mark_done(f"batch_{batch_id}")
+                checkpoint.mark_done("batch_merging", None)
 
                 # Log the progress and prediction speed
                 _general_util.report_progress(
@@ -3865,6 +4284,9 @@ def _two_layer_vector_operation(
             tmp_output_path, output_path, output_layer, output_with_spatial_index
         )
 
+        # The merged result was moved, so it can't be reused anymore
+        checkpoint.reset()
+
         logger.info(f"Ready, took {datetime.now() - start_time}")
 
 
@@ -4195,6 +4617,7 @@ def _convert_to_spatialite_based(
     unzip_gpkg: bool,
     input2_path: Path | None = None,
     input2_layer: LayerInfo | None = None,
+    nb_parallel: int = 1,
 ) -> tuple[Path, LayerInfo, Path | None, LayerInfo | None]:
     """Prepare input files for the calculation.
 
@@ -4208,6 +4631,8 @@ def _convert_to_spatialite_based(
         unzip_gpkg (bool): if True, zipped gpkg files will be unzipped
         input2_path (Optional[Path]): path to the 2nd input file
         input2_layer (Optional[LayerInfo]): the layer info of the 2nd input file
+        nb_parallel (int, optional): the number of parallel workers to use to convert
+            the input files. Defaults to 1.
 
     Returns:
         the input1_path, input1_layer, input2_path, input2_layer
@@ -4252,6 +4677,7 @@ def _convert_to_spatialite_based(
             dst=input1_tmp_path,
             dst_layer=input1_layer.name,
             preserve_fid=True,
+            nb_parallel=nb_parallel,
         )
         input1_path = input1_tmp_path
         input1_info = _geofileinfo.get_geofileinfo(input1_path)
@@ -4284,6 +4710,7 @@ def _convert_to_spatialite_based(
                 dst=input2_tmp_path,
                 dst_layer=input2_layer.name,
                 preserve_fid=True,
+                nb_parallel=nb_parallel,
             )
             input2_path = input2_tmp_path
             input2_info = _geofileinfo.get_geofileinfo(input2_path)
@@ -4381,9 +4808,16 @@ def _prepare_processing_params(
     batch_filter_column: str = "rowid",
     input2_path: Path | None = None,
     input2_layer: LayerInfo | None = None,
+    skip_batches_without_overlap: bool = False,
+    input1_rowids: list[int] | None = None,
 ) -> ProcessingParams | None:
     # Prepare batches to process
     nb_rows_input_layer = input1_layer.featurecount
+    if input1_rowids is not None:
+        # Only the rows with these rowids need to be processed
+        if len(input1_rowids) == 0:
+            return None
+        nb_rows_input_layer = len(input1_rowids)
     input2_layername = None if input2_layer is None else input2_layer.name
 
     # Determine optimal number of batches
@@ -4396,7 +4830,27 @@ def _prepare_processing_params(
 
     # Check number of batches + appoint nb rows to batches
     batches: dict[int, dict] = {}
-    if nb_batches == 1:
+    if input1_rowids is not None:
+        # Distribute the rowids over the batches and filter on them explicitly
+        layer_alias_d = ""
+        if input1_layer_alias is not None:
+            layer_alias_d = f"{input1_layer_alias}."
+        rowids_sorted = sorted(input1_rowids)
+        for batch_id, batch_rowids in enumerate(
+            np.array_split(rowids_sorted, min(nb_batches, len(rowids_sorted)))
+        ):
+            rowids_str = ",".join(str(int(rowid)) for rowid in batch_rowids)
+            batches[batch_id] = {
+                "input1_path": input1_path,
+                "input1_layer": input1_layer,
+                "input2_path": input2_path,
+                "input2_layer": input2_layername,
+                "batch_filter": (
+                    f"AND {layer_alias_d}{batch_filter_column} IN ({rowids_str}) "
+                ),
+            }
+
+    elif nb_batches == 1:
         # If only one batch, no filtering is needed
         batches[0] = {}
         batches[0]["input1_path"] = input1_path
@@ -4425,50 +4879,32 @@ def _prepare_processing_params(
             batch_info_df.reset_index(names=["batch_id"], inplace=True)
             nb_batches = len(batch_info_df)
 
+        elif (
+            ConfigOptions.get_batch_balance_by_cost
+            and input2_path is not None
+            and input2_layer is not None
+            and input1_layer.geometrycolumn is not None
+            and input2_layer.geometrycolumn is not None
+            and _geofileinfo.get_geofileinfo(input1_path).driver == "GPKG"
+            and _geofileinfo.get_geofileinfo(input2_path).driver == "GPKG"
+        ):
+            # Determine the rowid ranges so each batch has about the same cost.
+            batch_info_df = _determine_batches_by_cost(
+                input1_path=input1_path,
+                input1_layer=input1_layer,
+                input2_path=input2_path,
+                input2_layer=input2_layer,
+                nb_batches=nb_batches,
+            )
+            nb_batches = len(batch_info_df)
+
         else:
-            # Determine the min_rowid and max_rowid
-            # Remark: SELECT MIN(rowid), MAX(rowid) ... is a lot slower than UNION ALL!
-            sql_stmt = f"""
-                SELECT MIN(rowid) minmax_rowid FROM "{input1_layer.name}"
-                UNION ALL
-                SELECT MAX(rowid) minmax_rowid FROM "{input1_layer.name}"
-            """
-            batch_info_df = gfo.read_file(
-                path=input1_path, sql_stmt=sql_stmt, sql_dialect="SQLITE"
+            batch_info_df = fileops._determine_rowid_batches(
+                path=input1_path,
+                layer=input1_layer.name,
+                nb_rows=nb_rows_input_layer,
+                nb_batches=nb_batches,
             )
-            min_rowid = pd.to_numeric(batch_info_df["minmax_rowid"][0]).item()
-            max_rowid = pd.to_numeric(batch_info_df["minmax_rowid"][1]).item()
-
-            # Determine the exact batches to use
-            if ((max_rowid - min_rowid) / nb_rows_input_layer) < 1.1:
-                # If the rowid's are quite consecutive, use an imperfect, but
-                # fast distribution in batches
-                batch_info_list = []
-                start_id = min_rowid
-                offset_per_batch = round((max_rowid - min_rowid) / nb_batches)
-                for batch_id in range(nb_batches):
-                    batch_info_list.append((batch_id, start_id))
-                    start_id += offset_per_batch
-
-                batch_info_df = pd.DataFrame(
-                    batch_info_list, columns=["batch_id", "start_id"]
-                )
-            else:
-                # The rowids are not consecutive, so determine the optimal rowid
-                # ranges for each batch so each batch has same number of elements
-                # Remark: - this might take some seconds for larger datasets!
-                #         - (batch_id - 1) AS id to make the id zero-based
-                sql_stmt = f"""
-                    SELECT (batch_id - 1) AS batch_id
-                        ,MIN(rowid) AS start_id
-                    FROM
-                        ( SELECT rowid
-                                ,NTILE({nb_batches}) OVER (ORDER BY rowid) batch_id
-                            FROM "{input1_layer.name}"
-                        )
-                    GROUP BY batch_id;
-                """
-                batch_info_df = gfo.read_file(path=input1_path, sql_stmt=sql_stmt)
 
         # Prepare the layer alias to use in the batch filter
         layer_alias_d = ""
@@ -4478,6 +4914,26 @@ def _prepare_processing_params(
         # The end_id is the start_id of the next batch - 1
         batch_info_df["end_id"] = batch_info_df["start_id"].shift(-1) - 1
 
+        # If rows without overlap with input2 don't give any result, shrink the batches
+        # to the overlapping rows and drop batches without any.
+        if (
+            skip_batches_without_overlap
+            and not input1_is_subdivided
+            and input2_path is not None
+            and input2_layer is not None
+            and input1_layer.geometrycolumn is not None
+            and input2_layer.geometrycolumn is not None
+            and _geofileinfo.get_geofileinfo(input1_path).driver == "GPKG"
+            and _geofileinfo.get_geofileinfo(input2_path).driver == "GPKG"
+        ):
+            batch_info_df = _shrink_batches_to_overlap(
+                input1_path=input1_path,
+                input1_layer=input1_layer,
+                input2_path=input2_path,
+                input2_layer=input2_layer,
+                batch_info_df=batch_info_df,
+            )
+
         # Now loop over all batch ranges to build up the necessary filters
         for batch_id, start_id, end_id in batch_info_df.itertuples(index=False):
             # The batch filter
@@ -4512,6 +4968,202 @@ def _prepare_processing_params(
     return returnvalue
 
 
+def _determine_batches_by_cost(
+    input1_path: Path,
+    input1_layer: LayerInfo,
+    input2_path: Path,
+    input2_layer: LayerInfo,
+    nb_batches: int,
+) -> pd.DataFrame:
+    """Determine the rowid ranges for batches so they have about the same cost.
+
+    The cost of a row of input1 is estimated as the number of vertices of its geometry
+    multiplied by the number of candidate rows in input2 it needs to be compared with,
+    being the rows of which the bounding box in the rtree index intersects with its
+    own bounding box. The batch boundaries are then determined on the cumulative cost
+    over the rows in rowid order.
+
+    Both input files should be Geopackages.
+
+    Args:
+        input1_path (Path): path to the 1st input file.
+        input1_layer (LayerInfo): the layer info of the 1st input file.
+        input2_path (Path): path to the 2nd input file.
+        input2_layer (LayerInfo): the layer info of the 2nd input file.
+        nb_batches (int): the number of batches to aim for.
+
+    Returns:
+        pd.DataFrame: a DataFrame with the columns "batch_id" and "start_id", with the
+            start_id being the first rowid of each batch. If individual rows are more
+            costly than a batch should be, less batches than `nb_batches` are returned.
+    """
+    start = time.perf_counter()
+    input1_rtree = f"rtree_{input1_layer.name}_{input1_layer.geometrycolumn}"
+    input2_rtree = f"rtree_{input2_layer.name}_{input2_layer.geometrycolumn}"
+    input1_geometrycolumn = input1_layer.geometrycolumn
+    input2_db = "main"
+    if input2_path != input1_path:
+        input2_db = "input2"
+
+    # Remarks:
+    #   - the candidate count is determined via the rtree index of input2 so only the
+    #     geometries of input1 need to be read.
+    #   - rows are assigned to a batch based on the midpoint of their cost interval,
+    #     so a very costly row tends to end up in a batch of its own.
+    #   - (batch_id - 1) AS batch_id to make the id zero-based.
+    sql_stmt = f"""
+        SELECT batch_id - 1 AS batch_id
+              ,MIN(rowid) AS start_id
+          FROM (
+            SELECT rowid
+                  ,1 + ((2 * cumul_cost - cost) * {nb_batches}) / (2 * total_cost)
+                       AS batch_id
+              FROM (
+                SELECT rowid
+                      ,cost
+                      ,SUM(cost) OVER (ORDER BY rowid) AS cumul_cost
+                      ,SUM(cost) OVER () AS total_cost
+                  FROM (
+                    SELECT layer1.rowid AS rowid
+                          ,1 + IFNULL(ST_NPoints(layer1.{input1_geometrycolumn}), 0)
+                             * (1 + (
+                                 SELECT COUNT(*)
+                                   FROM {input2_db}."{input2_rtree}" layer2tree
+                                  WHERE layer2tree.minx <= layer1tree.maxx
+                                    AND layer2tree.maxx >= layer1tree.minx
+                                    AND layer2tree.miny <= layer1tree.maxy
+                                    AND layer2tree.maxy >= layer1tree.miny
+                               )) AS cost
+                      FROM "{input1_layer.name}" layer1
+                      LEFT JOIN "{input1_rtree}" layer1tree
+                        ON layer1tree.id = layer1.rowid
+                  )
+              )
+          )
+         GROUP BY batch_id
+         ORDER BY batch_id
+    """
+    conn = _sqlite_util.connect(input1_path)
+    try:
+        if input2_db != "main":
+            conn.execute(f"ATTACH DATABASE ? AS {input2_db}", (str(input2_path),))
+        rows = conn.execute(sql_stmt).fetchall()
+    finally:
+        conn.close()
+
+    # Batch id's can have gaps if rows are more costly than a batch, so renumber them.
+    batch_info_df = pd.DataFrame(rows, columns=["batch_id", "start_id"])
+    batch_info_df["batch_id"] = range(len(batch_info_df))
+    logger.info(
+        f"Batches balanced by cost in {time.perf_counter() - start:.2f} s: "
+        f"{len(batch_info_df)} batches"
+    )
+
+    return batch_info_df
+
+
+def _shrink_batches_to_overlap(
+    input1_path: Path,
+    input1_layer: LayerInfo,
+    input2_path: Path,
+    input2_layer: LayerInfo,
+    batch_info_df: pd.DataFrame,
+) -> pd.DataFrame:
+    """Shrink the rowid ranges of the batches to the rows that overlap with input2.
+
+    Overlap is determined on the bounding boxes in the rtree indexes, so only the
+    indexes need to be read. Batches without any overlapping rows are removed.
+
+    Both input files should be Geopackages.
+
+    Args:
+        input1_path (Path): path to the 1st input file.
+        input1_layer (LayerInfo): the layer info of the 1st input file.
+        input2_path (Path): path to the 2nd input file.
+        input2_layer (LayerInfo): the layer info of the 2nd input file.
+        batch_info_df (pd.DataFrame): DataFrame with the columns "batch_id",
+            "start_id" and "end_id" of contiguous rowid ranges.
+
+    Returns:
+        pd.DataFrame: a DataFrame with the columns "batch_id", "start_id" and "end_id"
+            of the remaining batches. If no rows overlap, a single batch that doesn't
+            select any rows is returned so the output is still created as usual.
+    """
+    start = time.perf_counter()
+    input1_rtree = f"rtree_{input1_layer.name}_{input1_layer.geometrycolumn}"
+    input2_rtree = f"rtree_{input2_layer.name}_{input2_layer.geometrycolumn}"
+    input2_db = "main"
+    if input2_path != input1_path:
+        input2_db = "input2"
+
+    # Remark: the batches are contiguous, so the batch of a row is the one with the
+    # largest start_id <= its rowid.
+    sql_stmt = f"""
+        SELECT batch_id
+              ,MIN(rowid) AS start_id
+              ,MAX(rowid) AS end_id
+          FROM (
+            SELECT layer1tree.id AS rowid
+                  ,(SELECT batches.batch_id
+                      FROM temp.gfo_batches batches
+                     WHERE batches.start_id <= layer1tree.id
+                     ORDER BY batches.start_id DESC
+                     LIMIT 1
+                   ) AS batch_id
+              FROM "{input1_rtree}" layer1tree
+             WHERE EXISTS (
+                     SELECT 1
+                       FROM {input2_db}."{input2_rtree}" layer2tree
+                      WHERE layer2tree.minx <= layer1tree.maxx
+                        AND layer2tree.maxx >= layer1tree.minx
+                        AND layer2tree.miny <= layer1tree.maxy
+                        AND layer2tree.maxy >= layer1tree.miny
+                   )
+          )
+         WHERE batch_id IS NOT NULL
+         GROUP BY batch_id
+         ORDER BY batch_id
+    """
+    conn = _sqlite_util.connect(input1_path, use_spatialite=False)
+    try:
+        if input2_db != "main":
+            conn.execute(f"ATTACH DATABASE ? AS {input2_db}", (str(input2_path),))
+        conn.execute(
+            "CREATE TEMP TABLE gfo_batches "
+            "(start_id INTEGER PRIMARY KEY, batch_id INTEGER)"
+        )
+        conn.executemany(
+            "INSERT INTO temp.gfo_batches (start_id, batch_id) VALUES (?, ?)",
+            [
+                (int(start_id), int(batch_id))
+                for batch_id, start_id in zip(
+                    batch_info_df["batch_id"], batch_info_df["start_id"], strict=True
+                )
+            ],
+        )
+        rows = conn.execute(sql_stmt).fetchall()
+    finally:
+        conn.close()
+
+    result_df = pd.DataFrame(rows, columns=["batch_id", "start_id", "end_id"])
+    if len(result_df) == 0:
+        # Keep one batch that doesn't select any rows.
+        start_id = int(batch_info_df["start_id"].iloc[0])
+        result_df = pd.DataFrame(
+            [(0, start_id, start_id - 1)], columns=["batch_id", "start_id", "end_id"]
+        )
+    else:
+        result_df["batch_id"] = range(len(result_df))
+
+    logger.info(
+        f"Batches without overlap with input2 determined in "
+        f"{time.perf_counter() - start:.2f} s: {len(batch_info_df) - len(result_df)} "
+        f"of {len(batch_info_df)} batches skipped"
+    )
+
+    return result_df
+
+
 def _determine_nb_batches(
     nb_rows_input_layer: int,
     nb_parallel: int | None,
@@ -362,3 +362,63 @@ def subdivide_vectorized(
     )
 
     return geom
+
+
+def connected_components(
+    geoseries: gpd.GeoSeries, groups: NDArray[np.integer] | None = None
+) -> NDArray[np.int64]:
+    """Determine the groups of geometries that are connected via intersections.
+
+    Two geometries are considered to be connected if they intersect, and if they are in
+    the same group. The connected components are determined using vectorized label
+    propagation on the pairs of intersecting geometries found with an STRtree.
+
+    Args:
+        geoseries (gpd.GeoSeries): the geometries to determine the components for.
+        groups (NDArray[np.integer], optional): a group code for each geometry. Only
+            geometries with the same group code can be connected. If None, all
+            geometries belong to the same group. Defaults to None.
+
+    Returns:
+        NDArray[np.int64]: the component id for each geometry. The ids are consecutive
+            integers starting from 0.
+    """
+    nb_geoms = len(geoseries)
+    if groups is not None and len(groups) != nb_geoms:
+        raise ValueError("groups should have the same length as geoseries")
+    if nb_geoms == 0:
+        return np.array([], dtype=np.int64)
+
+    # Determine all pairs of intersecting geometries
+    geoms = np.asarray(geoseries)
+    tree = shapely.STRtree(geoms)
+    left, right = tree.query(geoms, predicate="intersects")
+    pairs_mask = left < right
+    if groups is not None:
+        groups = np.asarray(groups)
+        pairs_mask &= groups[left] == groups[right]
+    left = left[pairs_mask]
+    right = right[pairs_mask]
+
+    # Label propagation: every geometry gets the smallest index of the geometries it is
+    # connected with. All pairs are processed at once each iteration, and the labels
+    # are shortcut to the label of their label, so only few iterations are needed.
+    labels = np.arange(nb_geoms, dtype=np.int64)
+    while True:
+        new_labels = labels.copy()
+        pair_min = np.minimum(labels[left], labels[right])
+        for nodes in (left, right, labels[left], labels[right]):
+            np.minimum.at(new_labels, nodes, pair_min)
+        while True:
+            shortcut_labels = new_labels[new_labels]
+            if np.array_equal(shortcut_labels, new_labels):
+                break
+            new_labels = shortcut_labels
+        if np.array_equal(new_labels, labels):
+            break
+        labels = new_labels
+    roots = labels
+
+    # Renumber the roots to consecutive component ids
+    _, component_ids = np.unique(roots, return_inverse=True)
+    return component_ids.astype(np.int64)
@@ -0,0 +1,697 @@
+"""Module to read and write Geopackage files directly via sqlite3, without GDAL."""
+
+import re
+import sqlite3
+from collections.abc import Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Union
+
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+import shapely
+from pandas.api.types import infer_dtype, is_integer_dtype
+from pygeoops import GeometryType
+
+import geofileops as gfo
+from geofileops._compat import SHAPELY_GTE_21
+from geofileops.util import _sqlite_util
+
+if TYPE_CHECKING:  # pragma: no cover
+    import os
+
+# Size of the envelope in the GPKG geometry blob header, indexed by the envelope
+# contents indicator in the flags byte. -1 for invalid indicator values.
+_ENVELOPE_SIZES = np.array([0, 32, 48, 48, 64, -1, -1, -1], dtype=np.int64)
+
+# Layout of the header of a GPKG geometry blob with an XY envelope.
+_HEADER_DTYPE = np.dtype(
+    [
+        ("magic", "S2"),
+        ("version", "u1"),
+        ("flags", "u1"),
+        ("srs_id", "<i4"),
+        ("envelope", "<f8", (4,)),
+    ]
+)
+
+# Column types that are read to the same dtype as GDAL would. For other column types
+# (e.g. DATETIME, BOOLEAN,...) the conversion GDAL applies is not replicated, so these
+# aren't supported. The values are read in nullable pandas dtypes, so pandas converts
+# the NULL values.
+_COLUMN_DTYPES = {
+    "INTEGER": "Int64",
+    "MEDIUMINT": "Int32",
+    "REAL": "Float64",
+    "DOUBLE": "Float64",
+    "TEXT": "object",
+}
+
+# Column types GDAL uses to write the pandas dtypes.
+_DTYPE_COLUMN_TYPES = {
+    "int64": "INTEGER",
+    "int32": "MEDIUMINT",
+    "float64": "REAL",
+    "float32": "FLOAT",
+    "bool": "BOOLEAN",
+}
+
+# Geometry types that can be read by shapely.
+_GEOMETRY_TYPES = {
+    "GEOMETRY",
+    "POINT",
+    "LINESTRING",
+    "POLYGON",
+    "MULTIPOINT",
+    "MULTILINESTRING",
+    "MULTIPOLYGON",
+    "GEOMETRYCOLLECTION",
+}
+
+# Geometry type names for the shapely geometry type ids.
+_TYPE_ID_GEOMETRY_TYPES = {
+    0: "POINT",
+    1: "LINESTRING",
+    3: "POLYGON",
+    4: "MULTIPOINT",
+    5: "MULTILINESTRING",
+    6: "MULTIPOLYGON",
+    7: "GEOMETRYCOLLECTION",
+}
+
+# Functions that can be used in a where filter. Other functions might be provided by
+# GDAL or spatialite and are not available in plain sqlite3.
+_WHERE_FUNCTIONS = {
+    "ABS",
+    "AND",
+    "CAST",
+    "COALESCE",
+    "IFNULL",
+    "IN",
+    "INSTR",
+    "LENGTH",
+    "LOWER",
+    "LTRIM",
+    "MAX",
+    "MIN",
+    "NOT",
+    "NULLIF",
+    "OR",
+    "REPLACE",
+    "ROUND",
+    "RTRIM",
+    "SUBSTR",
+    "TRIM",
+    "TYPEOF",
+    "UPPER",
+}
+
+
+def read_gpkg(
+    path: Union[str, "os.PathLike[Any]"],
+    layer: str | None = None,
+    columns: list[str] | None = None,
+    bbox: tuple[float, float, float, float] | None = None,
+    rows: slice | None = None,
+    where: str | None = None,
+    ignore_geometry: bool = False,
+    fid_as_index: bool = False,
+) -> pd.DataFrame | gpd.GeoDataFrame | None:
+    """Read a Geopackage layer directly with sqlite3.
+
+    The query is run directly in sqlite3, the GPKG geometry blob headers are parsed
+    vectorized and all geometries are converted with a single call to
+    `shapely.from_wkb`. This avoids the overhead of the per feature iteration in GDAL.
+
+    Only layers and filters that give the same result as reading via GDAL are
+    supported. If this is not the case, None is returned and the layer should be read
+    via GDAL.
+
+    Args:
+        path (PathLike): path to the Geopackage file.
+        layer (str, optional): the layer to read. If None, the file should contain only
+            one layer. Defaults to None.
+        columns (list[str], optional): the (non-geometry) columns to read. The column
+            names are case insensitive. If None, all columns are read.
+            Defaults to None.
+        bbox (tuple, optional): only read the rows intersecting this bbox.
+            Defaults to None.
+        rows (slice, optional): only read these rows. Defaults to None.
+        where (str, optional): sqlite where clause to filter the rows. Only simple
+            where clauses are supported. Defaults to None.
+        ignore_geometry (bool, optional): True not to read the geometry column.
+            Defaults to False.
+        fid_as_index (bool, optional): True to use the fid as index.
+            Defaults to False.
+
+    Returns:
+        pd.DataFrame | gpd.GeoDataFrame | None: the data read or None if the read
+            isn't supported.
+    """
+    path = Path(path)
+    if path.suffix.lower() != ".gpkg" or not path.exists():
+        return None
+    if where is not None and not _is_simple_where(where):
+        return None
+    if rows is not None and (rows.step not in (None, 1) or rows.start is None):
+        return None
+
+    conn = sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True)
+    try:
+        # Determine the table to read
+        sql = "SELECT table_name, data_type FROM gpkg_contents"
+        contents = conn.execute(sql).fetchall()
+        if layer is None:
+            if len(contents) != 1:
+                return None
+            table = contents[0][0]
+        else:
+            tables = [row[0] for row in contents if row[0].lower() == layer.lower()]
+            if len(tables) != 1:
+                return None
+            table = tables[0]
+
+        # Determine the fid, geometry and other columns
+        geometrycolumn = None
+        srs_id = None
+        sql = """
+            SELECT column_name, geometry_type_name, srs_id, m
+              FROM gpkg_geometry_columns
+             WHERE table_name = ?
+        """
+        geometry_info = conn.execute(sql, (table,)).fetchone()
+        if geometry_info is not None:
+            geometrycolumn, geometrytype, srs_id, m = geometry_info
+            if geometrytype.upper() not in _GEOMETRY_TYPES or m != 0:
+                return None
+
+        fid_column = None
+        layer_columns = {}
+        for _, name, column_type, _, _, pk in conn.execute(
+            f"PRAGMA table_info('{table}')"
+        ).fetchall():
+            if pk == 1 and column_type.upper() == "INTEGER":
+                fid_column = name
+            elif name != geometrycolumn:
+                layer_columns[name] = column_type.split("(")[0].strip().upper()
+        if fid_column is None:
+            return None
+
+        # Determine the columns to read, in the layer order with the casing asked
+        if columns is None:
+            columns_to_read = {column: column for column in layer_columns}
+        else:
+            columns_upper_lookup = {column.upper(): column for column in columns}
+            columns_to_read = {
+                column: columns_upper_lookup[column.upper()]
+                for column in layer_columns
+                if column.upper() in columns_upper_lookup
+            }
+        if any(layer_columns[col] not in _COLUMN_DTYPES for col in columns_to_read):
+            return None
+
+        read_geometry = geometrycolumn is not None and not ignore_geometry
+        if not read_geometry and len(columns_to_read) == 0:
+            return None
+
+        crs = None
+        if read_geometry:
+            if srs_id == 0:
+                return None
+            if srs_id is not None and srs_id != -1:
+                crs = _get_crs(conn, srs_id)
+
+        # Prepare the query
+        columns_str = "".join(f', "{column}"' for column in columns_to_read)
+        geometry_str = f', "{geometrycolumn}"' if read_geometry else ""
+        where_str = f"AND ({where})" if where is not None else ""
+        params: list[Any] = []
+        if bbox is not None:
+            # The geometries are needed to apply the exact bbox filter
+            if not read_geometry:
+                return None
+            rtree = f"rtree_{table}_{geometrycolumn}"
+            sql = "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?"
+            if conn.execute(sql, (rtree,)).fetchone() is None:
+                return None
+            where_str += f"""
+                AND "{fid_column}" IN (
+                      SELECT id FROM "{rtree}"
+                       WHERE minx <= ? AND maxx >= ? AND miny <= ? AND maxy >= ?
+                    )
+            """
+            params.extend([bbox[2], bbox[0], bbox[3], bbox[1]])
+
+        limit_str = ""
+        if rows is not None and bbox is None:
+            # With a bbox the rows can only be selected after the exact filtering
+            stop = -1 if rows.stop is None else max(rows.stop - rows.start, 0)
+            limit_str = "LIMIT ? OFFSET ?"
+            params.extend([stop, rows.start])
+
+        sql = f"""
+            SELECT "{fid_column}"{columns_str}{geometry_str}
+              FROM "{table}"
+             WHERE 1=1
+               {where_str}
+             {limit_str}
+        """
+        data = conn.execute(sql, params).fetchall()
+
+    finally:
+        conn.close()
+
+    # Convert the data to numpy/pandas
+    nb_columns = 1 + len(columns_to_read) + (1 if read_geometry else 0)
+    values = list(zip(*data, strict=True)) if len(data) > 0 else [()] * nb_columns
+    fids = np.array(values[0], dtype=np.int64)
+    geoms = None
+    if read_geometry:
+        geoms = gpkg_blobs_to_geometries(values[-1])
+        if geoms is None:
+            return None
+
+    # Apply the exact bbox filter + the rows to read
+    mask = None
+    if bbox is not None and geoms is not None:
+        mask = shapely.intersects(geoms, shapely.box(*bbox))
+        if rows is not None:
+            selected = np.flatnonzero(mask)[rows.start : rows.stop]
+            mask = np.zeros(len(geoms), dtype=bool)
+            mask[selected] = True
+        fids = fids[mask]
+        geoms = geoms[mask]
+
+    index = pd.Index(fids, name="fid") if fid_as_index else pd.RangeIndex(len(fids))
+    result: dict[str, Any] = {}
+    for idx, (column, column_asked) in enumerate(columns_to_read.items()):
+        result[column_asked] = _to_series(
+            values[idx + 1], _COLUMN_DTYPES[layer_columns[column]], mask, index
+        )
+
+    if geoms is None:
+        return pd.DataFrame(result, index=index)
+
+    result["geometry"] = geoms
+    return gpd.GeoDataFrame(result, geometry="geometry", crs=crs, index=index)
+
+
+def gpkg_blobs_to_geometries(blobs: Sequence[bytes | None]) -> np.ndarray | None:
+    """Convert GPKG geometry blobs to shapely geometries.
+
+    The headers of the blobs are parsed vectorized and the WKB is converted in a single
+    call to `shapely.from_wkb`.
+
+    Args:
+        blobs (Sequence[bytes | None]): GPKG geometry blobs. None values result in
+            None.
+
+    Raises:
+        ValueError: if a blob is not a valid GPKG geometry blob.
+
+    Returns:
+        np.ndarray | None: array with the shapely geometries. None if extended geometry
+            types (e.g. curves) are present, as these aren't supported by shapely.
+    """
+    notnull = np.fromiter((blob is not None for blob in blobs), dtype=bool)
+    geoms = np.full(len(notnull), None, dtype=object)
+    if not notnull.any():
+        return geoms
+
+    # Concatenate all blobs to be able to parse the headers with numpy
+    blobs_notnull = [blob for blob in blobs if blob is not None]
+    lengths = np.fromiter((len(blob) for blob in blobs_notnull), dtype=np.int64)
+    if lengths.min() < 8:
+        raise ValueError("invalid GPKG geometry blob: too short")
+    buffer = b"".join(blobs_notnull)
+    data = np.frombuffer(buffer, dtype=np.uint8)
+    starts = np.zeros(len(lengths), dtype=np.int64)
+    np.cumsum(lengths[:-1], out=starts[1:])
+
+    if not ((data[starts] == ord("G")) & (data[starts + 1] == ord("P"))).all():
+        raise ValueError("invalid GPKG geometry blob: magic number not found")
+
+    # Flags: bit 5 = extended geometry type, bits 1-3 = envelope contents indicator
+    flags = data[starts + 3]
+    if ((flags >> 5) & 1).any():
+        return None
+    envelope_sizes = _ENVELOPE_SIZES[(flags >> 1) & 0b111]
+    if (envelope_sizes < 0).any():
+        raise ValueError("invalid GPKG geometry blob: invalid envelope indicator")
+
+    wkb_starts = starts + 8 + envelope_sizes
+    wkb_ends = starts + lengths
+    wkbs = [
+        buffer[start:end]
+        for start, end in zip(wkb_starts.tolist(), wkb_ends.tolist(), strict=True)
+    ]
+    geoms[notnull] = shapely.from_wkb(wkbs)
+
+    return geoms
+
+
+def write_gpkg(
+    gdf: gpd.GeoDataFrame,
+    path: Union[str, "os.PathLike[Any]"],
+    layer: str,
+    force_output_geometrytype: GeometryType | str | None = None,
+    force_multitype: bool = False,
+    append: bool = False,
+    index: bool | None = None,
+    create_spatial_index: bool | None = None,
+) -> bool:
+    """Write a GeoDataFrame to a Geopackage layer directly with sqlite3.
+
+    The GPKG geometry blobs are encoded vectorized, with the envelopes of all geometries
+    calculated in a single call to `shapely.bounds`. The rows are inserted with
+    `executemany` in a single transaction. The spatial index is created in bulk after
+    all rows were inserted.
+
+    Only data that gives the same result as writing via GDAL is supported. If this is
+    not the case, nothing is written, False is returned and the data should be written
+    via GDAL.
+
+    Args:
+        gdf (gpd.GeoDataFrame): the data to write.
+        path (PathLike): path to the Geopackage file.
+        layer (str): the layer to write to.
+        force_output_geometrytype (GeometryType | str, optional): geometry type to use
+            for the layer if it is created. Defaults to None.
+        force_multitype (bool, optional): True to convert single geometries to their
+            multi type. Defaults to False.
+        append (bool, optional): True to append to the layer if it already exists.
+            Defaults to False.
+        index (bool, optional): True to write the index as a column. If None, the index
+            is written if it is named or not an integer index. Defaults to None.
+        create_spatial_index (bool, optional): True to create a spatial index if the
+            layer is created, False not to. None to create one.
+            Defaults to None.
+
+    Returns:
+        bool: True if the data was written, False if writing it isn't supported.
+    """
+    path = Path(path)
+    if path.suffix.lower() != ".gpkg" or str(path).startswith("/vsi"):
+        return False
+    if not isinstance(gdf, gpd.GeoDataFrame) or "'" in layer:
+        return False
+    if index or (
+        index is None
+        and (list(gdf.index.names) != [None] or not is_integer_dtype(gdf.index.dtype))
+    ):
+        return False
+
+    # Determine the column types
+    if gdf.columns.has_duplicates:
+        return False
+    geometry_name = gdf.geometry.name
+    column_types = {}
+    for column in gdf.columns:
+        if column == geometry_name:
+            continue
+        column_type = _get_column_type(gdf[column])
+        if (
+            column_type is None
+            or not isinstance(column, str)
+            or column.lower() in ("fid", "geom")
+        ):
+            return False
+        column_types[column] = column_type
+
+    # Determine the geometries and the geometry type to write
+    geoms = gdf.geometry.to_numpy()
+    if force_multitype:
+        geoms = _to_multi(geoms)
+    type_ids = np.unique(shapely.get_type_id(geoms[~shapely.is_missing(geoms)]))
+    if len(type_ids) > 1 or any(t not in _TYPE_ID_GEOMETRY_TYPES for t in type_ids):
+        # Mixed geometry types are harmonized differently by GDAL
+        return False
+    has_z = bool(shapely.has_z(geoms).any())
+    if has_z and not SHAPELY_GTE_21:
+        # Before shapely 2.1, Z geometries can only be written as extended WKB, while
+        # Geopackage requires ISO WKB.
+        return False
+    if force_output_geometrytype is not None:
+        if isinstance(force_output_geometrytype, str):
+            geometrytype = GeometryType[force_output_geometrytype.upper()].name
+        else:
+            geometrytype = force_output_geometrytype.name
+        if geometrytype.endswith("Z") and geometrytype[:-1] in _GEOMETRY_TYPES:
+            geometrytype = geometrytype[:-1]
+            has_z = True
+    elif len(type_ids) == 1:
+        geometrytype = _TYPE_ID_GEOMETRY_TYPES[type_ids[0]]
+    else:
+        geometrytype = "GEOMETRY"
+    if geometrytype not in _GEOMETRY_TYPES:
+        return False
+
+    # Determine the srs_id to use
+    srs_id = -1
+    if gdf.crs is not None:
+        srs_id = gdf.crs.to_epsg()
+        if srs_id is None:
+            return False
+
+    # Check if the layer can be (created and) appended to
+    sql: str | None = None
+    layer_exists = False
+    if path.exists():
+        conn = sqlite3.connect(path)
+        try:
+            sql = "SELECT table_name FROM gpkg_contents WHERE lower(table_name) = ?"
+            row = conn.execute(sql, (layer.lower(),)).fetchone()
+            if row is not None:
+                if not append:
+                    return False
+                layer = row[0]
+                layer_exists = True
+                sql = """
+                    SELECT column_name, srs_id
+                      FROM gpkg_geometry_columns
+                     WHERE table_name = ?
+                """
+                geometry_info = conn.execute(sql, (layer,)).fetchone()
+                if geometry_info is None or geometry_info[0].lower() != "geom":
+                    return False
+                srs_id = geometry_info[1]
+                layer_columns = [
+                    (name, column_type.split("(")[0].strip().upper())
+                    for _, name, column_type, _, _, pk in conn.execute(
+                        f"PRAGMA table_info('{layer}')"
+                    ).fetchall()
+                    if pk == 0 and name != geometry_info[0]
+                ]
+                if layer_columns != list(column_types.items()):
+                    return False
+        finally:
+            conn.close()
+
+    # Create the layer if needed, reusing the logic for sql based operations
+    if not layer_exists:
+        datatypes = {"geom": geometrytype, **column_types}
+        _sqlite_util.create_table_as_sql(
+            input_databases={},
+            output_path=path,
+            sql_stmt=f"SELECT {', '.join(['NULL'] * len(datatypes))} WHERE 0 = 1",
+            output_layer=layer,
+            output_geometrytype=GeometryType[geometrytype],
+            output_crs=srs_id,
+            create_ogr_contents=True,
+            column_datatypes=datatypes,
+        )
+
+    # Insert the data
+    blobs = geometries_to_gpkg_blobs(geoms, srs_id=srs_id)
+    values = [
+        gdf[column].astype(object).where(gdf[column].notna(), None).tolist()
+        for column in column_types
+    ]
+    bounds = shapely.total_bounds(geoms)
+    columns_str = "".join(f', "{column}"' for column in column_types)
+    placeholders = ", ?" * len(column_types)
+
+    conn = _sqlite_util.connect(path)
+    sql = None
+    try:
+        _sqlite_util.set_performance_options(
+            conn, _sqlite_util.SqliteProfile.SPEED, ["main"]
+        )
+        sql = "BEGIN TRANSACTION;"
+        conn.execute(sql)
+
+        # Make sure the crs is available in the file
+        if srs_id > 0:
+            sql = "SELECT 1 FROM gpkg_spatial_ref_sys WHERE srs_id = ?"
+            if conn.execute(sql, (srs_id,)).fetchone() is None:
+                sql = "SELECT gpkgInsertEpsgSRID(?)"
+                conn.execute(sql, (srs_id,))
+
+        sql = f'INSERT INTO "{layer}" ("geom"{columns_str}) VALUES (?{placeholders})'
+        conn.executemany(sql, zip(blobs, *values, strict=True))
+
+        # Update the metadata
+        if has_z:
+            sql = "UPDATE gpkg_geometry_columns SET z = 1 WHERE table_name = ?"
+            conn.execute(sql, (layer,))
+        if not np.isnan(bounds).any():
+            if layer_exists:
+                sql = """
+                    SELECT min_x, min_y, max_x, max_y
+                      FROM gpkg_contents
+                     WHERE table_name = ?
+                """
+                old_bounds = conn.execute(sql, (layer,)).fetchone()
+                if None not in old_bounds:
+                    bounds = np.concatenate(
+                        [
+                            np.minimum(bounds[:2], old_bounds[:2]),
+                            np.maximum(bounds[2:], old_bounds[2:]),
+                        ]
+                    )
+            sql = """
+                UPDATE gpkg_contents
+                   SET min_x = ?, min_y = ?, max_x = ?, max_y = ?
+                 WHERE table_name = ?
+            """
+            conn.execute(sql, (*bounds.tolist(), layer))
+        sql = """
+            UPDATE gpkg_contents
+               SET last_change = strftime('%Y-%m-%dT%H:%M:%fZ', 'now')
+             WHERE table_name = ?
+        """
+        conn.execute(sql, (layer,))
+
+        conn.commit()
+
+    except Exception as ex:
+        conn.rollback()
+        raise RuntimeError(f"Error {ex} executing {sql}") from ex
+    finally:
+        conn.close()
+
+    # Create the spatial index in bulk, now all rows are inserted
+    if not layer_exists and create_spatial_index is not False:
+        gfo.create_spatial_index(path, layer, exist_ok=True)
+
+    return True
+
+
+def geometries_to_gpkg_blobs(geoms: np.ndarray, srs_id: int) -> list[bytes | None]:
+    """Convert shapely geometries to GPKG geometry blobs.
+
+    The envelopes of all geometries are calculated in a single call to `shapely.bounds`
+    and the blob headers are built vectorized. The geometries are written as ISO WKB,
+    as required by the Geopackage specification.
+
+    Args:
+        geoms (np.ndarray): array with the shapely geometries. None values result in
+            None. Z values are only written with shapely >= 2.1, as older versions
+            cannot write them as ISO WKB.
+        srs_id (int): the srs_id to write in the blob headers.
+
+    Returns:
+        list[bytes | None]: the GPKG geometry blobs.
+    """
+    missing = shapely.is_missing(geoms)
+    empty = shapely.is_empty(geoms) & ~missing
+    # Geopackage requires ISO WKB, so e.g. Z geometries aren't written as extended WKB
+    if SHAPELY_GTE_21:
+        wkbs = shapely.to_wkb(geoms, output_dimension=3, byte_order=1, flavor="iso")
+    else:
+        wkbs = shapely.to_wkb(geoms, output_dimension=2, byte_order=1)
+
+    # Header: magic, version, flags, srs_id and the XY envelope (minx, maxx, miny, maxy)
+    # Flags: bit 0 = little endian, bits 1-3 = envelope indicator, bit 4 = empty
+    headers = np.zeros(len(geoms), dtype=_HEADER_DTYPE)
+    headers["magic"] = b"GP"
+    headers["flags"] = np.where(empty, 0b0001_0001, 0b0000_0011)
+    headers["srs_id"] = srs_id
+    headers["envelope"] = shapely.bounds(geoms)[:, [0, 2, 1, 3]]
+    header_sizes = np.where(empty, 8, _HEADER_DTYPE.itemsize)
+
+    buffer = headers.tobytes()
+    itemsize = _HEADER_DTYPE.itemsize
+    return [
+        None if is_missing else buffer[idx * itemsize : idx * itemsize + size] + wkb
+        for idx, (is_missing, size, wkb) in enumerate(
+            zip(missing.tolist(), header_sizes.tolist(), wkbs, strict=True)
+        )
+    ]
+
+
+def _to_series(
+    values: tuple, dtype: str, mask: np.ndarray | None, index: pd.Index
+) -> pd.Series:
+    """Convert the values read for a column to a series like GDAL would."""
+    series = pd.Series(values, dtype=dtype)
+    if mask is not None:
+        series = series[mask]
+    if dtype != "object":
+        # GDAL returns numpy dtypes, so integer columns with NULL values as float
+        series = series.astype(np.dtype("float64" if series.hasnans else dtype.lower()))
+
+    return series.set_axis(index)
+
+
+def _get_column_type(series: pd.Series) -> str | None:
+    """Get the column type GDAL would use to write a column, if supported."""
+    dtype_str = str(series.dtype)
+    if dtype_str in _DTYPE_COLUMN_TYPES:
+        return _DTYPE_COLUMN_TYPES[dtype_str]
+    if dtype_str in ("object", "str", "string"):
+        if infer_dtype(series, skipna=True) in ("string", "empty"):
+            return "TEXT"
+
+    return None
+
+
+def _to_multi(geoms: np.ndarray) -> np.ndarray:
+    """Convert the single geometries in the array to their multi type."""
+    geoms = geoms.copy()
+    type_ids = shapely.get_type_id(geoms)
+    not_empty = ~shapely.is_empty(geoms)
+    for type_id, to_multi in [
+        (0, shapely.multipoints),
+        (1, shapely.multilinestrings),
+        (3, shapely.multipolygons),
+    ]:
+        mask = (type_ids == type_id) & not_empty
+        if mask.any():
+            geoms[mask] = to_multi(geoms[mask], indices=np.arange(mask.sum()))
+
+    return geoms
+
+
+def _get_crs(conn: sqlite3.Connection, srs_id: int) -> str | None:
+    """Get the crs for a srs_id as a string that can be interpreted by pyproj."""
+    sql = """
+        SELECT organization, organization_coordsys_id, definition
+          FROM gpkg_spatial_ref_sys
+         WHERE srs_id = ?
+    """
+    row = conn.execute(sql, (srs_id,)).fetchone()
+    if row is None:
+        return None
+    organization, coordsys_id, definition = row
+    if organization is not None and organization.upper() == "EPSG":
+        return f"EPSG:{coordsys_id}"
+    if definition is None or definition.strip().lower() == "undefined":
+        return None
+
+    return definition
+
+
+def _is_simple_where(where: str) -> bool:
+    """Check if a where clause can be evaluated in plain sqlite3.
+
+    The where clause should not contain any functions that are only available in GDAL
+    or spatialite, nor multiple statements.
+    """
+    # Remove string literals, as they can contain anything
+    where_stripped = re.sub(r"'(?:[^']|'')*'", "''", where)
+    if ";" in where_stripped:
+        return False
+
+    functions = re.findall(r"([A-Za-z_][A-Za-z0-9_]*)\s*\(", where_stripped)
+    return all(function.upper() in _WHERE_FUNCTIONS for function in functions)
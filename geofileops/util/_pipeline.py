@@ -0,0 +1,344 @@
+"""Module with a lazy pipeline of geo operations on a layer."""
+
+import logging
+from collections.abc import Callable
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Union
+
+from pygeoops import GeometryType
+
+import geofileops as gfo
+from geofileops.helpers import _general_helper
+from geofileops.util import _geoops_gpd, _io_util
+from geofileops.util._geometry_util import (
+    BufferEndCapStyle,
+    BufferJoinStyle,
+    SimplifyAlgorithm,
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    import os
+
+logger = logging.getLogger(__name__)
+
+# The operations that only need the geometry of one row at a time, so they can be
+# applied one after the other on a batch of rows without writing intermediate files.
+_ROW_LOCAL_OPERATIONS = (
+    "apply",
+    "apply_vectorized",
+    "buffer",
+    "convexhull",
+    "makevalid",
+    "simplify",
+)
+
+
+class Pipeline:
+    """A lazy pipeline of geo operations on a layer.
+
+    A pipeline is typically created with :func:`pipeline`. Adding an operation returns
+    a new pipeline, the operations are only executed when :meth:`run` is called.
+
+    Consecutive operations that only need the geometry of one row at a time, e.g.
+    ``makevalid``, ``buffer``, ``simplify``,... are fused: each batch of rows is read
+    once, all these operations are applied on it and the result is written once.
+    Intermediate files are only written before operations that need a view on all
+    rows, e.g. ``clip``, ``difference`` and ``dissolve``.
+
+    Examples:
+        .. code-block:: python
+
+            gfo.pipeline("parcels.gpkg").makevalid().buffer(5).clip("mask.gpkg").run(
+                "parcels_buffered_clipped.gpkg"
+            )
+
+    """
+
+    def __init__(
+        self,
+        input_path: Union[str, "os.PathLike[Any]"],
+        input_layer: str | None = None,
+        columns: list[str] | None = None,
+        steps: list[tuple[str, dict[str, Any]]] | None = None,
+    ) -> None:
+        """Constructor of Pipeline.
+
+        Args:
+            input_path (PathLike): the input file.
+            input_layer (str, optional): input layer name. If None, ``input_path``
+                should contain only one layer. Defaults to None.
+            columns (List[str], optional): list of columns to retain. If None, all
+                standard columns are retained. Defaults to None.
+            steps (list[tuple[str, dict]], optional): the operations in the pipeline,
+                as tuples of the operation name and its parameters. Defaults to None.
+        """
+        self.input_path = Path(input_path)
+        self.input_layer = input_layer
+        self.columns = columns
+        self.steps = list(steps) if steps is not None else []
+
+    def __repr__(self) -> str:
+        """Return a string representation of the pipeline."""
+        steps = " -> ".join(name for name, _ in self.steps)
+        return f"{self.__class__.__name__}({self.input_path}: {steps})"
+
+    def _add_step(self, name: str, params: dict[str, Any]) -> "Pipeline":
+        return Pipeline(
+            input_path=self.input_path,
+            input_layer=self.input_layer,
+            columns=self.columns,
+            steps=[*self.steps, (name, params)],
+        )
+
+    def apply(
+        self,
+        func: Callable[[Any], Any],
+        only_geom_input: bool = True,
+        force_output_geometrytype: GeometryType | str | None = None,
+    ) -> "Pipeline":
+        """Add an :func:`apply` operation to the pipeline."""
+        params = {
+            "func": func,
+            "only_geom_input": only_geom_input,
+            "force_output_geometrytype": force_output_geometrytype,
+        }
+        return self._add_step("apply", params)
+
+    def apply_vectorized(
+        self,
+        func: Callable[[Any], Any],
+        force_output_geometrytype: GeometryType | str | None = None,
+    ) -> "Pipeline":
+        """Add an :func:`apply_vectorized` operation to the pipeline."""
+        params = {"func": func, "force_output_geometrytype": force_output_geometrytype}
+        return self._add_step("apply_vectorized", params)
+
+    def buffer(
+        self,
+        distance: float,
+        quadrantsegments: int = 5,
+        endcap_style: BufferEndCapStyle = BufferEndCapStyle.ROUND,
+        join_style: BufferJoinStyle = BufferJoinStyle.ROUND,
+        mitre_limit: float = 5.0,
+        single_sided: bool = False,
+    ) -> "Pipeline":
+        """Add a :func:`buffer` operation to the pipeline."""
+        params = {
+            "distance": distance,
+            "quadrantsegments": quadrantsegments,
+            "endcap_style": endcap_style,
+            "join_style": join_style,
+            "mitre_limit": mitre_limit,
+            "single_sided": single_sided,
+        }
+        return self._add_step("buffer", params)
+
+    def convexhull(self) -> "Pipeline":
+        """Add a :func:`convexhull` operation to the pipeline."""
+        return self._add_step("convexhull", {})
+
+    def makevalid(
+        self, force_output_geometrytype: GeometryType | str | None = None
+    ) -> "Pipeline":
+        """Add a :func:`makevalid` operation to the pipeline."""
+        params = {"force_output_geometrytype": force_output_geometrytype}
+        return self._add_step("makevalid", params)
+
+    def simplify(
+        self,
+        tolerance: float,
+        algorithm: SimplifyAlgorithm = SimplifyAlgorithm.RAMER_DOUGLAS_PEUCKER,
+        lookahead: int = 8,
+    ) -> "Pipeline":
+        """Add a :func:`simplify` operation to the pipeline."""
+        params = {
+            "tolerance": tolerance,
+            "algorithm": algorithm,
+            "lookahead": lookahead,
+        }
+        return self._add_step("simplify", params)
+
+    def clip(
+        self,
+        clip_path: Union[str, "os.PathLike[Any]"],
+        clip_layer: str | None = None,
+        subdivide_coords: int = 15000,
+    ) -> "Pipeline":
+        """Add a :func:`clip` operation to the pipeline."""
+        params = {
+            "clip_path": clip_path,
+            "clip_layer": clip_layer,
+            "subdivide_coords": subdivide_coords,
+        }
+        return self._add_step("clip", params)
+
+    def difference(
+        self,
+        input2_path: Union[str, "os.PathLike[Any]"],
+        input2_layer: str | None = None,
+        subdivide_coords: int = 2000,
+    ) -> "Pipeline":
+        """Add a :func:`difference` operation to the pipeline."""
+        params = {
+            "input2_path": input2_path,
+            "input2_layer": input2_layer,
+            "subdivide_coords": subdivide_coords,
+        }
+        return self._add_step("difference", params)
+
+    def dissolve(
+        self,
+        explodecollections: bool,
+        groupby_columns: list[str] | str | None = None,
+        agg_columns: dict | None = None,
+        tiles_path: Union[str, "os.PathLike[Any]", None] = None,
+        nb_squarish_tiles: int = 1,
+    ) -> "Pipeline":
+        """Add a :func:`dissolve` operation to the pipeline."""
+        params = {
+            "explodecollections": explodecollections,
+            "groupby_columns": groupby_columns,
+            "agg_columns": agg_columns,
+            "tiles_path": tiles_path,
+            "nb_squarish_tiles": nb_squarish_tiles,
+        }
+        return self._add_step("dissolve", params)
+
+    def run(
+        self,
+        output_path: Union[str, "os.PathLike[Any]"],
+        output_layer: str | None = None,
+        explodecollections: bool = False,
+        gridsize: float = 0.0,
+        keep_empty_geoms: bool = False,
+        where_post: str | None = None,
+        nb_parallel: int | None = None,
+        batchsize: int = -1,
+        force: bool = False,
+    ) -> None:
+        """Run the pipeline and write the result to the output file.
+
+        ``explodecollections``, ``gridsize`` and ``where_post`` are applied on the
+        result of the last operation. ``keep_empty_geoms`` is applied for all
+        operations that support it.
+
+        Args:
+            output_path (PathLike): the file to write the result to
+            output_layer (str, optional): output layer name. If None, the
+                ``output_path`` stem is used. Defaults to None.
+            explodecollections (bool, optional): True to output only simple
+                geometries. Defaults to False.
+            gridsize (float, optional): the size of the grid the coordinates of the
+                ouput will be rounded to. Eg. 0.001 to keep 3 decimals. Value 0.0
+                doesn't change the precision. Defaults to 0.0.
+            keep_empty_geoms (bool, optional): True to keep rows with empty/null
+                geometries in the output. Defaults to False.
+            where_post (str, optional): SQL filter to apply on the result of the last
+                operation. Defaults to None.
+            nb_parallel (int | None, optional): the number of parallel workers to use.
+                If None, the preference set in the nb_parallel configuration option is
+                used. For more information, see :func:`options.set_nb_parallel`.
+                Defaults to None.
+            batchsize (int, optional): indicative number of rows to process per
+                batch. Defaults to -1: (try to) determine optimal size automatically.
+            force (bool, optional): overwrite existing output file(s).
+                Defaults to False.
+        """
+        start_time = datetime.now()
+        output_path = Path(output_path)
+        if len(self.steps) == 0:
+            raise ValueError("pipeline: no operations were added to the pipeline")
+        if _io_util.output_exists(path=output_path, remove_if_exists=force):
+            return
+
+        # Group consecutive row-local operations, so they can be fused
+        stages: list[tuple[str, Any]] = []
+        for name, params in self.steps:
+            if name in _ROW_LOCAL_OPERATIONS:
+                if len(stages) > 0 and stages[-1][0] == "chain":
+                    stages[-1][1].append((name, params))
+                else:
+                    stages.append(("chain", [(name, params)]))
+            else:
+                stages.append((name, params))
+
+        logger.info(f"Start, {self!r} in {len(stages)} stages")
+        with _general_helper.create_gfo_tmp_dir("pipeline") as tmp_dir:
+            stage_input_path = self.input_path
+            stage_input_layer = self.input_layer
+            stage_columns = self.columns
+            for stage_id, (name, params) in enumerate(stages):
+                # Only the last stage writes to the output file. The other stages
+                # write to an intermediate file.
+                is_last = stage_id == len(stages) - 1
+                if is_last:
+                    stage_output_path = output_path
+                    stage_output_layer = output_layer
+                else:
+                    stage_output_path = tmp_dir / f"stage_{stage_id}_{name}.gpkg"
+                    stage_output_layer = None
+                kwargs: dict[str, Any] = {
+                    "output_path": stage_output_path,
+                    "output_layer": stage_output_layer,
+                    "gridsize": gridsize if is_last else 0.0,
+                    "where_post": where_post if is_last else None,
+                    "nb_parallel": nb_parallel,
+                    "batchsize": batchsize,
+                    "force": force,
+                }
+                explode = explodecollections and is_last
+
+                if name == "chain":
+                    _geoops_gpd.chain(
+                        input_path=stage_input_path,
+                        steps=params,
+                        input_layer=stage_input_layer,
+                        columns=stage_columns,
+                        explodecollections=explode,
+                        keep_empty_geoms=keep_empty_geoms,
+                        **kwargs,
+                    )
+                elif name == "clip":
+                    gfo.clip(
+                        input_path=stage_input_path,
+                        input_layer=stage_input_layer,
+                        input_columns=stage_columns,
+                        explodecollections=explode,
+                        **params,
+                        **kwargs,
+                    )
+                elif name == "difference":
+                    gfo.difference(
+                        input1_path=stage_input_path,
+                        input1_layer=stage_input_layer,
+                        input1_columns=stage_columns,
+                        explodecollections=explode,
+                        **params,
+                        **kwargs,
+                    )
+                elif name == "dissolve":
+                    # The columns of the output are determined by the dissolve
+                    dissolve_params = {
+                        **params,
+                        "explodecollections": params["explodecollections"] or explode,
+                    }
+                    gfo.dissolve(
+                        input_path=stage_input_path,
+                        input_layer=stage_input_layer,
+                        **dissolve_params,
+                        **kwargs,
+                    )
+                else:
+                    raise ValueError(f"pipeline: unsupported operation: {name}")
+
+                # If a stage gave no result, the next stages won't either
+                if not stage_output_path.exists():
+                    logger.info(f"Stage {stage_id} ({name}) gave no result")
+                    break
+
+                stage_input_path = stage_output_path
+                stage_input_layer = stage_output_layer
+                stage_columns = None
+
+        logger.info(f"Ready, took {datetime.now() - start_time}")
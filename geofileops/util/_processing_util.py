@@ -1,16 +1,26 @@
 """Module containing utilities regarding processes."""
 
+import logging
 import multiprocessing
 import multiprocessing.context
 import os
-from collections.abc import Callable
+from collections import deque
+from collections.abc import Callable, Hashable, Iterator, Mapping
 from concurrent import futures
 from types import TracebackType
+from typing import Any, TypeVar
 
 import psutil
 
+from geofileops.helpers._options import ConfigOptions
+from geofileops.util import _general_util, _workqueue_util
+
 WORKER_TYPES = {"threads", "processes"}
 
+_TaskId = TypeVar("_TaskId", bound=Hashable)
+
+logger = logging.getLogger(__name__)
+
 
 class PooledExecutorFactory:
     """Context manager to create a pooled executor.
@@ -24,6 +34,10 @@ class PooledExecutorFactory:
         mp_context (BaseContext, optional): multiprocessing context if processes are
             used. If None, "forkserver" will be used on linux to avoid risks on getting
             deadlocks. Defaults to None.
+        distributable (bool, optional): True if the tasks can be executed by workers
+            on other machines. If so and a work queue directory is configured, a
+            :class:`WorkQueueExecutor` on this directory is created instead of a local
+            pool. Defaults to False.
 
     """
 
@@ -34,6 +48,7 @@ class PooledExecutorFactory:
         initializer: Callable | None = None,
         initargs: tuple = (),
         mp_context: multiprocessing.context.BaseContext | None = None,
+        distributable: bool = False,
     ) -> None:
         self.worker_type = worker_type.lower()
         if self.worker_type not in WORKER_TYPES:
@@ -53,10 +68,16 @@ class PooledExecutorFactory:
         if mp_context is None and os.name not in {"nt", "darwin"}:
             # On linux, overrule default to "forkserver" to avoid risks to deadlocks
             self.mp_context = multiprocessing.get_context("forkserver")
+        self.distributable = distributable
         self.pool: futures.Executor | None = None
 
     def __enter__(self) -> futures.Executor:
-        if self.worker_type == "threads":
+        work_queue_dir = ConfigOptions.get_work_queue_dir
+        if self.distributable and work_queue_dir is not None:
+            self.pool = _workqueue_util.WorkQueueExecutor(
+                work_queue_dir, timeout=ConfigOptions.get_work_queue_timeout
+            )
+        elif self.worker_type == "threads":
             self.pool = futures.ThreadPoolExecutor(
                 max_workers=self.max_workers,
                 initializer=self.initializer,
@@ -84,7 +105,107 @@ class PooledExecutorFactory:
         traceback: TracebackType | None,
     ) -> None:
         if self.pool is not None:
-            self.pool.shutdown(wait=True)
+            # If stopped because of an exception, don't start the queued tasks anymore
+            self.pool.shutdown(wait=True, cancel_futures=value is not None)
+
+
+def submit_with_backpressure(
+    pool: futures.Executor,
+    tasks: Mapping[_TaskId, Callable[[], Any]],
+    max_running: int,
+    min_mem_available: int,
+    check_interval: float = 1.0,
+) -> Iterator[tuple[_TaskId, futures.Future]]:
+    """Submit tasks to a pool when enough memory is available and yield them when done.
+
+    Up to twice `max_running` tasks are submitted, so the pool can start the next task
+    while the caller is still processing the results of finished tasks. A new task is
+    only submitted if the memory available exceeds `min_mem_available` plus the memory
+    needed by the submitted tasks that didn't start yet and the new task. The memory a
+    task needs is estimated as the largest resident memory (RSS) observed for the
+    worker processes so far. While tasks are
+    being held back, the available memory is checked again every `check_interval`
+    seconds and when a running task finishes. If no tasks are running, a task is always
+    submitted to guarantee progress.
+
+    Args:
+        pool (futures.Executor): the pool to submit the tasks to.
+        tasks (Mapping[Hashable, Callable[[], Any]]): the tasks to submit, in order. The
+            key is an id for the task, the value the callable to execute, typically a
+            :func:`functools.partial` of the function with its arguments.
+        max_running (int): the maximum number of tasks that can run at the same time.
+            Typically the number of workers in the pool.
+        min_mem_available (int): the minimum number of bytes that should remain
+            available when a new task is started. If <= 0, tasks are submitted without
+            checking the memory.
+        check_interval (float, optional): the number of seconds to wait before checking
+            the available memory again while tasks are held back. Defaults to 1.0.
+
+    Yields:
+        tuple[Hashable, futures.Future]: the task id and the future of each task, in
+            the order they finish.
+    """
+    to_submit = deque(tasks.items())
+    max_submitted = 2 * max_running
+    running: dict[futures.Future, _TaskId] = {}
+    done: list[tuple[_TaskId, futures.Future]] = []
+    worker_rss_max = 0
+    holding_back = False
+
+    while True:
+        # Submit new tasks as long as allowed
+        while len(to_submit) > 0 and len(running) < max_submitted:
+            if len(running) > 0 and min_mem_available > 0:
+                worker_rss_max = max(worker_rss_max, get_worker_rss_max())
+                mem_available = psutil.virtual_memory().available
+                nb_waiting = sum(not future.running() for future in running)
+                mem_needed = (nb_waiting + 1) * worker_rss_max
+                if mem_available < min_mem_available + mem_needed:
+                    if not holding_back:
+                        holding_back = True
+                        logger.info(
+                            "Low memory available "
+                            f"({_general_util.formatbytes(mem_available)}, largest "
+                            f"worker: {_general_util.formatbytes(worker_rss_max)}): "
+                            "hold back new batches"
+                        )
+                    break
+
+            if holding_back:
+                holding_back = False
+                logger.info("Memory available again: resume starting new batches")
+            task_id, task = to_submit.popleft()
+            running[pool.submit(task)] = task_id
+
+        # Yield the tasks that are ready
+        yield from done
+        done = []
+        if len(running) == 0:
+            break
+
+        # Wait till a task is ready. If tasks are held back, recheck memory regularly.
+        timeout = check_interval if holding_back else None
+        done_futures, _ = futures.wait(
+            running, timeout=timeout, return_when=futures.FIRST_COMPLETED
+        )
+        done = [(running.pop(future), future) for future in done_futures]
+
+
+def get_worker_rss_max() -> int:
+    """Get the largest resident memory (RSS) of the child processes of this process.
+
+    Returns:
+        int: the largest RSS in bytes of the child processes, 0 if there are none.
+    """
+    rss_max = 0
+    for child in psutil.Process(os.getpid()).children(recursive=True):
+        try:
+            rss_max = max(rss_max, child.memory_info().rss)
+        except (psutil.NoSuchProcess, psutil.AccessDenied):  # pragma: no cover
+            # The process might have stopped in the meantime
+            continue
+
+    return rss_max
 
 
 def initialize_worker(worker_type: str, nice_value: int = 15) -> None:
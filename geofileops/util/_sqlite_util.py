@@ -567,12 +567,15 @@ def copy_table(
     where: str | None = None,
     preserve_fid: bool = False,
     profile: SqliteProfile = SqliteProfile.DEFAULT,
+    delete_where: Iterable[str] | None = None,
 ) -> None:
     """Copy data from one to another table.
 
     Notes:
         - At the moment only appending to an existing table is supported.
         - At the moment only copying from one sqlite file to another is supported.
+        - The rows are deleted and copied in one transaction: if an error occurs, the
+          output table is left unchanged.
 
     Args:
         input_path (PathLike): The path to the input SQLite database.
@@ -587,6 +590,9 @@ def copy_table(
             column. Defaults to False.
         profile (SqliteProfile, optional): The SQLite profile to use.
             Defaults to SqliteProfile.DEFAULT.
+        delete_where (Iterable[str] | None, optional): SQL WHERE clauses to delete
+            rows from the output table with before the data is copied. Defaults to
+            None.
     """
     # copy_table only supports local paths... so we can just use Path
     input_path = Path(input_path)
@@ -645,6 +651,10 @@ def copy_table(
         sql = "BEGIN TRANSACTION;"
         conn.execute(sql)
 
+        for delete_clause in delete_where or []:
+            sql = f'DELETE FROM main."{output_table}" WHERE {delete_clause};'
+            conn.execute(sql)
+
         if columns is None:
             # If the columns are not specified, determine them from the input table.
             # If the input layer has fewer columns than the output, those columns will
@@ -698,6 +708,131 @@ def copy_table(
         conn = None  # type: ignore[assignment]
 
 
+def evaluate_expressions(
+    input_path: Path,
+    input_table: str,
+    expressions: list[str],
+    output_path: Path,
+    output_table: str,
+    where: str | None = None,
+) -> None:
+    """Evaluate SQL expressions on the rows of a table into a table keyed on rowid.
+
+    The output table has a column "gfo_rowid" with the rowid of the input row and one
+    column "value_{i}" per expression. The value columns don't have a data type, so
+    the values are stored exactly as they were evaluated.
+
+    Args:
+        input_path (Path): the path to the input database.
+        input_table (str): the table to evaluate the expressions on.
+        expressions (list[str]): the SQL expressions to evaluate.
+        output_path (Path): the path to the database to write the values to. If it
+            doesn't exist, it is created.
+        output_table (str): the table to write the values to.
+        where (str, optional): SQL where clause to restrict the rows to evaluate the
+            expressions for. Defaults to None.
+    """
+    conn = connect(input_path, use_spatialite=True)
+    sql = None
+    try:
+        sql = "ATTACH DATABASE ? AS output_db"
+        conn.execute(sql, (str(output_path),))
+        set_performance_options(conn, SqliteProfile.SPEED, ["output_db"])
+
+        value_columns = [f"value_{idx}" for idx in range(len(expressions))]
+        columns_str = ", ".join(f'"{column}"' for column in value_columns)
+        sql = f"""
+            CREATE TABLE output_db."{output_table}" (
+                gfo_rowid INTEGER PRIMARY KEY, {columns_str}
+            );
+        """
+        conn.execute(sql)
+
+        expressions_str = "\n,".join(
+            f'{expression} AS "{column}"'
+            for expression, column in zip(expressions, value_columns, strict=True)
+        )
+        where_clause = f"WHERE {where}" if where else ""
+        sql = f"""
+            INSERT INTO output_db."{output_table}" (gfo_rowid, {columns_str})
+            SELECT rowid, {expressions_str}
+              FROM main."{input_table}"
+             {where_clause};
+        """
+        conn.execute(sql)
+        conn.commit()
+
+    except Exception as ex:
+        conn.rollback()
+        raise RuntimeError(f"Error {ex} executing {sql}") from ex
+    finally:
+        conn.close()
+        conn = None  # type: ignore[assignment]
+
+
+def update_table_from_values(
+    path: Path,
+    table: str,
+    columns: list[str],
+    values_paths: list[Path],
+    values_table: str,
+) -> None:
+    """Update columns of a table with values written by :func:`evaluate_expressions`.
+
+    The values of all files are first collected in a temporary table, so the table is
+    updated in a single transaction with one ``UPDATE ... FROM`` statement.
+
+    Args:
+        path (Path): the path to the database to update.
+        table (str): the table to update.
+        columns (list[str]): the columns to update, in the order of the expressions
+            the values were evaluated for.
+        values_paths (list[Path]): the paths to the databases with the values.
+        values_table (str): the table with the values in the values databases.
+    """
+    conn = connect(path, use_spatialite=True)
+    sql = None
+    try:
+        set_performance_options(conn)
+        value_columns = [f"value_{idx}" for idx in range(len(columns))]
+        columns_str = ", ".join(f'"{column}"' for column in value_columns)
+        sql = f"""
+            CREATE TEMP TABLE gfo_values (gfo_rowid INTEGER PRIMARY KEY, {columns_str});
+        """
+        conn.execute(sql)
+        for values_path in values_paths:
+            sql = "ATTACH DATABASE ? AS values_db"
+            conn.execute(sql, (str(values_path),))
+            sql = f"""
+                INSERT INTO temp.gfo_values
+                SELECT gfo_rowid, {columns_str} FROM values_db."{values_table}";
+            """
+            conn.execute(sql)
+            conn.commit()
+            sql = "DETACH DATABASE values_db"
+            conn.execute(sql)
+
+        set_str = "\n,".join(
+            f'"{column}" = gfo_values."{value_column}"'
+            for column, value_column in zip(columns, value_columns, strict=True)
+        )
+        sql = f"""
+            UPDATE main."{table}"
+               SET {set_str}
+              FROM temp.gfo_values
+             WHERE main."{table}".rowid = gfo_values.gfo_rowid;
+        """
+        conn.execute(sql)
+        conn.commit()
+
+    except Exception as ex:
+        conn.rollback()
+        raise RuntimeError(f"Error {ex} executing {sql}") from ex
+    finally:
+        conn.close()
+        conn = None  # type: ignore[assignment]
+
+
 def create_table_as_sql(
     input_databases: dict[str, Path],
     output_path: Path,
@@ -0,0 +1,401 @@
+"""Module with a work queue on a shared directory to distribute tasks over workers.
+
+The process that submits the tasks writes each task as a pickled callable to a job
+directory in the work queue directory. Workers, possibly on other machines, claim a
+task by atomically creating a lock file next to it, execute it and write the result
+back. While executing a task, the worker regularly writes a new heartbeat in the lock
+file. The submitting process polls for the results.
+
+Layout of the work queue directory::
+
+    <queue_dir>/job_000001/task_000000.task     the pickled task
+    <queue_dir>/job_000001/task_000000.lock     created by the worker claiming it
+    <queue_dir>/job_000001/task_000000.result   the pickled result
+
+As the tasks and results are unpickled, which can execute arbitrary code, the work
+queue directory should only be writable by trusted users.
+"""
+
+import functools
+import logging
+import os
+import pickle
+import shutil
+import socket
+import threading
+import time
+from collections.abc import Callable
+from concurrent import futures
+from pathlib import Path
+from typing import Any, Union
+
+import cloudpickle
+
+from geofileops.util import _general_util, _io_util, _processing_util
+
+logger = logging.getLogger(__name__)
+
+_TASK_SUFFIX = ".task"
+_LOCK_SUFFIX = ".lock"
+_RESULT_SUFFIX = ".result"
+
+# The interval in seconds a worker writes a heartbeat in the lock file of its task
+_HEARTBEAT_INTERVAL = 10.0
+
+# The interval in seconds to log a warning if no worker claims the tasks submitted
+_NO_WORKERS_WARNING_INTERVAL = 60.0
+
+
+class WorkQueueExecutor(futures.Executor):
+    """Executor that submits tasks to a work queue on a shared directory.
+
+    The tasks are executed by workers started with :func:`run_worker` on the same
+    directory. The environment variables with the geofileops runtime options of the
+    submitting process are applied while a worker executes a task.
+
+    If no worker claims a task for some time, a warning is logged regularly. If a
+    ``timeout`` is specified, the tasks not claimed yet fail with a ``TimeoutError``
+    once no task was claimed for ``timeout`` seconds.
+
+    Args:
+        queue_dir (Path): the work queue directory.
+        poll_interval (float, optional): the number of seconds between checks for
+            results. Defaults to 0.5.
+        stale_timeout (float, optional): if the heartbeat in the lock file of a
+            claimed task didn't change for this number of seconds, the worker is
+            assumed to have died and the task is released again so another worker can
+            claim it. Defaults to 120.
+        timeout (float, optional): if no task was claimed by a worker for this number
+            of seconds, the tasks not claimed yet fail with a ``TimeoutError``. If
+            None, wait indefinitely. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        queue_dir: Path,
+        poll_interval: float = 0.5,
+        stale_timeout: float = 120.0,
+        timeout: float | None = None,
+    ) -> None:
+        self.queue_dir = Path(queue_dir)
+        self.poll_interval = poll_interval
+        self.stale_timeout = stale_timeout
+        self.timeout = timeout
+        self.job_dir = _io_util.create_tempdir("job", parent_dir=self.queue_dir)
+
+        self._futures: dict[str, futures.Future] = {}
+        # Per claimed task: the last heartbeat seen and when it was first seen
+        self._heartbeats: dict[str, tuple[bytes, float]] = {}
+        self._next_task_id = 0
+        self._lock = threading.Lock()
+        self._shutdown = False
+        self._unclaimed_since = time.monotonic()
+        self._last_warning = self._unclaimed_since
+        self._stop = threading.Event()
+        self._monitor = threading.Thread(target=self._monitor_results, daemon=True)
+        self._monitor.start()
+        logger.info(
+            f"Submit tasks to work queue {self.job_dir}, start workers with "
+            f"run_worker({str(self.queue_dir)!r}) to process them"
+        )
+
+    def submit(
+        self, fn: Callable, /, *args: object, **kwargs: object
+    ) -> futures.Future:
+        """Submit a task to the work queue.
+
+        Args:
+            fn (Callable): the function to execute.
+            *args: the positional arguments to pass to the function.
+            **kwargs: the keyword arguments to pass to the function.
+
+        Returns:
+            futures.Future: the future for the result of the task.
+        """
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new tasks after shutdown")
+            task_name = f"task_{self._next_task_id:06d}"
+            self._next_task_id += 1
+            future: futures.Future = futures.Future()
+            self._futures[task_name] = future
+
+        # Pass the runtime options, as workers on other machines don't inherit them
+        envs = {
+            key: value for key, value in os.environ.items() if key.startswith("GFO_")
+        }
+        task = (functools.partial(fn, *args, **kwargs), envs)
+        task_path = self.job_dir / f"{task_name}{_TASK_SUFFIX}"
+        _write_atomic(task_path, cloudpickle.dumps(task))
+
+        return future
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        """Stop accepting tasks and clean up the job directory.
+
+        Args:
+            wait (bool, optional): True to wait till the pending tasks are done.
+                Defaults to True.
+            cancel_futures (bool, optional): True to cancel the tasks that weren't
+                claimed by a worker yet. Defaults to False.
+        """
+        with self._lock:
+            self._shutdown = True
+            pending = dict(self._futures)
+
+        if cancel_futures:
+            for task_name, future in pending.items():
+                if self._withdraw(task_name):
+                    future.cancel()
+
+        if wait:
+            with self._lock:
+                pending = dict(self._futures)
+            futures.wait(pending.values())
+            self._stop.set()
+            self._monitor.join()
+        else:
+            self._stop.set()
+
+        shutil.rmtree(self.job_dir, ignore_errors=True)
+
+    def _monitor_results(self) -> None:
+        while not self._stop.wait(self.poll_interval):
+            self._check_results()
+
+    def _check_results(self) -> None:
+        with self._lock:
+            pending = dict(self._futures)
+
+        unclaimed = []
+        for task_name, future in pending.items():
+            result_path = self.job_dir / f"{task_name}{_RESULT_SUFFIX}"
+            if not result_path.exists():
+                if not self._release_if_stale(task_name):
+                    unclaimed.append(task_name)
+                continue
+
+            try:
+                succeeded, value = pickle.loads(result_path.read_bytes())
+            except Exception as ex:
+                succeeded, value = False, ex
+            for suffix in (_TASK_SUFFIX, _LOCK_SUFFIX, _RESULT_SUFFIX):
+                (self.job_dir / f"{task_name}{suffix}").unlink(missing_ok=True)
+            with self._lock:
+                del self._futures[task_name]
+            self._heartbeats.pop(task_name, None)
+
+            if future.done():
+                continue
+            if succeeded:
+                future.set_result(value)
+            else:
+                future.set_exception(value)
+
+        self._check_unclaimed(unclaimed, nb_pending=len(pending))
+
+    def _check_unclaimed(self, unclaimed: list[str], nb_pending: int) -> None:
+        """Warn or time out if the tasks submitted aren't claimed by any worker."""
+        now = time.monotonic()
+        if len(unclaimed) == 0 or len(unclaimed) < nb_pending:
+            # All tasks are claimed or some worker is active on this job
+            self._unclaimed_since = now
+            self._last_warning = now
+            return
+
+        unclaimed_time = now - self._unclaimed_since
+        if self.timeout is not None and unclaimed_time > self.timeout:
+            error = TimeoutError(
+                f"no task in {self.job_dir} was claimed by a worker in "
+                f"{unclaimed_time:.0f} secs, are workers running with "
+                f"run_worker({str(self.queue_dir)!r})?"
+            )
+            with self._lock:
+                pending = dict(self._futures)
+            for task_name in unclaimed:
+                if self._withdraw(task_name):
+                    pending[task_name].set_exception(error)
+        elif now - self._last_warning > _NO_WORKERS_WARNING_INTERVAL:
+            logger.warning(
+                f"No task in {self.job_dir} was claimed by a worker in "
+                f"{unclaimed_time:.0f} secs, start workers with "
+                f"run_worker({str(self.queue_dir)!r}) to process them"
+            )
+            self._last_warning = now
+
+    def _withdraw(self, task_name: str) -> bool:
+        """Withdraw a task from the work queue if it wasn't claimed by a worker yet.
+
+        Returns:
+            bool: True if the task was withdrawn, False if a worker claimed it already.
+        """
+        # Claim the task so no worker will start it anymore
+        lock_path = self.job_dir / f"{task_name}{_LOCK_SUFFIX}"
+        if not _io_util.create_file_atomic(lock_path):
+            return False
+
+        task_path = self.job_dir / f"{task_name}{_TASK_SUFFIX}"
+        task_path.unlink(missing_ok=True)
+        with self._lock:
+            del self._futures[task_name]
+        return True
+
+    def _release_if_stale(self, task_name: str) -> bool:
+        """Release the task if the worker that claimed it stopped giving heartbeats.
+
+        The heartbeats are compared with the ones seen before, using the local clock,
+        because the clocks of the hosts sharing the work queue can differ.
+
+        Returns:
+            bool: True if the task is claimed by a worker, False otherwise.
+        """
+        lock_path = self.job_dir / f"{task_name}{_LOCK_SUFFIX}"
+        try:
+            heartbeat = lock_path.read_bytes()
+        except FileNotFoundError:
+            # Not claimed yet
+            self._heartbeats.pop(task_name, None)
+            return False
+
+        now = time.monotonic()
+        last_heartbeat = self._heartbeats.get(task_name)
+        if last_heartbeat is None or last_heartbeat[0] != heartbeat:
+            self._heartbeats[task_name] = (heartbeat, now)
+            return True
+
+        time_since_heartbeat = now - last_heartbeat[1]
+        if time_since_heartbeat > self.stale_timeout:
+            logger.warning(
+                f"No heartbeat for {task_name} in {self.job_dir} since "
+                f"{time_since_heartbeat:.0f} secs, release it for another worker"
+            )
+            lock_path.unlink(missing_ok=True)
+            self._heartbeats.pop(task_name, None)
+            return False
+
+        return True
+
+
+def run_worker(
+    queue_dir: Union[str, "os.PathLike[Any]"],
+    poll_interval: float = 1.0,
+    idle_timeout: float | None = None,
+) -> int:
+    """Claim and execute tasks from a work queue till the idle timeout is reached.
+
+    The tasks are unpickled, which can execute arbitrary code, so the work queue
+    directory should only be writable by trusted users.
+
+    Args:
+        queue_dir (PathLike): the work queue directory.
+        poll_interval (float, optional): the number of seconds to wait before
+            checking for new tasks again if there are none. Defaults to 1.0.
+        idle_timeout (float, optional): stop if no task was found for this number of
+            seconds. If None, keep on running. Defaults to None.
+
+    Returns:
+        int: the number of tasks executed.
+    """
+    queue_dir = Path(queue_dir)
+    _processing_util.initialize_worker("processes")
+    logger.info(f"Start worker {socket.gethostname()}:{os.getpid()} on {queue_dir}")
+
+    nb_tasks = 0
+    idle_since = time.monotonic()
+    while True:
+        task_path = _claim_task(queue_dir)
+        if task_path is None:
+            if (
+                idle_timeout is not None
+                and time.monotonic() - idle_since > idle_timeout
+            ):
+                break
+            time.sleep(poll_interval)
+            continue
+
+        _execute_task(task_path)
+        nb_tasks += 1
+        idle_since = time.monotonic()
+
+    logger.info(f"Stop worker, {nb_tasks} tasks executed")
+    return nb_tasks
+
+
+def _claim_task(queue_dir: Path) -> Path | None:
+    """Claim the first task in the queue that isn't claimed yet.
+
+    Returns:
+        Path | None: the path to the task claimed or None if there are no tasks.
+    """
+    for task_path in sorted(queue_dir.glob(f"*/*{_TASK_SUFFIX}")):
+        lock_path = task_path.with_suffix(_LOCK_SUFFIX)
+        if lock_path.exists() or task_path.with_suffix(_RESULT_SUFFIX).exists():
+            continue
+        if not _io_util.create_file_atomic(lock_path):
+            continue
+
+        # The task can have been completed and cleaned up in the meantime
+        if task_path.exists() and not task_path.with_suffix(_RESULT_SUFFIX).exists():
+            return task_path
+        lock_path.unlink(missing_ok=True)
+
+    return None
+
+
+def _execute_task(task_path: Path) -> None:
+    logger.info(f"Execute {task_path}")
+    lock_path = task_path.with_suffix(_LOCK_SUFFIX)
+    stop = threading.Event()
+    heartbeat = threading.Thread(target=_heartbeat, args=(lock_path, stop), daemon=True)
+    heartbeat.start()
+
+    try:
+        try:
+            task, envs = pickle.loads(task_path.read_bytes())
+            with _general_util.TempEnv(envs):
+                result = (True, task())
+        except Exception as ex:
+            logger.exception(f"Error executing {task_path}")
+            result = (False, ex)
+
+        try:
+            data = cloudpickle.dumps(result)
+        except Exception:
+            # E.g. an exception that cannot be pickled
+            error = RuntimeError(f"{type(result[1]).__name__}: {result[1]}")
+            data = cloudpickle.dumps((False, error))
+
+        try:
+            _write_atomic(task_path.with_suffix(_RESULT_SUFFIX), data)
+        except OSError as ex:
+            # E.g. the job was cancelled and cleaned up in the meantime
+            logger.warning(f"Error writing result of {task_path}: {ex}")
+    finally:
+        stop.set()
+        heartbeat.join()
+
+
+def _heartbeat(lock_path: Path, stop: threading.Event) -> None:
+    """Write a heartbeat in the lock file regularly while the task is being executed.
+
+    The heartbeat is a counter rather than the modification time of the file, as the
+    clocks of the hosts sharing the work queue can differ.
+    """
+    worker = f"{socket.gethostname()}:{os.getpid()}"
+    counter = 0
+    while not stop.wait(_HEARTBEAT_INTERVAL):
+        counter += 1
+        try:
+            # Don't recreate the lock file if the task was released in the meantime
+            with lock_path.open("r+") as lock_file:
+                lock_file.write(f"{worker}:{counter}")
+                lock_file.truncate()
+        except OSError:
+            return
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write data to a file so other processes never see a partially written file."""
+    tmp_path = path.with_name(f"{path.name}_{socket.gethostname()}_{os.getpid()}.tmp")
+    tmp_path.write_bytes(data)
+    tmp_path.replace(path)
@@ -23,6 +23,7 @@ import geofileops as gfo
 from geofileops import fileops
 from geofileops._compat import (
     GDAL_GTE_311,
+    GEOPANDAS_GTE_10,
     PANDAS_GTE_20,
     PANDAS_GTE_22,
     PANDAS_GTE_30,
@@ -306,8 +307,9 @@ def test_add_columns(tmp_path, output_stem, do_updates, suffix):
     assert all(pd.isna(gdf["TST_INT_N"]))
 
     # Check the tmp_dir
-    if output_stem is not None or do_updates:
-        # If an output_path is given or if updates are done, the tmp dir should exist
+    if output_stem is not None or (do_updates and suffix == ".shp"):
+        # If an output_path is given or if updates are done on a file type without
+        # transactions, the tmp dir should exist
         assert tmp_dir.exists()
         shutil.rmtree(tmp_dir, ignore_errors=True)
     else:
@@ -362,6 +364,24 @@ def test_add_columns_errors(tmp_path, kwargs, exp_exception, exp_error):
         gfo.add_columns(test_path, **kwargs)
 
 
+def test_add_columns_in_place_error(tmp_path):
+    """If updating the values fails, a Geopackage file should be left unchanged."""
+    test_path = test_helper.get_testfile("polygon-parcel", dst_dir=tmp_path)
+    input_info = gfo.get_layerinfo(test_path)
+    new_columns = [
+        ("TST_AREA", "real", "ST_area(geom)"),
+        ("TST_ERROR", "real", "invalid_function(geom)"),
+    ]
+
+    with pytest.raises(Exception, match="add_columns error for"):
+        gfo.add_columns(test_path, new_columns=new_columns)
+
+    # The columns should not have been added
+    output_info = gfo.get_layerinfo(test_path)
+    assert list(output_info.columns) == list(input_info.columns)
+    assert output_info.featurecount == input_info.featurecount
+
+
 def test_add_columns_errors_different_output_suffix(tmp_path):
     """Test error when output_path has a different suffix than input file."""
     test_path = test_helper.get_testfile("polygon-parcel", suffix=".gpkg")
@@ -453,6 +473,36 @@ def test_append_to(tmp_path):
     assert info.featurecount == 96
 
 
+def test_add_columns_nb_parallel(tmp_path):
+    # Prepare test data: large enough to be updated in multiple batches
+    nb_points = 25_000
+    test_gdf = gpd.GeoDataFrame(
+        {"value": np.arange(nb_points)},
+        geometry=gpd.points_from_xy(np.arange(nb_points), np.arange(nb_points)),
+        crs=31370,
+    )
+    test_path = tmp_path / "points.gpkg"
+    gfo.to_file(test_gdf, test_path)
+    expected_path = tmp_path / "points_expected.gpkg"
+    gfo.copy(test_path, expected_path)
+    new_columns = [
+        ("x", "REAL", "ST_X(geom)"),
+        ("value_text", "TEXT", "CASE WHEN value % 2 = 0 THEN 'even' ELSE NULL END"),
+        ("value_half", "INTEGER", "value / 2.0"),
+        ("empty", "REAL"),
+    ]
+
+    # Test
+    gfo.add_columns(test_path, new_columns, nb_parallel=4)
+
+    # Check result: should be the same as adding the columns without parallelization
+    gfo.add_columns(expected_path, new_columns)
+    result_gdf = gfo.read_file(test_path)
+    expected_gdf = gfo.read_file(expected_path)
+    assert result_gdf["value_text"].isnull().sum() == nb_points // 2
+    assert_geodataframe_equal(result_gdf, expected_gdf)
+
+
 @pytest.mark.parametrize("force_update", [True, False])
 def test_add_columns_existing(tmp_path, force_update):
     """Test adding columns that already exist."""
@@ -1122,6 +1172,44 @@ def test_copy_layer_layer(tmp_path, layer):
     assert dst_info.featurecount == 48
 
 
+@pytest.mark.parametrize(
+    "src_suffix, dst_suffix, kwargs",
+    [
+        (".shp", ".gpkg", {"preserve_fid": True}),
+        (".gpkg", ".gpkg", {"where": "value % 2 = 0"}),
+        (".gpkg", ".shp", {"dst_crs": 4326, "reproject": True}),
+        (".shp", ".sqlite", {"columns": ["value"]}),
+    ],
+)
+def test_copy_layer_nb_parallel(tmp_path, src_suffix, dst_suffix, kwargs):
+    # Prepare test data: large enough to be copied in multiple batches
+    nb_points = 25_000
+    test_gdf = gpd.GeoDataFrame(
+        {"value": np.arange(nb_points), "name": "test"},
+        geometry=gpd.points_from_xy(np.arange(nb_points), np.arange(nb_points)),
+        crs=31370,
+    )
+    src = tmp_path / f"points{src_suffix}"
+    gfo.to_file(test_gdf, src)
+    dst = tmp_path / f"points_parallel{dst_suffix}"
+    expected_path = tmp_path / f"points_expected{dst_suffix}"
+
+    # Test
+    gfo.copy_layer(src, dst, nb_parallel=4, **kwargs)
+
+    # Check result: should be the same as copying without parallelization
+    gfo.copy_layer(src, expected_path, **kwargs)
+    result_gdf = gfo.read_file(dst, fid_as_index=True)
+    expected_gdf = gfo.read_file(expected_path, fid_as_index=True)
+    assert len(result_gdf) > 0
+    assert result_gdf.crs == expected_gdf.crs
+    if kwargs.get("preserve_fid"):
+        assert result_gdf.index.tolist() == expected_gdf.index.tolist()
+    assert_geodataframe_equal(
+        result_gdf.reset_index(drop=True), expected_gdf.reset_index(drop=True)
+    )
+
+
 @pytest.mark.parametrize(
     "src_suffix, dst_suffix, preserve_fid, exp_preserved_fids",
     [
@@ -1443,6 +1531,28 @@ def test_get_crs_bad_prj(tmp_path):
         assert file_corrected.read() == fileops.PRJ_EPSG_31370
 
 
+def test_get_crs_bad_prj_cached(tmp_path):
+    """The crs of a bad .prj is cached, but the .prj is still corrected per file."""
+    bad_prj_src = test_helper.data_dir / "crs_custom_match" / "31370_no_epsg.prj"
+    srcs = []
+    for name in ["src1", "src2"]:
+        src = test_helper.get_testfile(
+            "polygon-parcel", dst_dir=tmp_path / name, suffix=".shp"
+        )
+        shutil.copy(bad_prj_src, src.with_suffix(".prj"))
+        srcs.append(src)
+
+    fileops._crs_from_wkt.cache_clear()
+    crs1 = fileops.get_crs(srcs[0])
+    crs2 = fileops.get_crs(srcs[1])
+
+    assert crs1.to_epsg() == 31370
+    assert crs2.to_epsg() == 31370
+    assert fileops._crs_from_wkt.cache_info().hits == 1
+    for src in srcs:
+        assert src.with_suffix(".prj").read_text() == fileops.PRJ_EPSG_31370
+
+
 def test_get_crs_invalid_params():
     src = test_helper.get_testfile("polygon-parcel")
     with pytest.raises(ValueError, match="Layer not_existing not found in file"):
@@ -1616,6 +1726,44 @@ def test_get_layerinfo_errors_not_existing_src():
         _ = gfo.get_layerinfo(not_existing_path)
 
 
+@pytest.mark.parametrize("nb_parallel", [1, 2])
+def test_get_layerinfo_many(nb_parallel):
+    paths = [
+        test_helper.get_testfile("polygon-parcel"),
+        test_helper.get_testfile("polygon-parcel", suffix=".shp"),
+        test_helper.get_testfile("polygon-twolayers"),
+    ]
+
+    result = dict(gfo.get_layerinfo_many(paths, nb_parallel=nb_parallel))
+
+    assert set(result) == set(paths)
+    for path, layerinfos in result.items():
+        assert isinstance(layerinfos, dict)
+        assert list(layerinfos) == gfo.listlayers(path)
+        for layer, layerinfo in layerinfos.items():
+            expected = gfo.get_layerinfo(path, layer)
+            assert layerinfo.name == expected.name
+            assert layerinfo.featurecount == expected.featurecount
+            assert layerinfo.columns == expected.columns
+            assert layerinfo.crs == expected.crs
+
+
+def test_get_layerinfo_many_errors():
+    src = test_helper.get_testfile("polygon-parcel")
+    not_existing_path = src.with_stem("not_existing_file_stem")
+
+    # By default, an error is raised
+    with pytest.raises(FileNotFoundError, match="File not found"):
+        _ = list(gfo.get_layerinfo_many([src, not_existing_path]))
+
+    # With raise_on_error=False, the exception is returned
+    result = dict(
+        gfo.get_layerinfo_many([src, not_existing_path], raise_on_error=False)
+    )
+    assert isinstance(result[src], dict)
+    assert isinstance(result[not_existing_path], FileNotFoundError)
+
+
 def test_get_layerinfo_nogeom(tmp_path):
     """
     Test correct behaviour of get_layerinfo if file doesn't have a geometry column.
@@ -1834,6 +1982,35 @@ def test_update_column(tmp_path):
     assert len(gdf_filtered) == 20
 
 
+@pytest.mark.parametrize("where", [None, "value >= 1000"])
+def test_update_column_nb_parallel(tmp_path, where):
+    # Prepare test data: large enough to be updated in multiple batches
+    nb_points = 25_000
+    test_gdf = gpd.GeoDataFrame(
+        {"value": np.arange(nb_points), "area": 1.0},
+        geometry=gpd.points_from_xy(np.arange(nb_points), np.arange(nb_points)),
+        crs=31370,
+    )
+    test_path = tmp_path / "points.gpkg"
+    gfo.to_file(test_gdf.set_geometry(test_gdf.buffer(5)), test_path)
+    expected_path = tmp_path / "points_expected.gpkg"
+    gfo.copy(test_path, expected_path)
+
+    # Test
+    gfo.update_column(
+        test_path, name="area", expression="ST_Area(geom)", where=where, nb_parallel=4
+    )
+
+    # Check result: should be the same as updating without parallelization
+    gfo.update_column(
+        expected_path, name="area", expression="ST_Area(geom)", where=where
+    )
+    result_gdf = gfo.read_file(test_path)
+    expected_gdf = gfo.read_file(expected_path)
+    assert (result_gdf["area"] == 1.0).sum() == (1000 if where is not None else 0)
+    assert_geodataframe_equal(result_gdf, expected_gdf)
+
+
 def test_update_column_error(tmp_path):
     test_path = test_helper.get_testfile("polygon-parcel", dst_dir=tmp_path)
     layerinfo = gfo.get_layerinfo(path=test_path, layer="parcels")
@@ -1989,6 +2166,38 @@ def test_read_file_invalid_params(tmp_path, engine_setter):  # noqa: ARG001
         _ = gfo.read_file(src)
 
 
+@pytest.mark.parametrize("suffix", [".gpkg", ".shp"])
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"fid_as_index": True},
+        {"columns": ["value", "fid"]},
+        {"where": "value >= 1000"},
+        {"bbox": (1000, 1000, 20000, 20000)},
+    ],
+)
+def test_read_file_nb_parallel(tmp_path, suffix, kwargs):
+    # Prepare test data: large enough to be read in multiple batches
+    nb_points = 25_000
+    test_gdf = gpd.GeoDataFrame(
+        {"value": np.arange(nb_points)},
+        geometry=gpd.points_from_xy(np.arange(nb_points), np.arange(nb_points)),
+        crs=31370,
+    )
+    test_path = tmp_path / f"points{suffix}"
+    gfo.to_file(test_gdf, test_path)
+
+    # Test
+    read_gdf = gfo.read_file(test_path, nb_parallel=4, **kwargs)
+
+    # Check result: should be the same as reading without parallelization
+    assert isinstance(read_gdf, gpd.GeoDataFrame)
+    expected_gdf = gfo.read_file(test_path, **kwargs)
+    assert len(read_gdf) > 0
+    assert_geodataframe_equal(read_gdf, expected_gdf)
+
+
 @pytest.mark.parametrize("suffix", SUFFIXES_FILEOPS)
 def test_read_file_fid_as_index(suffix, engine_setter):  # noqa: ARG001
     # Prepare test data
@@ -2015,6 +2224,90 @@ def test_read_file_fid_as_index(suffix, engine_setter):  # noqa: ARG001
         assert read_gdf.index[0] == 6
 
 
+@pytest.mark.parametrize("suffix", SUFFIXES_FILEOPS)
+@pytest.mark.parametrize("fid_as_index", [True, False])
+def test_read_file_iter(suffix, fid_as_index):
+    pytest.importorskip("pyarrow")
+    src = test_helper.get_testfile("polygon-parcel", suffix=suffix)
+    exp_gdf = gfo.read_file(src, fid_as_index=fid_as_index)
+
+    chunks = list(gfo.read_file_iter(src, fid_as_index=fid_as_index, batch_size=10))
+
+    assert len(chunks) == 5
+    assert all(len(chunk) <= 10 for chunk in chunks)
+    read_gdf = pd.concat(chunks)
+    assert list(read_gdf.columns) == list(exp_gdf.columns)
+    assert read_gdf.index.tolist() == exp_gdf.index.tolist()
+    if suffix != ".csv":
+        assert isinstance(read_gdf, gpd.GeoDataFrame)
+        assert read_gdf.crs == exp_gdf.crs
+        assert read_gdf.geometry.geom_equals(exp_gdf.geometry).all()
+
+
+@pytest.mark.parametrize(
+    "columns, exp_columns",
+    [
+        (["OIDN", "gewasGROEP"], ["OIDN", "gewasGROEP", "geometry"]),
+        (["fid", "OIDN"], ["OIDN", "geometry", "fid"]),
+    ],
+)
+def test_read_file_iter_columns(columns, exp_columns):
+    pytest.importorskip("pyarrow")
+    src = test_helper.get_testfile("polygon-parcel")
+
+    chunks = list(gfo.read_file_iter(src, columns=columns, batch_size=20))
+
+    assert len(chunks) == 3
+    for chunk in chunks:
+        assert list(chunk.columns) == exp_columns
+    read_gdf = pd.concat(chunks)
+    assert read_gdf.index.is_unique
+    if "fid" in exp_columns:
+        assert read_gdf["fid"].tolist() == list(range(1, 49))
+
+
+def test_read_file_iter_arrow():
+    pytest.importorskip("pyarrow")
+    src = test_helper.get_testfile("polygon-parcel")
+
+    chunks = list(
+        gfo.read_file_iter(
+            src, columns=["oidn", "fid"], where="OIDN > 0", as_arrow=True
+        )
+    )
+
+    assert len(chunks) == 1
+    assert {"oidn", "fid"}.issubset(chunks[0].column_names)
+    assert chunks[0].num_rows == len(gfo.read_file(src, where="OIDN > 0"))
+
+
+def test_read_file_iter_sql():
+    pytest.importorskip("pyarrow")
+    src = test_helper.get_testfile("polygon-parcel")
+    sql_stmt = """
+        SELECT {geometrycolumn}
+              {columns_to_select_str}
+          FROM "{input_layer}" layer
+    """
+
+    chunks = list(
+        gfo.read_file_iter(src, sql_stmt=sql_stmt, columns=["OIDN"], batch_size=30)
+    )
+
+    assert len(chunks) == 2
+    read_gdf = pd.concat(chunks)
+    assert len(read_gdf) == 48
+    assert list(read_gdf.columns) == ["OIDN", "geometry"]
+
+
+def test_read_file_iter_invalid_params():
+    pytest.importorskip("pyarrow")
+    src = test_helper.get_testfile("polygon-parcel")
+
+    with pytest.raises(ValueError, match="batch_size should be > 0"):
+        _ = list(gfo.read_file_iter(src, batch_size=0))
+
+
 @pytest.mark.parametrize("suffix", SUFFIXES_FILEOPS)
 def test_read_file_sql(suffix, engine_setter):
     # Prepare test data
@@ -2547,6 +2840,78 @@ def test_to_file_append_different_columns(tmp_path, engine_setter):
         gfo.to_file(test_gdf, path=test_path, append=True)
 
 
+@pytest.mark.skipif(not GEOPANDAS_GTE_10, reason="geopandas >= 1.0 is needed")
+@pytest.mark.parametrize("suffix", [".gpkg", ".shp"])
+def test_open_writer(tmp_path, suffix):
+    pytest.importorskip("pyarrow")
+    src = test_helper.get_testfile("polygon-parcel", suffix=suffix)
+    src_gdf = gfo.read_file(src)
+    dst = tmp_path / f"dst{suffix}"
+
+    with gfo.open_writer(dst, transaction_size=20) as writer:
+        for start in range(0, len(src_gdf), 10):
+            writer.write(src_gdf.iloc[start : start + 10])
+
+    # Check result
+    assert writer.nb_rows_written == len(src_gdf)
+    dst_info = gfo.get_layerinfo(dst)
+    assert dst_info.featurecount == len(src_gdf)
+    assert list(dst_info.columns) == list(gfo.get_layerinfo(src).columns)
+    if suffix == ".gpkg":
+        assert gfo.has_spatial_index(dst)
+    dst_gdf = gfo.read_file(dst)
+    assert dst_gdf.geometry.geom_equals(src_gdf.geometry).all()
+
+
+@pytest.mark.skipif(not GEOPANDAS_GTE_10, reason="geopandas >= 1.0 is needed")
+def test_open_writer_append(tmp_path):
+    pytest.importorskip("pyarrow")
+    test_path = test_helper.get_testfile("polygon-parcel", dst_dir=tmp_path)
+    test_gdf = gfo.read_file(test_path)
+
+    with gfo.open_writer(test_path) as writer:
+        writer.write(test_gdf)
+
+    assert gfo.get_layerinfo(test_path).featurecount == len(test_gdf) * 2
+
+
+def test_open_writer_arrow(tmp_path):
+    pytest.importorskip("pyarrow")
+    src = test_helper.get_testfile("polygon-parcel")
+    dst = tmp_path / "dst.gpkg"
+
+    with gfo.open_writer(dst, layer="parcels") as writer:
+        for table in gfo.read_file_iter(src, batch_size=20, as_arrow=True):
+            writer.write(table)
+
+    dst_info = gfo.get_layerinfo(dst, layer="parcels")
+    assert dst_info.featurecount == 48
+    assert dst_info.geometrycolumn == "geom"
+
+
+@pytest.mark.skipif(not GEOPANDAS_GTE_10, reason="geopandas >= 1.0 is needed")
+def test_open_writer_rollback(tmp_path):
+    """The data written since the last commit is rolled back if an error occurs."""
+    pytest.importorskip("pyarrow")
+    src_gdf = gfo.read_file(test_helper.get_testfile("polygon-parcel"))
+    dst = tmp_path / "dst.gpkg"
+
+    with (
+        pytest.raises(RuntimeError, match="Stop writing"),
+        gfo.open_writer(dst, transaction_size=20) as writer,
+    ):
+        writer.write(src_gdf.iloc[0:30])
+        writer.write(src_gdf.iloc[30:35])
+        raise RuntimeError("Stop writing")
+
+    # The first 30 rows were committed, the next 5 were rolled back
+    assert gfo.get_layerinfo(dst).featurecount == 30
+
+    # Writing to a closed writer gives an error
+    with pytest.raises(ValueError, match=r"LayerWriter for .* is closed"):
+        writer.write(src_gdf)
+
+
 def test_to_file_attribute_table_gpkg(tmp_path, engine_setter):  # noqa: ARG001
     """Test writing a DataFrame without geometry to a geopackage."""
     # Prepare test data
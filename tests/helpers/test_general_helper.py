@@ -8,6 +8,71 @@ from geofileops.helpers import _general_helper
 from geofileops.util import _general_util
 
 
+def test_checkpoint(tmp_path):
+    """Test that the state of a checkpoint is found again when resumed."""
+    with (
+        _general_util.TempEnv({"GFO_CHECKPOINT_DIR": str(tmp_path)}),
+        _general_helper.checkpoint_scope("key"),
+    ):
+        checkpoint = _general_helper.Checkpoint(tmp_path, identity="test:a")
+        assert checkpoint.enabled
+        assert checkpoint.batches(["batch_0", "batch_1"]) == ["batch_0", "batch_1"]
+        checkpoint.mark_done("batch_0")
+        checkpoint.mark_done("step", ["value"])
+
+        # The same operation finds the completed work again, also if the batches
+        # would be determined differently now.
+        resumed = _general_helper.Checkpoint(tmp_path, identity="test:a")
+        assert resumed.batches(["other_batch"]) == ["batch_0", "batch_1"]
+        assert resumed.is_done("batch_0")
+        assert not resumed.is_done("batch_1")
+        assert resumed.get("step") == ["value"]
+
+        # Another operation starts from scratch in an empty directory
+        (tmp_path / "partial.gpkg").touch()
+        other = _general_helper.Checkpoint(tmp_path, identity="test:b")
+        assert not other.is_done("batch_0")
+        assert not (tmp_path / "partial.gpkg").exists()
+
+
+def test_checkpoint_disabled(tmp_path):
+    """Test that nothing is saved if the operation isn't resumable."""
+    with _general_util.TempEnv({"GFO_CHECKPOINT_DIR": None}):
+        checkpoint = _general_helper.Checkpoint(tmp_path, identity="test")
+        assert not checkpoint.enabled
+        checkpoint.mark_done("batch_0")
+
+    assert not checkpoint.is_done("batch_0")
+    assert not checkpoint.path.exists()
+
+
+def test_checkpoint_scope(tmp_path):
+    """Test that temporary directories are kept if a resumable operation fails."""
+    checkpoint_dir = tmp_path / "checkpoints"
+    with _general_util.TempEnv({"GFO_CHECKPOINT_DIR": str(checkpoint_dir)}):
+        with pytest.raises(RuntimeError, match="operation failed"):
+            with (
+                _general_helper.checkpoint_scope("key"),
+                _general_helper.create_gfo_tmp_dir("testje") as tmp_dir,
+            ):
+                assert tmp_dir.parent == checkpoint_dir / "key"
+                (tmp_dir / "partial.gpkg").touch()
+                _general_helper.Checkpoint(tmp_dir, identity="test")
+                raise RuntimeError("operation failed")
+
+        # The directory of the failed operation is kept and reused when resumed
+        assert (tmp_dir / "partial.gpkg").exists()
+        with (
+            _general_helper.checkpoint_scope("key"),
+            _general_helper.create_gfo_tmp_dir("testje") as resumed_tmp_dir,
+        ):
+            assert resumed_tmp_dir == tmp_dir
+            assert (resumed_tmp_dir / "partial.gpkg").exists()
+
+    # After success, everything is removed
+    assert not (checkpoint_dir / "key").exists()
+
+
 def test_create_gfo_tmp_dir():
     """Test the creation of a temporary directory in the default tmp dir."""
     with (
@@ -46,6 +111,29 @@ def test_create_gfo_tmp_dir_env_invalid():
         pass
 
 
+@pytest.mark.parametrize(
+    "env_value, gpkg_needed, expected",
+    [
+        (None, False, ".gpkg"),
+        ("FGB", False, ".fgb"),
+        ("FGB", True, ".gpkg"),
+        ("GPKG", False, ".gpkg"),
+    ],
+)
+def test_tmp_partial_suffix(env_value, gpkg_needed, expected):
+    with _general_util.TempEnv({"GFO_TMP_FILE_FORMAT": env_value}):
+        result = _general_helper.tmp_partial_suffix(gpkg_needed=gpkg_needed)
+    assert result == expected
+
+
+def test_tmp_partial_suffix_invalid():
+    with (
+        _general_util.TempEnv({"GFO_TMP_FILE_FORMAT": "csv"}),
+        pytest.raises(ValueError, match="invalid value for configoption"),
+    ):
+        _general_helper.tmp_partial_suffix()
+
+
 def test_warn_if_low_mem():
     """Test the low memory warning function."""
     # Set the threshold to a high value to trigger the warning
@@ -56,9 +56,18 @@ def test_get_bool_invalidvalue():
 @pytest.mark.parametrize(
     "key, value, expected",
     [
+        ("GFO_BATCH_BALANCE_BY_COST", "TRUe", True),
+        ("GFO_BATCH_BALANCE_BY_COST", None, False),
+        ("GFO_CACHE_DIR", None, None),
+        ("GFO_CACHE_MAX_SIZE", "1000", 1000),
+        ("GFO_CACHE_MAX_SIZE", None, 10 * 1024 * 1024 * 1024),
+        ("GFO_CHECKPOINT_DIR", None, None),
+        ("GFO_CHECKPOINT_DIR", "", None),
         ("GFO_IO_ENGINE", "PYOgrio", "pyogrio"),
         ("GFO_IO_ENGINE", "FIOna", "fiona"),
         ("GFO_IO_ENGINE", None, "pyogrio-arrow"),
+        ("GFO_LOW_MEM_AVAILABLE_PAUSE_THRESHOLD", "1000", 1000),
+        ("GFO_LOW_MEM_AVAILABLE_PAUSE_THRESHOLD", None, 500 * 1024 * 1024),
         ("GFO_LOW_MEM_AVAILABLE_WARN_THRESHOLD", "1000", 1000),
         ("GFO_LOW_MEM_AVAILABLE_WARN_THRESHOLD", None, 500 * 1024 * 1024),
         ("GFO_NB_PARALLEL", "4", 4),
@@ -67,9 +76,19 @@ def test_get_bool_invalidvalue():
         ("GFO_ON_DATA_ERROR", "RAIse", "raise"),
         ("GFO_ON_DATA_ERROR", "WARn", "warn"),
         ("GFO_ON_DATA_ERROR", None, "raise"),
+        ("GFO_READ_FILE_SQLITE_DIRECT", "TRUe", True),
+        ("GFO_READ_FILE_SQLITE_DIRECT", None, False),
         ("GFO_REMOVE_TEMP_FILES", "TRUe", True),
         ("GFO_REMOVE_TEMP_FILES", "FALse", False),
         ("GFO_REMOVE_TEMP_FILES", None, True),
+        ("GFO_TMP_FILE_FORMAT", "FGb", "fgb"),
+        ("GFO_TMP_FILE_FORMAT", None, "gpkg"),
+        ("GFO_TO_FILE_SQLITE_DIRECT", "TRUe", True),
+        ("GFO_TO_FILE_SQLITE_DIRECT", None, False),
+        ("GFO_WORK_QUEUE_DIR", None, None),
+        ("GFO_WORK_QUEUE_DIR", "", None),
+        ("GFO_WORK_QUEUE_TIMEOUT", "60", 60.0),
+        ("GFO_WORK_QUEUE_TIMEOUT", None, None),
         ("GFO_WORKER_TYPE", "THReads", "threads"),
         ("GFO_WORKER_TYPE", "PROcesses", "processes"),
         ("GFO_WORKER_TYPE", "AUTo", "auto"),
@@ -79,16 +98,36 @@ def test_get_bool_invalidvalue():
 def test_get_option(key, value, expected):
     """Test all ConfigOptions class properties."""
     with gfo.TempEnv({key: value}):
-        if key == "GFO_IO_ENGINE":
+        if key == "GFO_BATCH_BALANCE_BY_COST":
+            result = ConfigOptions.get_batch_balance_by_cost
+        elif key == "GFO_CACHE_DIR":
+            result = ConfigOptions.get_cache_dir
+        elif key == "GFO_CACHE_MAX_SIZE":
+            result = ConfigOptions.get_cache_max_size
+        elif key == "GFO_CHECKPOINT_DIR":
+            result = ConfigOptions.get_checkpoint_dir
+        elif key == "GFO_IO_ENGINE":
             result = ConfigOptions.get_io_engine
+        elif key == "GFO_LOW_MEM_AVAILABLE_PAUSE_THRESHOLD":
+            result = ConfigOptions.get_low_mem_available_pause_threshold
         elif key == "GFO_LOW_MEM_AVAILABLE_WARN_THRESHOLD":
             result = ConfigOptions.get_low_mem_available_warn_threshold
         elif key == "GFO_NB_PARALLEL":
             result = ConfigOptions.get_nb_parallel(None)
         elif key == "GFO_ON_DATA_ERROR":
             result = ConfigOptions.get_on_data_error
+        elif key == "GFO_READ_FILE_SQLITE_DIRECT":
+            result = ConfigOptions.get_read_file_sqlite_direct
         elif key == "GFO_REMOVE_TEMP_FILES":
             result = ConfigOptions.get_remove_temp_files
+        elif key == "GFO_TMP_FILE_FORMAT":
+            result = ConfigOptions.get_tmp_file_format
+        elif key == "GFO_TO_FILE_SQLITE_DIRECT":
+            result = ConfigOptions.get_to_file_sqlite_direct
+        elif key == "GFO_WORK_QUEUE_DIR":
+            result = ConfigOptions.get_work_queue_dir
+        elif key == "GFO_WORK_QUEUE_TIMEOUT":
+            result = ConfigOptions.get_work_queue_timeout
         elif key == "GFO_WORKER_TYPE":
             result = ConfigOptions.get_worker_type
         else:
@@ -100,7 +139,17 @@ def test_get_option(key, value, expected):
 @pytest.mark.parametrize(
     "key, invalid_value, expected_error",
     [
+        (
+            "GFO_CACHE_MAX_SIZE",
+            "invalid",
+            "invalid value for configoption <GFO_CACHE_MAX_SIZE>",
+        ),
         ("GFO_IO_ENGINE", "invalid", "invalid value for configoption <GFO_IO_ENGINE>"),
+        (
+            "GFO_LOW_MEM_AVAILABLE_PAUSE_THRESHOLD",
+            "invalid",
+            "invalid value for configoption <GFO_LOW_MEM_AVAILABLE_PAUSE_THRESHOLD>",
+        ),
         (
             "GFO_LOW_MEM_AVAILABLE_WARN_THRESHOLD",
             "invalid",
@@ -141,6 +190,16 @@ def test_get_option(key, value, expected):
             "   ",
             "GFO_TMPDIR='' environment variable found which is not supported",
         ),
+        (
+            "GFO_TMP_FILE_FORMAT",
+            "invalid",
+            "invalid value for configoption <GFO_TMP_FILE_FORMAT>",
+        ),
+        (
+            "GFO_WORK_QUEUE_TIMEOUT",
+            "invalid",
+            "invalid value for configoption <GFO_WORK_QUEUE_TIMEOUT>",
+        ),
         (
             "GFO_WORKER_TYPE",
             "invalid",
@@ -153,8 +212,12 @@ def test_get_option_invalid(key, invalid_value, expected_error):
         gfo.TempEnv({key: invalid_value}),
         pytest.raises(ValueError, match=expected_error),
     ):
-        if key == "GFO_IO_ENGINE":
+        if key == "GFO_CACHE_MAX_SIZE":
+            _ = ConfigOptions.get_cache_max_size
+        elif key == "GFO_IO_ENGINE":
             _ = ConfigOptions.get_io_engine
+        elif key == "GFO_LOW_MEM_AVAILABLE_PAUSE_THRESHOLD":
+            _ = ConfigOptions.get_low_mem_available_pause_threshold
         elif key == "GFO_LOW_MEM_AVAILABLE_WARN_THRESHOLD":
             _ = ConfigOptions.get_low_mem_available_warn_threshold
         elif key == "GFO_NB_PARALLEL":
@@ -171,6 +234,10 @@ def test_get_option_invalid(key, invalid_value, expected_error):
             _ = ConfigOptions.get_subdivide_check_parallel_rows
         elif key == "GFO_TMPDIR":
             _ = ConfigOptions.get_tmp_dir
+        elif key == "GFO_TMP_FILE_FORMAT":
+            _ = ConfigOptions.get_tmp_file_format
+        elif key == "GFO_WORK_QUEUE_TIMEOUT":
+            _ = ConfigOptions.get_work_queue_timeout
         elif key == "GFO_WORKER_TYPE":
             _ = ConfigOptions.get_worker_type
         else:
@@ -213,6 +280,130 @@ def test_get_tmp_dir(tmp_path):
         assert str(tmp_dir).startswith(tempdir)
 
 
+def test_set_batch_balance_by_cost() -> None:
+    """Test the batch_balance_by_cost option setter."""
+    # Make sure the environment variable is not set at the start of the test
+    key = "GFO_BATCH_BALANCE_BY_COST"
+    if key in os.environ:
+        del os.environ[key]
+
+    # Test setting the option permanently
+    gfo.options.set_batch_balance_by_cost(True)
+    assert os.environ[key] == "TRUE"
+
+    # Test setting the option temporarily using context manager
+    with gfo.options.set_batch_balance_by_cost(False):
+        assert os.environ[key] == "FALSE"
+
+    # After exiting the context manager, the value should be restored to the last
+    # permanent setting (which was True)
+    assert os.environ[key] == "TRUE"
+
+    # Clean up by setting with None
+    gfo.options.set_batch_balance_by_cost(None)
+
+    # Test setting the option temporarily using context manager
+    with gfo.options.set_batch_balance_by_cost(True):
+        assert os.environ[key] == "TRUE"
+
+    # After exiting the context manager, the environment variable should be removed
+    assert key not in os.environ
+
+
+def test_get_cache_dir(tmp_path):
+    """Test ConfigOptions.get_cache_dir property."""
+    cache_dir = tmp_path / "cache"
+    with gfo.TempEnv({"GFO_CACHE_DIR": str(cache_dir)}):
+        assert ConfigOptions.get_cache_dir == cache_dir
+        assert cache_dir.exists()
+
+
+def test_set_cache_dir() -> None:
+    """Test the cache_dir option setter."""
+    # Make sure the environment variable is not set at the start of the test
+    key = "GFO_CACHE_DIR"
+    if key in os.environ:
+        del os.environ[key]
+
+    # Test setting the option permanently
+    gfo.options.set_cache_dir(Path("/tmp/geofileops_cache"))
+    assert os.environ[key] == str(Path("/tmp/geofileops_cache"))
+
+    # Test setting the option temporarily using context manager
+    with gfo.options.set_cache_dir("/tmp/geofileops_cache_temp"):
+        assert os.environ[key] == "/tmp/geofileops_cache_temp"
+
+    # After exiting the context manager, the value should be restored to the last
+    # permanent setting
+    assert os.environ[key] == str(Path("/tmp/geofileops_cache"))
+
+    # Clean up by setting with None
+    gfo.options.set_cache_dir(None)
+    assert key not in os.environ
+
+
+def test_set_cache_max_size() -> None:
+    """Test the cache_max_size option setter."""
+    # Make sure the environment variable is not set at the start of the test
+    key = "GFO_CACHE_MAX_SIZE"
+    if key in os.environ:
+        del os.environ[key]
+
+    # Test setting the option permanently
+    gfo.options.set_cache_max_size(2000000)
+    assert os.environ[key] == "2000000"
+
+    # Test setting the option temporarily using context manager
+    with gfo.options.set_cache_max_size(1000000):
+        assert os.environ[key] == "1000000"
+
+    # After exiting the context manager, the value should be restored to the last
+    # permanent setting (which was 2000000)
+    assert os.environ[key] == "2000000"
+
+    # Clean up by setting with None
+    gfo.options.set_cache_max_size(None)
+
+    # Test setting the option temporarily using context manager
+    with gfo.options.set_cache_max_size(500000):
+        assert os.environ[key] == "500000"
+
+    # After exiting the context manager, the environment variable should be removed
+    assert key not in os.environ
+
+
+def test_get_checkpoint_dir(tmp_path):
+    """Test ConfigOptions.get_checkpoint_dir property."""
+    checkpoint_dir = tmp_path / "checkpoints"
+    with gfo.TempEnv({"GFO_CHECKPOINT_DIR": str(checkpoint_dir)}):
+        assert ConfigOptions.get_checkpoint_dir == checkpoint_dir
+        assert checkpoint_dir.exists()
+
+
+def test_set_checkpoint_dir() -> None:
+    """Test the checkpoint_dir option setter."""
+    # Make sure the environment variable is not set at the start of the test
+    key = "GFO_CHECKPOINT_DIR"
+    if key in os.environ:
+        del os.environ[key]
+
+    # Test setting the option permanently
+    gfo.options.set_checkpoint_dir(Path("/tmp/geofileops_checkpoints"))
+    assert os.environ[key] == str(Path("/tmp/geofileops_checkpoints"))
+
+    # Test setting the option temporarily using context manager
+    with gfo.options.set_checkpoint_dir("/tmp/geofileops_checkpoints_temp"):
+        assert os.environ[key] == "/tmp/geofileops_checkpoints_temp"
+
+    # After exiting the context manager, the value should be restored to the last
+    # permanent setting
+    assert os.environ[key] == str(Path("/tmp/geofileops_checkpoints"))
+
+    # Clean up by setting with None
+    gfo.options.set_checkpoint_dir(None)
+    assert key not in os.environ
+
+
 def test_set_copy_layer_sqlite_direct() -> None:
     """Test the copy_layer_sqlite_direct option setter."""
     # Make sure the environment variable is not set at the start of the test
@@ -273,6 +464,36 @@ def test_set_io_engine() -> None:
     assert key not in os.environ
 
 
+def test_set_low_mem_available_pause_threshold() -> None:
+    """Test the low_mem_available_pause_threshold option setter."""
+    # Make sure the environment variable is not set at the start of the test
+    key = "GFO_LOW_MEM_AVAILABLE_PAUSE_THRESHOLD"
+    if key in os.environ:
+        del os.environ[key]
+
+    # Test setting the option permanently
+    gfo.options.set_low_mem_available_pause_threshold(2000000)
+    assert os.environ[key] == "2000000"
+
+    # Test setting the option temporarily using context manager
+    with gfo.options.set_low_mem_available_pause_threshold(1000000):
+        assert os.environ[key] == "1000000"
+
+    # After exiting the context manager, the value should be restored to the last
+    # permanent setting (which was 2000000)
+    assert os.environ[key] == "2000000"
+
+    # Clean up by setting with None
+    gfo.options.set_low_mem_available_pause_threshold(None)
+
+    # Test setting the option temporarily using context manager
+    with gfo.options.set_low_mem_available_pause_threshold(500000):
+        assert os.environ[key] == "500000"
+
+    # After exiting the context manager, the environment variable should be removed
+    assert key not in os.environ
+
+
 def test_set_low_mem_available_warn_threshold() -> None:
     """Test the low_mem_available_warn_threshold option setter."""
     # Make sure the environment variable is not set at the start of the test
@@ -363,6 +584,36 @@ def test_set_on_data_error() -> None:
     assert key not in os.environ
 
 
+def test_set_read_file_sqlite_direct() -> None:
+    """Test the read_file_sqlite_direct option setter."""
+    # Make sure the environment variable is not set at the start of the test
+    key = "GFO_READ_FILE_SQLITE_DIRECT"
+    if key in os.environ:
+        del os.environ[key]
+
+    # Test setting the option permanently
+    gfo.options.set_read_file_sqlite_direct(True)
+    assert os.environ[key] == "TRUE"
+
+    # Test setting the option temporarily using context manager
+    with gfo.options.set_read_file_sqlite_direct(False):
+        assert os.environ[key] == "FALSE"
+
+    # After exiting the context manager, the value should be restored to the last
+    # permanent setting (which was True)
+    assert os.environ[key] == "TRUE"
+
+    # Clean up by setting with None
+    gfo.options.set_read_file_sqlite_direct(None)
+
+    # Test setting the option temporarily using context manager
+    with gfo.options.set_read_file_sqlite_direct(True):
+        assert os.environ[key] == "TRUE"
+
+    # After exiting the context manager, the environment variable should be removed
+    assert key not in os.environ
+
+
 def test_set_remove_temp_files() -> None:
     """Test the remove_temp_files option setter."""
     # Make sure the environment variable is not set at the start of the test
@@ -538,6 +789,122 @@ def test_set_tmp_dir_pathlike(path: Union[str, "os.PathLike[Any]"]) -> None:
     assert key not in os.environ
 
 
+def test_set_tmp_file_format() -> None:
+    """Test the tmp_file_format option setter."""
+    # Make sure the environment variable is not set at the start of the test
+    key = "GFO_TMP_FILE_FORMAT"
+    if key in os.environ:
+        del os.environ[key]
+
+    # Test setting the option permanently
+    gfo.options.set_tmp_file_format("fgb")
+    assert os.environ[key] == "FGB"
+
+    # Test setting the option temporarily using context manager
+    with gfo.options.set_tmp_file_format("gpkg"):
+        assert os.environ[key] == "GPKG"
+
+    # After exiting the context manager, the value should be restored to the last
+    # permanent setting (which was "fgb")
+    assert os.environ[key] == "FGB"
+
+    # Clean up by setting with None
+    gfo.options.set_tmp_file_format(None)
+
+    # Test setting the option temporarily using context manager
+    with gfo.options.set_tmp_file_format("gpkg"):
+        assert os.environ[key] == "GPKG"
+
+    # After exiting the context manager, the environment variable should be removed
+    assert key not in os.environ
+
+
+def test_set_to_file_sqlite_direct() -> None:
+    """Test the to_file_sqlite_direct option setter."""
+    # Make sure the environment variable is not set at the start of the test
+    key = "GFO_TO_FILE_SQLITE_DIRECT"
+    if key in os.environ:
+        del os.environ[key]
+
+    # Test setting the option permanently
+    gfo.options.set_to_file_sqlite_direct(True)
+    assert os.environ[key] == "TRUE"
+
+    # Test setting the option temporarily using context manager
+    with gfo.options.set_to_file_sqlite_direct(False):
+        assert os.environ[key] == "FALSE"
+
+    # After exiting the context manager, the value should be restored to the last
+    # permanent setting (which was True)
+    assert os.environ[key] == "TRUE"
+
+    # Clean up by setting with None
+    gfo.options.set_to_file_sqlite_direct(None)
+
+    # Test setting the option temporarily using context manager
+    with gfo.options.set_to_file_sqlite_direct(True):
+        assert os.environ[key] == "TRUE"
+
+    # After exiting the context manager, the environment variable should be removed
+    assert key not in os.environ
+
+
+def test_get_work_queue_dir(tmp_path):
+    """Test ConfigOptions.get_work_queue_dir property."""
+    work_queue_dir = tmp_path / "queue"
+    with gfo.TempEnv({"GFO_WORK_QUEUE_DIR": str(work_queue_dir)}):
+        assert ConfigOptions.get_work_queue_dir == work_queue_dir
+        assert work_queue_dir.exists()
+
+
+def test_set_work_queue_dir() -> None:
+    """Test the work_queue_dir option setter."""
+    # Make sure the environment variable is not set at the start of the test
+    key = "GFO_WORK_QUEUE_DIR"
+    if key in os.environ:
+        del os.environ[key]
+
+    # Test setting the option permanently
+    gfo.options.set_work_queue_dir(Path("/tmp/geofileops_queue"))
+    assert os.environ[key] == str(Path("/tmp/geofileops_queue"))
+
+    # Test setting the option temporarily using context manager
+    with gfo.options.set_work_queue_dir("/tmp/geofileops_queue_temp"):
+        assert os.environ[key] == "/tmp/geofileops_queue_temp"
+
+    # After exiting the context manager, the value should be restored to the last
+    # permanent setting
+    assert os.environ[key] == str(Path("/tmp/geofileops_queue"))
+
+    # Clean up by setting with None
+    gfo.options.set_work_queue_dir(None)
+    assert key not in os.environ
+
+
+def test_set_work_queue_timeout() -> None:
+    """Test the work_queue_timeout option setter."""
+    # Make sure the environment variable is not set at the start of the test
+    key = "GFO_WORK_QUEUE_TIMEOUT"
+    if key in os.environ:
+        del os.environ[key]
+
+    # Test setting the option permanently
+    gfo.options.set_work_queue_timeout(600)
+    assert os.environ[key] == "600"
+
+    # Test setting the option temporarily using context manager
+    with gfo.options.set_work_queue_timeout(0.5):
+        assert os.environ[key] == "0.5"
+
+    # After exiting the context manager, the value should be restored to the last
+    # permanent setting
+    assert os.environ[key] == "600"
+
+    # Clean up by setting with None
+    gfo.options.set_work_queue_timeout(None)
+    assert key not in os.environ
+
+
 def test_set_worker_type() -> None:
     """Test the worker_type option setter."""
     # Make sure the environment variable is not set at the start of the test
@@ -206,6 +206,43 @@ def test_concat_input1_more_columns(tmp_path):
     assert output_gdf["OIDN"].isnull().sum() == input2_info.featurecount
 
 
+@pytest.mark.parametrize("sqlite_direct", [True, False])
+def test_concat_mixed_formats(tmp_path, sqlite_direct):
+    """Test concat of GeoPackage and shapefile inputs with different columns.
+
+    With sqlite_direct, the shapefile input is staged in a parallel worker while the
+    GeoPackage inputs are inserted directly.
+    """
+    # Prepare test data
+    input1 = test_helper.get_testfile("polygon-parcel", dst_dir=tmp_path)
+    gfo.drop_column(input1, column_name="OIDN")
+    input2 = tmp_path / "input2.shp"
+    gfo.copy_layer(test_helper.get_testfile("polygon-parcel"), input2)
+    input1_info = gfo.get_layerinfo(input1)
+    input2_info = gfo.get_layerinfo(input2)
+
+    # Test
+    output = tmp_path / "output.gpkg"
+    with gfo.options.set_copy_layer_sqlite_direct(sqlite_direct):
+        gfo.concat([input1, input2, input1], output, nb_parallel=2)
+
+    # Now check result file
+    output_info = gfo.get_layerinfo(output)
+    exp_featurecount = input1_info.featurecount * 2 + input2_info.featurecount
+    assert output_info.featurecount == exp_featurecount
+    assert "OIDN" in output_info.columns
+    assert len(output_info.columns) == len(input1_info.columns) + 1
+    assert output_info.geometrytypename == input1_info.geometrytypename
+
+    # The rows should be in the order of the input files
+    output_gdf = gfo.read_file(output)
+    assert output_gdf["OIDN"].isnull().sum() == input1_info.featurecount * 2
+    input2_rows = output_gdf.iloc[
+        input1_info.featurecount : input1_info.featurecount + input2_info.featurecount
+    ]
+    assert input2_rows["OIDN"].notnull().all()
+
+
 def test_concat_invalid_input(tmp_path):
     """Test the concat function with invalid input."""
     # Prepare test data
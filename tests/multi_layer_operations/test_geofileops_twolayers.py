@@ -1,5 +1,6 @@
 """Tests for operations that are executed using a sql statement on two layers."""
 
+import logging
 import math
 import os
 import sys
@@ -729,6 +730,89 @@ def test_intersect_deprecated(tmp_path):
     assert output_path.exists()
 
 
+def test_intersection_in_memory(tmp_path):
+    """Intersection of two GeoDataFrames, returning the result as GeoDataFrame."""
+    input1_path = test_helper.get_testfile("polygon-parcel")
+    input2_path = test_helper.get_testfile("polygon-zone")
+    input1_gdf = gfo.read_file(input1_path)
+
+    # Test
+    result_gdf = gfo.intersection(
+        input1_path=input1_gdf,
+        input2_path=gfo.read_file(input2_path),
+        output_path=None,
+    )
+
+    # Check the result: should be the same as for the files
+    expected_path = tmp_path / "expected.gpkg"
+    gfo.intersection(
+        input1_path=input1_path, input2_path=input2_path, output_path=expected_path
+    )
+    expected_gdf = gfo.read_file(expected_path)
+    assert isinstance(result_gdf, gpd.GeoDataFrame)
+    assert len(result_gdf) > 0
+    assert_geodataframe_equal(result_gdf, expected_gdf, sort_values=True)
+
+
+@pytest.mark.parametrize("operation", ["intersection", "union"])
+def test_iter_batch_results(tmp_path, operation):
+    """The batch results should together be the same as the normal result."""
+    input1_path = test_helper.get_testfile("polygon-parcel")
+    input2_path = test_helper.get_testfile("polygon-zone")
+    output_path = tmp_path / "output.gpkg"
+    kwargs = {"input1_path": input1_path, "input2_path": input2_path}
+
+    # Test
+    batch_gdfs = list(
+        gfo.iter_batch_results(
+            getattr(gfo, operation),
+            output_path=output_path,
+            nb_parallel=2,
+            batchsize=10,
+            **kwargs,
+        )
+    )
+
+    # Check the result
+    expected_path = tmp_path / "expected.gpkg"
+    getattr(gfo, operation)(output_path=expected_path, **kwargs)
+    expected_gdf = gfo.read_file(expected_path)
+    if operation == "intersection":
+        assert len(batch_gdfs) > 1
+    else:
+        # union combines several steps, so the result is yielded at once
+        assert len(batch_gdfs) == 1
+    result_gdf = pd.concat(batch_gdfs, ignore_index=True)
+    assert_geodataframe_equal(result_gdf, expected_gdf, sort_values=True)
+
+    # The complete result should also have been written to output_path
+    assert_geodataframe_equal(
+        gfo.read_file(output_path), expected_gdf, sort_values=True
+    )
+
+
+def test_iter_batch_results_stop(tmp_path, caplog):
+    """Stopping the iteration early should stop the operation without errors."""
+    input1_path = test_helper.get_testfile("polygon-parcel")
+    input2_path = test_helper.get_testfile("polygon-zone")
+    output_path = tmp_path / "output.gpkg"
+
+    batch_results = gfo.iter_batch_results(
+        gfo.intersection,
+        input1_path=input1_path,
+        input2_path=input2_path,
+        output_path=output_path,
+        nb_parallel=2,
+        batchsize=5,
+    )
+    first_gdf = next(batch_results)
+    batch_results.close()
+
+    assert len(first_gdf) > 0
+    # The operation was stopped, not treated as failed
+    assert not any(record.levelno >= logging.ERROR for record in caplog.records)
+
+
 @pytest.mark.parametrize(
     "suffix_in, suffix_out, epsg, gridsize, explodecollections, worker_type, "
     "nb_parallel",
@@ -2610,3 +2694,155 @@ def test_union_self(tmp_path, subdivide_coords, include_duplicates, fid_column):
         # The l1_... columns should NOT be NULL.
         null_counts = (output_gdf.filter(like="l1_").isnull()).sum().item()
         assert null_counts == 0
+
+
+@pytest.mark.parametrize("operation", ["intersection", "join_by_location"])
+@pytest.mark.parametrize("use_changed_ids", [True, False])
+def test_update_overlay(tmp_path, operation, use_changed_ids):
+    # Prepare test data: the output for the previous version of input1
+    input1_previous_path = test_helper.get_testfile("polygon-parcel", dst_dir=tmp_path)
+    input2_path = test_helper.get_testfile("polygon-zone")
+    output_path = tmp_path / "output.gpkg"
+    operation_params = {"input1_columns": ["fid", "GEWASGROEP"]}
+    getattr(gfo, operation)(
+        input1_previous_path, input2_path, output_path, **operation_params
+    )
+
+    # Change input1: delete, change and add some features
+    input1_path = tmp_path / "input1.gpkg"
+    gfo.copy(input1_previous_path, input1_path)
+    layer = gfo.get_only_layer(input1_path)
+    gfo.execute_sql(input1_path, f'DELETE FROM "{layer}" WHERE fid IN (1, 2)')
+    gfo.execute_sql(
+        input1_path, f"UPDATE \"{layer}\" SET GEWASGROEP = 'X' WHERE fid IN (3, 4)"
+    )
+    gfo.execute_sql(
+        input1_path,
+        f'INSERT INTO "{layer}" (geom, GEWASGROEP) '
+        f'SELECT geom, GEWASGROEP FROM "{layer}" WHERE fid = 5',
+    )
+    sql_stmt = f'SELECT MAX(fid) AS max_fid FROM "{layer}"'
+    added_fid = int(gfo.read_file(input1_path, sql_stmt=sql_stmt)["max_fid"][0])
+
+    # Run test
+    changed_kwargs = {"input1_previous_path": input1_previous_path}
+    if use_changed_ids:
+        changed_kwargs = {"changed_ids": [1, 2, 3, 4, added_fid]}
+    gfo.update_overlay(
+        operation,
+        input1_path=input1_path,
+        input2_path=input2_path,
+        output_path=output_path,
+        id_column="fid",
+        operation_params=operation_params,
+        **changed_kwargs,
+    )
+
+    # The result should be the same as calculating the output again
+    expected_path = tmp_path / "expected.gpkg"
+    getattr(gfo, operation)(input1_path, input2_path, expected_path, **operation_params)
+    output_gdf = gfo.read_file(output_path)
+    assert not output_gdf["l1_fid"].isin([1, 2]).any()
+    assert_geodataframe_equal(
+        output_gdf,
+        gfo.read_file(expected_path),
+        check_dtype=False,
+        sort_values=True,
+        normalize=True,
+    )
+
+
+def test_update_overlay_error(tmp_path):
+    input1_path = test_helper.get_testfile("polygon-parcel", dst_dir=tmp_path)
+    input2_path = test_helper.get_testfile("polygon-zone")
+    output_path = tmp_path / "output.gpkg"
+    gfo.intersection(input1_path, input2_path, output_path)
+    output_before_gdf = gfo.read_file(output_path)
+
+    # If an error occurs while patching, the output should be left unchanged. The
+    # error occurs when inserting, so after the rows were already deleted.
+    conn = _sqlite_util.connect(output_path, use_spatialite=False)
+    try:
+        conn.execute(
+            """
+            CREATE TRIGGER insert_error BEFORE INSERT ON output
+            BEGIN
+              SELECT RAISE(ABORT, 'insert_error');
+            END
+            """
+        )
+        conn.commit()
+    finally:
+        conn.close()
+    with pytest.raises(RuntimeError, match="insert_error"):
+        gfo.update_overlay(
+            "intersection",
+            input1_path,
+            input2_path,
+            output_path,
+            "fid",
+            changed_ids=[1, 2],
+        )
+
+    assert_geodataframe_equal(gfo.read_file(output_path), output_before_gdf)
+    assert sorted(path.name for path in tmp_path.iterdir()) == sorted(
+        [input1_path.name, output_path.name]
+    )
+
+
+def test_update_overlay_invalid_params(tmp_path):
+    input1_path = test_helper.get_testfile("polygon-parcel", dst_dir=tmp_path)
+    input2_path = test_helper.get_testfile("polygon-zone")
+    output_path = tmp_path / "output.gpkg"
+    gfo.intersection(input1_path, input2_path, output_path)
+
+    with pytest.raises(ValueError, match="unsupported operation: union"):
+        gfo.update_overlay(
+            "union", input1_path, input2_path, output_path, "fid", changed_ids=[1]
+        )
+    with pytest.raises(ValueError, match="specify either input1_previous_path or"):
+        gfo.update_overlay("intersection", input1_path, input2_path, output_path, "fid")
+    with pytest.raises(ValueError, match="column l1_unknown not found in"):
+        gfo.update_overlay(
+            "intersection",
+            input1_path,
+            input2_path,
+            output_path,
+            "unknown",
+            changed_ids=[1],
+        )
+
+
+@pytest.mark.parametrize(
+    "param",
+    [
+        "input1_path",
+        "output_layer",
+        "force",
+        "nb_parallel",
+        "batchsize",
+        "overlay_self",
+        "include_duplicates",
+        "input1_subdivided_path",
+        "operation_prefix",
+        "tmp_basedir",
+        "input1_rowids",
+    ],
+)
+def test_update_overlay_invalid_operation_params(tmp_path, param):
+    """The parameters update_overlay sets itself can't be in operation_params."""
+    input1_path = test_helper.get_testfile("polygon-parcel", dst_dir=tmp_path)
+    input2_path = test_helper.get_testfile("polygon-zone")
+    output_path = tmp_path / "output.gpkg"
+    gfo.intersection(input1_path, input2_path, output_path)
+
+    with pytest.raises(ValueError, match=f"invalid operation_params: \\['{param}'\\]"):
+        gfo.update_overlay(
+            "intersection",
+            input1_path,
+            input2_path,
+            output_path,
+            "fid",
+            operation_params={param: None},
+            changed_ids=[1],
+        )
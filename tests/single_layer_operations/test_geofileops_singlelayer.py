@@ -12,8 +12,9 @@ import pytest
 import shapely
 from shapely import MultiPolygon, Polygon
 
-from geofileops import GeometryType, fileops, geoops
+from geofileops import GeometryType, fileops, geoops, options
 from geofileops._compat import GDAL_GTE_39, GDAL_GTE_311
+from geofileops.helpers import _general_helper
 from geofileops.util import _general_util, _geofileinfo, _geoops_sql
 from geofileops.util._geofileinfo import GeofileInfo
 from geofileops.util._geopath_util import GeoPath
@@ -734,6 +735,98 @@ def test_buffer_preserve_fid_gpkg(tmp_path, geoops_module):
     )
 
 
+@pytest.mark.parametrize("geoops_module", GEOOPS_MODULES)
+@pytest.mark.parametrize("tmp_file_format", ["fgb", "gpkg"])
+def test_buffer_tmp_file_format(tmp_path, geoops_module, tmp_file_format):
+    """Buffer test with different file formats for the temporary partial files."""
+    input_path = test_helper.get_testfile("polygon-parcel")
+    input_layerinfo = fileops.get_layerinfo(input_path)
+    batchsize = math.ceil(input_layerinfo.featurecount / 2)
+
+    # Now run test, with a .shp output so the partial files don't need to preserve
+    # the fid.
+    output_path = tmp_path / f"output_{tmp_file_format}.shp"
+    set_geoops_module(geoops_module)
+    with options.set_tmp_file_format(tmp_file_format):
+        geoops.buffer(
+            input_path=input_path,
+            output_path=output_path,
+            distance=1,
+            nb_parallel=2,
+            batchsize=batchsize,
+        )
+
+    # Check the result: should be the same as with the default file format
+    expected_path = tmp_path / "expected.shp"
+    geoops.buffer(
+        input_path=input_path,
+        output_path=expected_path,
+        distance=1,
+        nb_parallel=2,
+        batchsize=batchsize,
+    )
+    output_gdf = fileops.read_file(output_path)
+    expected_gdf = fileops.read_file(expected_path)
+    assert len(output_gdf) > 0
+    assert_geodataframe_equal(output_gdf, expected_gdf, sort_values=True)
+
+
+@pytest.mark.parametrize("output_in_memory", [True, False])
+def test_buffer_in_memory(tmp_path, output_in_memory):
+    """Buffer with a GeoDataFrame as input and optionally returning the result."""
+    input_path = test_helper.get_testfile("polygon-parcel")
+    input_gdf = fileops.read_file(input_path)
+    output_path = None if output_in_memory else tmp_path / "output.gpkg"
+
+    # Test
+    result = geoops.buffer(input_path=input_gdf, output_path=output_path, distance=1)
+
+    # Check the result: should be the same as buffering the file
+    expected_path = tmp_path / "expected.gpkg"
+    geoops.buffer(input_path=input_path, output_path=expected_path, distance=1)
+    expected_gdf = fileops.read_file(expected_path)
+    if output_in_memory:
+        assert isinstance(result, gpd.GeoDataFrame)
+        output_gdf = result
+    else:
+        assert result is None
+        output_gdf = fileops.read_file(output_path)
+    assert len(output_gdf) == len(input_gdf)
+    assert_geodataframe_equal(output_gdf, expected_gdf, sort_values=True)
+
+
+def test_buffer_in_memory_work_queue(tmp_path, monkeypatch):
+    """With a work queue, in-memory input is written to the tmp dir, not /dev/shm."""
+    input_gdf = fileops.read_file(test_helper.get_testfile("polygon-parcel"))
+    parent_dirs = []
+
+    def create_gfo_tmp_dir(base_dirname, parent_dir=None):  # noqa: ARG001
+        parent_dirs.append(parent_dir)
+        raise RuntimeError("stop")
+
+    monkeypatch.setattr(_general_helper, "create_gfo_tmp_dir", create_gfo_tmp_dir)
+    with (
+        options.set_tmp_dir(tmp_path / "tmp"),
+        options.set_work_queue_dir(tmp_path / "queue"),
+    ):
+        with pytest.raises(RuntimeError, match="stop"):
+            geoops.buffer(input_path=input_gdf, output_path=None, distance=1)
+
+    assert parent_dirs == [tmp_path / "tmp"]
+
+
+def test_estimate_file_size():
+    """The size of the geometries is estimated from their coordinates."""
+    polygon = shapely.Point(0, 0).buffer(10, quad_segs=100)
+    input_gdf = gpd.GeoDataFrame({"name": ["a", "b"]}, geometry=[polygon, polygon])
+
+    size = geoops._estimate_file_size(input_gdf)
+
+    nb_coords = shapely.get_num_coordinates(polygon)
+    assert size > 2 * nb_coords * 2 * 8
+    assert size > input_gdf.memory_usage(deep=True).sum()
+
+
 @pytest.mark.parametrize("geoops_module", GEOOPS_MODULES)
 def test_buffer_shp_to_gpkg(
     tmp_path,
@@ -15,7 +15,7 @@ from geofileops.util import _geometry_util
 from geofileops.util import _geoops_gpd as geoops_gpd
 from geofileops.util._geofileinfo import GeofileInfo
 from tests import test_helper
-from tests.test_helper import SUFFIXES_GEOOPS
+from tests.test_helper import SUFFIXES_GEOOPS, assert_geodataframe_equal
 
 
 @pytest.mark.parametrize("suffix", SUFFIXES_GEOOPS)
@@ -223,6 +223,70 @@ def test_apply_geooperation_invalid_operation(tmp_path):
         )
 
 
+@pytest.mark.parametrize("suffix", SUFFIXES_GEOOPS)
+def test_apply_operations(tmp_path, suffix):
+    input_path = test_helper.get_testfile("polygon-parcel", suffix=suffix)
+    batchsize = math.ceil(gfo.get_layerinfo(input_path).featurecount / 2)
+    operations = [
+        ("buffer", tmp_path / f"buffer_5{suffix}", {"distance": 5}),
+        ("buffer", tmp_path / f"buffer_10{suffix}", {"distance": 10}),
+        ("convexhull", tmp_path / f"convexhull{suffix}", {}),
+        ("simplify", tmp_path / f"simplify{suffix}", {"tolerance": 1}),
+    ]
+
+    # Run test
+    gfo.apply_operations(
+        input_path=input_path, operations=operations, nb_parallel=2, batchsize=batchsize
+    )
+
+    # The results should be the same as running the operations separately
+    for operation, output_path, params in operations:
+        assert output_path.exists()
+        expected_path = tmp_path / f"{output_path.stem}_expected{suffix}"
+        getattr(geoops_gpd, operation)(input_path, expected_path, **params)
+        expected_gdf = gfo.read_file(expected_path)
+        output_gdf = gfo.read_file(output_path)
+        assert_geodataframe_equal(
+            output_gdf, expected_gdf, check_like=True, sort_values=True
+        )
+
+
+def test_apply_operations_invalid(tmp_path):
+    input_path = test_helper.get_testfile("polygon-parcel")
+
+    with pytest.raises(ValueError, match="unsupported operation: INVALID"):
+        gfo.apply_operations(
+            input_path, operations=[("INVALID", tmp_path / "output.gpkg", {})]
+        )
+    with pytest.raises(ValueError, match="missing parameters for buffer"):
+        gfo.apply_operations(
+            input_path, operations=[("buffer", tmp_path / "output.gpkg", {})]
+        )
+    with pytest.raises(ValueError, match="invalid parameters for convexhull"):
+        gfo.apply_operations(
+            input_path,
+            operations=[("convexhull", tmp_path / "output.gpkg", {"distance": 1})],
+        )
+
+
+def test_apply_operations_invalid_force(tmp_path):
+    input_path = test_helper.get_testfile("polygon-parcel")
+    output_path = tmp_path / "output.gpkg"
+    gfo.copy(input_path, output_path)
+
+    with pytest.raises(ValueError, match="missing parameters for buffer"):
+        gfo.apply_operations(
+            input_path,
+            operations=[
+                ("convexhull", output_path, {}),
+                ("buffer", tmp_path / "output_buffer.gpkg", {}),
+            ],
+            force=True,
+        )
+    # The existing output isn't removed, as the operations are validated first
+    assert output_path.exists()
+
+
 @pytest.mark.parametrize("suffix", SUFFIXES_GEOOPS)
 def test_apply_vectorized(tmp_path, suffix):
     # Prepare test data
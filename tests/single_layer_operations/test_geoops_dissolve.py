@@ -577,6 +577,43 @@ def test_dissolve_invalid_params(
             )
 
 
+@pytest.mark.parametrize("tmp_file_format", ["fgb", "gpkg"])
+def test_dissolve_polygons_tmp_file_format(tmp_path, tmp_file_format):
+    """Test dissolve polygons with different formats for the temporary files."""
+    input_path = test_helper.get_testfile("polygon-parcel")
+    input_layerinfo = gfo.get_layerinfo(input_path)
+    batchsize = math.ceil(input_layerinfo.featurecount / 4)
+
+    # Run test
+    output_path = tmp_path / f"output_{tmp_file_format}.gpkg"
+    with gfo.options.set_tmp_file_format(tmp_file_format):
+        gfo.dissolve(
+            input_path=input_path,
+            output_path=output_path,
+            groupby_columns="GEWASGROEP",
+            explodecollections=True,
+            nb_parallel=2,
+            batchsize=batchsize,
+        )
+
+    # Check the result: should be the same as with the default file format
+    expected_path = tmp_path / "expected.gpkg"
+    gfo.dissolve(
+        input_path=input_path,
+        output_path=expected_path,
+        groupby_columns="GEWASGROEP",
+        explodecollections=True,
+        nb_parallel=2,
+        batchsize=batchsize,
+    )
+    output_gdf = gfo.read_file(output_path)
+    expected_gdf = gfo.read_file(expected_path)
+    assert len(output_gdf) > 0
+    assert_geodataframe_equal(
+        output_gdf, expected_gdf, normalize=True, sort_values=True
+    )
+
+
 def test_dissolve_polygons_groupby_None(tmp_path):
     """
     Test dissolve polygons with a column with None values. There was once an issue
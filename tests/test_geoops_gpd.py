@@ -1,8 +1,17 @@
+import json
 import logging
+import math
 
+import geopandas as gpd
 import pytest
+import shapely.geometry as sh_geom
+from pygeoops import GeometryType
 
+import geofileops as gfo
 from geofileops.util import _geoops_gpd
+from geofileops.util._geometry_util import BufferEndCapStyle
+from tests import test_helper
+from tests.test_helper import assert_geodataframe_equal
 
 
 @pytest.mark.parametrize(
@@ -59,3 +68,237 @@ def test_determine_nb_batches(
 
     assert exp_nb_parallel == res_nb_parallel
     assert exp_nb_batches == res_nb_batches
+
+
+@pytest.mark.parametrize("suffix", [".gpkg", ".shp"])
+@pytest.mark.parametrize(
+    "operation", [None, _geoops_gpd.GeoOperation.BUFFER, _geoops_gpd.GeoOperation.APPLY]
+)
+def test_estimate_row_costs(suffix, operation):
+    input_path = test_helper.get_testfile("polygon-parcel", suffix=suffix)
+    input_layer = gfo.get_layerinfo(input_path)
+
+    estimate = _geoops_gpd._estimate_row_costs(
+        input_path, input_layer, columns=None, operation=operation, sample_size=20
+    )
+
+    assert estimate is not None
+    assert 0 < estimate["nb_rows_sampled"] <= 20
+    assert estimate["avg_npoints"] > 0
+    assert estimate["bytes_per_row"] > estimate["avg_attr_bytes"]
+    assert estimate["cost_per_row"] >= estimate["avg_npoints"]
+
+
+def test_prepare_processing_params_row_costs(tmp_path, monkeypatch):
+    input_path = test_helper.get_testfile("polygon-parcel")
+    input_layer = gfo.get_layerinfo(input_path)
+
+    # Make sure the row costs are estimated, also for this small test file
+    monkeypatch.setattr(_geoops_gpd, "_ROW_COST_ESTIMATE_MIN_ROWS", 0)
+    params = _geoops_gpd._prepare_processing_params(
+        input_path=input_path,
+        input_layer=input_layer,
+        nb_parallel=2,
+        batchsize=-1,
+        tmp_dir=tmp_path,
+        operation=_geoops_gpd.GeoOperation.BUFFER,
+    )
+
+    assert params.row_cost_estimate is not None
+    assert params.row_cost_estimate["bytes_per_row"] > 0
+
+    # The estimate is also written to processing_params.json
+    with (tmp_path / "processing_params.json").open() as file:
+        params_json = json.load(file)
+    assert params_json["row_cost_estimate"]["bytes_per_row"] > 0
+
+    # If a batchsize is specified, the row costs aren't estimated
+    params = _geoops_gpd._prepare_processing_params(
+        input_path=input_path,
+        input_layer=input_layer,
+        nb_parallel=2,
+        batchsize=10,
+        operation=_geoops_gpd.GeoOperation.BUFFER,
+    )
+    assert params.row_cost_estimate is None
+
+
+def test_dissolve_polygons_merge_onborder_large_component(tmp_path):
+    """A component larger than the batch size is unioned at once in one batch."""
+    # A grid of touching boxes forms one large connected component
+    boxes = [sh_geom.box(x, y, x + 1, y + 1) for x in range(20) for y in range(20)]
+    onborder_gdf = gpd.GeoDataFrame(
+        {"group": ["a"] * len(boxes)}, geometry=boxes, crs="EPSG:31370"
+    )
+    input_path = tmp_path / "onborder.gpkg"
+    gfo.to_file(onborder_gdf, input_path, layer="output")
+    output_path = tmp_path / "output.gpkg"
+
+    _geoops_gpd._dissolve_polygons_merge_onborder(
+        input_path=input_path,
+        output_path=output_path,
+        explodecollections=True,
+        groupby_columns=["group"],
+        agg_columns=None,
+        result_tiles_gdf=None,
+        input_geometrytype=GeometryType.POLYGON,
+        output_layer="output",
+        gridsize=0.0,
+        nb_parallel=2,
+        batchsize=50,
+        geoindex_column="__geoindex",
+    )
+
+    result_gdf = gfo.read_file(output_path)
+    assert len(result_gdf) == 1
+    assert result_gdf["group"][0] == "a"
+    assert result_gdf.geometry[0].area == pytest.approx(400)
+
+
+def test_dissolve_polygons_merge_onborder_bbox_overlap(tmp_path):
+    """Polygons with only overlapping bounding boxes are not merged."""
+    triangles = [
+        sh_geom.Polygon([(0, 0), (10, 0), (0, 10)]),
+        sh_geom.Polygon([(10, 10), (10, 1), (1, 10)]),
+    ]
+    onborder_gdf = gpd.GeoDataFrame(geometry=triangles, crs="EPSG:31370")
+    input_path = tmp_path / "onborder.gpkg"
+    gfo.to_file(onborder_gdf, input_path, layer="output")
+    output_path = tmp_path / "output.gpkg"
+
+    _geoops_gpd._dissolve_polygons_merge_onborder(
+        input_path=input_path,
+        output_path=output_path,
+        explodecollections=True,
+        groupby_columns=None,
+        agg_columns=None,
+        result_tiles_gdf=None,
+        input_geometrytype=GeometryType.POLYGON,
+        output_layer="output",
+        gridsize=0.0,
+        nb_parallel=2,
+        batchsize=1,
+        geoindex_column="__geoindex",
+    )
+
+    result_gdf = gfo.read_file(output_path)
+    assert len(result_gdf) == 2
+    assert sorted(result_gdf.geometry.area) == pytest.approx([40.5, 50])
+
+
+def test_resume_after_failure(tmp_path, monkeypatch):
+    """Test that a failed operation only redoes the batches that weren't completed."""
+    input_path = test_helper.get_testfile("polygon-parcel", dst_dir=tmp_path)
+    output_path = tmp_path / "output.gpkg"
+    batchsize = math.ceil(gfo.get_layerinfo(input_path).featurecount / 4)
+    apply_geooperation_orig = _geoops_gpd._apply_geooperation
+    calls = []
+    fail = True
+
+    def apply_geooperation_failing(**kwargs):
+        calls.append(kwargs["where"])
+        if fail and len(calls) == 2:
+            raise RuntimeError("simulated failure")
+        return apply_geooperation_orig(**kwargs)
+
+    # Run the operation, failing in the second batch. A non-default endcap_style is
+    # used so the buffer is calculated via GeoPandas.
+    monkeypatch.setattr(_geoops_gpd, "_apply_geooperation", apply_geooperation_failing)
+    with (
+        gfo.TempEnv({"GFO_WORKER_TYPE": "threads"}),
+        gfo.options.set_checkpoint_dir(tmp_path / "checkpoints"),
+    ):
+        with pytest.raises(RuntimeError, match="simulated failure"):
+            gfo.buffer(
+                input_path,
+                output_path,
+                distance=1,
+                endcap_style=BufferEndCapStyle.SQUARE,
+                nb_parallel=1,
+                batchsize=batchsize,
+            )
+        assert not output_path.exists()
+        completed_batch = calls[0]
+
+        # Resume: only the batches that weren't completed are calculated again
+        calls.clear()
+        fail = False
+        gfo.buffer(
+            input_path,
+            output_path,
+            distance=1,
+            endcap_style=BufferEndCapStyle.SQUARE,
+            nb_parallel=1,
+            batchsize=batchsize,
+        )
+
+    assert len(calls) > 0
+    assert completed_batch not in calls
+    assert not any((tmp_path / "checkpoints").iterdir())
+    expected_path = tmp_path / "expected.gpkg"
+    _geoops_gpd.buffer(
+        input_path, expected_path, distance=1, endcap_style=BufferEndCapStyle.SQUARE
+    )
+    assert_geodataframe_equal(
+        gfo.read_file(output_path),
+        gfo.read_file(expected_path),
+        check_like=True,
+        sort_values=True,
+    )
+
+
+def test_resume_dissolve_after_failure(tmp_path, monkeypatch):
+    """Test that a failed dissolve only redoes the tiles that weren't completed."""
+    input_path = test_helper.get_testfile("polygon-parcel", dst_dir=tmp_path)
+    output_path = tmp_path / "output.gpkg"
+    dissolve_polygons_orig = _geoops_gpd._dissolve_polygons
+    calls = []
+    fail = True
+
+    def dissolve_polygons_failing(**kwargs):
+        calls.append(kwargs["bbox"])
+        if fail and len(calls) == 2:
+            raise RuntimeError("simulated failure")
+        return dissolve_polygons_orig(**kwargs)
+
+    # Run the dissolve, failing in the second tile
+    monkeypatch.setattr(_geoops_gpd, "_dissolve_polygons", dissolve_polygons_failing)
+    with (
+        gfo.TempEnv({"GFO_WORKER_TYPE": "threads"}),
+        gfo.options.set_checkpoint_dir(tmp_path / "checkpoints"),
+    ):
+        with pytest.raises(RuntimeError, match="simulated failure"):
+            gfo.dissolve(
+                input_path,
+                output_path,
+                explodecollections=True,
+                nb_parallel=1,
+                batchsize=10,
+            )
+        assert not output_path.exists()
+        completed_tile = calls[0]
+
+        # Resume: only the tiles that weren't completed are dissolved again
+        calls.clear()
+        fail = False
+        gfo.dissolve(
+            input_path,
+            output_path,
+            explodecollections=True,
+            nb_parallel=1,
+            batchsize=10,
+        )
+
+    assert len(calls) > 0
+    assert completed_tile not in calls
+    assert not any((tmp_path / "checkpoints").iterdir())
+    expected_path = tmp_path / "expected.gpkg"
+    gfo.dissolve(input_path, expected_path, explodecollections=True)
+    assert_geodataframe_equal(
+        gfo.read_file(output_path),
+        gfo.read_file(expected_path),
+        check_like=True,
+        sort_values=True,
+        normalize=True,
+        check_less_precise=True,
+    )
@@ -54,6 +54,101 @@ def test_determine_nb_batches(
     assert exp_nb_batches == res_nb_batches
 
 
+def test_determine_batches_by_cost():
+    input1_path = test_helper.get_testfile("polygon-parcel")
+    input1_layer = gfo.get_layerinfo(input1_path)
+    input2_path = test_helper.get_testfile("polygon-zone")
+    input2_layer = gfo.get_layerinfo(input2_path)
+
+    batch_info_df = _geoops_sql._determine_batches_by_cost(
+        input1_path=input1_path,
+        input1_layer=input1_layer,
+        input2_path=input2_path,
+        input2_layer=input2_layer,
+        nb_batches=4,
+    )
+
+    assert list(batch_info_df.columns) == ["batch_id", "start_id"]
+    assert 1 < len(batch_info_df) <= 4
+    assert batch_info_df["batch_id"].tolist() == list(range(len(batch_info_df)))
+    assert batch_info_df["start_id"].is_monotonic_increasing
+    assert batch_info_df["start_id"].iloc[0] == 1
+
+
+@pytest.mark.parametrize("balance_by_cost", [True, False])
+def test_prepare_processing_params_balance_by_cost(tmp_path, balance_by_cost):
+    input1_path = test_helper.get_testfile("polygon-parcel")
+    input1_layer = gfo.get_layerinfo(input1_path)
+    input2_path = test_helper.get_testfile("polygon-zone")
+    input2_layer = gfo.get_layerinfo(input2_path)
+
+    with gfo.options.set_batch_balance_by_cost(balance_by_cost):
+        processing_params = _geoops_sql._prepare_processing_params(
+            input1_path=input1_path,
+            input1_layer=input1_layer,
+            input1_layer_alias="layer1",
+            input2_path=input2_path,
+            input2_layer=input2_layer,
+            tmp_dir=tmp_path,
+            nb_parallel=2,
+        )
+
+    assert processing_params is not None
+    assert processing_params.batches is not None
+    assert len(processing_params.batches) > 1
+
+    # All rows should be in exactly one batch
+    nb_rows = 0
+    for batch in processing_params.batches.values():
+        sql_stmt = f"""
+            SELECT COUNT(*) AS nb_rows FROM "{input1_layer.name}" layer1
+             WHERE 1=1
+               {batch["batch_filter"]}
+        """
+        batch_df = gfo.read_file(input1_path, sql_stmt=sql_stmt)
+        nb_rows += batch_df["nb_rows"].iloc[0]
+    assert nb_rows == input1_layer.featurecount
+
+
+def test_prepare_processing_params_skip_batches_without_overlap(tmp_path):
+    input1_path = test_helper.get_testfile("polygon-parcel")
+    input1_layer = gfo.get_layerinfo(input1_path)
+
+    # Use a single parcel as input2, so most rows of input1 don't overlap with it.
+    input1_gdf = gfo.read_file(input1_path, fid_as_index=True)
+    input2_gdf = input1_gdf[~input1_gdf.geometry.isna()].iloc[[0]]
+    input2_path = tmp_path / "input2.gpkg"
+    gfo.to_file(input2_gdf, input2_path)
+    input2_layer = gfo.get_layerinfo(input2_path)
+
+    processing_params = _geoops_sql._prepare_processing_params(
+        input1_path=input1_path,
+        input1_layer=input1_layer,
+        input1_layer_alias="layer1",
+        input2_path=input2_path,
+        input2_layer=input2_layer,
+        tmp_dir=tmp_path,
+        nb_parallel=2,
+        skip_batches_without_overlap=True,
+    )
+
+    assert processing_params is not None
+    assert processing_params.batches is not None
+
+    # Only rows overlapping with input2 should remain, including the parcel itself.
+    rowids = []
+    for batch in processing_params.batches.values():
+        sql_stmt = f"""
+            SELECT layer1.rowid AS rowid_1 FROM "{input1_layer.name}" layer1
+             WHERE 1=1
+               {batch["batch_filter"]}
+        """
+        batch_df = gfo.read_file(input1_path, sql_stmt=sql_stmt)
+        rowids.extend(batch_df["rowid_1"].tolist())
+    assert input2_gdf.index[0] in rowids
+    assert len(rowids) < input1_layer.featurecount
+
+
 @pytest.mark.parametrize(
     "input1_suffix, input2_suffix, output1_suffix, output2_suffix, unzip_gpkg",
     [
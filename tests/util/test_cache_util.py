@@ -0,0 +1,127 @@
+"""
+Tests for the cache of results of operations.
+"""
+
+import os
+
+import geofileops as gfo
+from geofileops.util import _cache_util
+from tests import test_helper
+from tests.test_helper import assert_geodataframe_equal
+
+
+def test_cache_hit(tmp_path):
+    input_path = test_helper.get_testfile("polygon-parcel", dst_dir=tmp_path)
+    cache_dir = tmp_path / "cache"
+
+    with gfo.options.set_cache_dir(cache_dir):
+        gfo.buffer(input_path, tmp_path / "output1.gpkg", distance=1)
+        assert len(list(cache_dir.iterdir())) == 1
+
+        # Same operation on the unchanged input: served from the cache
+        gfo.buffer(input_path, tmp_path / "output2.gpkg", distance=1)
+        assert len(list(cache_dir.iterdir())) == 1
+
+        # Other parameters: not in the cache yet
+        gfo.buffer(input_path, tmp_path / "output3.gpkg", distance=2)
+        assert len(list(cache_dir.iterdir())) == 2
+
+    assert_geodataframe_equal(
+        gfo.read_file(tmp_path / "output1.gpkg"),
+        gfo.read_file(tmp_path / "output2.gpkg"),
+    )
+
+
+def test_cache_input_changed(tmp_path):
+    input_path = test_helper.get_testfile("polygon-parcel", dst_dir=tmp_path)
+    output_path = tmp_path / "output.gpkg"
+    cache_dir = tmp_path / "cache"
+
+    with gfo.options.set_cache_dir(cache_dir):
+        gfo.buffer(input_path, output_path, distance=1)
+
+        # Change the input file: the cached result should not be used
+        input_gdf = gfo.read_file(input_path)
+        gfo.to_file(input_gdf.iloc[:10], input_path)
+        stat = input_path.stat()
+        os.utime(input_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        gfo.buffer(input_path, output_path, distance=1, force=True)
+
+    assert len(list(cache_dir.iterdir())) == 2
+    assert gfo.get_layerinfo(output_path).featurecount == 10
+
+
+def test_cache_key():
+    arguments = {
+        "input_path": "not_existing.gpkg",
+        "output_path": "output.gpkg",
+        "distance": 1.0,
+        "force": False,
+    }
+
+    key = _cache_util.cache_key("buffer", arguments)
+
+    assert key is not None
+    # Parameters that don't influence the result are not part of the key
+    assert key == _cache_util.cache_key("buffer", {**arguments, "force": True})
+    assert key != _cache_util.cache_key("buffer", {**arguments, "distance": 2.0})
+    assert key != _cache_util.cache_key("convexhull", arguments)
+    assert key != _cache_util.cache_key(
+        "buffer", {**arguments, "output_path": "output.shp"}
+    )
+    assert key == _cache_util.cache_key("buffer", {**arguments, "output_layer": "a"})
+    # Runtime options that influence the result are part of the key
+    with gfo.options.set_sliver_tolerance(0.5):
+        assert key != _cache_util.cache_key("buffer", arguments)
+
+
+def test_checkpoint_key():
+    arguments = {
+        "input_path": "not_existing.gpkg",
+        "output_path": "output.gpkg",
+        "distance": 1.0,
+    }
+
+    key = _cache_util.checkpoint_key("buffer", arguments)
+
+    assert key is not None
+    assert key != _cache_util.cache_key("buffer", arguments)
+    assert key != _cache_util.checkpoint_key("buffer", {**arguments, "distance": 2.0})
+    # Contrary to the cache key, the output path and layer are part of the key
+    assert key != _cache_util.checkpoint_key(
+        "buffer", {**arguments, "output_path": "output2.gpkg"}
+    )
+    assert key != _cache_util.checkpoint_key(
+        "buffer", {**arguments, "output_layer": "a"}
+    )
+
+
+def test_cache_hit_output_layer(tmp_path):
+    input_path = test_helper.get_testfile("polygon-parcel", dst_dir=tmp_path)
+    cache_dir = tmp_path / "cache"
+
+    with gfo.options.set_cache_dir(cache_dir):
+        gfo.buffer(input_path, tmp_path / "output1.gpkg", distance=1)
+        gfo.buffer(input_path, tmp_path / "output2.gpkg", distance=1, output_layer="a")
+        gfo.buffer(input_path, tmp_path / "output3.gpkg", distance=1)
+        assert len(list(cache_dir.iterdir())) == 1
+
+    # The results served from the cache have the layer name asked
+    assert gfo.listlayers(tmp_path / "output2.gpkg") == ["a"]
+    assert gfo.listlayers(tmp_path / "output3.gpkg") == ["output3"]
+    output_gdf = gfo.read_file(tmp_path / "output3.gpkg", layer="output3")
+    assert len(output_gdf) == gfo.get_layerinfo(tmp_path / "output1.gpkg").featurecount
+
+
+def test_cache_evict(tmp_path):
+    cache_dir = tmp_path / "cache"
+    for index in range(3):
+        entry_dir = cache_dir / f"entry_{index}"
+        entry_dir.mkdir(parents=True)
+        (entry_dir / "output.gpkg").write_bytes(b"0" * 100)
+        os.utime(entry_dir, (index, index))
+
+    _cache_util.evict(cache_dir, max_size=250)
+
+    # The least recently used entry is removed
+    assert sorted(path.name for path in cache_dir.iterdir()) == ["entry_1", "entry_2"]
@@ -361,3 +361,35 @@ def test_subdivide_vectorized(geom, num_coords_max, exp_nb_parts):
     # Check that the union of all parts is equal to the original geometry
     union = shapely.union_all(result)
     assert shapely.equals(union, exp_union_result)
+
+
+@pytest.mark.parametrize(
+    "groups, exp_components",
+    [
+        (None, [0, 0, 0, 1, 2]),
+        ([0, 0, 1, 1, 1], [0, 0, 1, 2, 3]),
+        ([0, 0, 0, 0, 0], [0, 0, 0, 1, 2]),
+    ],
+)
+def test_connected_components(groups, exp_components):
+    """Test determining the groups of intersecting geometries."""
+    geoseries = gpd.GeoSeries(
+        [
+            sh_geom.box(0, 0, 10, 10),
+            sh_geom.box(10, 0, 20, 10),
+            sh_geom.box(20, 0, 30, 10),
+            sh_geom.box(100, 0, 110, 10),
+            None,
+        ]
+    )
+    if groups is not None:
+        groups = np.array(groups)
+
+    result = _geoseries_util.connected_components(geoseries, groups)
+
+    assert result.tolist() == exp_components
+
+
+def test_connected_components_empty():
+    result = _geoseries_util.connected_components(gpd.GeoSeries([]))
+    assert len(result) == 0
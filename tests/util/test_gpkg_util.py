@@ -0,0 +1,272 @@
+"""
+Tests for functionalities in _gpkg_util.
+"""
+
+import geopandas as gpd
+import numpy as np
+import pytest
+import shapely
+from shapely import box
+
+import geofileops as gfo
+from geofileops._compat import SHAPELY_GTE_21
+from geofileops.util import _gpkg_util, _sqlite_util
+from tests import test_helper
+from tests.test_helper import assert_geodataframe_equal
+
+COLUMNS = ["OIDN", "uidn", "HFDTLT", "LENGTE", "OPPERVL"]
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"fid_as_index": True},
+        {"where": "OIDN > 500000 AND lower(GEWASGROEP) IN ('grasland', 'maïs')"},
+        {"rows": slice(5, 10)},
+        {"bbox": (156000, 196500, 156500, 197000)},
+        {"bbox": (156000, 196500, 156500, 197000), "rows": slice(2, 4)},
+        {"ignore_geometry": True},
+    ],
+)
+def test_read_gpkg(kwargs):
+    src = test_helper.get_testfile("polygon-parcel")
+
+    result_gdf = _gpkg_util.read_gpkg(src, columns=COLUMNS, **kwargs)
+
+    assert result_gdf is not None
+    expected_gdf = gfo.read_file(src, columns=COLUMNS, **kwargs)
+    assert len(result_gdf) > 0
+    assert list(result_gdf.columns) == list(expected_gdf.columns)
+    if kwargs.get("ignore_geometry"):
+        assert result_gdf.equals(expected_gdf)
+    else:
+        assert_geodataframe_equal(result_gdf, expected_gdf)
+
+
+def test_read_gpkg_null_values(tmp_path):
+    src = test_helper.get_testfile("polygon-parcel", dst_dir=tmp_path)
+    layer = gfo.get_only_layer(src)
+    gfo.execute_sql(
+        src, f'UPDATE "{layer}" SET OIDN = NULL, LENGTE = NULL WHERE fid <= 2'
+    )
+
+    result_gdf = _gpkg_util.read_gpkg(src, columns=COLUMNS)
+
+    # Like GDAL, integer columns with NULL values are read as float
+    assert result_gdf is not None
+    assert result_gdf["OIDN"].dtype == "float64"
+    assert result_gdf["OIDN"].isna().sum() == 2
+    assert_geodataframe_equal(result_gdf, gfo.read_file(src, columns=COLUMNS))
+
+
+def test_read_gpkg_empty():
+    src = test_helper.get_testfile("polygon-parcel", empty=True)
+
+    result_gdf = _gpkg_util.read_gpkg(src, columns=COLUMNS)
+
+    assert result_gdf is not None
+    assert len(result_gdf) == 0
+    assert list(result_gdf.columns) == [*COLUMNS, "geometry"]
+    assert result_gdf.crs == gfo.get_crs(src)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        # Reading DATETIME columns isn't supported
+        {},
+        # A spatialite function in the where clause isn't supported
+        {"columns": COLUMNS, "where": "ST_Area(geom) > 1000"},
+        # A where clause with multiple statements isn't supported
+        {"columns": COLUMNS, "where": "1=1; DROP TABLE parcels"},
+        # Reading without geometry nor columns isn't supported
+        {"columns": [], "ignore_geometry": True},
+    ],
+)
+def test_read_gpkg_not_supported(kwargs):
+    src = test_helper.get_testfile("polygon-parcel")
+
+    assert _gpkg_util.read_gpkg(src, **kwargs) is None
+
+
+def test_read_file_sqlite_direct():
+    src = test_helper.get_testfile("polygon-parcel")
+
+    with gfo.options.set_read_file_sqlite_direct(True):
+        read_gdf = gfo.read_file(src, columns=[*COLUMNS, "fid"])
+        read_all_gdf = gfo.read_file(src)
+
+    expected_gdf = gfo.read_file(src, columns=[*COLUMNS, "fid"])
+    assert_geodataframe_equal(read_gdf, expected_gdf)
+    assert_geodataframe_equal(read_all_gdf, gfo.read_file(src))
+
+
+def test_gpkg_blobs_to_geometries():
+    geoms = [box(0, 0, 1, 1), None, shapely.Point(5, 5), shapely.Polygon()]
+    envelope_sizes = [32, 0, 32, 0]
+    blobs = []
+    for geom, envelope_size in zip(geoms, envelope_sizes, strict=True):
+        if geom is None:
+            blobs.append(None)
+            continue
+        # Header: magic, version, flags (little endian, envelope, empty), srs_id
+        flags = 0b1 | ((1 if envelope_size > 0 else 0) << 1)
+        if geom.is_empty:
+            flags |= 0b1 << 4
+        header = b"GP" + bytes([0, flags]) + (31370).to_bytes(4, "little")
+        envelope = b"\x00" * envelope_size
+        blobs.append(header + envelope + shapely.to_wkb(geom))
+
+    result = _gpkg_util.gpkg_blobs_to_geometries(blobs)
+
+    assert len(result) == len(geoms)
+    for result_geom, geom in zip(result, geoms, strict=True):
+        if geom is None:
+            assert result_geom is None
+        else:
+            assert shapely.equals(result_geom, geom) or geom.is_empty
+            assert result_geom.is_empty == geom.is_empty
+
+
+def test_gpkg_blobs_to_geometries_invalid():
+    with pytest.raises(ValueError, match="magic number not found"):
+        _gpkg_util.gpkg_blobs_to_geometries([b"XX\x00\x01\x00\x00\x00\x00"])
+
+
+def test_geometries_to_gpkg_blobs():
+    geoms = np.array(
+        [box(0, 0, 1, 1), None, shapely.Point(5, 5, 2), shapely.Polygon()],
+        dtype=object,
+    )
+
+    blobs = _gpkg_util.geometries_to_gpkg_blobs(geoms, srs_id=31370)
+
+    assert blobs[1] is None
+    assert blobs[0][:2] == b"GP"
+    assert int.from_bytes(blobs[0][4:8], "little") == 31370
+    # The envelope is only written for non-empty geometries
+    assert blobs[0][3] == 0b0000_0011
+    assert blobs[3][3] == 0b0001_0001
+    result = _gpkg_util.gpkg_blobs_to_geometries(blobs)
+    assert shapely.equals(result[0], geoms[0])
+    assert result[1] is None
+    assert shapely.equals(result[2], geoms[2])
+    assert result[2].has_z == SHAPELY_GTE_21
+    assert result[3].is_empty
+
+
+@pytest.mark.parametrize("force_multitype", [True, False])
+@pytest.mark.parametrize("has_z", [True, False])
+def test_write_gpkg(tmp_path, force_multitype, has_z):
+    if has_z and not SHAPELY_GTE_21:
+        pytest.skip("writing Z geometries as ISO WKB needs shapely >= 2.1")
+    src = test_helper.get_testfile("polygon-parcel")
+    input_gdf = gfo.read_file(src, columns=COLUMNS)
+    input_gdf["bool_col"] = input_gdf["OIDN"] > 500000
+    geoms = shapely.get_geometry(input_gdf.geometry.to_numpy(), 0)
+    if has_z:
+        geoms = shapely.force_3d(geoms, z=2.5)
+    input_gdf["geometry"] = gpd.GeoSeries(
+        geoms, index=input_gdf.index, crs=input_gdf.crs
+    )
+    output_path = tmp_path / "output.gpkg"
+
+    written = _gpkg_util.write_gpkg(
+        input_gdf, output_path, layer="output", force_multitype=force_multitype
+    )
+
+    assert written
+    output_info = gfo.get_layerinfo(output_path)
+    exp_geometrytype = "MULTIPOLYGON" if force_multitype else "POLYGON"
+    if has_z:
+        exp_geometrytype = f"{exp_geometrytype}Z"
+    assert output_info.geometrytypename == exp_geometrytype
+    assert output_info.featurecount == len(input_gdf)
+    assert gfo.has_spatial_index(output_path)
+
+    # Read the result via GDAL
+    output_gdf = gfo.read_file(output_path)
+    assert output_gdf.crs == input_gdf.crs
+    assert_geodataframe_equal(
+        output_gdf, input_gdf, promote_to_multi=force_multitype, check_dtype=False
+    )
+    assert output_gdf.geometry.has_z.all() == has_z
+    if has_z:
+        z_values = shapely.get_coordinates(output_gdf.geometry, include_z=True)[:, 2]
+        assert (z_values == 2.5).all()
+
+    # Read the result via spatialite: the blobs should be valid GPKG geometries in
+    # ISO WKB, with the right dimensions.
+    conn = _sqlite_util.connect(output_path)
+    try:
+        sql = """
+            SELECT IsValidGPB(geom) AS is_valid
+                  ,CoordDimension(GeomFromGPB(geom)) AS dimension
+                  ,ST_MinZ(GeomFromGPB(geom)) AS min_z
+                  ,ST_MaxZ(GeomFromGPB(geom)) AS max_z
+              FROM "output"
+        """
+        rows = conn.execute(sql).fetchall()
+    finally:
+        conn.close()
+    assert len(rows) == len(input_gdf)
+    exp_dimension = "XYZ" if has_z else "XY"
+    exp_z = 2.5 if has_z else None
+    assert all(row == (1, exp_dimension, exp_z, exp_z) for row in rows)
+
+
+def test_write_gpkg_append(tmp_path):
+    src = test_helper.get_testfile("polygon-parcel")
+    input_gdf = gfo.read_file(src, columns=COLUMNS)
+    output_path = tmp_path / "output.gpkg"
+    gfo.to_file(input_gdf, output_path)
+
+    written = _gpkg_util.write_gpkg(input_gdf, output_path, layer="output", append=True)
+
+    assert written
+    output_info = gfo.get_layerinfo(output_path)
+    assert output_info.featurecount == 2 * len(input_gdf)
+    output_gdf = gfo.read_file(output_path, bbox=input_gdf.total_bounds.tolist())
+    assert len(output_gdf) == 2 * len(input_gdf)
+
+
+@pytest.mark.parametrize(
+    "kwargs, columns, datetime_column",
+    [
+        # The layer already exists and should be overwritten
+        ({"append": False}, None, False),
+        # The columns are different from the existing layer
+        ({"append": True}, ["OIDN"], False),
+        # The index should be written
+        ({"append": True, "index": True}, None, False),
+        # A datetime column isn't supported
+        ({"append": True}, None, True),
+    ],
+)
+def test_write_gpkg_not_supported(tmp_path, kwargs, columns, datetime_column):
+    src = test_helper.get_testfile("polygon-parcel")
+    input_gdf = gfo.read_file(src, columns=COLUMNS)
+    output_path = tmp_path / "output.gpkg"
+    gfo.to_file(input_gdf, output_path)
+    if datetime_column:
+        input_gdf["datetime"] = gfo.read_file(src, columns=["DATUM"])["DATUM"]
+    if columns is not None:
+        input_gdf = input_gdf[[*columns, "geometry"]]
+
+    assert not _gpkg_util.write_gpkg(input_gdf, output_path, layer="output", **kwargs)
+    assert gfo.get_layerinfo(output_path).featurecount == len(input_gdf)
+
+
+def test_to_file_sqlite_direct(tmp_path):
+    src = test_helper.get_testfile("polygon-parcel")
+    input_gdf = gfo.read_file(src, columns=COLUMNS)
+    output_path = tmp_path / "output.gpkg"
+
+    with gfo.options.set_to_file_sqlite_direct(True):
+        gfo.to_file(input_gdf, output_path)
+        gfo.to_file(input_gdf, output_path, append=True)
+
+    output_gdf = gfo.read_file(output_path)
+    assert len(output_gdf) == 2 * len(input_gdf)
+    assert_geodataframe_equal(output_gdf.iloc[: len(input_gdf)], input_gdf)
@@ -0,0 +1,93 @@
+"""
+Tests for the lazy pipeline of geo operations.
+"""
+
+import pytest
+
+import geofileops as gfo
+from geofileops.util import _geoops_gpd
+from tests import test_helper
+from tests.test_helper import assert_geodataframe_equal
+
+
+@pytest.mark.parametrize("suffix", [".gpkg", ".shp"])
+def test_pipeline_fused(tmp_path, suffix):
+    input_path = test_helper.get_testfile("polygon-parcel", suffix=suffix)
+    output_path = tmp_path / f"output{suffix}"
+
+    gfo.pipeline(input_path).makevalid().buffer(2).simplify(1).run(
+        output_path, nb_parallel=2
+    )
+
+    # The result should be the same as running the operations one by one
+    makevalid_path = tmp_path / "makevalid.gpkg"
+    buffer_path = tmp_path / "buffer.gpkg"
+    expected_path = tmp_path / f"expected{suffix}"
+    _geoops_gpd.makevalid(input_path, makevalid_path)
+    _geoops_gpd.buffer(makevalid_path, buffer_path, distance=2)
+    _geoops_gpd.simplify(buffer_path, expected_path, tolerance=1)
+    assert_geodataframe_equal(
+        gfo.read_file(output_path),
+        gfo.read_file(expected_path),
+        check_like=True,
+        sort_values=True,
+    )
+
+
+def test_pipeline_clip_dissolve(tmp_path):
+    input_path = test_helper.get_testfile("polygon-parcel")
+    clip_path = test_helper.get_testfile("polygon-zone")
+    output_path = tmp_path / "output.gpkg"
+
+    (
+        gfo.pipeline(input_path, columns=["OIDN", "GEWASGROEP"])
+        .buffer(1)
+        .clip(clip_path)
+        .dissolve(explodecollections=True, groupby_columns=["GEWASGROEP"])
+        .run(output_path)
+    )
+
+    buffer_path = tmp_path / "buffer.gpkg"
+    clip_output_path = tmp_path / "clip.gpkg"
+    expected_path = tmp_path / "expected.gpkg"
+    _geoops_gpd.buffer(
+        input_path, buffer_path, distance=1, columns=["OIDN", "GEWASGROEP"]
+    )
+    gfo.clip(buffer_path, clip_path, clip_output_path)
+    gfo.dissolve(
+        clip_output_path,
+        expected_path,
+        explodecollections=True,
+        groupby_columns=["GEWASGROEP"],
+    )
+    assert_geodataframe_equal(
+        gfo.read_file(output_path),
+        gfo.read_file(expected_path),
+        check_like=True,
+        sort_values=True,
+    )
+
+
+def test_pipeline_lazy(tmp_path):
+    input_path = test_helper.get_testfile("polygon-parcel")
+    output_path = tmp_path / "output.gpkg"
+
+    pipeline = gfo.pipeline(input_path).buffer(1)
+    pipeline_hull = pipeline.convexhull()
+
+    # Adding an operation returns a new pipeline and doesn't run anything
+    assert len(pipeline.steps) == 1
+    assert len(pipeline_hull.steps) == 2
+    assert "buffer -> convexhull" in repr(pipeline_hull)
+    assert not output_path.exists()
+
+    pipeline_hull.run(output_path)
+    assert output_path.exists()
+    assert gfo.get_layerinfo(output_path).geometrytypename == "MULTIPOLYGON"
+
+
+def test_pipeline_no_operations(tmp_path):
+    input_path = test_helper.get_testfile("polygon-parcel")
+
+    with pytest.raises(ValueError, match="no operations were added to the pipeline"):
+        gfo.pipeline(input_path).run(tmp_path / "output.gpkg")
@@ -2,7 +2,11 @@
 Tests for functionalities in _processing_util.
 """
 
+import functools
 import os
+import time
+
+import pytest
 
 from geofileops.util import _processing_util
 
@@ -42,3 +46,57 @@ def test_processnice():
 
     # Reset niceness to original value before test
     _processing_util.setprocessnice(nice_orig)
+
+
+@pytest.mark.parametrize("min_mem_available", [0, 1024, 2**60])
+def test_submit_with_backpressure(min_mem_available):
+    """All tasks should be executed, even if memory is (reported as being) too low."""
+    tasks = {task_id: functools.partial(pow, task_id, 2) for task_id in range(10)}
+
+    with _processing_util.PooledExecutorFactory(
+        worker_type="threads", max_workers=2
+    ) as pool:
+        results = {
+            task_id: future.result()
+            for task_id, future in _processing_util.submit_with_backpressure(
+                pool,
+                tasks,
+                max_running=2,
+                min_mem_available=min_mem_available,
+                check_interval=0.01,
+            )
+        }
+
+    assert results == {task_id: task_id**2 for task_id in range(10)}
+
+
+def test_submit_with_backpressure_queued():
+    """Tasks are queued, so the pool keeps working while the results are processed."""
+    started = []
+    tasks = {
+        task_id: functools.partial(started.append, task_id) for task_id in range(10)
+    }
+
+    with _processing_util.PooledExecutorFactory(
+        worker_type="threads", max_workers=2
+    ) as pool:
+        for _task_id, _future in _processing_util.submit_with_backpressure(
+            pool, tasks, max_running=2, min_mem_available=0
+        ):
+            # While the first result is processed, the queued tasks are started
+            time.sleep(0.1)
+            break
+
+    assert len(started) == 4
+
+
+def test_pooled_executor_cancel_on_error():
+    """If the pool is exited because of an error, the queued tasks are cancelled."""
+    with pytest.raises(RuntimeError, match="stop"):
+        with _processing_util.PooledExecutorFactory(
+            worker_type="threads", max_workers=1
+        ) as pool:
+            task_futures = [pool.submit(time.sleep, 0.1) for _ in range(5)]
+            raise RuntimeError("stop")
+
+    assert sum(future.cancelled() for future in task_futures) >= 3
@@ -0,0 +1,158 @@
+"""
+Tests for the work queue to distribute tasks over workers.
+"""
+
+import multiprocessing
+import os
+import threading
+import time
+
+import pytest
+
+import geofileops as gfo
+from geofileops.util import _geoops_gpd, _workqueue_util
+from tests import test_helper
+from tests.test_helper import assert_geodataframe_equal
+
+
+@pytest.fixture
+def queue_dir(tmp_path):
+    """Start two local worker processes on a work queue directory."""
+    queue_dir = tmp_path / "queue"
+    queue_dir.mkdir()
+    mp_context = multiprocessing.get_context("spawn")
+    workers = [
+        mp_context.Process(
+            target=gfo.run_worker,
+            kwargs={"queue_dir": queue_dir, "poll_interval": 0.1, "idle_timeout": 120},
+        )
+        for _ in range(2)
+    ]
+    for worker in workers:
+        worker.start()
+
+    yield queue_dir
+
+    for worker in workers:
+        worker.terminate()
+        worker.join()
+
+
+def test_executor(queue_dir):
+    with _workqueue_util.WorkQueueExecutor(queue_dir, poll_interval=0.1) as pool:
+        results = [pool.submit(pow, 2, exponent) for exponent in range(5)]
+        pid_future = pool.submit(os.getpid)
+        error_future = pool.submit(int, "not a number")
+
+        assert [future.result() for future in results] == [1, 2, 4, 8, 16]
+        # The tasks are executed by the workers, not by this process
+        assert pid_future.result() != os.getpid()
+        with pytest.raises(ValueError, match="invalid literal for int"):
+            error_future.result()
+
+    # The job directory is cleaned up
+    assert list(queue_dir.iterdir()) == []
+
+
+def test_executor_release_stale(tmp_path):
+    queue_dir = tmp_path / "queue"
+    pool = _workqueue_util.WorkQueueExecutor(queue_dir, stale_timeout=1)
+    future = pool.submit(pow, 2, 2)
+
+    # Simulate a worker that claimed the task and gives heartbeats
+    lock_path = pool.job_dir / "task_000000.lock"
+    lock_path.write_text("worker:1")
+    pool._check_results()
+    assert lock_path.exists()
+    time.sleep(0.6)
+    lock_path.write_text("worker:2")
+    pool._check_results()
+    assert lock_path.exists()
+
+    # If the heartbeat doesn't change for longer than stale_timeout, the worker is
+    # assumed to be dead. The modification time of the lock file isn't used, as the
+    # clocks of the hosts can differ.
+    os.utime(lock_path)
+    time.sleep(1.5)
+    pool._check_results()
+    assert not lock_path.exists()
+
+    # Without workers the task can only be cancelled
+    pool.shutdown(cancel_futures=True)
+    assert future.cancelled()
+    assert list(queue_dir.iterdir()) == []
+
+
+def test_heartbeat(tmp_path, monkeypatch):
+    monkeypatch.setattr(_workqueue_util, "_HEARTBEAT_INTERVAL", 0.05)
+    lock_path = tmp_path / "task_000000.lock"
+    lock_path.touch()
+    stop = threading.Event()
+    heartbeat = threading.Thread(
+        target=_workqueue_util._heartbeat, args=(lock_path, stop)
+    )
+    heartbeat.start()
+    try:
+        time.sleep(0.3)
+        first_heartbeat = lock_path.read_text()
+        time.sleep(0.3)
+        assert first_heartbeat != ""
+        assert lock_path.read_text() != first_heartbeat
+
+        # If the lock file was removed, e.g. because the task was released, the
+        # heartbeat stops without recreating it
+        lock_path.unlink()
+        heartbeat.join(timeout=5)
+        assert not heartbeat.is_alive()
+        assert not lock_path.exists()
+    finally:
+        stop.set()
+        heartbeat.join()
+
+
+def test_executor_no_workers(tmp_path, caplog, monkeypatch):
+    monkeypatch.setattr(_workqueue_util, "_NO_WORKERS_WARNING_INTERVAL", 0.2)
+    queue_dir = tmp_path / "queue"
+    pool = _workqueue_util.WorkQueueExecutor(queue_dir, poll_interval=0.1, timeout=1)
+    future = pool.submit(pow, 2, 2)
+
+    # Without workers, warnings are logged and the task fails after the timeout
+    with pytest.raises(TimeoutError, match="was claimed by a worker in"):
+        future.result(timeout=30)
+    assert "start workers with run_worker" in caplog.text
+
+    pool.shutdown()
+    assert list(queue_dir.iterdir()) == []
+
+
+def test_operations(tmp_path, queue_dir):
+    input1_path = test_helper.get_testfile("polygon-parcel")
+    input2_path = test_helper.get_testfile("polygon-zone")
+
+    with gfo.options.set_work_queue_dir(queue_dir):
+        _geoops_gpd.buffer(
+            input1_path,
+            tmp_path / "buffer.gpkg",
+            distance=1,
+            nb_parallel=2,
+            batchsize=10,
+        )
+        gfo.intersection(
+            input1_path,
+            input2_path,
+            tmp_path / "intersection.gpkg",
+            nb_parallel=2,
+            batchsize=10,
+        )
+    assert list(queue_dir.iterdir()) == []
+
+    # The results should be the same as when processed locally
+    _geoops_gpd.buffer(input1_path, tmp_path / "buffer_local.gpkg", distance=1)
+    gfo.intersection(input1_path, input2_path, tmp_path / "intersection_local.gpkg")
+    for name in ["buffer", "intersection"]:
+        assert_geodataframe_equal(
+            gfo.read_file(tmp_path / f"{name}.gpkg"),
+            gfo.read_file(tmp_path / f"{name}_local.gpkg"),
+            check_like=True,
+            sort_values=True,
+        )